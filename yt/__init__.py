@@ -138,6 +138,7 @@ from yt.visualization.api import (
     FITSOffAxisSlice,
     FITSOffAxisProjection,
     plot_2d,
+    render_plots,
 )
 
 from yt.visualization.volume_rendering.api import (
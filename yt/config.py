@@ -51,6 +51,9 @@ ytcfg_defaults = dict(
     thread_field_detection="False",
     ignore_invalid_unit_operation_errors="False",
     chunk_size="1000",
+    contour_scratch_dir="",
+    octree_cache_dir="",
+    profile_cache_dir="",
     xray_data_dir="/does/not/exist",
     supp_data_dir="/does/not/exist",
     default_colormap="arbre",
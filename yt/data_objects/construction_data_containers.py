@@ -3,6 +3,8 @@ import io
 import os
 import warnings
 import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from re import finditer
 from tempfile import NamedTemporaryFile, TemporaryFile
@@ -19,7 +21,15 @@ from yt.data_objects.selection_objects.data_selection_objects import (
 from yt.extern.tqdm import tqdm
 from yt.fields.field_exceptions import NeedsGridType, NeedsOriginalGrid
 from yt.frontends.sph.data_structures import ParticleDataset
-from yt.funcs import ensure_list, get_memory_usage, iterable, mylog, only_on_root
+from yt.frontends.ytdata.utilities import _create_field_dataset
+from yt.funcs import (
+    ensure_list,
+    get_memory_usage,
+    iterable,
+    mylog,
+    only_on_root,
+    resolve_num_threads,
+)
 from yt.geometry import particle_deposit as particle_deposit
 from yt.geometry.coordinates.cartesian_coordinates import all_data
 from yt.loaders import load_uniform_grid
@@ -31,7 +41,7 @@ from yt.utilities.exceptions import (
     YTParticleDepositionNotImplemented,
     YTTooManyVertices,
 )
-from yt.utilities.grid_data_format.writer import write_to_gdf
+from yt.utilities.grid_data_format.writer import write_slabs_to_gdf
 from yt.utilities.lib.cyoctree import CyOctree
 from yt.utilities.lib.interpolators import ghost_zone_interpolate
 from yt.utilities.lib.marching_cubes import march_cubes_grid, march_cubes_grid_flux
@@ -41,7 +51,7 @@ from yt.utilities.lib.pixelization_routines import (
     interpolate_sph_positions_gather,
     normalization_1d_utility,
     normalization_3d_utility,
-    pixelize_sph_kernel_arbitrary_grid,
+    pixelize_sph_kernel_arbitrary_grid_multi,
 )
 from yt.utilities.lib.quad_tree import QuadTree
 from yt.utilities.minimal_representation import MinimalProjectionData
@@ -51,6 +61,10 @@ from yt.utilities.parallel_tools.parallel_analysis_interface import (
     parallel_root_only,
 )
 
+# Cells per slab generated at a time when writing data out, summed over
+# fields
+_slab_cells = 2 ** 23
+
 
 class YTStreamline(YTSelectionContainer1D):
     """
@@ -883,26 +897,34 @@ class YTCoveringGrid(YTSelectionContainer3D):
         is_periodic = int(any(self.ds.periodicity))
 
         if smoothing_style == "scatter":
+            # All the fields of a given particle type are deposited together,
+            # so that the particles are read, and the kernel evaluated, once.
+            fields_by_ptype = {}
             for field in fields:
                 fi = self.ds._get_field_info(field)
                 ptype = fi.name[0]
                 if ptype not in self.ds._sph_ptypes:
                     raise KeyError(f"{ptype} is not a SPH particle type!")
-                buff = np.zeros(size, dtype="float64")
-                if normalize:
-                    buff_den = np.zeros(size, dtype="float64")
+                fields_by_ptype.setdefault(ptype, []).append(field)
 
-                pbar = tqdm(desc=f"Interpolating SPH field {field}")
-                for chunk in self._data_source.chunks([field], "io"):
+            num_threads = resolve_num_threads()
+            for ptype, ptype_fields in fields_by_ptype.items():
+                nf = len(ptype_fields)
+                buff = np.zeros(tuple(size) + (nf + int(normalize),), dtype="float64")
+
+                pbar = tqdm(desc=f"Interpolating SPH fields {ptype_fields}")
+                for chunk in self._data_source.chunks(ptype_fields, "io"):
                     px = chunk[(ptype, "particle_position_x")].in_base("code").d
                     py = chunk[(ptype, "particle_position_y")].in_base("code").d
                     pz = chunk[(ptype, "particle_position_z")].in_base("code").d
                     hsml = chunk[(ptype, "smoothing_length")].in_base("code").d
                     mass = chunk[(ptype, "particle_mass")].in_base("code").d
                     dens = chunk[(ptype, "density")].in_base("code").d
-                    field_quantity = chunk[field].d
+                    quantities = np.empty((nf, px.size), dtype="float64")
+                    for i, field in enumerate(ptype_fields):
+                        quantities[i] = chunk[field].d
 
-                    pixelize_sph_kernel_arbitrary_grid(
+                    pixelize_sph_kernel_arbitrary_grid_multi(
                         buff,
                         px,
                         py,
@@ -910,63 +932,110 @@ class YTCoveringGrid(YTSelectionContainer3D):
                         hsml,
                         mass,
                         dens,
-                        field_quantity,
+                        quantities,
                         bounds,
-                        pbar=pbar,
+                        normalize=int(normalize),
                         check_period=is_periodic,
                         period=period,
+                        num_threads=num_threads,
                     )
+                    pbar.update(px.size)
+
+                for i, field in enumerate(ptype_fields):
+                    fi = self.ds._get_field_info(field)
+                    field_buff = np.ascontiguousarray(buff[..., i])
                     if normalize:
-                        pixelize_sph_kernel_arbitrary_grid(
-                            buff_den,
-                            px,
-                            py,
-                            pz,
-                            hsml,
-                            mass,
-                            dens,
-                            np.ones(dens.shape[0]),
-                            bounds,
-                            pbar=pbar,
-                            check_period=is_periodic,
-                            period=period,
-                        )
-
-                if normalize:
-                    normalization_3d_utility(buff, buff_den)
-
-                self[field] = self.ds.arr(buff, fi.units)
+                        normalization_3d_utility(field_buff, buff[..., nf])
+                    self[field] = self.ds.arr(field_buff, fi.units)
                 pbar.close()
 
         if smoothing_style == "gather":
             num_neighbors = getattr(self.ds, "num_neighbors", 32)
+            fields_by_ptype = {}
             for field in fields:
-                buff = np.zeros(size, dtype="float64")
-
-                fields_to_get = [
-                    "particle_position",
-                    "density",
-                    "particle_mass",
-                    "smoothing_length",
-                    field[1],
-                ]
-                all_fields = all_data(self.ds, field[0], fields_to_get, kdtree=True)
+                fields_by_ptype.setdefault(field[0], []).append(field)
+            for ptype, ptype_fields in fields_by_ptype.items():
+                buffs = self._gather_sph_fields(
+                    ptype, ptype_fields, bounds, size, normalize, num_neighbors
+                )
+                for field, buff in zip(ptype_fields, buffs):
+                    fi = self.ds._get_field_info(field)
+                    self[field] = self.ds.arr(buff, fi.units)
+
+    def _gather_sph_fields(self, ptype, fields, bounds, size, normalize, num_neighbors):
+        # Only the particles within some margin of the grid are read, and the
+        # neighbors of each cell are searched for in a kd-tree of those. This
+        # is exact as long as the furthest neighbor of every cell is closer
+        # than the margin, as any particle left out is further away than
+        # that. Otherwise the margin is widened to that distance, which is
+        # then guaranteed to be enough, and the particles are read again.
+        from yt.utilities.lib.cykdtree import PyKDTree
+
+        DLE = self.ds.domain_left_edge.to("code_length").d
+        DRE = self.ds.domain_right_edge.to("code_length").d
+        le = np.asarray(bounds[0::2])
+        re = np.asarray(bounds[1::2])
+        npart = max(self.ds.particle_type_counts.get(ptype, 0), 1)
+        # Start with the radius of a sphere holding num_neighbors particles
+        # at the mean density.
+        margin = (np.prod(DRE - DLE) * num_neighbors / npart) ** (1.0 / 3.0)
+        names = ["particle_position", "density", "particle_mass", "smoothing_length"]
+        names += [f for _, f in fields if f not in names]
+        while True:
+            rle = np.maximum(le - margin, DLE)
+            rre = np.minimum(re + margin, DRE)
+            whole_domain = (rle <= DLE).all() and (rre >= DRE).all()
+            reg = self.ds.region(
+                self.ds.arr((rle + rre) / 2, "code_length"),
+                self.ds.arr(rle, "code_length"),
+                self.ds.arr(rre, "code_length"),
+            )
+            data = {name: [] for name in names}
+            for chunk in reg.chunks([], "io"):
+                for name in names:
+                    data[name].append(chunk[ptype, name].in_base("code"))
+            data = {name: uconcatenate(data[name]) for name in names}
+            positions = data["particle_position"].d.astype("float64")
+            if positions.shape[0] < num_neighbors and not whole_domain:
+                margin *= 2
+                continue
+            if positions.shape[0] == 0:
+                return [np.zeros(size, dtype="float64") for _ in fields]
+
+            kdtree = PyKDTree(
+                positions,
+                left_edge=np.minimum(rle, le),
+                right_edge=np.maximum(rre, re),
+                periodic=False,
+                leafsize=2 * int(num_neighbors),
+            )
+            order = kdtree.idx.astype("int64")
+            positions = np.ascontiguousarray(positions[order])
+            for name in names[1:]:
+                data[name] = data[name][order]
 
+            buffs = []
+            for field in fields:
                 fi = self.ds._get_field_info(field)
-                interpolate_sph_grid_gather(
+                buff = np.zeros(size, dtype="float64")
+                max_h2 = interpolate_sph_grid_gather(
                     buff,
-                    all_fields["particle_position"],
+                    positions,
                     bounds,
-                    all_fields["smoothing_length"],
-                    all_fields["particle_mass"],
-                    all_fields["density"],
-                    all_fields[field[1]].in_units(fi.units),
-                    self.ds.index.kdtree,
+                    data["smoothing_length"].d,
+                    data["particle_mass"].d,
+                    data["density"].d,
+                    data[field[1]].in_units(fi.units).d,
+                    kdtree,
                     use_normalization=normalize,
                     num_neigh=num_neighbors,
                 )
-
-                self[field] = self.ds.arr(buff, fi.units)
+                if not whole_domain and np.sqrt(max_h2) >= margin:
+                    break
+                buffs.append(buff)
+            else:
+                return buffs
+            margin = np.sqrt(max_h2) * (1 + 1e-8)
 
     def _fill_fields(self, fields):
         fields = [f for f in fields if f not in self.field_data]
@@ -1064,10 +1133,23 @@ class YTCoveringGrid(YTSelectionContainer3D):
         # squeeze dummy dimension we appended above
         return np.squeeze(vals, axis=0)
 
-    def write_to_gdf(self, gdf_path, fields, nprocs=1, field_units=None, **kwargs):
+    def write_to_gdf(
+        self,
+        gdf_path,
+        fields,
+        nprocs=1,
+        field_units=None,
+        slab_size=None,
+        num_threads=None,
+        **kwargs,
+    ):
         r"""
         Write the covering grid data to a GDF file.
 
+        The fields are generated and written a slab of planes along z at a
+        time, so that they are never held in memory as a whole. A pool of
+        threads generates the following slabs while one is written.
+
         Parameters
         ----------
         gdf_path : string
@@ -1080,26 +1162,45 @@ class YTCoveringGrid(YTSelectionContainer3D):
         field_units : dictionary, optional
             Dictionary of units to convert fields to. If not set, fields are
             in their default units.
-        All remaining keyword arguments are passed to
-        yt.utilities.grid_data_format.writer.write_to_gdf.
+        slab_size : integer, optional
+            The number of planes of cells in each slab. By default, slabs
+            are sized to be of a few tens of megabytes.
+        num_threads : integer, optional
+            The number of threads generating the slabs. If not set, the
+            value of ``get_num_threads`` is used, with 0 meaning one thread
+            per core.
+        All remaining keyword arguments, such as the *chunks* and
+        *compression* of the HDF5 datasets, are passed to
+        yt.utilities.grid_data_format.writer.write_slabs_to_gdf.
 
         Examples
         --------
         >>> cube.write_to_gdf("clumps.h5", ["density","temperature"], nprocs=16,
-        ...                   overwrite=True)
+        ...                   overwrite=True, compression="gzip")
         """
-        data = {}
-        for field in fields:
-            if field in field_units:
-                units = field_units[field]
-            else:
-                units = str(self[field].units)
-            data[field] = (self[field].in_units(units).v, units)
+        if field_units is None:
+            field_units = {}
+        fields = ensure_list(fields)
+        names = [field[1] if isinstance(field, tuple) else field for field in fields]
+        slabs = self._iter_slabs(fields, slab_size=slab_size, num_threads=num_threads)
+        start, data = next(slabs)
+        units = {}
+        for name, field in zip(names, fields):
+            units[name] = field_units.get(field, str(data[field].units))
+
+        def gdf_slabs(start, data):
+            while data is not None:
+                yield start, {
+                    name: data[field].in_units(units[name]).v
+                    for name, field in zip(names, fields)
+                }
+                start, data = next(slabs, (None, None))
+
         le = self.left_edge.v
         re = self.right_edge.v
         bbox = np.array([[l, r] for l, r in zip(le, re)])
         ds = load_uniform_grid(
-            data,
+            {},
             self.ActiveDimensions,
             bbox=bbox,
             length_unit=self.ds.length_unit,
@@ -1108,7 +1209,104 @@ class YTCoveringGrid(YTSelectionContainer3D):
             nprocs=nprocs,
             sim_time=self.ds.current_time.v,
         )
-        write_to_gdf(ds, gdf_path, **kwargs)
+        write_slabs_to_gdf(ds, gdf_path, units, gdf_slabs(start, data), **kwargs)
+
+    def _get_slab_bounds(self, slab_size):
+        nz = int(self.ActiveDimensions[2])
+        # Grids one cell thick along an axis are refined differently, so that
+        # slabs are at least two cells thick.
+        starts = list(range(0, nz, max(slab_size, 2)))
+        if len(starts) > 1 and nz - starts[-1] == 1:
+            starts.pop()
+        return list(zip(starts, starts[1:] + [nz]))
+
+    def _get_slab_data(self, fields, start, stop):
+        # The data of the cells between two planes along z, from a grid of
+        # the same kind covering just them.
+        nz = int(self.ActiveDimensions[2])
+        if start == 0 and stop == nz:
+            return {field: self[field] for field in fields}
+        # Smoothed and arbitrary grids are filled from the cells overlapping
+        # them, which differ at the faces of a slab, so that these slabs are
+        # taken from thicker ones overlapping the coarsest cells.
+        if self._type_name == "covering_grid":
+            halo = 0
+        else:
+            dz = self.ds.domain_width[2] / self.ds.domain_dimensions[2]
+            halo = max(int(np.ceil(float(dz / self.dds[2]))), 1)
+        lo = max(start - halo, 0)
+        hi = min(stop + halo, nz)
+        left_edge = self.left_edge.copy()
+        left_edge[2] += lo * self.dds[2]
+        dims = self.ActiveDimensions.copy()
+        dims[2] = hi - lo
+        args = {
+            "level": getattr(self, "level", None),
+            "left_edge": left_edge,
+            "right_edge": left_edge + dims * self.dds,
+            "ActiveDimensions": dims,
+        }
+        slab = getattr(self.ds, self._type_name)(
+            *[args[name] for name in self._con_args],
+            field_parameters=self.field_parameters,
+        )
+        data = {field: slab[field][:, :, start - lo : stop - lo] for field in fields}
+        # The slab is only freed along with its reference cycles, so that its
+        # arrays are let go of right away.
+        slab.field_data.clear()
+        return data
+
+    def _iter_slabs(self, fields, slab_size=None, num_threads=None):
+        """
+        Generate the data of the fields in slabs of planes along z, as
+        (start, data) tuples in order, with a pool of threads creating the
+        following slabs while each one is used.
+        """
+        if slab_size is None:
+            plane = int(np.prod(self.ActiveDimensions[:2]))
+            slab_size = max(_slab_cells // (plane * len(fields)), 1)
+        num_threads = resolve_num_threads(num_threads)
+        # The index is shared by the slabs, so it is set up before the threads
+        self.ds.index
+
+        def get_slab(bounds):
+            return bounds[0], self._get_slab_data(fields, *bounds)
+
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            for bounds in self._get_slab_bounds(slab_size):
+                pending.append(executor.submit(get_slab, bounds))
+                if len(pending) > num_threads:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def _save_fields(self, fh, fields, field_types, **dataset_kwargs):
+        # The fields of the grid are generated and written a slab of planes
+        # along z at a time.
+        grid_fields = [f for f in fields if field_types[f] == "grid"]
+        other_fields = [f for f in fields if f not in grid_fields]
+        super()._save_fields(fh, other_fields, field_types, **dataset_kwargs)
+        if not grid_fields:
+            return
+        dsets = None
+        for start, data in self._iter_slabs(grid_fields):
+            if dsets is None:
+                dsets = [
+                    _create_field_dataset(
+                        fh,
+                        field,
+                        field_types[field],
+                        tuple(self.ActiveDimensions),
+                        data[field].dtype,
+                        str(data[field].units),
+                        **dataset_kwargs,
+                    )
+                    for field in grid_fields
+                ]
+            for dset, field in zip(dsets, grid_fields):
+                arr = data[field]
+                dset[:, :, start : start + arr.shape[2]] = arr.d
 
     def _get_grid_bounds_size(self):
         dd = self.ds.domain_width / 2 ** self.level
@@ -1147,6 +1345,25 @@ class YTCoveringGrid(YTSelectionContainer3D):
         fid = FITSImageData(self, fields, length_unit=length_unit)
         return fid
 
+    def write_fits(self, filename, fields, **kwargs):
+        r"""Write a set of gridded fields to a FITS file a slab at a time.
+
+        Unlike ``to_fits_data``, the fields are generated and written in
+        slabs of planes along z, without holding the whole cube in memory.
+        See :func:`~yt.visualization.fits_image.write_fits` for the keyword
+        arguments, such as ``dtype="float32"``.
+
+        Parameters
+        ----------
+        filename : string
+            The name of the FITS file to write.
+        fields : list of strings
+            The fields to write.
+        """
+        from yt.visualization.fits_image import write_fits
+
+        write_fits(self, filename, fields=fields, **kwargs)
+
 
 class YTArbitraryGrid(YTCoveringGrid):
     """A 3D region with arbitrary bounds and dimensions.
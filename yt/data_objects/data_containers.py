@@ -7,7 +7,7 @@ import numpy as np
 from yt.data_objects.field_data import YTFieldData
 from yt.data_objects.profiles import create_profile
 from yt.fields.field_exceptions import NeedsGridType
-from yt.frontends.ytdata.utilities import save_as_dataset
+from yt.frontends.ytdata.utilities import _create_dataset_file, _save_field
 from yt.funcs import ensure_list, get_output_filename, iterable, mylog
 from yt.units.yt_array import YTArray, YTQuantity, uconcatenate
 from yt.utilities.amr_kdtree.api import AMRKDTree
@@ -551,7 +551,7 @@ class YTDataContainer:
             t[field[-1]] = self[field].to_astropy()
         return t
 
-    def save_as_dataset(self, filename=None, fields=None):
+    def save_as_dataset(self, filename=None, fields=None, **dataset_kwargs):
         r"""Export a data object to a reloadable yt dataset.
 
         This function will take a data object and output a dataset
@@ -569,6 +569,10 @@ class YTDataContainer:
             If this is supplied, it is the list of fields to be saved to
             disk.  If not supplied, all the fields that have been queried
             will be saved.
+        **dataset_kwargs
+            Additional keyword arguments, such as *chunks* and
+            *compression*, are passed to :meth:`~h5py.Group.create_dataset`
+            for the field arrays.
 
         Returns
         -------
@@ -597,17 +601,17 @@ class YTDataContainer:
         keyword = f"{str(self.ds)}_{self._type_name}"
         filename = get_output_filename(filename, keyword, ".h5")
 
-        data = {}
+        # The fields are only generated when written, so that they are not
+        # all held in memory at once.
         if fields is not None:
-            for f in self._determine_fields(fields):
-                data[f] = self[f]
+            data_fields = list(self._determine_fields(fields))
         else:
-            data.update(self.field_data)
+            data_fields = list(self.field_data.keys())
         # get the extra fields needed to reconstruct the container
         tds_fields = tuple([("index", t) for t in self._tds_fields])
-        for f in [f for f in self._container_fields + tds_fields if f not in data]:
-            data[f] = self[f]
-        data_fields = list(data.keys())
+        for f in self._container_fields + tds_fields:
+            if f not in data_fields:
+                data_fields.append(f)
 
         need_grid_positions = False
         need_particle_positions = False
@@ -633,22 +637,19 @@ class YTDataContainer:
             for ax in self.ds.coordinates.axis_order:
                 for ptype in ptypes:
                     p_field = (ptype, f"particle_position_{ax}")
-                    if p_field in self.ds.field_info and p_field not in data:
-                        data_fields.append(field)
+                    if p_field in self.ds.field_info and p_field not in ftypes:
+                        data_fields.append(p_field)
                         ftypes[p_field] = p_field[0]
-                        data[p_field] = self[p_field]
         if need_grid_positions:
             for ax in self.ds.coordinates.axis_order:
                 g_field = ("index", ax)
-                if g_field in self.ds.field_info and g_field not in data:
+                if g_field in self.ds.field_info and g_field not in ftypes:
                     data_fields.append(g_field)
                     ftypes[g_field] = "grid"
-                    data[g_field] = self[g_field]
                 g_field = ("index", "d" + ax)
-                if g_field in self.ds.field_info and g_field not in data:
+                if g_field in self.ds.field_info and g_field not in ftypes:
                     data_fields.append(g_field)
                     ftypes[g_field] = "grid"
-                    data[g_field] = self[g_field]
 
         extra_attrs = dict(
             [
@@ -660,12 +661,20 @@ class YTDataContainer:
         extra_attrs["data_type"] = "yt_data_container"
         extra_attrs["container_type"] = self._type_name
         extra_attrs["dimensionality"] = self._dimensionality
-        save_as_dataset(
-            self.ds, filename, data, field_types=ftypes, extra_attrs=extra_attrs
-        )
+        with _create_dataset_file(self.ds, filename, extra_attrs) as fh:
+            self._save_fields(fh, data_fields, ftypes, **dataset_kwargs)
 
         return filename
 
+    def _save_fields(self, fh, fields, field_types, **dataset_kwargs):
+        # Each field is dropped again once written, unless it was already
+        # there, so that only one of them at a time is held in memory.
+        for field in fields:
+            had_field = field in self.field_data
+            _save_field(fh, field, field_types[field], self[field], **dataset_kwargs)
+            if not had_field:
+                self.field_data.pop(field, None)
+
     def to_glue(self, fields, label="yt", data_collection=None):
         """
         Takes specific *fields* in the container and exports them to
@@ -642,11 +642,17 @@ class SampleAtMaxFieldValues(DerivedQuantity):
     """
 
     def count_values(self, field, sample_fields):
-        # field itself, then index, then the number of sample fields
-        self.num_vals = 1 + len(sample_fields)
+        # the extremum of each chunk and its index within the chunk
+        self.num_vals = 2
 
     def __call__(self, field, sample_fields):
-        rv = super(SampleAtMaxFieldValues, self).__call__(field, sample_fields)
+        # Only the field itself is read from every chunk; the sample fields
+        # are read from the chunk holding the extremum once it is known.
+        ma, chunk_index, index = super(SampleAtMaxFieldValues, self).__call__(
+            field, sample_fields
+        )
+        field = self.data_source._determine_fields(field)[0]
+        rv = (ma,) + self._sample_chunk(field, chunk_index, index, sample_fields)
         if len(rv) == 1:
             rv = rv[0]
         return rv
@@ -654,17 +660,48 @@ class SampleAtMaxFieldValues(DerivedQuantity):
     def process_chunk(self, data, field, sample_fields):
         field = data._determine_fields(field)[0]
         ma = array_like_field(data, self._sign * HUGE, field)
-        vals = [array_like_field(data, -1, sf) for sf in sample_fields]
         maxi = -1
         if data[field].size > 0:
             maxi = self._func(data[field])
             ma = data[field][maxi]
-            vals = [data[sf][maxi] for sf in sample_fields]
-        return (ma,) + tuple(vals)
+        return ma, maxi
 
     def reduce_intermediate(self, values):
         i = self._func(values[0])  # ma is values[0]
-        return [val[i] for val in values]
+        return values[0][i], i, int(values[1][i])
+
+    def _sample_chunk(self, field, chunk_index, index, sample_fields):
+        if index < 0:
+            return tuple(
+                array_like_field(self.data_source, -1, sf) for sf in sample_fields
+            )
+        # Every MPI task iterates over all the chunks, outside of
+        # parallel_objects, and reads the one holding the extremum, so that
+        # they all return the samples without having to broadcast them. The
+        # chunks are iterated to the end, as leaving the loops early would
+        # not restore the state of the data source.
+        rv = None
+        chunking_style = self.data_source._derived_quantity_chunking
+        chunks = self.data_source.chunks([], chunking_style=chunking_style)
+        particles = self.data_source.ds.field_info[field].sampling_type == "particle"
+        for i, data in enumerate(chunks):
+            if i != chunk_index:
+                continue
+            # The number of particles of each grid is only known once they
+            # are read, so the samples of particle fields are taken from the
+            # whole chunk.
+            if chunking_style != "io" or len(data._current_chunk.objs) < 2 or particles:
+                rv = tuple(data[sf][index] for sf in sample_fields)
+                continue
+            # Narrow the read down to the grid holding the extremum; the grids
+            # of an io chunk are concatenated in order.
+            for sub in data.chunks([], "io", chunk_sizing="just_one"):
+                size = sub._current_chunk.data_size
+                if rv is None and index < size:
+                    rv = tuple(sub[sf][index] for sf in sample_fields)
+                index -= size
+        assert rv is not None
+        return rv
 
     def _func(self, arr):
         return np.argmax(arr)
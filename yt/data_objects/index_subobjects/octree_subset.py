@@ -1,3 +1,4 @@
+import hashlib
 from contextlib import contextmanager
 from itertools import product, repeat
 
@@ -8,7 +9,7 @@ import yt.geometry.particle_smooth as particle_smooth
 from yt.data_objects.selection_objects.data_selection_objects import (
     YTSelectionContainer,
 )
-from yt.funcs import issue_deprecation_warning, mylog
+from yt.funcs import issue_deprecation_warning, mylog, resolve_num_threads
 from yt.geometry.particle_oct_container import ParticleOctreeContainer
 from yt.units.dimensions import length
 from yt.units.yt_array import YTArray
@@ -41,6 +42,8 @@ class OctreeSubset(YTSelectionContainer):
     _domain_offset = 0
     _cell_count = -1
     _block_order = "C"
+    _particle_octree = None
+    _oct_neighbors = None
 
     def __init__(
         self, base_region, domain, ds, over_refine_factor=1, num_ghost_zones=0
@@ -131,7 +134,9 @@ class OctreeSubset(YTSelectionContainer):
             self._domain_ind = di
         return self._domain_ind
 
-    def deposit(self, positions, fields=None, method=None, kernel_name="cubic"):
+    def deposit(
+        self, positions, fields=None, method=None, kernel_name="cubic", num_threads=None
+    ):
         r"""Operate on the mesh, in a particle-against-mesh fashion, with
         exclusively local input.
 
@@ -158,6 +163,10 @@ class OctreeSubset(YTSelectionContainer):
             This is the name of the smoothing kernel to use. Current supported
             kernel names include `cubic`, `quartic`, `quintic`, `wendland2`,
             `wendland4`, and `wendland6`.
+        num_threads : int, optional
+            The number of threads used to deposit the particles. Octs are
+            shared out between threads, and the result does not depend on
+            their number. Defaults to the ``numthreads`` configuration option.
 
         Returns
         -------
@@ -199,6 +208,7 @@ class OctreeSubset(YTSelectionContainer):
             fields,
             self.domain_id,
             self._domain_offset,
+            num_threads=resolve_num_threads(num_threads),
         )
         vals = op.finalize()
         if vals is None:
@@ -278,6 +288,7 @@ class OctreeSubset(YTSelectionContainer):
         create_octree=False,
         nneighbors=64,
         kernel_name="cubic",
+        num_threads=None,
     ):
         r"""Operate on the mesh, in a particle-against-mesh fashion, with
         non-local input.
@@ -315,6 +326,9 @@ class OctreeSubset(YTSelectionContainer):
             This is the name of the smoothing kernel to use. Current supported
             kernel names include `cubic`, `quartic`, `quintic`, `wendland2`,
             `wendland4`, and `wendland6`.
+        num_threads : int, optional
+            The number of threads among which the octs are shared out.
+            Defaults to the ``numthreads`` configuration option.
 
         Returns
         -------
@@ -323,28 +337,13 @@ class OctreeSubset(YTSelectionContainer):
         # Here we perform our particle deposition.
         positions.convert_to_units("code_length")
         if create_octree:
-            morton = compute_morton(
-                positions[:, 0],
-                positions[:, 1],
-                positions[:, 2],
-                self.ds.domain_left_edge,
-                self.ds.domain_right_edge,
-            )
-            morton.sort()
-            particle_octree = ParticleOctreeContainer(
-                [1, 1, 1],
-                self.ds.domain_left_edge,
-                self.ds.domain_right_edge,
-                over_refine=self._oref,
+            particle_octree, pdom_ind, oct_neighbors = self._get_particle_octree(
+                positions, nneighbors, self._oref, self.domain_id
             )
-            # This should ensure we get everything within one neighbor of home.
-            particle_octree.n_ref = nneighbors * 2
-            particle_octree.add(morton)
-            particle_octree.finalize(self.domain_id)
-            pdom_ind = particle_octree.domain_ind(self.selector)
         else:
             particle_octree = self.oct_handler
             pdom_ind = self.domain_ind
+            oct_neighbors = self._oct_neighbors
         if fields is None:
             fields = []
         if index_fields is None:
@@ -376,7 +375,10 @@ class OctreeSubset(YTSelectionContainer):
             particle_octree,
             pdom_ind,
             self.ds.geometry,
+            oct_neighbors=oct_neighbors,
+            num_threads=resolve_num_threads(num_threads),
         )
+        self._keep_oct_neighbors(op.oct_neighbors, create_octree)
         # If there are 0s in the smoothing field this will not throw an error,
         # but silently return nans for vals where dividing by 0
         # Same as what is currently occurring, but suppressing the div by zero
@@ -389,8 +391,58 @@ class OctreeSubset(YTSelectionContainer):
             vals = np.asfortranarray(vals)
         return vals
 
+    def _get_particle_octree(self, positions, nneighbors, over_refine, domain_id):
+        # The octree built on the particles, and the lists of neighbors of its
+        # octs, only depend on the particle positions, so they are kept for
+        # the last positions used in this subset (and so its domain);
+        # smoothing several fields of the same particles then only builds them
+        # once. The positions are keyed on a digest of their values, so that
+        # new positions read into a recycled array are not matched, and the
+        # array itself is not kept alive.
+        digest = hashlib.sha1(np.ascontiguousarray(positions)).hexdigest()
+        key = (positions.shape, digest, nneighbors, over_refine, domain_id)
+        cached = self._particle_octree
+        if cached is not None and cached[0] == key:
+            return cached[1:]
+        morton = compute_morton(
+            positions[:, 0],
+            positions[:, 1],
+            positions[:, 2],
+            self.ds.domain_left_edge,
+            self.ds.domain_right_edge,
+        )
+        morton.sort()
+        particle_octree = ParticleOctreeContainer(
+            [1, 1, 1],
+            self.ds.domain_left_edge,
+            self.ds.domain_right_edge,
+            over_refine=over_refine,
+        )
+        # This should ensure we get everything within one neighbor of home.
+        particle_octree.n_ref = nneighbors * 2
+        particle_octree.add(morton)
+        if domain_id is None:
+            particle_octree.finalize()
+        else:
+            particle_octree.finalize(domain_id)
+        pdom_ind = particle_octree.domain_ind(self.selector)
+        self._particle_octree = (key, particle_octree, pdom_ind, None)
+        return particle_octree, pdom_ind, None
+
+    def _keep_oct_neighbors(self, oct_neighbors, built_octree):
+        if built_octree:
+            self._particle_octree = self._particle_octree[:3] + (oct_neighbors,)
+        else:
+            self._oct_neighbors = oct_neighbors
+
     def particle_operation(
-        self, positions, fields=None, method=None, nneighbors=64, kernel_name="cubic"
+        self,
+        positions,
+        fields=None,
+        method=None,
+        nneighbors=64,
+        kernel_name="cubic",
+        num_threads=None,
     ):
         r"""Operate on particles, in a particle-against-particle fashion.
 
@@ -422,6 +474,9 @@ class OctreeSubset(YTSelectionContainer):
             This is the name of the smoothing kernel to use. Current supported
             kernel names include `cubic`, `quartic`, `quintic`, `wendland2`,
             `wendland4`, and `wendland6`.
+        num_threads : int, optional
+            The number of threads among which the particles are shared out.
+            Defaults to the ``numthreads`` configuration option.
 
         Returns
         -------
@@ -430,24 +485,9 @@ class OctreeSubset(YTSelectionContainer):
         """
         # Here we perform our particle deposition.
         positions.convert_to_units("code_length")
-        morton = compute_morton(
-            positions[:, 0],
-            positions[:, 1],
-            positions[:, 2],
-            self.ds.domain_left_edge,
-            self.ds.domain_right_edge,
-        )
-        morton.sort()
-        particle_octree = ParticleOctreeContainer(
-            [1, 1, 1],
-            self.ds.domain_left_edge,
-            self.ds.domain_right_edge,
-            over_refine=1,
+        particle_octree, pdom_ind, oct_neighbors = self._get_particle_octree(
+            positions, nneighbors, 1, None
         )
-        particle_octree.n_ref = nneighbors * 2
-        particle_octree.add(morton)
-        particle_octree.finalize()
-        pdom_ind = particle_octree.domain_ind(self.selector)
         if fields is None:
             fields = []
         cls = getattr(particle_smooth, f"{method}_smooth", None)
@@ -470,7 +510,10 @@ class OctreeSubset(YTSelectionContainer):
             self._domain_offset,
             self.ds.periodicity,
             self.ds.geometry,
+            oct_neighbors=oct_neighbors,
+            num_threads=resolve_num_threads(num_threads),
         )
+        self._keep_oct_neighbors(op.oct_neighbors, True)
         vals = op.finalize()
         if vals is None:
             return
@@ -8,4 +8,4 @@ from .clump_tools import (
     return_bottom_clumps,
 )
 from .clump_validators import add_validator
-from .contour_finder import identify_contours
+from .contour_finder import identify_contour_levels, identify_contours
@@ -1,4 +1,5 @@
 import uuid
+from collections import defaultdict
 
 import numpy as np
 
@@ -9,7 +10,7 @@ from yt.utilities.tree_container import TreeContainer
 
 from .clump_info_items import clump_info_registry
 from .clump_validators import clump_validator_registry
-from .contour_finder import identify_contours
+from .contour_finder import identify_contour_levels, identify_contours
 
 
 def add_contour_field(ds, contour_key):
@@ -33,6 +34,151 @@ def add_contour_field(ds, contour_key):
     )
 
 
+def get_contour_regions(data_source, contour_key, contour_ids):
+    """
+    Return a dictionary of cut regions, keyed by contour id, for the contours
+    found by identify_contours.  The contour labels of the base object are
+    computed once and its cells sorted by label, so each cut region selects
+    its cells by index instead of re-evaluating the contour field.
+    """
+    base_object = getattr(data_source, "base_object", data_source)
+    cells, block_ids = _group_contour_cells(base_object, contour_key, contour_ids)
+    regions = {}
+    for cid in cells:
+        regions[cid] = _make_contour_region(
+            base_object, contour_key, contour_ids, cid, cells[cid], block_ids[cid]
+        )
+    return regions
+
+
+def _group_contour_cells(base_object, contour_key, contour_ids):
+    # Return the indices of the cells of the base object in each contour, and
+    # the ids of the grids holding them.  The indices of all the contours are
+    # views of a single array, which only covers the cells in a contour.
+    add_contour_field(base_object.ds, contour_key)
+    field_parameters = {f"contour_slices_{contour_key}": contour_ids}
+    block_ids = defaultdict(set)
+    for gid, sl_list in contour_ids.items():
+        for _sl, ff in sl_list:
+            for cid in np.unique(ff):
+                block_ids[cid].add(gid)
+    with base_object._field_parameter_state(field_parameters):
+        labels = base_object["index", f"contours_{contour_key}"]
+    labels = labels.d.astype("int64")
+    order = np.argsort(labels, kind="stable")
+    labels = labels[order]
+    first = np.searchsorted(labels, 0)
+    order = order[first:].copy()
+    labels = labels[first:]
+    cids, starts = np.unique(labels, return_index=True)
+    ends = np.append(starts[1:], labels.size)
+    cells = {}
+    for cid, start, end in zip(cids, starts, ends):
+        cells[cid] = order[start:end]
+    return cells, block_ids
+
+
+def _make_contour_region(base_object, contour_key, contour_ids, cid, cells, grids):
+    cr = base_object.cut_region(
+        [f"obj['contours_{contour_key}'] == {cid}"],
+        {f"contour_slices_{contour_key}": contour_ids},
+    )
+    cr._set_cell_selection(cells, grids)
+    return cr
+
+
+class ContourLevel:
+    """
+    The contours of a data object above one of the thresholds of a clump
+    hierarchy, with the cells of the base object in each of them and the
+    contour of the level below that each one lies in.
+    """
+
+    def __init__(self, base_object, contour_ids, parent_level=None):
+        self.base_object = base_object
+        self.contour_key = uuid.uuid4().hex
+        self.contour_ids = contour_ids
+        self.cells, self.block_ids = _group_contour_cells(
+            base_object, self.contour_key, contour_ids
+        )
+        self.parent_level = parent_level
+        self.parents = {}
+        if parent_level is not None:
+            # Contours only shrink as the threshold goes up, so each one lies
+            # in a single contour of the level below; any of its cells tells
+            # which.
+            reps = np.array([cells[0] for cells in self.cells.values()], "int64")
+            for cid, parent in zip(self.cells, parent_level.lookup(reps)):
+                self.parents[cid] = parent
+        self._sorted = None
+        self._by_ancestor = {}
+
+    def lookup(self, indices):
+        """Return the contour ids of the cells with the given indices."""
+        if self._sorted is None:
+            cells = np.concatenate([np.empty(0, "int64")] + list(self.cells.values()))
+            labels = np.concatenate(
+                [np.empty(0, "int64")]
+                + [np.full(c.size, cid, "int64") for cid, c in self.cells.items()]
+            )
+            order = np.argsort(cells)
+            self._sorted = cells[order], labels[order]
+        cells, labels = self._sorted
+        return labels[np.searchsorted(cells, indices)]
+
+    def ancestor(self, cid, level):
+        """Return the contour of the (lower) *level* holding contour *cid*."""
+        current = self
+        while current is not level:
+            cid = current.parents[cid]
+            current = current.parent_level
+        return cid
+
+    def regions(self, parent=None):
+        """
+        Return the cut regions of the contours, keyed by contour id, that lie
+        in *parent*, a ``(level, contour id)`` pair, or of all the contours if
+        it is None.
+        """
+        if parent is None:
+            cids = sorted(self.cells)
+        else:
+            level, parent_cid = parent
+            if level not in self._by_ancestor:
+                by_ancestor = defaultdict(list)
+                for cid in sorted(self.cells):
+                    by_ancestor[self.ancestor(cid, level)].append(cid)
+                self._by_ancestor[level] = by_ancestor
+            cids = self._by_ancestor[level].get(parent_cid, [])
+        regions = {}
+        for cid in cids:
+            regions[cid] = _make_contour_region(
+                self.base_object,
+                self.contour_key,
+                self.contour_ids,
+                cid,
+                self.cells[cid],
+                self.block_ids[cid],
+            )
+        return regions
+
+
+def get_contour_levels(data_source, field, min_vals, max_val):
+    """
+    Identify the contours of *field* in *data_source* above each of the
+    increasing thresholds *min_vals* (and below *max_val*) in a single pass
+    over its tiles, and return a list with a ``ContourLevel`` for each one.
+    """
+    base_object = getattr(data_source, "base_object", data_source)
+    levels = []
+    for _nj, contour_ids in identify_contour_levels(
+        data_source, field, min_vals, max_val
+    ):
+        parent_level = levels[-1] if levels else None
+        levels.append(ContourLevel(base_object, contour_ids, parent_level))
+    return levels
+
+
 class Clump(TreeContainer):
     def __init__(
         self,
@@ -151,29 +297,17 @@ class Clump(TreeContainer):
             max_val = self.max_val
         nj, cids = identify_contours(self.data, self.field, min_val, max_val)
         # Here, cids is the set of slices and values, keyed by the
-        # parent_grid_id, that defines the contours.  So we can figure out all
-        # the unique values of the contours by examining the list here.
-        unique_contours = set([])
-        for sl_list in cids.values():
-            for _sl, ff in sl_list:
-                unique_contours.update(np.unique(ff))
+        # parent_grid_id, that defines the contours.  Contours that no longer
+        # contain any cell (because they were joined) do not get a region.
         contour_key = uuid.uuid4().hex
-        base_object = getattr(self.data, "base_object", self.data)
-        add_contour_field(base_object.ds, contour_key)
-        for cid in sorted(unique_contours):
-            if cid == -1:
-                continue
-            new_clump = base_object.cut_region(
-                [f"obj['contours_{contour_key}'] == {cid}"],
-                {(f"contour_slices_{contour_key}"): cids},
-            )
-            if new_clump["ones"].size == 0:
-                # This is to skip possibly duplicate clumps.
-                # Using "ones" here will speed things up.
-                continue
+        regions = get_contour_regions(self.data, contour_key, cids)
+        self._add_children(regions, contour_key)
+
+    def _add_children(self, regions, contour_key):
+        for cid in sorted(regions):
             self.children.append(
                 Clump(
-                    new_clump,
+                    regions[cid],
                     self.field,
                     parent=self,
                     validators=self.validators,
@@ -411,19 +545,57 @@ class Clump(TreeContainer):
 
 
 def find_clumps(clump, min_val, max_val, d_clump):
+    """
+    Find the children of *clump*: the contours of its field above *min_val*
+    and below *max_val*, then their own children above ``min_val * d_clump``
+    and so on, keeping those which pass the validators of the clump.
+
+    The contours of all the thresholds are identified in a single pass over
+    the data, and the hierarchy is then built from them.
+    """
+    min_vals = []
+    val = min_val
+    while val < max_val:
+        if d_clump <= 1:
+            raise ValueError(f"The clump step must be above 1, got {d_clump}.")
+        min_vals.append(val)
+        val = val * d_clump
+    levels = []
+    if min_vals:
+        levels = get_contour_levels(clump.data, clump.field, min_vals, max_val)
+    _find_clumps(clump, levels, min_vals, max_val, d_clump, 0, None)
+
+
+def _find_clumps(clump, levels, min_vals, max_val, d_clump, index, contour):
+    # The children of *clump* are the contours of levels[index] inside
+    # *contour*, the (level, contour id) of the clump, or None for the clump
+    # find_clumps was called with.
+    min_val = min_vals[index] if index < len(min_vals) else max_val
     mylog.info("Finding clumps: min: %e, max: %e, step: %f", min_val, max_val, d_clump)
-    if min_val >= max_val:
+    if index == len(levels):
         return
-    clump.find_children(min_val, max_val=max_val)
+    level = levels[index]
+    if clump.children:
+        mylog.info("Wiping out existing children clumps: %d.", len(clump.children))
+    clump.children = []
+    clump._add_children(level.regions(contour), level.contour_key)
 
     if len(clump.children) == 1:
-        find_clumps(clump, min_val * d_clump, max_val, d_clump)
+        _find_clumps(clump, levels, min_vals, max_val, d_clump, index + 1, contour)
 
     elif len(clump.children) > 0:
         these_children = []
         mylog.info("Investigating %d children.", len(clump.children))
         for child in clump.children:
-            find_clumps(child, min_val * d_clump, max_val, d_clump)
+            _find_clumps(
+                child,
+                levels,
+                min_vals,
+                max_val,
+                d_clump,
+                index + 1,
+                (level, child.contour_id),
+            )
             if len(child.children) > 0:
                 these_children.append(child)
             elif child._validate():
@@ -1,48 +1,180 @@
+import tempfile
 from collections import defaultdict
 
 import numpy as np
 
-from yt.funcs import get_pbar, mylog
+from yt.config import ytcfg
+from yt.funcs import get_pbar, mylog, threaded_map
 from yt.utilities.lib.contour_finding import (
     ContourTree,
     TileContourTree,
     link_node_contours,
-    update_joins,
 )
 from yt.utilities.lib.partitioned_grid import PartitionedGrid
 
+# Number of cells whose contours are identified concurrently; the field
+# values are only held in memory for one batch of tiles at a time.
+_BATCH_SIZE = 2 ** 24
 
-def identify_contours(data_source, field, min_val, max_val, cached_fields=None):
-    tree = ContourTree()
-    gct = TileContourTree(min_val, max_val)
-    total_contours = 0
-    contours = {}
-    node_ids = []
+
+def _allocate(size, dtype, scratch_dir):
+    if not scratch_dir:
+        return np.empty(size, dtype=dtype)
+    # The file is removed as soon as it is closed, which happens once the
+    # memory map referencing it has been garbage collected.
+    f = tempfile.TemporaryFile(dir=scratch_dir)
+    return np.memmap(f, dtype=dtype, mode="w+", shape=(max(size, 1),))[:size]
+
+
+def identify_contours(
+    data_source, field, min_val, max_val, cached_fields=None, scratch_dir=None
+):
+    """
+    Identify the connected regions of *data_source* where *field* lies
+    between *min_val* and *max_val*.
+
+    Tiles are labelled independently, in batches, by a pool of threads, and
+    then linked together across tile boundaries. The contour ids of every
+    tile are kept in memory unless *scratch_dir* is given (it defaults to the
+    ``contour_scratch_dir`` configuration option), in which case they are
+    stored in temporary files in that directory, so that very large data
+    sources can be handled.
+
+    Returns the number of contours and a dictionary mapping grid ids to lists
+    of ``(slice, contour_ids)`` pairs.
+    """
+    levels = _identify_contour_levels(
+        data_source, field, [min_val], max_val, scratch_dir, copy=False
+    )
+    return next(levels)
+
+
+def identify_contour_levels(
+    data_source, field, min_vals, max_val, cached_fields=None, scratch_dir=None
+):
+    """
+    Identify the connected regions of *data_source* where *field* lies
+    between each of *min_vals* and *max_val*, in one pass over the tiles of
+    *data_source*: the field is only read once, and the tiles are then
+    labelled and linked for each minimum value in turn.
+
+    This is a generator yielding, for each minimum value, the same number of
+    contours and dictionary of contour ids as ``identify_contours``. Tiles
+    without any cell in range are left out of the dictionaries, so that the
+    contours of high values take little memory.
+    """
+    yield from _identify_contour_levels(
+        data_source, field, min_vals, max_val, scratch_dir, copy=True
+    )
+
+
+def _identify_contour_levels(data_source, field, min_vals, max_val, scratch_dir, copy):
+    if scratch_dir is None:
+        scratch_dir = ytcfg.get("yt", "contour_scratch_dir")
     DLE = data_source.ds.domain_left_edge
     masks = dict((g.id, m) for g, m in data_source.blocks)
-    for (g, node, (sl, dims, gi)) in data_source.tiles.slice_traverse():
+    tiles = list(data_source.tiles.slice_traverse())
+    sizes = np.array([int(np.prod(dims)) for _, _, (_, dims, _) in tiles], "int64")
+    offsets = np.concatenate([[0], np.cumsum(sizes)])
+    node_ids = []
+    for ti, (g, node, _) in enumerate(tiles):
         g.field_parameters.update(data_source.field_parameters)
-        node.node_ind = len(node_ids)
-        nid = node.node_id
-        node_ids.append(nid)
-        values = g[field][sl].astype("float64")
-        contour_ids = np.zeros(dims, "int64") - 1
-        mask = masks[g.id][sl].astype("uint8")
-        total_contours += gct.identify_contours(
-            values, contour_ids, mask, total_contours
-        )
-        new_contours = tree.cull_candidates(contour_ids)
-        tree.add_contours(new_contours)
-        # Now we can create a partitioned grid with the contours.
-        LE = (DLE + g.dds * gi).in_units("code_length").ndarray_view()
-        RE = LE + (dims * g.dds).in_units("code_length").ndarray_view()
-        pg = PartitionedGrid(
-            g.id, [contour_ids.view("float64")], mask, LE, RE, dims.astype("int64")
-        )
-        contours[nid] = (g.Level, node.node_ind, pg, sl)
+        node.node_ind = ti
+        node_ids.append(node.node_id)
     node_ids = np.array(node_ids).astype("int64")
-    if node_ids.size == 0:
-        return 0, {}
+    all_ids = _allocate(offsets[-1], "int64", scratch_dir)
+    all_masks = _allocate(offsets[-1], "uint8", scratch_dir)
+    # With several levels, the values are kept, so that the field is read
+    # only once; the contour ids of each level overwrite those of the last.
+    all_values = None
+    if len(min_vals) > 1:
+        all_values = _allocate(offsets[-1], "float64", scratch_dir)
+    for level, min_val in enumerate(min_vals):
+        if len(tiles) == 0:
+            yield 0, {}
+            continue
+
+        def get_values(ti):
+            g, _, (sl, dims, _) = tiles[ti]
+            if all_values is None:
+                return g[field][sl].astype("float64")
+            values = all_values[offsets[ti] : offsets[ti + 1]].reshape(dims)
+            if level == 0:
+                values[:] = g[field][sl]
+            return values
+
+        nj, contour_ids = _link_tile_contours(
+            data_source,
+            tiles,
+            offsets,
+            node_ids,
+            get_values,
+            masks if level == 0 else None,
+            all_ids,
+            all_masks,
+            min_val,
+            max_val,
+            DLE,
+        )
+        if copy:
+            contour_ids = dict(
+                (gid, [(sl, ff.copy()) for sl, ff in sl_list if (ff > -1).any()],)
+                for gid, sl_list in contour_ids.items()
+            )
+            contour_ids = dict((gid, v) for gid, v in contour_ids.items() if v)
+        yield nj, contour_ids
+
+
+def _link_tile_contours(
+    data_source,
+    tiles,
+    offsets,
+    node_ids,
+    get_values,
+    masks,
+    all_ids,
+    all_masks,
+    min_val,
+    max_val,
+    DLE,
+):
+    tree = ContourTree()
+    gct = TileContourTree(min_val, max_val)
+    total_contours = 0
+    contours = {}
+    start = 0
+    while start < len(tiles):
+        stop = start + 1
+        while stop < len(tiles) and offsets[stop + 1] - offsets[start] <= _BATCH_SIZE:
+            stop += 1
+        batch = []
+        for ti in range(start, stop):
+            g, node, (sl, dims, gi) = tiles[ti]
+            values = get_values(ti)
+            contour_ids = all_ids[offsets[ti] : offsets[ti + 1]].reshape(dims)
+            contour_ids[:] = -1
+            mask = all_masks[offsets[ti] : offsets[ti + 1]].reshape(dims)
+            if masks is not None:
+                mask[:] = masks[g.id][sl]
+            batch.append((values, contour_ids, mask))
+        # The tiles are labelled starting from zero, and their ids shifted
+        # below so that they are numbered in the same order as a serial pass.
+        counts = threaded_map(lambda args: gct.identify_contours(*args, 0), batch)
+        for ti, nc in zip(range(start, stop), counts):
+            g, node, (sl, dims, gi) = tiles[ti]
+            values, contour_ids, mask = batch[ti - start]
+            contour_ids[contour_ids > -1] += total_contours
+            total_contours += nc
+            new_contours = tree.cull_candidates(contour_ids)
+            tree.add_contours(new_contours)
+            # Now we can create a partitioned grid with the contours.
+            LE = (DLE + g.dds * gi).in_units("code_length").ndarray_view()
+            RE = LE + (dims * g.dds).in_units("code_length").ndarray_view()
+            pg = PartitionedGrid(
+                g.id, [contour_ids.view("float64")], mask, LE, RE, dims.astype("int64")
+            )
+            contours[node.node_id] = (g.Level, node.node_ind, pg, sl)
+        start = stop
     trunk = data_source.tiles.tree.trunk
     mylog.info("Linking node (%s) contours.", len(contours))
     link_node_contours(trunk, contours, tree, node_ids)
@@ -53,10 +185,16 @@ def identify_contours(data_source, field, min_val, max_val, cached_fields=None):
     contour_ids = defaultdict(list)
     pbar = get_pbar("Updating joins ... ", len(contours))
     final_joins = np.unique(joins[:, 1])
+    # Every contour id is in the tree, so each one can be mapped directly to
+    # the (one-based) index of its final join.
+    order = np.argsort(joins[:, 0])
+    sources = joins[order, 0]
+    ranks = np.searchsorted(final_joins, joins[order, 1]) + 1
     for i, nid in enumerate(sorted(contours)):
         level, node_ind, pg, sl = contours[nid]
         ff = pg.my_data[0].view("int64")
-        update_joins(joins, ff, final_joins)
+        valid = ff > -1
+        ff[valid] = ranks[np.searchsorted(sources, ff[valid])]
         contour_ids[pg.parent_grid_id].append((sl, ff))
         pbar.update(i)
     pbar.finish()
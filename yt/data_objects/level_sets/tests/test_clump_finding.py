@@ -178,3 +178,103 @@ def test_clump_field_parameters():
 
     for c1, c2 in zip(leaf_clumps_1, leaf_clumps_2):
         assert_array_equal(c1["gas", "density"], c2["gas", "density"])
+
+
+def test_contour_regions():
+    from yt.data_objects.level_sets.clump_handling import get_contour_regions
+    from yt.data_objects.level_sets.contour_finder import identify_contours
+    from yt.testing import fake_amr_ds
+
+    ds = fake_amr_ds(fields=("density",))
+    sp = ds.sphere([0.5, 0.5, 0.5], 0.4)
+    field = ("gas", "density")
+    nj, cids = identify_contours(sp, field, 0.5, 1.0)
+    regions = get_contour_regions(sp, "test", cids)
+    assert len(regions) > 1
+    ncells = 0
+    for cid, region in regions.items():
+        cut = sp.cut_region(
+            [f"obj['contours_test'] == {cid}"], {"contour_slices_test": cids}
+        )
+        assert_array_equal(region[field], cut[field])
+        assert_array_equal(region["index", "x"], cut["index", "x"])
+        assert_equal(
+            region.quantities.total_quantity(("gas", "cell_mass")),
+            cut.quantities.total_quantity(("gas", "cell_mass")),
+        )
+        ncells += region[field].size
+    assert_equal(ncells, (sp[field] >= 0.5).sum())
+
+
+def test_identify_contours_scratch_dir():
+    from yt.data_objects.level_sets.contour_finder import identify_contours
+    from yt.testing import fake_amr_ds
+
+    ds = fake_amr_ds(fields=("density",))
+    sp = ds.sphere([0.5, 0.5, 0.5], 0.4)
+    field = ("gas", "density")
+    nj1, cids1 = identify_contours(sp, field, 0.5, 1.0)
+    tmpdir = tempfile.mkdtemp()
+    try:
+        nj2, cids2 = identify_contours(sp, field, 0.5, 1.0, scratch_dir=tmpdir)
+        assert_equal(nj1, nj2)
+        assert_equal(sorted(cids1), sorted(cids2))
+        for gid in cids1:
+            for (sl1, ff1), (sl2, ff2) in zip(cids1[gid], cids2[gid]):
+                assert_equal(sl1, sl2)
+                assert_array_equal(ff1, ff2)
+        del cids2
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+def test_identify_contour_levels():
+    from yt.data_objects.level_sets.contour_finder import (
+        identify_contour_levels,
+        identify_contours,
+    )
+    from yt.testing import fake_amr_ds
+
+    ds = fake_amr_ds(fields=("density",))
+    sp = ds.sphere([0.5, 0.5, 0.5], 0.4)
+    field = ("gas", "density")
+    min_vals = [0.3, 0.5, 0.9]
+    levels = list(identify_contour_levels(sp, field, min_vals, 1.0))
+    assert_equal(len(levels), len(min_vals))
+    for min_val, (nj1, cids1) in zip(min_vals, levels):
+        nj2, cids2 = identify_contours(sp, field, min_val, 1.0)
+        assert_equal(nj1, nj2)
+        # Only the tiles with cells in a contour are kept
+        for gid, sl_list in cids2.items():
+            kept = dict((repr(sl), ff) for sl, ff in cids1.get(gid, []))
+            for sl, ff in sl_list:
+                if (ff > -1).any():
+                    assert_array_equal(kept[repr(sl)], ff)
+                else:
+                    assert repr(sl) not in kept
+
+
+def test_find_clumps_single_pass():
+    # The field is read once for all the thresholds of the hierarchy
+    ds = load_uniform_grid({"density": np.ones((16, 16, 16))}, (16, 16, 16), nprocs=8)
+    reads = []
+
+    def _blobs(field, data):
+        x, y, z = (data["index", ax].d for ax in "xyz")
+        if data["index", "ones"].size > 64:
+            reads.append(data["index", "ones"].size)
+        r1 = (x - 0.3) ** 2 + (y - 0.3) ** 2 + (z - 0.3) ** 2
+        r2 = (x - 0.7) ** 2 + (y - 0.7) ** 2 + (z - 0.7) ** 2
+        return data.ds.arr(np.exp(-r1 / 0.01) + 2 * np.exp(-r2 / 0.01), "g/cm**3")
+
+    ds.add_field(("gas", "blobs"), _blobs, sampling_type="cell", units="g/cm**3")
+    ad = ds.all_data()
+    master_clump = Clump(ad, ("gas", "blobs"))
+    master_clump.add_validator("min_cells", 1)
+    del reads[:]
+    find_clumps(master_clump, 0.01, 4.0, 2.0)
+    assert_equal(len(master_clump.children), 2)
+    assert_equal(sum(reads), 16 ** 3)
+    for child in master_clump.children:
+        assert child["gas", "blobs"].min() >= 0.01
+        assert_equal(child.contour_key, master_clump.children[0].contour_key)
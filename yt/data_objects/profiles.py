@@ -1,3 +1,5 @@
+import copy
+
 import numpy as np
 
 from yt.data_objects.field_data import YTFieldData
@@ -321,6 +323,140 @@ been deprecated, use profile.standard_deviation instead."""
         else:
             return np.linspace(mi, ma, n + 1)
 
+    def rebin(self, n_bins=None, extrema=None):
+        r"""Derive a profile with coarser bins from this one.
+
+        The new bins are computed like those of :func:`create_profile`, and
+        each of them has to be made of whole bins of this profile, so that
+        the binned values can be combined without reading the data again.
+        Sums are added up, while weighted averages and standard deviations
+        are combined using the weights of the bins.
+
+        Parameters
+        ----------
+        n_bins : int or list of ints, optional
+            The number of bins along each bin field. Defaults to the current
+            number of bins.
+        extrema : list of (min, max) tuples, optional
+            The range of each bin field, as quantities or in the current
+            units of the bins. Defaults to the current range; a None bound
+            is left unchanged.
+
+        Raises
+        ------
+        ValueError
+            If the new bin edges are not edges of the current bins.
+        NotImplementedError
+            For accumulated, fractional and particle profiles.
+
+        Examples
+        --------
+
+        >>> profile = yt.create_profile(ad, "density", "temperature",
+        ...                             n_bins=256)
+        >>> coarse = profile.rebin(n_bins=64)
+        """
+        if getattr(self, "fractional", False) or any(
+            ensure_list(getattr(self, "accumulation", False))
+        ):
+            raise NotImplementedError(
+                "Accumulated and fractional profiles cannot be rebinned."
+            )
+        if isinstance(self, ParticleProfile):
+            raise NotImplementedError("Particle profiles cannot be rebinned.")
+        axes = "xyz"[: len(self.bin_fields)]
+        if not iterable(n_bins):
+            n_bins = [n_bins] * len(axes)
+        if extrema is None:
+            extrema = [(None, None)] * len(axes)
+
+        new = copy.copy(self)
+        weight = np.asarray(self.weight, dtype="float64")
+        used = self.used.astype("int64")
+        values = {f: self.field_data[f].d for f in self.field_data}
+        if self.weight_field is not None:
+            std = {f: self.standard_deviation[f].d for f in self.field_data}
+        for axis, ax in enumerate(axes):
+            bins = getattr(self, f"{ax}_bins")
+            old = bins.d
+            n = len(old) - 1 if n_bins[axis] is None else int(n_bins[axis])
+            edges = []
+            for ex, default in zip(extrema[axis], (old[0], old[-1])):
+                if ex is None:
+                    ex = default
+                elif hasattr(ex, "units"):
+                    ex = ex.to(bins.units).d
+                edges.append(float(ex))
+            edges = self._get_bins(edges[0], edges[1], n, getattr(self, f"{ax}_log"))
+            ind = np.clip(np.searchsorted(old, edges), 1, len(old) - 1)
+            ind -= edges - old[ind - 1] < old[ind] - edges
+            if (np.diff(ind) <= 0).any() or not np.allclose(
+                old[ind], edges, rtol=1e-8, atol=0
+            ):
+                raise ValueError(
+                    f"The new {ax} bins do not lie on the edges of the current ones."
+                )
+
+            counts = np.diff(ind)
+            start = ind[:-1] - ind[0]
+
+            def take(arr):
+                return np.take(arr, np.arange(ind[0], ind[-1]), axis=axis)
+
+            def reduce(arr):
+                return np.add.reduceat(take(arr), start, axis=axis)
+
+            used = reduce(used)
+            new_weight = reduce(weight)
+            for f in values:
+                if self.weight_field is None:
+                    values[f] = reduce(values[f])
+                    continue
+                # The weighted means and variances of the bins are combined
+                # as in _finalize_storage.
+                mean = np.zeros_like(new_weight)
+                np.divide(
+                    reduce(values[f] * weight), new_weight, mean, where=new_weight > 0
+                )
+                dev = take(values[f]) - np.repeat(mean, counts, axis=axis)
+                var = np.zeros_like(new_weight)
+                np.divide(
+                    np.add.reduceat(
+                        take(weight) * (take(std[f]) ** 2 + dev ** 2), start, axis=axis
+                    ),
+                    new_weight,
+                    var,
+                    where=new_weight > 0,
+                )
+                values[f] = mean
+                std[f] = np.sqrt(var)
+            weight = new_weight
+
+            new_bins = self.ds.arr(edges, bins.units)
+            setattr(new, f"{ax}_bins", new_bins)
+            setattr(new, ax, 0.5 * (new_bins[1:] + new_bins[:-1]))
+
+        new.size = tuple(getattr(new, f"{ax}_bins").size - 1 for ax in axes)
+        new.used = used > 0
+        blank = ~new.used
+        weight[blank] = 0.0
+        new.field_data = YTFieldData()
+        new.field_units = self.field_units.copy()
+        new.field_map = self.field_map.copy()
+        if self.weight_field is None:
+            new.weight = weight
+        else:
+            new.weight = self.ds.arr(weight, self.weight.units)
+            new.standard_deviation = YTFieldData()
+        for f in values:
+            units = self.field_data[f].units
+            new.field_data[f] = self.ds.arr(values[f], units)
+            new.field_data[f][blank] = 0.0
+            if self.weight_field is not None:
+                new.standard_deviation[f] = self.ds.arr(std[f], units)
+                new.standard_deviation[f][blank] = 0.0
+        return new
+
     def save_as_dataset(self, filename=None):
         r"""Export a profile to a reloadable yt dataset.
 
@@ -1,3 +1,5 @@
+import ast
+
 import numpy as np
 
 from yt.data_objects.selection_objects.data_selection_objects import (
@@ -11,6 +13,30 @@ from yt.utilities.exceptions import YTIllDefinedCutRegion
 from yt.utilities.on_demand_imports import _scipy
 
 
+def _parse_conditional(conditional):
+    """
+    Compile a cut region conditional, and return the code object along with
+    the fields it accesses as ``obj[...]`` with a literal field name.
+    """
+    tree = ast.parse(conditional.strip(), mode="eval")
+    fields = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Subscript):
+            continue
+        if not (isinstance(node.value, ast.Name) and node.value.id == "obj"):
+            continue
+        key = node.slice
+        if isinstance(key, getattr(ast, "Index", ())):
+            key = key.value
+        try:
+            field = ast.literal_eval(key)
+        except ValueError:
+            continue
+        if isinstance(field, (str, tuple)) and field not in fields:
+            fields.append(field)
+    return compile(tree, "<cut_region>", "eval"), fields
+
+
 class YTCutRegion(YTSelectionContainer3D):
     """
     This is a data object designed to allow individuals to apply logical
@@ -78,25 +104,67 @@ class YTCutRegion(YTSelectionContainer3D):
         self.base_object = data_source
         self.locals = locals
         self._selector = None
+        # The conditionals are parsed once; the fields they need are read
+        # along with the requested ones, and the resulting mask is kept for
+        # the duration of a chunk.
+        self._compiled_conditionals = []
+        self._conditional_fields = []
+        for cond in self.conditionals:
+            code, fields = _parse_conditional(cond)
+            self._compiled_conditionals.append(code)
+            for field in fields:
+                if field not in self._conditional_fields:
+                    self._conditional_fields.append(field)
+        self._cond_ind_cache = None
+        self._cell_selection = None
         # Need to interpose for __getitem__, fwidth, fcoords, icoords, iwidth,
         # ires and get_data
 
+    def _set_cell_selection(self, indices, block_ids=None):
+        """
+        Select cells by their index into the (unchunked) base object, rather
+        than by evaluating the conditionals over all of it.  The conditionals
+        must select the same cells; they are still used when the base object
+        is read in chunks.  If given, *block_ids* are the ids of the only
+        blocks of the base object that contain selected cells.
+        """
+        size = self.base_object["index", "ones"].size
+        self._cell_selection = (np.asarray(indices, dtype="int64"), size, block_ids)
+
     def chunks(self, fields, chunking_style, **kwargs):
+        if chunking_style == "all" and self._cell_selection is not None:
+            # The selected cells index the whole base object, so a single
+            # chunk is served without re-reading it.
+            self.get_data(fields)
+            yield self
+            return
         # We actually want to chunk the sub-chunk, not ourselves.  We have no
         # chunks to speak of, as we do not data IO.
         for chunk in self.index._chunk(self.base_object, chunking_style, **kwargs):
-            with self.base_object._chunked_read(chunk):
-                with self._chunked_read(chunk):
-                    self.get_data(fields)
-                    yield self
+            try:
+                with self.base_object._chunked_read(chunk):
+                    with self._chunked_read(chunk):
+                        self.get_data(fields)
+                        yield self
+            finally:
+                self._cond_ind_cache = None
 
     def get_data(self, fields=None):
         fields = ensure_list(fields)
-        self.base_object.get_data(fields)
+        obj = self.base_object
+        if self._use_cell_selection:
+            obj.get_data(fields)
+            mesh_shape = (self._cell_selection[1],)
+        else:
+            with obj._field_parameter_state(self.field_parameters):
+                obj.get_data(fields + self._conditional_fields)
+            mesh_shape = None
         ind = self._cond_ind
+        if mesh_shape is None:
+            mesh_shape = ind.shape
         for field in fields:
             f = self.base_object[field]
-            if f.shape != ind.shape:
+            if f.shape != mesh_shape:
                 parent = getattr(self, "parent", self.base_object)
                 self.field_data[field] = parent[field][self._part_ind(field[0])]
             else:
@@ -106,18 +174,43 @@ class YTCutRegion(YTSelectionContainer3D):
     def blocks(self):
         # We have to take a slightly different approach here.  Note that all
         # that .blocks has to yield is a 3D array and a mask.
+        block_ids = None
+        if self._cell_selection is not None:
+            block_ids = self._cell_selection[2]
         for obj, m in self.base_object.blocks:
+            if block_ids is not None and obj.id not in block_ids:
+                continue
             m = m.copy()
             with obj._field_parameter_state(self.field_parameters):
-                for cond in self.conditionals:
-                    ss = eval(cond)
+                for code in self._compiled_conditionals:
+                    ss = eval(code)
                     m = np.logical_and(m, ss, m)
             if not np.any(m):
                 continue
             yield obj, m
 
+    @property
+    def _use_cell_selection(self):
+        # The selected cells index the base object as a whole, so they can
+        # only be used when neither object is being read in smaller chunks.
+        if self._cell_selection is None:
+            return False
+        size = self._cell_selection[1]
+        for chunk in (self._current_chunk, self.base_object._current_chunk):
+            if chunk is None:
+                continue
+            if chunk.chunk_type != "all" or chunk.data_size != size:
+                return False
+        return True
+
     @property
     def _cond_ind(self):
+        if self._use_cell_selection:
+            return self._cell_selection[0]
+        chunk = self._current_chunk
+        cache = self._cond_ind_cache
+        if chunk is not None and cache is not None and cache[0] is chunk:
+            return cache[1]
         ind = None
         obj = self.base_object
         locals = self.locals.copy()
@@ -128,13 +221,16 @@ class YTCutRegion(YTSelectionContainer3D):
             )
         locals["obj"] = obj
         with obj._field_parameter_state(self.field_parameters):
-            for cond in self.conditionals:
-                res = eval(cond, locals)
+            obj.get_data(self._conditional_fields)
+            for code in self._compiled_conditionals:
+                res = eval(code, locals)
                 if ind is None:
                     ind = res
                 if ind.shape != res.shape:
                     raise YTIllDefinedCutRegion(self.conditionals)
                 np.logical_and(res, ind, ind)
+        if chunk is not None:
+            self._cond_ind_cache = (chunk, ind)
         return ind
 
     def _part_ind_KDTree(self, ptype):
@@ -1366,39 +1366,32 @@ class YTSelectionContainer3D(YTSelectionContainer):
         studied and used to 'paint' their source grids, thus enabling
         them to be plotted.
 
-        Note that this function *can* return a connected set object that has no
-        member values.
+        Contours that were joined to another one, and hence have no member
+        values left, are not returned.
         """
         if log_space:
             cons = np.logspace(np.log10(min_val), np.log10(max_val), num_levels + 1)
         else:
             cons = np.linspace(min_val, max_val, num_levels + 1)
+        from yt.data_objects.level_sets.clump_handling import get_contour_regions
+        from yt.data_objects.level_sets.contour_finder import (
+            identify_contour_levels,
+            identify_contours,
+        )
+
+        if cumulative:
+            # All the levels share the same maximum, so their contours are
+            # identified in a single pass over the data.
+            found = identify_contour_levels(self, field, cons[:num_levels], max_val)
+        else:
+            found = (
+                identify_contours(self, field, cons[level], cons[level + 1])
+                for level in range(num_levels)
+            )
         contours = {}
-        for level in range(num_levels):
-            contours[level] = {}
-            if cumulative:
-                mv = max_val
-            else:
-                mv = cons[level + 1]
-            from yt.data_objects.level_sets.api import identify_contours
-            from yt.data_objects.level_sets.clump_handling import add_contour_field
-
-            nj, cids = identify_contours(self, field, cons[level], mv)
-            unique_contours = set([])
-            for sl_list in cids.values():
-                for _sl, ff in sl_list:
-                    unique_contours.update(np.unique(ff))
+        for level, (_nj, cids) in enumerate(found):
             contour_key = uuid.uuid4().hex
-            # In case we're a cut region already...
-            base_object = getattr(self, "base_object", self)
-            add_contour_field(base_object.ds, contour_key)
-            for cid in sorted(unique_contours):
-                if cid == -1:
-                    continue
-                contours[level][cid] = base_object.cut_region(
-                    [f"obj['contours_{contour_key}'] == {cid}"],
-                    {f"contour_slices_{contour_key}": cids},
-                )
+            contours[level] = get_contour_regions(self, contour_key, cids)
         return cons, contours
 
     def _get_bbox(self):
@@ -2,6 +2,7 @@ import numpy as np
 
 import yt
 from yt import particle_filter
+from yt.fields.field_detector import FieldDetector
 from yt.testing import (
     assert_almost_equal,
     assert_equal,
@@ -143,6 +144,41 @@ def test_sample_at_max_field_values():
             assert_equal(ad["velocity_x"][mi], vm)
 
 
+def test_sample_fields_read_at_extremum_only():
+    # The sample fields are only read in the chunk holding the extremum
+    ds = fake_random_ds(
+        16, nprocs=8, fields=("density", "temperature"), units=("g/cm**3", "K")
+    )
+    sizes = []
+
+    def _sampled(field, data):
+        if not isinstance(data, FieldDetector):
+            sizes.append(data["gas", "temperature"].size)
+        return data["gas", "temperature"]
+
+    ds.add_field(
+        ("gas", "sampled"), _sampled, sampling_type="cell", units="K", take_log=False
+    )
+    ad = ds.all_data()
+    mv, temp = ad.quantities.sample_at_max_field_values("density", ["sampled"])
+    mi = np.argmax(ad["density"])
+    assert_equal(mv, ad["density"][mi])
+    assert_equal(temp, ad["temperature"][mi])
+    assert_equal(len(sizes), 1)
+    assert sizes[0] < ad["density"].size
+
+    # Particle fields are sampled in the whole chunk holding the extremum
+    for ds in (fake_particle_ds(), fake_random_ds(16, nprocs=8, particles=1000)):
+        ad = ds.all_data()
+        field = ("all", "particle_mass")
+        mv, px = ad.quantities.sample_at_max_field_values(
+            field, [("all", "particle_position_x")]
+        )
+        mi = np.argmax(ad[field])
+        assert_equal(mv, ad[field][mi])
+        assert_equal(px, ad["all", "particle_position_x"][mi])
+
+
 def test_in_memory_sph_derived_quantities():
     ds = fake_sph_orientation_ds()
     ad = ds.all_data()
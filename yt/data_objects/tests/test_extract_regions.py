@@ -104,3 +104,49 @@ def test_chained_cut_region():
     assert_equal(
         cr12.quantities.total_quantity(field), cr12c.quantities.total_quantity(field)
     )
+
+
+def test_cut_region_selector():
+    ds = fake_amr_ds(fields=("Density",))
+    sp = ds.sphere([0.5, 0.5, 0.5], 0.3)
+    cr = sp.cut_region(["obj['Density'] > 0.5"])
+    selector = cr.selector
+    ncells = 0
+    for g in ds.index.grids:
+        mask = selector.fill_mask(g)
+        if mask is not None:
+            ncells += mask.sum()
+    assert_equal(ncells, cr["index", "ones"].size)
+
+
+def test_cut_region_conditional_fields():
+    from yt.data_objects.selection_objects.cut_region import _parse_conditional
+
+    _, fields = _parse_conditional(
+        "(obj['density'] > 0.5) & (obj['gas', 'temperature'].in_units('K') < 1e6)"
+    )
+    assert_equal(fields, ["density", ("gas", "temperature")])
+    _, fields = _parse_conditional("~np.isnan(obj[name]) & (obj['density'] > 0)")
+    assert_equal(fields, ["density"])
+
+
+def test_cut_region_fused_read():
+    # Fields read together through a chain of cuts match the fields read one
+    # at a time
+    ds = fake_random_ds(32, nprocs=8, fields=("density", "temperature", "velocity_x"))
+    fields = [("gas", "density"), ("gas", "temperature"), ("gas", "velocity_x")]
+
+    def chain():
+        dd = ds.all_data()
+        return dd.include_above("density", 0.25).include_below("temperature", 0.75)
+
+    fused = chain()
+    fused.get_data(fields)
+    for field in fields:
+        separate = chain()
+        assert_equal(fused[field], separate[field])
+
+    dd = ds.all_data()
+    t = (dd["gas", "density"] > 0.25) & (dd["gas", "temperature"] < 0.75)
+    for field in fields:
+        assert_equal(np.sort(fused[field]), np.sort(dd[field][t]))
@@ -429,6 +429,42 @@ def test_particle_profile_negative_field():
         )
 
 
+def test_profile_rebin():
+    ds = fake_random_ds(32, fields=_fields, units=_units)
+    dd = ds.all_data()
+    for weight_field in [None, "density"]:
+        fine = create_profile(
+            dd,
+            ["density", "temperature"],
+            ["tribbles"],
+            n_bins=[32, 16],
+            weight_field=weight_field,
+        )
+        extrema = {"density": (fine.x_bins[8], fine.x_bins[24])}
+        extrema["temperature"] = (fine.y_bins[0], fine.y_bins[-1])
+        coarse = fine.rebin([8, 8], [extrema["density"], extrema["temperature"]])
+        direct = create_profile(
+            dd,
+            ["density", "temperature"],
+            ["tribbles"],
+            n_bins=[8, 8],
+            extrema=extrema,
+            weight_field=weight_field,
+        )
+        assert_rel_equal(coarse.x_bins.d, direct.x_bins.d, 12)
+        assert_rel_equal(coarse.y_bins.d, direct.y_bins.d, 12)
+        assert_equal(coarse.used, direct.used)
+        assert_rel_equal(coarse["tribbles"].d, direct["tribbles"].d, 10)
+        if weight_field is not None:
+            assert_rel_equal(
+                coarse.standard_deviation["stream", "tribbles"].d,
+                direct.standard_deviation["stream", "tribbles"].d,
+                8,
+            )
+    # New bin edges must coincide with the existing ones
+    assert_raises(ValueError, fine.rebin, [5, 8])
+
+
 def test_profile_zero_weight():
     def DMparticles(pfilter, data):
         filter = data[(pfilter.filtered_type, "particle_type")] == 1
@@ -1,7 +1,12 @@
 import numpy as np
 
 from yt import SlicePlot
-from yt.testing import assert_equal, fake_sph_grid_ds, fake_sph_orientation_ds
+from yt.testing import (
+    assert_allclose,
+    assert_equal,
+    fake_sph_grid_ds,
+    fake_sph_orientation_ds,
+)
 
 
 def test_point():
@@ -332,3 +337,51 @@ def test_covering_grid_gather():
     cg_dens = cg[field].to("g*cm**-3").d
 
     assert_equal(ag_dens, cg_dens)
+
+
+def test_gather_grid_subregion():
+    from yt import load_particles
+    from yt.utilities.lib.cykdtree import PyKDTree
+    from yt.utilities.lib.pixelization_routines import interpolate_sph_grid_gather
+
+    np.random.seed(0x4D3D3D3)
+    npart = 5000
+    pos = np.random.random((npart, 3))
+    hsml = np.random.uniform(0.02, 0.08, npart)
+    dens = np.random.uniform(0.5, 2.0, npart)
+    data = {
+        "particle_position_x": (pos[:, 0], "cm"),
+        "particle_position_y": (pos[:, 1], "cm"),
+        "particle_position_z": (pos[:, 2], "cm"),
+        "particle_mass": (np.ones(npart), "g"),
+        "smoothing_length": (hsml, "cm"),
+        "density": (dens, "g/cm**3"),
+    }
+    bbox = np.array([[0, 1], [0, 1], [0, 1]])
+    ds = load_particles(data=data, length_unit=1.0, bbox=bbox)
+    ds.sph_smoothing_style = "gather"
+    ds.num_neighbors = 16
+    field = ("io", "density")
+
+    left_edge = np.array([0.3, 0.0, 0.35])
+    right_edge = np.array([0.6, 0.55, 0.7])
+    dims = np.array([6, 5, 7])
+    ag = ds.arbitrary_grid(left_edge, right_edge, dims=dims)
+
+    # Compare with a search over every particle in the domain
+    kdtree = PyKDTree(pos, left_edge=bbox[:, 0], right_edge=bbox[:, 1], leafsize=32)
+    order = kdtree.idx.astype("int64")
+    expected = np.zeros(dims)
+    bounds = np.array(list(zip(left_edge, right_edge)), dtype="float64").ravel()
+    interpolate_sph_grid_gather(
+        expected,
+        np.ascontiguousarray(pos[order]),
+        bounds,
+        hsml[order],
+        np.ones(npart),
+        dens[order],
+        dens[order],
+        kdtree,
+        num_neigh=16,
+    )
+    assert_allclose(ag[field].d, expected, rtol=1e-10)
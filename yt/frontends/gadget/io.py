@@ -12,6 +12,61 @@ from yt.utilities.on_demand_imports import _h5py as h5py
 from .definitions import SNAP_FORMAT_2_OFFSET, gadget_hdf5_ptypes
 
 
+class _ReadPlan:
+    """
+    Translate a selection mask over the particles [si, ei) of a file into a
+    small number of contiguous hyperslabs, so that only the parts of the
+    datasets that contain selected particles are read from disk.
+
+    Runs of selected particles separated by less than *max_gap* unselected
+    ones are merged, and the number of hyperslabs is capped to
+    *max_ranges*, so that the number of read calls stays small.
+    """
+
+    max_gap = 4096
+    max_ranges = 64
+
+    def __init__(self, mask, si, ei):
+        self.si = si
+        self.ei = ei
+        if isinstance(mask, slice):
+            self.ranges = None
+            self.mask = mask
+            return
+        ind = np.flatnonzero(mask)
+        if ind.size == 0:
+            self.ranges = []
+            self.mask = mask[:0]
+            return
+        # Find the runs of selected particles, and the gaps between them
+        breaks = np.flatnonzero(np.diff(ind) > 1)
+        starts = np.concatenate([ind[:1], ind[breaks + 1]])
+        ends = np.concatenate([ind[breaks] + 1, ind[-1:] + 1])
+        gaps = starts[1:] - ends[:-1]
+        max_gap = self.max_gap
+        if gaps.size >= self.max_ranges:
+            max_gap = max(max_gap, np.sort(gaps)[-self.max_ranges])
+        keep = np.flatnonzero(gaps > max_gap)
+        starts = np.concatenate([starts[:1], starts[keep + 1]])
+        ends = np.concatenate([ends[keep], ends[-1:]])
+        self.ranges = list(zip(starts.tolist(), ends.tolist()))
+        self.mask = np.concatenate([mask[start:end] for start, end in self.ranges])
+
+    def read(self, dataset, col=None):
+        """Read the selected elements of an (optionally column of) dataset."""
+        si = self.si
+        if col is None:
+            col = Ellipsis
+        if self.ranges is None:
+            return dataset[si : self.ei, col]
+        if len(self.ranges) == 0:
+            return dataset[si:si, col]
+        data = np.concatenate(
+            [dataset[si + start : si + end, col] for start, end in self.ranges]
+        )
+        return data[self.mask, ...]
+
+
 class IOHandlerGadgetHDF5(IOHandlerSPH):
     _dataset_type = "gadget_hdf5"
     _vector_fields = ("Coordinates", "Velocity", "Velocities")
@@ -171,6 +226,7 @@ class IOHandlerGadgetHDF5(IOHandlerSPH):
                 if data_file.total_particles[ptype] == 0:
                     continue
                 g = f[f"/{ptype}"]
+                coords = None
                 if getattr(selector, "is_all_data", False):
                     mask = slice(None, None, None)
                     mask_sum = data_file.total_particles[ptype]
@@ -188,9 +244,11 @@ class IOHandlerGadgetHDF5(IOHandlerSPH):
                     )
                     if mask is not None:
                         mask_sum = mask.sum()
-                    del coords
                 if mask is None:
                     continue
+                # The selection is turned once into a list of contiguous
+                # ranges of the file, which is then used for all the fields.
+                plan = _ReadPlan(mask, si, ei)
                 for field in field_list:
 
                     if field in ("Mass", "Masses") and ptype not in self.var_mass:
@@ -199,16 +257,16 @@ class IOHandlerGadgetHDF5(IOHandlerSPH):
                         data[:] = self.ds["Massarr"][ind]
                     elif field in self._element_names:
                         rfield = "ElementAbundance/" + field
-                        data = g[rfield][si:ei][mask, ...]
+                        data = plan.read(g[rfield])
                     elif field.startswith("Metallicity_"):
                         col = int(field.rsplit("_", 1)[-1])
-                        data = g["Metallicity"][si:ei, col][mask]
+                        data = plan.read(g["Metallicity"], col)
                     elif field.startswith("GFM_Metals_"):
                         col = int(field.rsplit("_", 1)[-1])
-                        data = g["GFM_Metals"][si:ei, col][mask]
+                        data = plan.read(g["GFM_Metals"], col)
                     elif field.startswith("Chemistry_"):
                         col = int(field.rsplit("_", 1)[-1])
-                        data = g["ChemistryAbundances"][si:ei, col][mask]
+                        data = plan.read(g["ChemistryAbundances"], col)
                     elif field == "smoothing_length":
                         # This is for frontends which do not store
                         # the smoothing length on-disk, so we do not
@@ -221,10 +279,15 @@ class IOHandlerGadgetHDF5(IOHandlerSPH):
                                 g["Coordinates"].shape,
                             ).astype("float64")
                         data = hsmls[mask]
+                    elif field == "Coordinates" and coords is not None:
+                        # Already read to compute the selection
+                        dt = g["Coordinates"].dtype.newbyteorder("N")
+                        data = coords[mask].astype(dt)
                     else:
-                        data = g[field][si:ei][mask, ...]
+                        data = plan.read(g[field])
 
                     yield (ptype, field), data
+                del coords
             f.close()
 
     def _count_particles(self, data_file):
@@ -356,19 +419,15 @@ class IOHandlerGadgetBinary(IOHandlerSPH):
             for obj in chunk.objs:
                 data_files.update(obj.data_files)
         for data_file in sorted(data_files, key=lambda x: (x.filename, x.start)):
-            poff = data_file.field_offsets
-            tp = data_file.total_particles
-            f = open(data_file.filename, "rb")
+            mm = self._open_memmap(data_file)
             for ptype in ptf:
-                f.seek(poff[ptype, "Coordinates"], os.SEEK_SET)
-                pos = self._read_field_from_file(f, tp[ptype], "Coordinates")
+                pos = self._read_field(mm, data_file, ptype, "Coordinates")
                 if ptype == self.ds._sph_ptypes[0]:
-                    f.seek(poff[ptype, "SmoothingLength"], os.SEEK_SET)
-                    hsml = self._read_field_from_file(f, tp[ptype], "SmoothingLength")
+                    hsml = self._read_field(mm, data_file, ptype, "SmoothingLength")
                 else:
                     hsml = 0.0
                 yield ptype, (pos[:, 0], pos[:, 1], pos[:, 2]), hsml
-            f.close()
+            del mm
 
     def _read_particle_fields(self, chunks, ptf, selector):
         data_files = set([])
@@ -376,22 +435,17 @@ class IOHandlerGadgetBinary(IOHandlerSPH):
             for obj in chunk.objs:
                 data_files.update(obj.data_files)
         for data_file in sorted(data_files, key=lambda x: (x.filename, x.start)):
-            poff = data_file.field_offsets
             tp = data_file.total_particles
-            f = open(data_file.filename, "rb")
+            mm = self._open_memmap(data_file)
             for ptype, field_list in sorted(ptf.items()):
                 if tp[ptype] == 0:
                     continue
                 if getattr(selector, "is_all_data", False):
                     mask = slice(None, None, None)
                 else:
-                    f.seek(poff[ptype, "Coordinates"], os.SEEK_SET)
-                    pos = self._read_field_from_file(f, tp[ptype], "Coordinates")
+                    pos = self._read_field(mm, data_file, ptype, "Coordinates")
                     if ptype == self.ds._sph_ptypes[0]:
-                        f.seek(poff[ptype, "SmoothingLength"], os.SEEK_SET)
-                        hsml = self._read_field_from_file(
-                            f, tp[ptype], "SmoothingLength"
-                        )
+                        hsml = self._read_field(mm, data_file, ptype, "SmoothingLength")
                     else:
                         hsml = 0.0
                     mask = selector.select_points(pos[:, 0], pos[:, 1], pos[:, 2], hsml)
@@ -410,13 +464,24 @@ class IOHandlerGadgetBinary(IOHandlerSPH):
                         data[:] = m
                         yield (ptype, field), data
                         continue
-                    f.seek(poff[ptype, field], os.SEEK_SET)
-                    data = self._read_field_from_file(f, tp[ptype], field)
-                    data = data[mask, ...]
+                    # Only the selected particles are read from the mapping
+                    data = self._read_field(mm, data_file, ptype, field, mask)
                     yield (ptype, field), data
-            f.close()
-
-    def _read_field_from_file(self, f, count, name):
+            del mm
+
+    def _open_memmap(self, data_file):
+        """
+        Return a read-only memory map of the file containing *data_file*,
+        from which the blocks of each field can be viewed without copy.
+        """
+        return np.memmap(data_file.filename, dtype="uint8", mode="r")
+
+    def _get_field_view(self, mm, data_file, ptype, name):
+        """
+        Return a view on the block of field *name* for particle type *ptype*
+        in the memory map *mm*, as computed by `_calculate_field_offsets`.
+        """
+        count = data_file.total_particles[ptype]
         if count == 0:
             return
         if name == "ParticleIDs":
@@ -425,32 +490,35 @@ class IOHandlerGadgetBinary(IOHandlerSPH):
             dt = self._endian + self._float_type
         dt = np.dtype(dt)
         if name in self._vector_fields:
-            count *= self._vector_fields[name]
-        arr = np.fromfile(f, dtype=dt, count=count)
-        # ensure data are in native endianness to avoid errors
-        # when field data are passed to cython
-        dt = dt.newbyteorder("N")
-        arr = arr.astype(dt)
-        if name in self._vector_fields:
-            factor = self._vector_fields[name]
-            arr = arr.reshape((count // factor, factor), order="C")
+            shape = (count, self._vector_fields[name])
+        else:
+            shape = (count,)
+        offset = data_file.field_offsets[ptype, name]
+        return np.ndarray(shape, dtype=dt, buffer=mm, offset=offset)
+
+    def _read_field(self, mm, data_file, ptype, name, mask=None):
+        arr = self._get_field_view(mm, data_file, ptype, name)
+        if arr is None:
+            return
+        if mask is not None:
+            # Only the pages holding the selected particles are read
+            arr = arr[mask, ...]
+        if not arr.dtype.isnative:
+            # ensure data are in native endianness to avoid errors
+            # when field data are passed to cython
+            arr = arr.astype(arr.dtype.newbyteorder("N"))
         return arr
 
     def _yield_coordinates(self, data_file, needed_ptype=None):
         self._float_type = data_file.ds._header.float_type
         self._field_size = np.dtype(self._float_type).itemsize
-        with open(data_file.filename, "rb") as f:
-            # We add on an additionally 4 for the first record.
-            f.seek(data_file._position_offset + 4)
-            for ptype, count in data_file.total_particles.items():
-                if count == 0:
-                    continue
-                if needed_ptype is not None and ptype != needed_ptype:
-                    continue
-                # The first total_particles * 3 values are positions
-                pp = np.fromfile(f, dtype=self._float_type, count=count * 3)
-                pp.shape = (count, 3)
-                yield ptype, pp
+        mm = self._open_memmap(data_file)
+        for ptype, count in data_file.total_particles.items():
+            if count == 0:
+                continue
+            if needed_ptype is not None and ptype != needed_ptype:
+                continue
+            yield ptype, self._read_field(mm, data_file, ptype, "Coordinates")
 
     def _get_smoothing_length(self, data_file, position_dtype, position_shape):
         ret = self._get_field(data_file, "SmoothingLength", "Gas")
@@ -463,12 +531,8 @@ class IOHandlerGadgetBinary(IOHandlerSPH):
         return ret
 
     def _get_field(self, data_file, field, ptype):
-        poff = data_file.field_offsets
-        tp = data_file.total_particles
-        with open(data_file.filename, "rb") as f:
-            f.seek(poff[ptype, field], os.SEEK_SET)
-            pp = self._read_field_from_file(f, tp[ptype], field)
-        return pp
+        mm = self._open_memmap(data_file)
+        return self._read_field(mm, data_file, ptype, field)
 
     def _count_particles(self, data_file):
         si, ei = data_file.start, data_file.end
@@ -4,10 +4,13 @@ import tempfile
 from collections import OrderedDict
 from itertools import product
 
+import numpy as np
+
 import yt
 from yt.frontends.gadget.api import GadgetDataset, GadgetHDF5Dataset
+from yt.frontends.gadget.io import _ReadPlan
 from yt.frontends.gadget.testing import fake_gadget_binary
-from yt.testing import ParticleSelectionComparison, requires_file
+from yt.testing import ParticleSelectionComparison, assert_equal, requires_file
 from yt.utilities.answer_testing.framework import data_dir_load, requires_ds, sph_answer
 
 isothermal_h5 = "IsothermalCollapse/snap_505.hdf5"
@@ -51,6 +54,9 @@ def test_gadget_binary():
         ds = yt.load(fake_snap, header_spec=header_spec)
         assert isinstance(ds, GadgetDataset)
         ds.field_list
+        # Check that the partial (memory-mapped) reads are consistent
+        psc = ParticleSelectionComparison(ds)
+        psc.run_defaults()
         try:
             os.remove(fake_snap)
         except FileNotFoundError:
@@ -60,6 +66,26 @@ def test_gadget_binary():
     shutil.rmtree(tmpdir)
 
 
+def test_read_plan():
+    np.random.seed(0x4D3D3D3)
+    data = np.random.random((10000, 3))
+    si, ei = 1000, 9000
+    masks = [
+        np.zeros(ei - si, dtype=bool),
+        np.ones(ei - si, dtype=bool),
+        np.random.random(ei - si) > 0.5,
+        np.random.random(ei - si) > 0.999,
+        np.arange(ei - si) % 5000 < 10,
+    ]
+    for mask in masks:
+        plan = _ReadPlan(mask, si, ei)
+        assert len(plan.ranges) <= _ReadPlan.max_ranges
+        assert_equal(plan.read(data), data[si:ei][mask])
+        assert_equal(plan.read(data, 1), data[si:ei, 1][mask])
+    plan = _ReadPlan(slice(None), si, ei)
+    assert_equal(plan.read(data), data[si:ei])
+
+
 @requires_file(isothermal_h5)
 def test_gadget_hdf5():
     assert isinstance(
@@ -29,10 +29,12 @@ class HTTPStreamDataset(ParticleDataset):
         unit_system="cgs",
         index_order=None,
         index_filename=None,
+        cache_dir=None,
     ):
         if get_requests() is None:
             raise ImportError("This functionality depends on the requests package")
         self.base_url = base_url
+        self.cache_dir = cache_dir
         super(HTTPStreamDataset, self).__init__(
             "",
             dataset_type=dataset_type,
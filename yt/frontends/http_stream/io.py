@@ -1,6 +1,7 @@
 import numpy as np
 
-from yt.funcs import get_requests, mylog
+from yt.funcs import get_requests
+from yt.utilities.http_client import HTTPClient
 from yt.utilities.io_handler import BaseIOHandler
 from yt.utilities.lib.geometry_utils import compute_morton
 
@@ -13,21 +14,45 @@ class IOHandlerHTTPStream(BaseIOHandler):
         if get_requests() is None:
             raise ImportError("This functionality depends on the requests package")
         self._url = ds.base_url
-        # This should eventually manage the IO and cache it
-        self.total_bytes = 0
+        self._client = HTTPClient(cache_dir=ds.cache_dir)
         super(IOHandlerHTTPStream, self).__init__(ds)
 
-    def _open_stream(self, data_file, field):
-        # This does not actually stream yet!
+    @property
+    def total_bytes(self):
+        return self._client.total_bytes
+
+    def _field_url(self, data_file, field):
         ftype, fname = field
-        s = f"{self._url}/{data_file.file_id}/{ftype}/{fname}"
-        mylog.info("Loading URL %s", s)
-        requests = get_requests()
-        resp = requests.get(s)
-        if resp.status_code != 200:
-            raise RuntimeError
-        self.total_bytes += len(resp.content)
-        return resp.content
+        return f"{self._url}/{data_file.file_id}/{ftype}/{fname}"
+
+    def _open_stream(self, data_file, field):
+        return self._client.get(self._field_url(data_file, field))
+
+    def _open_streams(self, requests):
+        # Fetch a batch of (data_file, field) streams concurrently, over the
+        # client's pooled connections, and return them keyed on the request.
+        requests = list(dict.fromkeys(requests))
+        urls = [self._field_url(data_file, field) for data_file, field in requests]
+        return dict(zip(requests, self._client.get_many(urls)))
+
+    def _iter_batches(self, data_files, fields):
+        # Group the data files so that the streams of several files are in
+        # flight at once, while only holding a few files in memory.
+        data_files = sorted(data_files, key=lambda x: (x.filename, x.start))
+        nbatch = max(self._client.num_threads, 1)
+        for i in range(0, len(data_files), nbatch):
+            batch = data_files[i : i + nbatch]
+            streams = self._open_streams(
+                [(data_file, field) for data_file in batch for field in fields]
+            )
+            for data_file in batch:
+                yield data_file, streams
+
+    def _get_array(self, stream, field):
+        c = np.frombuffer(stream, dtype="float64")
+        if field in self._vector_fields:
+            c = c.reshape((-1, 3))
+        return c
 
     def _identify_fields(self, data_file):
         f = []
@@ -41,11 +66,11 @@ class IOHandlerHTTPStream(BaseIOHandler):
         for chunk in chunks:
             for obj in chunk.objs:
                 data_files.update(obj.data_files)
-        for data_file in sorted(data_files, key=lambda x: (x.filename, x.start)):
+        fields = [(ptype, "Coordinates") for ptype in ptf]
+        for data_file, streams in self._iter_batches(data_files, fields):
             for ptype in ptf:
-                s = self._open_stream(data_file, (ptype, "Coordinates"))
-                c = np.frombuffer(s, dtype="float64")
-                c.shape = (c.shape[0] / 3.0, 3)
+                s = streams[data_file, (ptype, "Coordinates")]
+                c = self._get_array(s, "Coordinates")
                 yield ptype, (c[:, 0], c[:, 1], c[:, 2])
 
     def _read_particle_fields(self, chunks, ptf, selector):
@@ -54,23 +79,32 @@ class IOHandlerHTTPStream(BaseIOHandler):
         for chunk in chunks:
             for obj in chunk.objs:
                 data_files.update(obj.data_files)
-        for data_file in sorted(data_files, key=lambda x: (x.filename, x.start)):
+        fields = []
+        for ptype, field_list in sorted(ptf.items()):
+            fields.append((ptype, "Coordinates"))
+            fields.extend((ptype, field) for field in field_list)
+        for data_file, streams in self._iter_batches(data_files, fields):
             for ptype, field_list in sorted(ptf.items()):
-                s = self._open_stream(data_file, (ptype, "Coordinates"))
-                c = np.frombuffer(s, dtype="float64")
-                c.shape = (c.shape[0] / 3.0, 3)
+                s = streams[data_file, (ptype, "Coordinates")]
+                c = self._get_array(s, "Coordinates")
                 mask = selector.select_points(c[:, 0], c[:, 1], c[:, 2], 0.0)
                 del c
                 if mask is None:
                     continue
                 for field in field_list:
-                    s = self._open_stream(data_file, (ptype, field))
-                    c = np.frombuffer(s, dtype="float64")
-                    if field in self._vector_fields:
-                        c.shape = (c.shape[0] / 3.0, 3)
-                    data = c[mask, ...]
+                    s = streams[data_file, (ptype, field)]
+                    data = self._get_array(s, field)[mask, ...]
                     yield (ptype, field), data
 
+    def _yield_coordinates(self, data_file):
+        ptypes = list(self.ds.parameters["particle_count"][data_file.file_id])
+        streams = self._open_streams(
+            [(data_file, (ptype, "Coordinates")) for ptype in ptypes]
+        )
+        for ptype in ptypes:
+            s = streams[data_file, (ptype, "Coordinates")]
+            yield ptype, self._get_array(s, "Coordinates")
+
     def _initialize_index(self, data_file, regions):
         header = self.ds.parameters
         ptypes = header["particle_count"][data_file.file_id].keys()
@@ -79,8 +113,7 @@ class IOHandlerHTTPStream(BaseIOHandler):
         ind = 0
         for ptype in ptypes:
             s = self._open_stream(data_file, (ptype, "Coordinates"))
-            c = np.frombuffer(s, dtype="float64")
-            c.shape = (c.shape[0] / 3.0, 3)
+            c = self._get_array(s, "Coordinates")
             regions.add_data_file(c, data_file.file_id, data_file.ds.filter_bbox)
             morton[ind : ind + c.shape[0]] = compute_morton(
                 c[:, 0],
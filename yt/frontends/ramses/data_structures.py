@@ -1,3 +1,4 @@
+import hashlib
 import os
 import weakref
 from collections import defaultdict
@@ -6,12 +7,16 @@ from glob import glob
 import numpy as np
 
 from yt.arraytypes import blankRecordArray
+from yt.config import ytcfg
 from yt.data_objects.index_subobjects.octree_subset import OctreeSubset
 from yt.data_objects.particle_filters import add_particle_filter
 from yt.data_objects.static_output import Dataset
-from yt.funcs import mylog, setdefaultattr
+from yt.funcs import mylog, setdefaultattr, threaded_map
 from yt.geometry.geometry_handler import YTDataChunk
-from yt.geometry.oct_container import RAMSESOctreeContainer
+from yt.geometry.oct_container import (
+    RAMSESOctreeContainer,
+    read_octree_file_header,
+)
 from yt.geometry.oct_geometry_handler import OctreeIndex
 from yt.utilities.cython_fortran_utils import FortranFile as fpu
 from yt.utilities.lib.cosmology_time import friedman
@@ -151,7 +156,23 @@ class RAMSESDomainFile:
            are needed - its position in the octree is found automatically.
            The most important is finding all the information to feed
            oct_handler.add
+
+           If the ``octree_cache_dir`` configuration option is set, the
+           octree is saved there once built, and loaded from there when the
+           dataset is opened again.
         """
+        cache_fn = self._octree_cache_filename()
+        if cache_fn is not None and os.path.exists(cache_fn):
+            try:
+                self.oct_handler = RAMSESOctreeContainer.load_from_file(cache_fn)
+                self.max_level = read_octree_file_header(cache_fn)["metadata"][
+                    "max_level"
+                ]
+                self.amr_file.close()
+                return
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                mylog.warning("Could not load the cached octree %s: %s", cache_fn, e)
+
         self.oct_handler = RAMSESOctreeContainer(
             self.ds.domain_dimensions / 2,
             self.ds.domain_left_edge,
@@ -180,6 +201,38 @@ class RAMSESDomainFile:
         # Close AMR file
         f.close()
 
+        if cache_fn is not None:
+            try:
+                self.oct_handler.save_to_file(
+                    cache_fn, metadata={"max_level": int(max_level)}
+                )
+            except OSError as e:
+                mylog.warning("Could not cache the octree in %s: %s", cache_fn, e)
+
+    def _octree_cache_filename(self):
+        cache_dir = ytcfg.get("yt", "octree_cache_dir")
+        if not cache_dir:
+            return None
+        os.makedirs(cache_dir, exist_ok=True)
+        # The cache is invalidated when the AMR file or the parameters used to
+        # build the octree change.
+        st = os.stat(self.amr_fn)
+        key = ":".join(
+            str(v)
+            for v in (
+                os.path.abspath(self.amr_fn),
+                st.st_size,
+                st.st_mtime_ns,
+                self.ds.min_level,
+                self.amr_header["nlevelmax"],
+                list(self.ds.domain_dimensions),
+                list(self.ds.domain_left_edge),
+                list(self.ds.domain_right_edge),
+            )
+        )
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(cache_dir, f"{digest}.octree")
+
     def included(self, selector):
         if getattr(selector, "domain_id", None) is not None:
             return selector.domain_id == self.domain_id
@@ -404,12 +457,20 @@ class RAMSESIndex(OctreeIndex):
         super(RAMSESIndex, self).__init__(ds, dataset_type)
 
     def _initialize_oct_handler(self):
+        cpu_list = []
         if self.ds._bbox is not None:
-            cpu_list = get_cpu_list(self.dataset, self.dataset._bbox)
-        else:
-            cpu_list = range(self.dataset["ncpu"])
-
-        self.domains = [RAMSESDomainFile(self.dataset, i + 1) for i in cpu_list]
+            cpu_list = list(get_cpu_list(self.dataset, self.dataset._bbox))
+        if len(cpu_list) == 0:
+            cpu_list = list(range(self.dataset["ncpu"]))
+
+        # The first domain is read on its own: it triggers the detection of
+        # the fields, which is shared by all the other domains. The AMR
+        # structure of the remaining domains is then read concurrently.
+        def _read_domain(icpu):
+            return RAMSESDomainFile(self.dataset, icpu + 1)
+
+        self.domains = [_read_domain(cpu_list[0])]
+        self.domains.extend(threaded_map(_read_domain, cpu_list[1:]))
         total_octs = sum(
             dom.local_oct_count for dom in self.domains  # + dom.ngridbound.sum()
         )
@@ -443,9 +504,38 @@ class RAMSESIndex(OctreeIndex):
 
         self.field_list = self.particle_field_list + self.fluid_field_list
 
+    def _get_candidate_domains(self, dobj):
+        """
+        Return the domains that may intersect the data object, using the
+        Hilbert decomposition of the simulation to discard the other ones
+        without looking at their octs.
+        """
+        if self.ds.parameters.get("ordering type") != "hilbert":
+            return self.domains
+        try:
+            left_edge, right_edge = dobj.get_bbox()
+        except (AttributeError, NotImplementedError):
+            return self.domains
+        left_edge = np.asarray(left_edge.to("code_length"))
+        right_edge = np.asarray(right_edge.to("code_length"))
+        dle = self.ds.domain_left_edge
+        dre = self.ds.domain_right_edge
+        if np.any(left_edge < dle) or np.any(right_edge > dre):
+            # The bounding box wraps around the periodic boundaries
+            return self.domains
+        if np.all(left_edge <= dle) and np.all(right_edge >= dre):
+            return self.domains
+        bbox = (np.array([left_edge, right_edge]) - dle) / (dre - dle)
+        cpu_ids = set(get_cpu_list(self.dataset, bbox))
+        return [dom for dom in self.domains if dom.domain_id - 1 in cpu_ids]
+
     def _identify_base_chunk(self, dobj):
         if getattr(dobj, "_chunk_info", None) is None:
-            domains = [dom for dom in self.domains if dom.included(dobj.selector)]
+            domains = [
+                dom
+                for dom in self._get_candidate_domains(dobj)
+                if dom.included(dobj.selector)
+            ]
             base_region = getattr(dobj, "base_region", dobj)
             if len(domains) > 1:
                 mylog.debug("Identified %s intersecting domains", len(domains))
@@ -2,6 +2,7 @@ from collections import defaultdict
 
 import numpy as np
 
+from yt.funcs import threaded_map
 from yt.utilities.cython_fortran_utils import FortranFile
 from yt.utilities.exceptions import (
     YTFieldTypeNotFound,
@@ -90,40 +91,52 @@ class IOHandlerRAMSES(BaseIOHandler):
 
         # Set of field types
         ftypes = set(f[0] for f in fields)
+
+        # Gather fields by type to minimize i/o operations
+        tasks = []
         for chunk in chunks:
-            # Gather fields by type to minimize i/o operations
             for ft in ftypes:
                 # Get all the fields of the same type
                 field_subs = list(filter(lambda f: f[0] == ft, fields))
 
                 # Loop over subsets
                 for subset in chunk.objs:
-                    fname = None
-                    for fh in subset.domain.field_handlers:
-                        if fh.ftype == ft:
-                            file_handler = fh
-                            fname = fh.fname
-                            break
-
-                    if fname is None:
-                        raise YTFieldTypeNotFound(ft)
-
-                    # Now we read the entire thing
-                    with FortranFile(fname) as fd:
-                        # This contains the boundary information, so we skim through
-                        # and pick off the right vectors
-                        rv = subset.fill(fd, field_subs, selector, file_handler)
-                    for ft, f in field_subs:
-                        d = rv.pop(f)
-                        mylog.debug(
-                            "Filling %s with %s (%0.3e %0.3e) (%s zones)",
-                            f,
-                            d.size,
-                            d.min(),
-                            d.max(),
-                            d.size,
-                        )
-                        tr[(ft, f)].append(d)
+                    tasks.append((subset, ft, field_subs))
+
+        def _read_subset(task):
+            subset, ft, field_subs = task
+            fname = None
+            for fh in subset.domain.field_handlers:
+                if fh.ftype == ft:
+                    file_handler = fh
+                    fname = fh.fname
+                    break
+
+            if fname is None:
+                raise YTFieldTypeNotFound(ft)
+
+            # Now we read the entire thing
+            with FortranFile(fname) as fd:
+                # This contains the boundary information, so we skim through
+                # and pick off the right vectors
+                return subset.fill(fd, field_subs, selector, file_handler)
+
+        # Each subset lives in its own file, so that they can be read
+        # concurrently. The results are merged in the original order.
+        for (subset, ft, field_subs), rv in zip(
+            tasks, threaded_map(_read_subset, tasks)
+        ):
+            for ft, f in field_subs:
+                d = rv.pop(f)
+                mylog.debug(
+                    "Filling %s with %s (%0.3e %0.3e) (%s zones)",
+                    f,
+                    d.size,
+                    d.min(),
+                    d.max(),
+                    d.size,
+                )
+                tr[(ft, f)].append(d)
         d = {}
         for field in fields:
             d[field] = np.concatenate(tr.pop(field))
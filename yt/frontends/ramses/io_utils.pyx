@@ -192,3 +192,44 @@ def fill_hydro(FortranFile f,
             else:
                 oct_handler.fill_level(
                     ilevel, levels, cell_inds, file_inds, tr, tmp)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def hilbert3d_keys(np.int64_t[:, :] X, np.int64_t[:] bit_length,
+                   np.int64_t[:, :, ::1] state_diagram):
+    """Compute the Hilbert key of a batch of integer positions.
+
+    Parameters
+    ----------
+    X : (N, 3) int64 array
+        The integer positions.
+    bit_length : (N, ) int64 array
+        The number of bits to use for each position.
+    state_diagram : (12, 2, 8) int64 array
+        The state diagram, indexed by (state, [next state, digit], input digit).
+
+    Returns
+    -------
+    order : (N, ) float64 array
+        The Hilbert key of each position.
+    """
+    cdef INT64_t npoint = X.shape[0]
+    cdef INT64_t ip, i, cstate, sdigit, hdigit
+    cdef np.ndarray[np.float64_t, ndim=1] order = np.zeros(npoint, dtype="float64")
+    cdef np.float64_t[:] order_view = order
+
+    with nogil:
+        for ip in range(npoint):
+            cstate = 0
+            for i in range(bit_length[ip] - 1, -1, -1):
+                # Interleave the bits of the coordinates
+                sdigit = (4 * ((X[ip, 0] >> i) & 1)
+                          + 2 * ((X[ip, 1] >> i) & 1)
+                          + ((X[ip, 2] >> i) & 1))
+                hdigit = state_diagram[cstate, 1, sdigit]
+                cstate = state_diagram[cstate, 0, sdigit]
+                order_view[ip] = order_view[ip] * 8 + hdigit
+
+    return order
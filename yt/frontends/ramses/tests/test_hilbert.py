@@ -1,7 +1,7 @@
 import numpy as np
 
 import yt
-from yt.frontends.ramses.hilbert import get_cpu_list, hilbert3d
+from yt.frontends.ramses.hilbert import get_cpu_list, get_cpu_lists, hilbert3d
 from yt.testing import assert_equal, requires_file
 
 
@@ -22,6 +22,14 @@ def test_hilbert3d():
     for i, o in zip(inputs, outputs):
         assert_equal(int(hilbert3d(i, 3)), o)
 
+    # All at once
+    assert_equal(hilbert3d(inputs, 3), outputs)
+
+    # With a different bit length for each position (checked against the
+    # reference implementation)
+    assert_equal(hilbert3d([[1, 1, 1], [1, 1, 1]], [1, 3]), [5, 5])
+    assert_equal(hilbert3d([[0, 0, 1], [2, 0, 0]], [1, 2]), [1, 60])
+
 
 output_00080 = "output_00080/info_00080.txt"
 
@@ -46,3 +54,8 @@ def test_get_cpu_list():
         ls = get_cpu_list(ds, bbox)
         assert len(ls) > 0
         assert all(np.array(o) == np.array(ls))
+
+    # Now in a single batch
+    bboxes = [np.sort(i, axis=0) for i in inputs]
+    for o, ls in zip(outputs, get_cpu_lists(ds, bboxes)):
+        assert_equal(ls, o)
@@ -1,10 +1,14 @@
 import os
+import shutil
+import tempfile
+from unittest import mock
 
 import numpy as np
 
 import yt
 from yt.config import ytcfg
 from yt.fields.field_detector import FieldDetector
+from yt.frontends.ramses import data_structures
 from yt.frontends.ramses.api import RAMSESDataset
 from yt.frontends.ramses.field_handlers import DETECTED_FIELDS, HydroFieldFileHandler
 from yt.testing import (
@@ -630,3 +634,31 @@ def test_invalid_max_level():
     for lvl, convention in invalid_type_args:
         with assert_raises(TypeError):
             yt.load(output_00080, max_level=lvl, max_level_convention=convention)
+
+
+@requires_file(output_00080)
+def test_octree_cache_dir():
+    cache_dir = tempfile.mkdtemp()
+    old_cache_dir = ytcfg.get("yt", "octree_cache_dir")
+    ytcfg["yt", "octree_cache_dir"] = cache_dir
+    try:
+        ds = yt.load(output_00080)
+        ad = ds.all_data()
+        expected = ad["index", "grid_level"], ad["gas", "density"]
+        ndomains = len(ds.index.domains)
+        assert_equal(len(os.listdir(cache_dir)), ndomains)
+
+        # The octrees are now read from the cache, not the AMR files
+        with mock.patch.object(
+            data_structures,
+            "read_octree_file_header",
+            wraps=data_structures.read_octree_file_header,
+        ) as read_header:
+            ds = yt.load(output_00080)
+            ad = ds.all_data()
+            assert_equal(ad["index", "grid_level"], expected[0])
+            assert_equal(ad["gas", "density"], expected[1])
+        assert_equal(read_header.call_count, ndomains)
+    finally:
+        ytcfg["yt", "octree_cache_dir"] = old_cache_dir
+        shutil.rmtree(cache_dir)
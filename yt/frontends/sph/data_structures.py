@@ -3,7 +3,7 @@ import os
 import numpy as np
 
 from yt.data_objects.static_output import ParticleDataset
-from yt.funcs import mylog
+from yt.funcs import mylog, resolve_num_threads
 from yt.geometry.particle_geometry_handler import ParticleIndex
 
 
@@ -100,24 +100,40 @@ class SPHParticleIndex(ParticleIndex):
                 else:
                     self._kdtree = kdtree
                     return
-        positions = []
+        # The positions are read into one float64 array sized from the
+        # particle counts of the data files, instead of being concatenated
+        # and converted once they have all been read. The whole array is
+        # still held in memory while the tree is built, and a single tree
+        # covers every data file: it is neither split into per-file subtrees
+        # nor loaded lazily, and a hash mismatch rebuilds it from scratch.
+        ptype = self.ds._sph_ptypes[0]
+        npart = sum(df.total_particles.get(ptype, 0) for df in self.data_files)
+        positions = np.empty((npart, 3), dtype="float64")
+        offset = 0
         for data_file in self.data_files:
-            for _, ppos in self.io._yield_coordinates(
-                data_file, needed_ptype=self.ds._sph_ptypes[0]
-            ):
-                positions.append(ppos)
-        if positions == []:
+            for _, ppos in self.io._yield_coordinates(data_file, needed_ptype=ptype):
+                n = ppos.shape[0]
+                if offset + n > positions.shape[0]:
+                    # Should a frontend yield more particles than its data
+                    # files declare, make room for them (this copies).
+                    extra = np.empty((offset + n - positions.shape[0], 3))
+                    positions = np.concatenate([positions, extra])
+                positions[offset : offset + n] = ppos
+                offset += n
+        if offset == 0:
             self._kdtree = None
             return
-        positions = np.concatenate(positions)
-        mylog.info("Allocating KDTree for %s particles", positions.shape[0])
+        positions = positions[:offset]
+        nthreads = resolve_num_threads()
+        mylog.info("Allocating KDTree for %s particles", offset)
         self._kdtree = PyKDTree(
-            positions.astype("float64"),
+            positions,
             left_edge=self.ds.domain_left_edge,
             right_edge=self.ds.domain_right_edge,
             periodic=np.array(self.ds.periodicity),
             leafsize=2 * int(self.ds.num_neighbors),
             data_version=self.ds._file_hash,
+            nthreads=nthreads,
         )
         if fname is not None:
             self._kdtree.save(fname)
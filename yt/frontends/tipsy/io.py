@@ -95,15 +95,15 @@ class IOHandlerTipsyBinary(IOHandlerSPH):
         for data_file in sorted(data_files, key=lambda x: (x.filename, x.start)):
             poff = data_file.field_offsets
             tp = data_file.total_particles
-            f = open(data_file.filename, "rb")
+            mm = self._open_memmap(data_file)
             for ptype in sorted(ptf, key=lambda a: poff.get(a, -1)):
                 if data_file.total_particles[ptype] == 0:
                     continue
-                f.seek(poff[ptype])
+                pp = self._get_particle_view(mm, data_file, ptype)
                 total = 0
                 while total < tp[ptype]:
                     count = min(self._chunksize, tp[ptype] - total)
-                    p = np.fromfile(f, self._pdtypes[ptype], count=count)
+                    p = pp[total : total + count]
                     total += p.size
                     d = [p["Coordinates"][ax].astype("float64") for ax in "xyz"]
                     del p
@@ -113,6 +113,26 @@ class IOHandlerTipsyBinary(IOHandlerSPH):
                         hsml = 0.0
                     yield ptype, d, hsml
 
+    def _open_memmap(self, data_file):
+        """
+        Return a read-only memory map of the file containing *data_file*.
+        """
+        return np.memmap(data_file.filename, dtype="uint8", mode="r")
+
+    def _get_particle_view(self, mm, data_file, ptype, count=None):
+        """
+        Return a view on the records of particle type *ptype* of *data_file*
+        in the memory map *mm*, without reading or copying them.
+        """
+        if count is None:
+            count = data_file.total_particles[ptype]
+        return np.ndarray(
+            (count,),
+            dtype=self._pdtypes[ptype],
+            buffer=mm,
+            offset=data_file.field_offsets[ptype],
+        )
+
     @property
     def hsml_filename(self):
         return f"{self.ds.parameter_filename}-{'hsml'}"
@@ -144,9 +164,15 @@ class IOHandlerTipsyBinary(IOHandlerSPH):
 
     def _read_smoothing_length(self, data_file, count):
         dtype = self._pdtypes["Gas"]["Coordinates"][0]
-        with open(self.hsml_filename, "rb") as f:
-            f.seek(struct.calcsize("q") + data_file.start * dtype.itemsize)
-            hsmls = np.fromfile(f, dtype, count=count)
+        if count == 0:
+            return np.empty(0, dtype="float64")
+        hsmls = np.memmap(
+            self.hsml_filename,
+            dtype=dtype,
+            mode="r",
+            offset=struct.calcsize("q") + data_file.start * dtype.itemsize,
+            shape=(count,),
+        )
         return hsmls.astype("float64")
 
     def _get_smoothing_length(self, data_file, dtype, shape):
@@ -162,7 +188,7 @@ class IOHandlerTipsyBinary(IOHandlerSPH):
             poff = data_file.field_offsets
             aux_fields_offsets = self._calculate_particle_offsets_aux(data_file)
             tp = data_file.total_particles
-            f = open(data_file.filename, "rb")
+            mm = self._open_memmap(data_file)
 
             # we need to open all aux files for chunking to work
             aux_fh = {}
@@ -174,10 +200,9 @@ class IOHandlerTipsyBinary(IOHandlerSPH):
             ):
                 if data_file.total_particles[ptype] == 0:
                     continue
-                f.seek(poff[ptype])
                 afields = list(set(field_list).intersection(self._aux_fields))
                 count = min(self._chunksize, tp[ptype])
-                p = np.fromfile(f, self._pdtypes[ptype], count=count)
+                p = self._get_particle_view(mm, data_file, ptype, count)
                 auxdata = []
                 for afield in afields:
                     aux_fh[afield].seek(aux_fields_offsets[afield][ptype])
@@ -221,7 +246,7 @@ class IOHandlerTipsyBinary(IOHandlerSPH):
                     yield (ptype, field), tf.pop(field)
 
             # close all file handles
-            f.close()
+            del mm
             for fh in list(aux_fh.values()):
                 fh.close()
 
@@ -285,31 +310,30 @@ class IOHandlerTipsyBinary(IOHandlerSPH):
         )
 
     def _yield_coordinates(self, data_file, needed_ptype=None):
-        with open(data_file.filename, "rb") as f:
-            poff = data_file.field_offsets
-            for ptype in self._ptypes:
-                if ptype not in poff:
-                    continue
-                f.seek(poff[ptype])
-                if needed_ptype is not None and ptype != needed_ptype:
-                    continue
-                # We'll just add the individual types separately
-                count = data_file.total_particles[ptype]
-                if count == 0:
-                    continue
-                pp = np.fromfile(f, dtype=self._pdtypes[ptype], count=count)
-                mis = np.empty(3, dtype="float64")
-                mas = np.empty(3, dtype="float64")
-                for axi, ax in enumerate("xyz"):
-                    mi = pp["Coordinates"][ax].min()
-                    ma = pp["Coordinates"][ax].max()
-                    mylog.debug("Spanning: %0.3e .. %0.3e in %s", mi, ma, ax)
-                    mis[axi] = mi
-                    mas[axi] = ma
-                pos = np.empty((pp.size, 3), dtype="float64")
-                for i, ax in enumerate("xyz"):
-                    pos[:, i] = pp["Coordinates"][ax]
-                yield ptype, pos
+        mm = self._open_memmap(data_file)
+        poff = data_file.field_offsets
+        for ptype in self._ptypes:
+            if ptype not in poff:
+                continue
+            if needed_ptype is not None and ptype != needed_ptype:
+                continue
+            # We'll just add the individual types separately
+            count = data_file.total_particles[ptype]
+            if count == 0:
+                continue
+            pp = self._get_particle_view(mm, data_file, ptype)
+            mis = np.empty(3, dtype="float64")
+            mas = np.empty(3, dtype="float64")
+            for axi, ax in enumerate("xyz"):
+                mi = pp["Coordinates"][ax].min()
+                ma = pp["Coordinates"][ax].max()
+                mylog.debug("Spanning: %0.3e .. %0.3e in %s", mi, ma, ax)
+                mis[axi] = mi
+                mas[axi] = ma
+            pos = np.empty((pp.size, 3), dtype="float64")
+            for i, ax in enumerate("xyz"):
+                pos[:, i] = pp["Coordinates"][ax]
+            yield ptype, pos
 
     def _count_particles(self, data_file):
         pcount = np.array(
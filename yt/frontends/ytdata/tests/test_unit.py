@@ -127,3 +127,28 @@ def test_non_square_frb():
     os.chdir(curdir)
     if tmpdir != ".":
         shutil.rmtree(tmpdir)
+
+
+@requires_module("h5py")
+def test_save_grid_data_in_slabs():
+    tmpdir = tempfile.mkdtemp()
+    curdir = os.getcwd()
+    os.chdir(tmpdir)
+
+    ds = fake_random_ds(32, nprocs=8, particles=100)
+    cg = ds.covering_grid(0, [0.25, 0.0, 0.125], [16, 24, 20])
+    ag = ds.arbitrary_grid([0.1] * 3, [0.9] * 3, [10, 12, 14])
+    for grid in (cg, ag):
+        fn = grid.save_as_dataset(
+            fields=["density", "particle_mass"], compression="gzip"
+        )
+        grid_ds = load(fn)
+        assert_array_equal(grid_ds.data["grid", "density"], grid["gas", "density"])
+        assert_array_equal(grid_ds.data["grid", "x"], grid["index", "x"])
+        assert_array_equal(
+            grid_ds.data["all", "particle_mass"], grid["all", "particle_mass"]
+        )
+
+    os.chdir(curdir)
+    if tmpdir != ".":
+        shutil.rmtree(tmpdir)
@@ -3,7 +3,9 @@ from yt.utilities.logger import ytLogger as mylog
 from yt.utilities.on_demand_imports import _h5py as h5py
 
 
-def save_as_dataset(ds, filename, data, field_types=None, extra_attrs=None):
+def save_as_dataset(
+    ds, filename, data, field_types=None, extra_attrs=None, **dataset_kwargs
+):
     r"""Export a set of field arrays to a reloadable yt dataset.
 
     This function can be used to create a yt loadable dataset from a
@@ -28,6 +30,10 @@ def save_as_dataset(ds, filename, data, field_types=None, extra_attrs=None):
         used.
     extra_attrs: dict, optional
         A dictionary of additional attributes to be saved.
+    **dataset_kwargs
+        Additional keyword arguments, such as *chunks* and *compression*,
+        are passed to :meth:`~h5py.Group.create_dataset` for the field
+        arrays.
 
     Returns
     -------
@@ -65,6 +71,23 @@ def save_as_dataset(ds, filename, data, field_types=None, extra_attrs=None):
 
     """
 
+    with _create_dataset_file(ds, filename, extra_attrs) as fh:
+        for field in data:
+            if field_types is None:
+                field_type = "data"
+            else:
+                field_type = field_types[field]
+            _save_field(fh, field, field_type, data[field], **dataset_kwargs)
+    return filename
+
+
+def _create_dataset_file(ds, filename, extra_attrs=None):
+    r"""Create a yt dataset file with the attributes of a dataset.
+
+    Returns the open hdf5 file, to which the fields are to be saved with
+    ``_save_field`` or ``_create_field_dataset``.
+    """
+
     mylog.info("Saving field data to yt dataset: %s.", filename)
 
     if extra_attrs is None:
@@ -118,28 +141,42 @@ def save_as_dataset(ds, filename, data, field_types=None, extra_attrs=None):
     if "data_type" not in extra_attrs:
         fh.attrs["data_type"] = "yt_array_data"
 
-    for field in data:
-        if field_types is None:
-            field_type = "data"
-        else:
-            field_type = field_types[field]
-        if field_type not in fh:
-            fh.create_group(field_type)
+    return fh
 
-        if isinstance(field, tuple):
-            field_name = field[1]
-        else:
-            field_name = field
 
-        # for python3
-        if data[field].dtype.kind == "U":
-            data[field] = data[field].astype("|S")
+def _get_field_group(fh, field, field_type):
+    if field_type not in fh:
+        fh.create_group(field_type)
+    if isinstance(field, tuple):
+        field_name = field[1]
+    else:
+        field_name = field
+    return fh[field_type], field_name
 
-        _yt_array_hdf5(fh[field_type], field_name, data[field])
-        if "num_elements" not in fh[field_type].attrs:
-            fh[field_type].attrs["num_elements"] = data[field].size
-    fh.close()
-    return filename
+
+def _save_field(fh, field, field_type, data, **dataset_kwargs):
+    r"""Save a field array to the group of its field type."""
+    group, field_name = _get_field_group(fh, field, field_type)
+
+    # for python3
+    if data.dtype.kind == "U":
+        data = data.astype("|S")
+
+    _yt_array_hdf5(group, field_name, data, **dataset_kwargs)
+    if "num_elements" not in group.attrs:
+        group.attrs["num_elements"] = data.size
+
+
+def _create_field_dataset(fh, field, field_type, shape, dtype, units, **dataset_kwargs):
+    r"""Create the dataset of a field array, to be filled in afterwards."""
+    group, field_name = _get_field_group(fh, field, field_type)
+    dataset = group.create_dataset(
+        str(field_name), shape, dtype=dtype, **dataset_kwargs
+    )
+    dataset.attrs["units"] = units
+    if "num_elements" not in group.attrs:
+        group.attrs["num_elements"] = dataset.size
+    return dataset
 
 
 def _hdf5_yt_array(fh, field, ds=None):
@@ -176,7 +213,7 @@ def _hdf5_yt_array(fh, field, ds=None):
     return new_arr(fh[field][()], units)
 
 
-def _yt_array_hdf5(fh, field, data):
+def _yt_array_hdf5(fh, field, data, **dataset_kwargs):
     r"""Save a YTArray to an open hdf5 file or group.
 
     Save a YTArray to an open hdf5 file or group, and save the
@@ -190,6 +227,9 @@ def _yt_array_hdf5(fh, field, data):
         The name of the field to be saved.
     data : YTArray
         The data array to be saved.
+    **dataset_kwargs
+        Additional keyword arguments are passed to
+        :meth:`~h5py.Group.create_dataset`.
 
     Returns
     -------
@@ -198,7 +238,7 @@ def _yt_array_hdf5(fh, field, data):
 
     """
 
-    dataset = fh.create_dataset(str(field), data=data)
+    dataset = fh.create_dataset(str(field), data=data, **dataset_kwargs)
     units = ""
     if isinstance(data, YTArray):
         units = str(data.units)
@@ -914,6 +914,45 @@ def get_num_threads():
     return nt
 
 
+def resolve_num_threads(num_threads=None):
+    """
+    Return the number of threads to use for *num_threads*: the value of the
+    ``numthreads`` config option (see ``get_num_threads``) if it is None,
+    and one thread per available core if it is 0 or negative.
+    """
+    if num_threads is None:
+        num_threads = int(get_num_threads())
+    if num_threads <= 0:
+        num_threads = os.cpu_count() or 1
+    return num_threads
+
+
+def threaded_map(func, items, num_threads=None):
+    """
+    Apply *func* to each element of *items* using a pool of threads and
+    return the results as a list, in the same order as *items*.
+
+    This is intended for work that spends most of its time in I/O or in
+    compiled code that releases the GIL, such as reading many files.  If
+    *num_threads* is None, the value returned by ``get_num_threads`` is
+    used, with 0 meaning one thread per available core.  With a single
+    thread or a single item the work is done serially in the calling thread.
+
+    Examples
+    --------
+
+    >>> sizes = threaded_map(os.path.getsize, ["a.dat", "b.dat"], num_threads=2)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    items = list(items)
+    num_threads = min(resolve_num_threads(num_threads), len(items))
+    if num_threads <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        return list(executor.map(func, items))
+
+
 def fix_axis(axis, ds):
     return ds.coordinates.axis_id.get(axis, axis)
 
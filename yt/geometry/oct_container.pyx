@@ -13,6 +13,11 @@ Oct container
 cimport cython
 cimport numpy as np
 
+import json
+import os
+import struct
+import tempfile
+
 import numpy as np
 
 from libc.math cimport ceil, floor
@@ -32,6 +37,111 @@ cdef extern from "stdlib.h":
     # NOTE that size_t might not be int
     void *alloca(int)
 
+# On-disk format of serialized octrees: the magic string, the length of a JSON
+# header and the header itself, followed by the flat arrays it describes.
+# Arrays are aligned so that they can be read through a memory map on load.
+_OCTREE_FILE_MAGIC = b"YTOCTREE"
+_OCTREE_FILE_VERSION = 1
+_OCTREE_FILE_ALIGN = 64
+
+def _aligned(np.int64_t offset):
+    return (offset + _OCTREE_FILE_ALIGN - 1) // _OCTREE_FILE_ALIGN * _OCTREE_FILE_ALIGN
+
+def _write_octree_file(filename, header, arrays):
+    layout = []
+    cdef np.int64_t offset = 0
+    for name, arr in arrays:
+        offset = _aligned(offset)
+        layout.append((name, arr.dtype.str, arr.shape, offset))
+        offset += arr.nbytes
+    header = dict(header, version = _OCTREE_FILE_VERSION, arrays = layout)
+    hdr = json.dumps(header).encode("utf-8")
+    data_start = _aligned(len(_OCTREE_FILE_MAGIC) + 8 + len(hdr))
+    dirname = os.path.dirname(os.path.abspath(filename))
+    # Write to a temporary file first, so that concurrent readers never see a
+    # partially written octree.
+    fd, tmp = tempfile.mkstemp(dir=dirname)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_OCTREE_FILE_MAGIC)
+            f.write(struct.pack("<Q", len(hdr)))
+            f.write(hdr)
+            for (name, arr), (_, _, _, offset) in zip(arrays, layout):
+                f.seek(data_start + offset)
+                f.write(np.ascontiguousarray(arr).data)
+        os.replace(tmp, filename)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+def read_octree_file_header(filename):
+    """
+    Return the header of an octree written by
+    :meth:`OctreeContainer.save_to_file`.
+
+    Besides the geometry of the octree, it contains the number of octs at each
+    level (``level_count``) and the ``metadata`` dictionary supplied when the
+    file was written.
+    """
+    with open(filename, "rb") as f:
+        if f.read(len(_OCTREE_FILE_MAGIC)) != _OCTREE_FILE_MAGIC:
+            raise ValueError(f"{filename} is not a serialized octree.")
+        size, = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(size).decode("utf-8"))
+    if header["version"] != _OCTREE_FILE_VERSION:
+        raise ValueError(f"Unsupported octree file version {header['version']}.")
+    header["data_start"] = _aligned(len(_OCTREE_FILE_MAGIC) + 8 + size)
+    return header
+
+def _read_octree_file(filename):
+    header = read_octree_file_header(filename)
+    arrays = {}
+    for name, dtype, shape, offset in header["arrays"]:
+        shape = tuple(shape)
+        if np.prod(shape) == 0:
+            arrays[name] = np.empty(shape, dtype=dtype)
+        else:
+            arrays[name] = np.memmap(filename, dtype=dtype, mode="r",
+                offset=header["data_start"] + offset, shape=shape)
+    return header, arrays
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef np.int64_t _oct_to_index(Oct *o, const np.uint64_t[:] bases,
+                              const np.int64_t[:] starts,
+                              const np.uint64_t[:] sizes) except -2:
+    # Map an oct to its position in the concatenation of the allocation
+    # containers; bases are the sorted addresses of the non-empty containers.
+    if o == NULL: return -1
+    cdef np.uint64_t addr = <np.uint64_t> o
+    cdef np.int64_t lo = 0, hi = bases.shape[0], mid
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if bases[mid] <= addr:
+            lo = mid
+        else:
+            hi = mid
+    cdef np.uint64_t ind = (addr - bases[lo]) // sizeof(Oct)
+    if addr < bases[lo] or ind >= sizes[lo]:
+        raise RuntimeError("Oct does not belong to any allocation container.")
+    return starts[lo] + ind
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef Oct *_index_to_oct(np.int64_t ind, Oct **bases,
+                        const np.int64_t[:] starts) except? NULL:
+    # The inverse of _oct_to_index; starts are the (increasing) positions of
+    # the first oct of each non-empty container.
+    if ind < 0: return NULL
+    cdef np.int64_t lo = 0, hi = starts.shape[0], mid
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if starts[mid] <= ind:
+            lo = mid
+        else:
+            hi = mid
+    return &bases[lo][ind - starts[lo]]
+
 # Here is the strategy for RAMSES containers:
 #   * Read each domain individually, creating *all* octs found in that domain
 #     file, even if they reside on other CPUs.
@@ -495,6 +605,233 @@ cdef class OctreeContainer:
         header['octree'] = ref_mask
         return header
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def save_to_file(self, filename, metadata = None):
+        """
+        Write the full octree to *filename* in a compact binary format.
+
+        Unlike :meth:`save_octree`, which only records the refinement
+        structure, this stores the file index, domain index and domain of
+        every oct of every allocation container, the layout of the containers
+        and the root octs, so that :meth:`load_from_file` restores an
+        identical octree without going back to the files it was built from.
+        Reading it back still allocates and fills every oct in memory; only
+        the file itself is memory-mapped while doing so.  *metadata* is an
+        optional JSON-serializable dictionary that is stored in the header;
+        see :func:`read_octree_file_header`.
+        """
+        cdef np.int64_t i, j, k, ind, row, n_con = len(self.domains)
+        cdef OctAllocationContainer *cont
+        cdef Oct *o
+        con_n = np.zeros(n_con, dtype="uint64")
+        con_assigned = np.zeros(n_con, dtype="uint64")
+        con_id = np.zeros(n_con, dtype="int64")
+        addr = np.zeros(n_con, dtype="uint64")
+        for i in range(n_con):
+            cont = self.domains.get_cont(i)
+            con_n[i] = cont.n
+            con_assigned[i] = cont.n_assigned
+            con_id[i] = cont.con_id
+            addr[i] = <np.uint64_t> cont.my_objs
+        first = np.zeros(n_con + 1, dtype="int64")
+        first[1:] = np.cumsum(con_assigned)
+        # Children are found from their address, by a binary search over the
+        # containers sorted by address.
+        order = np.flatnonzero(con_assigned > 0)
+        order = order[np.argsort(addr[order])]
+        cdef np.uint64_t[:] bases = addr[order]
+        cdef np.int64_t[:] starts = first[order]
+        cdef np.uint64_t[:] sizes = con_assigned[order]
+        cdef np.int64_t[:] file_ind = np.empty(first[n_con], dtype="int64")
+        cdef np.int64_t[:] domain_ind = np.empty(first[n_con], dtype="int64")
+        cdef np.int64_t[:] domain = np.empty(first[n_con], dtype="int64")
+        cdef np.int64_t[:] child_row = np.empty(first[n_con], dtype="int64")
+        cdef np.int64_t nparents = 0
+        ind = 0
+        for i in range(n_con):
+            cont = self.domains.get_cont(i)
+            for j in range(cont.n_assigned):
+                o = &cont.my_objs[j]
+                file_ind[ind] = o.file_ind
+                domain_ind[ind] = o.domain_ind
+                domain[ind] = o.domain
+                child_row[ind] = -1
+                if o.children != NULL:
+                    child_row[ind] = nparents
+                    nparents += 1
+                ind += 1
+        cdef np.int64_t[:, :] children = np.empty((nparents, 8), dtype="int64")
+        ind = 0
+        for i in range(n_con):
+            cont = self.domains.get_cont(i)
+            for j in range(cont.n_assigned):
+                o = &cont.my_objs[j]
+                row = child_row[ind]
+                ind += 1
+                if row < 0: continue
+                for k in range(8):
+                    children[row, k] = _oct_to_index(
+                        o.children[k], bases, starts, sizes)
+        cdef SparseOctreeContainer sparse
+        cdef np.int64_t[:] root_octs
+        cdef np.int64_t[:] root_keys
+        cdef np.int64_t[:, :, :] root_mesh
+        header = dict(container = type(self).__name__,
+                      dims = [self.nn[0], self.nn[1], self.nn[2]],
+                      left_edge = [self.DLE[0], self.DLE[1], self.DLE[2]],
+                      right_edge = [self.DRE[0], self.DRE[1], self.DRE[2]],
+                      over_refine = self.oref,
+                      partial_coverage = self.partial_coverage,
+                      level_offset = self.level_offset,
+                      nocts = self.nocts,
+                      num_domains = self.num_domains,
+                      fill_style = self.fill_style,
+                      metadata = metadata or {})
+        arrays = [("container_n", con_n),
+                  ("container_n_assigned", con_assigned),
+                  ("container_id", con_id),
+                  ("file_ind", np.asarray(file_ind)),
+                  ("domain_ind", np.asarray(domain_ind)),
+                  ("domain", np.asarray(domain)),
+                  ("child_row", np.asarray(child_row)),
+                  ("children", np.asarray(children))]
+        if isinstance(self, SparseOctreeContainer):
+            sparse = self
+            header["max_root"] = sparse.max_root
+            root_keys = np.empty(sparse.num_root, dtype="int64")
+            root_octs = np.empty(sparse.num_root, dtype="int64")
+            for i in range(sparse.num_root):
+                root_keys[i] = sparse.root_nodes[i].key
+                root_octs[i] = _oct_to_index(
+                    sparse.root_nodes[i].node, bases, starts, sizes)
+            arrays.append(("root_keys", np.asarray(root_keys)))
+            roots = np.asarray(root_octs)
+        else:
+            root_mesh = np.empty((self.nn[0], self.nn[1], self.nn[2]),
+                                 dtype="int64")
+            for i in range(self.nn[0]):
+                for j in range(self.nn[1]):
+                    for k in range(self.nn[2]):
+                        root_mesh[i, j, k] = _oct_to_index(
+                            self.root_mesh[i][j][k], bases, starts, sizes)
+            roots = np.asarray(root_mesh)
+        arrays.append(("root_octs", roots))
+        # Count the octs of each level, walking the tree from the roots.
+        level_count = []
+        level = roots[roots >= 0]
+        all_children = np.asarray(children)
+        all_rows = np.asarray(child_row)
+        while level.size > 0:
+            level_count.append(int(level.size))
+            level = all_children[all_rows[level][all_rows[level] >= 0]].ravel()
+            level = level[level >= 0]
+        header["level_count"] = level_count
+        _write_octree_file(filename, header, arrays)
+
+    @classmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def load_from_file(cls, filename):
+        """
+        Restore an octree written with :meth:`save_to_file`.
+
+        The file is memory-mapped and every oct is allocated and filled from
+        it in a single pass, so the whole octree is held in memory afterwards
+        as usual; this is faster than building it again from the original
+        data, but does not use less memory.
+        """
+        header, arrays = _read_octree_file(filename)
+        if header["container"] != cls.__name__:
+            raise TypeError(f"{filename} holds a {header['container']}, "
+                            f"not a {cls.__name__}.")
+        cdef OctreeContainer obj
+        if issubclass(cls, SparseOctreeContainer):
+            obj = cls(header["dims"], header["left_edge"],
+                      header["right_edge"], over_refine = header["over_refine"])
+        else:
+            obj = cls(header["dims"], header["left_edge"],
+                      header["right_edge"],
+                      partial_coverage = header["partial_coverage"],
+                      over_refine = header["over_refine"])
+        obj.partial_coverage = header["partial_coverage"]
+        obj.level_offset = header["level_offset"]
+        obj.fill_style = header["fill_style"]
+        cdef np.int64_t i, j, k, ind, row, n_con
+        cdef OctAllocationContainer *cont
+        cdef Oct *o
+        con_n = arrays["container_n"]
+        con_assigned = arrays["container_n_assigned"]
+        con_id = arrays["container_id"]
+        n_con = con_n.shape[0]
+        for i in range(n_con):
+            obj.domains.append(con_n[i], con_id[i])
+            obj.domains.get_cont(i).n_assigned = con_assigned[i]
+        obj.num_domains = header["num_domains"]
+        obj.nocts = header["nocts"]
+        cdef const np.int64_t[:] file_ind = arrays["file_ind"]
+        cdef const np.int64_t[:] domain_ind = arrays["domain_ind"]
+        cdef const np.int64_t[:] domain = arrays["domain"]
+        cdef const np.int64_t[:] child_row = arrays["child_row"]
+        cdef const np.int64_t[:, :] children = arrays["children"]
+        if file_ind.shape[0] != con_assigned.sum() or (
+                children.shape[0] > 0 and
+                np.asarray(children).max() >= file_ind.shape[0]):
+            raise ValueError(f"{filename} is not a consistent octree.")
+        nonempty = np.flatnonzero(con_assigned > 0)
+        cdef const np.int64_t[:] starts = np.concatenate(
+            [[0], np.cumsum(con_assigned)])[nonempty].astype("int64")
+        cdef SparseOctreeContainer sparse
+        cdef const np.int64_t[:] root_keys
+        cdef const np.int64_t[:] root_octs
+        cdef const np.int64_t[:, :, :] root_mesh
+        cdef Oct **bases = <Oct **> malloc(sizeof(Oct*) * max(nonempty.size, 1))
+        for i in range(nonempty.size):
+            bases[i] = obj.domains.get_cont(nonempty[i]).my_objs
+        ind = 0
+        try:
+            for i in range(n_con):
+                cont = obj.domains.get_cont(i)
+                for j in range(cont.n_assigned):
+                    o = &cont.my_objs[j]
+                    o.file_ind = file_ind[ind]
+                    o.domain_ind = domain_ind[ind]
+                    o.domain = domain[ind]
+                    row = child_row[ind]
+                    ind += 1
+                    if row < 0: continue
+                    o.children = <Oct **> malloc(sizeof(Oct *) * 8)
+                    for k in range(8):
+                        o.children[k] = _index_to_oct(
+                            children[row, k], bases, starts)
+            if isinstance(obj, SparseOctreeContainer):
+                sparse = obj
+                root_keys = arrays["root_keys"]
+                root_octs = arrays["root_octs"]
+                sparse.max_root = header["max_root"]
+                sparse.root_nodes = <OctKey*> malloc(
+                    sizeof(OctKey) * sparse.max_root)
+                for i in range(sparse.max_root):
+                    sparse.root_nodes[i].key = -1
+                    sparse.root_nodes[i].node = NULL
+                for i in range(root_keys.shape[0]):
+                    sparse.root_nodes[i].key = root_keys[i]
+                    sparse.root_nodes[i].node = _index_to_oct(
+                        root_octs[i], bases, starts)
+                    tsearch(<void*> &sparse.root_nodes[i], &sparse.tree_root,
+                            root_node_compare)
+                sparse.num_root = root_keys.shape[0]
+            else:
+                root_mesh = arrays["root_octs"]
+                for i in range(obj.nn[0]):
+                    for j in range(obj.nn[1]):
+                        for k in range(obj.nn[2]):
+                            obj.root_mesh[i][j][k] = _index_to_oct(
+                                root_mesh[i, j, k], bases, starts)
+        finally:
+            free(bases)
+        return obj
+
     def selector_fill(self, SelectorObject selector,
                       np.ndarray source,
                       np.ndarray dest = None,
@@ -95,6 +95,17 @@ cdef class ParticleOctreeContainer(OctreeContainer):
     #How many particles do we keep befor refining
     cdef public int n_ref
 
+    def save_to_file(self, filename, metadata = None):
+        # The octs are not held in allocation containers, which is what
+        # OctreeContainer.save_to_file serializes.
+        raise NotImplementedError(
+            f"{type(self).__name__} cannot be saved to an octree file.")
+
+    @classmethod
+    def load_from_file(cls, filename):
+        raise NotImplementedError(
+            f"{cls.__name__} cannot be loaded from an octree file.")
+
     def allocate_root(self):
         cdef int i, j, k
         cdef Oct *cur
@@ -1967,6 +1978,16 @@ cdef class ParticleBitmapOctreeContainer(SparseOctreeContainer):
         self._index_base_roots = <np.uint8_t[:num_root]> self._ptr_index_base_roots
         self._octs_per_root = <np.uint64_t[:num_root]> self._ptr_octs_per_root
 
+    def save_to_file(self, filename, metadata = None):
+        # The per-root oct counts and index bases are not serialized.
+        raise NotImplementedError(
+            f"{type(self).__name__} cannot be saved to an octree file.")
+
+    @classmethod
+    def load_from_file(cls, filename):
+        raise NotImplementedError(
+            f"{cls.__name__} cannot be loaded from an octree file.")
+
     def allocate_domains(self, counts = None):
         if counts is None:
             counts = [self.max_root]
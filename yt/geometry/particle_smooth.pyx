@@ -1,5 +1,7 @@
 # distutils: include_dirs = LIB_DIR
 # distutils: libraries = STD_LIBS
+# distutils: extra_compile_args = OMP_ARGS
+# distutils: extra_link_args = OMP_ARGS
 """
 Particle smoothing in cells
 
@@ -14,23 +16,114 @@ cimport numpy as np
 import numpy as np
 
 cimport cython
+from cpython cimport PyObject
 from cpython.exc cimport PyErr_CheckSignals
+from cython.parallel cimport parallel, prange, threadid
 from libc.math cimport cos, fabs, sin, sqrt
 from libc.stdlib cimport free, malloc, realloc
 from libc.string cimport memmove
 from oct_container cimport Oct, OctInfo, OctreeContainer
 
 
-cdef void spherical_coord_setup(np.float64_t ipos[3], np.float64_t opos[3]):
+cdef void spherical_coord_setup(np.float64_t ipos[3], np.float64_t opos[3]) nogil:
     opos[0] = ipos[0] * sin(ipos[1]) * cos(ipos[2])
     opos[1] = ipos[0] * sin(ipos[1]) * sin(ipos[2])
     opos[2] = ipos[0] * cos(ipos[1])
 
-cdef void cart_coord_setup(np.float64_t ipos[3], np.float64_t opos[3]):
+cdef void cart_coord_setup(np.float64_t ipos[3], np.float64_t opos[3]) nogil:
     opos[0] = ipos[0]
     opos[1] = ipos[1]
     opos[2] = ipos[2]
 
+cdef class OctNeighbors:
+    """Lists of the octs neighboring each oct of a particle octree.
+
+    The list of an oct is computed the first time a position inside it is
+    passed to ``find``, and kept afterwards, so that one instance can be
+    shared between several smoothing operations on the same octree.  The
+    lists are indexed by the local index of the octs, as are the particle
+    counts and offsets of the smoothing operations.
+    """
+    def __cinit__(self, OctreeContainer octree, np.int64_t noct, periodicity,
+                  int domain_id = -1):
+        cdef np.int64_t i
+        self.octree = octree
+        self.noct = noct
+        self.domain_id = domain_id
+        self.moff = octree.get_domain_offset(domain_id)
+        for i in range(3):
+            self.periodicity[i] = periodicity[i]
+        self.start = <np.int64_t *> malloc(sizeof(np.int64_t) * max(noct, 1))
+        self.count = <np.int64_t *> malloc(sizeof(np.int64_t) * max(noct, 1))
+        for i in range(noct):
+            self.start[i] = -1
+            self.count[i] = 0
+        self.buf_size = 27 * max(noct, 1)
+        self.buf = <np.int64_t *> malloc(sizeof(np.int64_t) * self.buf_size)
+        self.buf_used = 0
+
+    def __dealloc__(self):
+        free(self.start)
+        free(self.count)
+        free(self.buf)
+
+    def matches(self, OctreeContainer octree, np.int64_t noct, periodicity,
+                int domain_id = -1):
+        """Whether these lists can be used for *octree* with *periodicity*."""
+        cdef int i
+        if self.octree is not octree or self.noct != noct \
+           or self.domain_id != domain_id:
+            return False
+        for i in range(3):
+            if self.periodicity[i] != bool(periodicity[i]):
+                return False
+        return True
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef int find(self, np.float64_t pos[3]) except -1:
+        # Make sure that the neighbors of the oct containing pos are known.
+        # This returns 1 if pos is not in any oct, and 0 otherwise.
+        cdef OctInfo oi
+        cdef Oct *o = self.octree.get(pos, &oi)
+        cdef Oct **neighbors
+        cdef np.int64_t i, j, n, ind, nind, first
+        if o == NULL:
+            return 1
+        ind = o.domain_ind - self.moff
+        if ind < 0 or ind >= self.noct:
+            raise IndexError(f"Oct {ind} is outside of the {self.noct} octs "
+                             "indexed.")
+        if self.start[ind] >= 0:
+            return 0
+        neighbors = self.octree.neighbors(&oi, &n, o, self.periodicity)
+        if self.buf_used + n > self.buf_size:
+            self.buf_size = max(2 * self.buf_size, self.buf_used + n)
+            self.buf = <np.int64_t *> realloc(
+                self.buf, sizeof(np.int64_t) * self.buf_size)
+        first = self.buf_used
+        for i in range(n):
+            # Particle octree neighbor indices; an oct can be found more than
+            # once, in which case we only keep it the first time.
+            nind = neighbors[i].domain_ind - self.moff
+            if nind < 0: continue
+            for j in range(first, self.buf_used):
+                if self.buf[j] == nind: break
+            else:
+                self.buf[self.buf_used] = nind
+                self.buf_used += 1
+        # This is allocated by the neighbors function, so we deallocate it.
+        free(neighbors)
+        self.start[ind] = first
+        self.count[ind] = self.buf_used - first
+        return 0
+
+    cdef np.int64_t *get(self, Oct *o, np.int64_t *nneighbors) nogil:
+        # The neighbors of o must already have been found.
+        cdef np.int64_t ind = o.domain_ind - self.moff
+        nneighbors[0] = self.count[ind]
+        return self.buf + self.start[ind]
+
 cdef class ParticleSmoothOperation:
     def __init__(self, nvals, nfields, max_neighbors, kernel_name):
         # This is the set of cells, in grids, blocks or octs, we are handling.
@@ -39,6 +132,7 @@ cdef class ParticleSmoothOperation:
         self.nfields = nfields
         self.maxn = max_neighbors
         self.sph_kernel = get_kernel_func(kernel_name)
+        self.oct_neighbors = None
 
     def initialize(self, *args):
         raise NotImplementedError
@@ -46,6 +140,36 @@ cdef class ParticleSmoothOperation:
     def finalize(self, *args):
         raise NotImplementedError
 
+    cdef OctNeighbors _get_oct_neighbors(self, OctreeContainer octree,
+                                         np.int64_t noct, int domain_id,
+                                         OctNeighbors oct_neighbors):
+        # Reuse the neighbor lists we were given, if they were built for this
+        # octree; the ones used are kept, so they can be passed on to the next
+        # operation.
+        periodicity = (self.periodicity[0], self.periodicity[1],
+                       self.periodicity[2])
+        if oct_neighbors is None or \
+           not oct_neighbors.matches(octree, noct, periodicity, domain_id):
+            oct_neighbors = OctNeighbors(octree, noct, periodicity, domain_id)
+        self.oct_neighbors = oct_neighbors
+        return oct_neighbors
+
+    cdef PyObject **_make_queues(self, int num_threads):
+        # Every thread needs a distance queue of its own.  OpenMP threads
+        # cannot hold references to Python objects, so they are given
+        # borrowed pointers to queues that are kept alive by self.
+        cdef int i
+        cdef DistanceQueue dq
+        cdef PyObject **queues = <PyObject **> malloc(
+            sizeof(PyObject *) * num_threads)
+        self._queues = []
+        for i in range(num_threads):
+            dq = DistanceQueue(self.maxn)
+            dq._setup(self.DW, self.periodicity)
+            self._queues.append(dq)
+            queues[i] = <PyObject *> dq
+        return queues
+
     @cython.cdivision(True)
     @cython.boundscheck(False)
     @cython.wraparound(False)
@@ -60,7 +184,9 @@ cdef class ParticleSmoothOperation:
                      index_fields = None,
                      OctreeContainer particle_octree = None,
                      np.int64_t [:] pdom_ind = None,
-                     geometry = "cartesian"):
+                     geometry = "cartesian",
+                     OctNeighbors oct_neighbors = None,
+                     int num_threads = 1):
         # This will be a several-step operation.
         #
         # We first take all of our particles and assign them to Octs.  If they
@@ -72,38 +198,31 @@ cdef class ParticleSmoothOperation:
         # overhead, but reduces complexity as we will now be able to use
         # argsort.
         #
-        # After the particles have been assigned to Octs, we process each Oct
-        # individually.  We will do this by calling "get" for the *first*
-        # particle in each set of Octs in the sorted list.  After this, we get
-        # neighbors for each Oct.
+        # After the particles have been assigned to Octs, we find the
+        # neighboring octs of every particle oct containing the center of a
+        # mesh cell.  These lists are held by an OctNeighbors object, which
+        # can be passed in through oct_neighbors to reuse the lists of a
+        # previous operation on the same particle octree.
         #
-        # Now, with the set of neighbors (and thus their indices) we allocate
-        # an array of particles and their fields, fill these in, and call our
-        # process function.
-        #
-        # This is not terribly efficient -- for starters, the neighbor function
-        # is not the most efficient yet.  We will also need to handle some
-        # mechanism of an expandable array for holding pointers to Octs, so
-        # that we can deal with >27 neighbors.
+        # Then the mesh octs are processed independently, by num_threads
+        # threads, each of which has its own distance queue.  For every cell,
+        # we gather the nearest particles of the neighboring octs and call our
+        # process function, which only writes to that cell.
         if particle_octree is None:
             particle_octree = mesh_octree
             pdom_ind = mdom_ind
-        cdef int nf, i, j, n
+        cdef int nf, i, j, k, n, ci, cj, ck
         cdef int dims[3]
-        cdef np.float64_t[:] *field_check
         cdef np.float64_t **field_pointers
-        cdef np.float64_t *field_vals
+        cdef np.float64_t **index_field_pointers
         cdef np.float64_t pos[3]
-        cdef np.float64_t dds[3]
-        cdef np.float64_t **octree_field_pointers
-        cdef int nsize = 0
-        cdef np.int64_t *nind = NULL
-        cdef OctInfo moi, poi
+        cdef np.float64_t cpos[3]
+        cdef np.float64_t opos[3]
+        cdef OctInfo moi
         cdef Oct *oct
-        cdef np.int64_t numpart, offset, local_ind, poff
+        cdef np.int64_t numpart, offset, poff, wi
         cdef np.int64_t moff_p, moff_m
         cdef np.int64_t[:] pind, doff, pdoms, pcount
-        cdef np.int64_t[:,:] doff_m
         cdef np.ndarray[np.float64_t, ndim=1] tarr
         cdef np.ndarray[np.float64_t, ndim=4] iarr
         cdef np.float64_t[:,:] cart_positions
@@ -136,15 +255,14 @@ cdef class ParticleSmoothOperation:
         oct_dds = np.zeros_like(oct_left_edges)
         # doff is the offset to a given oct in the sorted particles.
         doff = np.zeros_like(pdom_ind) - 1
-        doff_m = np.zeros((mdom_ind.shape[0], 2), dtype="int64")
         moff_p = particle_octree.get_domain_offset(domain_id + domain_offset)
         moff_m = mesh_octree.get_domain_offset(domain_id + domain_offset)
         # pdoms points particles at their octs.  So the value in this array, for
         # a given index, is the local oct index.
         pdoms = np.zeros(positions.shape[0], dtype="int64") - 1
-        nf = len(fields)
         if fields is None:
             fields = []
+        nf = len(fields)
         field_pointers = <np.float64_t**> alloca(sizeof(np.float64_t *) * nf)
         for i in range(nf):
             tarr = fields[i]
@@ -193,16 +311,21 @@ cdef class ParticleSmoothOperation:
             # If we have yet to assign the starting index to this oct, we do so
             # now.
             if doff[offset] < 0: doff[offset] = i
-        #print(domain_id, domain_offset, moff_p, moff_m)
-        #raise RuntimeError
         # Now doff is full of offsets to the first entry in the pind that
         # refers to that oct's particles.
+        cdef OctNeighbors nbrs = self._get_oct_neighbors(
+            particle_octree, doff.shape[0], domain_id, oct_neighbors)
+        num_threads = max(num_threads, 1)
+        # Collect the mesh octs we have to process, and make sure we know the
+        # neighbors of all the particle octs their cells are in.
         cdef np.ndarray[np.uint8_t, ndim=1] visited
         visited = np.zeros(mdom_ind.shape[0], dtype="uint8")
-        cdef int nproc = 0
-        # This should be thread-private if we ever go to OpenMP
-        cdef DistanceQueue dist_queue = DistanceQueue(self.maxn)
-        dist_queue._setup(self.DW, self.periodicity)
+        cdef np.int64_t nwork = 0
+        cdef np.int64_t[:] work_offset
+        cdef np.float64_t[:,:] work_le, work_dds
+        work_offset = np.empty(oct_positions.shape[0], dtype="int64")
+        work_le = np.empty((oct_positions.shape[0], 3), dtype="float64")
+        work_dds = np.empty((oct_positions.shape[0], 3), dtype="float64")
         for i in range(oct_positions.shape[0]):
             if (i % 10000) == 0:
                 PyErr_CheckSignals()
@@ -213,16 +336,33 @@ cdef class ParticleSmoothOperation:
             if visited[oct.domain_ind - moff_m] == 1: continue
             visited[oct.domain_ind - moff_m] = 1
             if offset < 0: continue
-            nproc += 1
-            self.neighbor_process(
-                dims, moi.left_edge, moi.dds, cart_positions, field_pointers, doff,
-                &nind, pind, pcount, offset, index_field_pointers,
-                particle_octree, domain_id, &nsize, oct_left_edges,
-                oct_dds, dist_queue)
-        #print("VISITED", visited.sum(), visited.size,)
-        #print(100.0*float(visited.sum())/visited.size)
-        if nind != NULL:
-            free(nind)
+            work_offset[nwork] = offset
+            for j in range(3):
+                work_le[nwork, j] = moi.left_edge[j]
+                work_dds[nwork, j] = moi.dds[j]
+            nwork += 1
+            cpos[0] = moi.left_edge[0] + 0.5*moi.dds[0]
+            for ci in range(dims[0]):
+                cpos[1] = moi.left_edge[1] + 0.5*moi.dds[1]
+                for cj in range(dims[1]):
+                    cpos[2] = moi.left_edge[2] + 0.5*moi.dds[2]
+                    for ck in range(dims[2]):
+                        self.pos_setup(cpos, opos)
+                        nbrs.find(opos)
+                        cpos[2] += moi.dds[2]
+                    cpos[1] += moi.dds[1]
+                cpos[0] += moi.dds[0]
+        cdef PyObject **queues = self._make_queues(num_threads)
+        cdef int tid
+        with nogil, parallel(num_threads=num_threads):
+            tid = threadid()
+            for wi in prange(nwork, schedule="dynamic"):
+                self.neighbor_process(
+                    dims, &work_le[wi, 0], &work_dds[wi, 0], cart_positions,
+                    field_pointers, doff, pind, pcount, work_offset[wi],
+                    index_field_pointers, nbrs, oct_left_edges, oct_dds,
+                    <DistanceQueue> queues[tid])
+        free(queues)
 
     @cython.cdivision(True)
     @cython.boundscheck(False)
@@ -234,7 +374,9 @@ cdef class ParticleSmoothOperation:
                      fields = None, int domain_id = -1,
                      int domain_offset = 0,
                      periodicity = (True, True, True),
-                     geometry = "cartesian"):
+                     geometry = "cartesian",
+                     OctNeighbors oct_neighbors = None,
+                     int num_threads = 1):
         # The other functions in this base class process particles in a way
         # that results in a modification to the *mesh*.  This function is
         # designed to process neighboring particles in such a way that a new
@@ -242,23 +384,21 @@ cdef class ParticleSmoothOperation:
         # attributes (*not* mesh attributes) can be created that rely on the
         # values of nearby particles.  For instance, a smoothing kernel, or a
         # nearest-neighbor field.
+        #
+        # As in process_octree, the neighbors of each particle oct are found
+        # once, and the particle octs are then shared out between threads;
+        # every particle only writes its own values.
         cdef int nf, i, j, k, n
-        cdef int dims[3]
         cdef np.float64_t **field_pointers
-        cdef np.float64_t *field_vals
-        cdef np.float64_t dds[3]
         cdef np.float64_t pos[3]
-        cdef np.float64_t **octree_field_pointers
-        cdef int nsize = 0
-        cdef np.int64_t *nind = NULL
-        cdef OctInfo moi, poi
+        cdef np.float64_t opos[3]
         cdef Oct *oct
-        cdef Oct **neighbors = NULL
-        cdef np.int64_t nneighbors, numpart, offset, local_ind
-        cdef np.int64_t moff_p, moff_m, pind0, poff
+        cdef np.int64_t numpart, offset
+        cdef np.int64_t moff_p, pind0, poff
         cdef np.int64_t[:] pind, doff, pdoms, pcount
         cdef np.ndarray[np.float64_t, ndim=1] tarr
-        cdef np.ndarray[np.float64_t, ndim=2] cart_positions
+        cdef np.float64_t[:,::1] raw_positions
+        cdef np.float64_t[:,:] cart_positions
         if geometry == "cartesian":
             self.pos_setup = cart_coord_setup
             cart_positions = positions
@@ -277,14 +417,15 @@ cdef class ParticleSmoothOperation:
             periodicity = (False, False, False)
         else:
             raise NotImplementedError
+        raw_positions = np.ascontiguousarray(positions)
         numpart = positions.shape[0]
         pcount = np.zeros_like(pdom_ind)
         doff = np.zeros_like(pdom_ind) - 1
         moff_p = particle_octree.get_domain_offset(domain_id + domain_offset)
         pdoms = np.zeros(positions.shape[0], dtype="int64") - 1
-        nf = len(fields)
         if fields is None:
             fields = []
+        nf = len(fields)
         field_pointers = <np.float64_t**> alloca(sizeof(np.float64_t *) * nf)
         for i in range(nf):
             tarr = fields[i]
@@ -320,98 +461,28 @@ cdef class ParticleSmoothOperation:
             # If we have yet to assign the starting index to this oct, we do so
             # now.
             if doff[offset] < 0: doff[offset] = i
-        #print(domain_id, domain_offset, moff_p, moff_m)
-        #raise RuntimeError
         # Now doff is full of offsets to the first entry in the pind that
         # refers to that oct's particles.
-        cdef int maxnei = 0
-        cdef int nproc = 0
-        # This should be thread-private if we ever go to OpenMP
-        cdef DistanceQueue dist_queue = DistanceQueue(self.maxn)
-        dist_queue._setup(self.DW, self.periodicity)
-        for i in range(doff.shape[0]):
-            if doff[i] < 0: continue
-            offset = pind[doff[i]]
-            for j in range(3):
-                pos[j] = positions[offset, j]
-            for j in range(pcount[i]):
-                pind0 = pind[doff[i] + j]
-                for k in range(3):
-                    pos[k] = positions[pind0, k]
-                self.neighbor_process_particle(pos, cart_positions, field_pointers,
-                            doff, &nind, pind, pcount, pind0,
-                            NULL, particle_octree, domain_id, &nsize,
-                            dist_queue)
-        #print("VISITED", visited.sum(), visited.size,)
-        #print(100.0*float(visited.sum())/visited.size)
-        if nind != NULL:
-            free(nind)
-
-    cdef int neighbor_search(self, np.float64_t pos[3], OctreeContainer octree,
-                             np.int64_t **nind, int *nsize,
-                             np.int64_t nneighbors, np.int64_t domain_id,
-                             Oct **oct = NULL, int extra_layer = 0):
-        cdef OctInfo oi
-        cdef Oct *ooct
-        cdef Oct **neighbors
-        cdef Oct **first_layer
-        cdef int j, total_neighbors = 0, initial_layer = 0
-        cdef int layer_ind = 0
-        cdef np.int64_t moff = octree.get_domain_offset(domain_id)
-        ooct = octree.get(pos, &oi)
-        if oct != NULL and ooct == oct[0]:
-            return nneighbors
-        oct[0] = ooct
-        if nind[0] == NULL:
-            nsize[0] = 27
-            nind[0] = <np.int64_t *> malloc(sizeof(np.int64_t)*nsize[0])
-        # This is our "seed" set of neighbors.  If we are asked to, we will
-        # create a master list of neighbors that is much bigger and includes
-        # everything.
-        layer_ind = 0
-        first_layer = NULL
-        while 1:
-            neighbors = octree.neighbors(&oi, &nneighbors, ooct, self.periodicity)
-            # Now we have all our neighbors.  And, we should be set for what
-            # else we need to do.
-            if total_neighbors + nneighbors > nsize[0]:
-                nind[0] = <np.int64_t *> realloc(
-                    nind[0], sizeof(np.int64_t)*(nneighbors + total_neighbors))
-                nsize[0] = nneighbors + total_neighbors
-            for j in range(nneighbors):
-                # Particle octree neighbor indices
-                nind[0][j + total_neighbors] = neighbors[j].domain_ind - moff
-            total_neighbors += nneighbors
-            if extra_layer == 0:
-                # Not adding on any additional layers here.
-                free(neighbors)
-                neighbors = NULL
-                break
-            if initial_layer == 0:
-                initial_layer = nneighbors
-                first_layer = neighbors
-            else:
-                # Allocated internally; we free this in the loops if we aren't
-                # tracking it
-                free(neighbors)
-                neighbors = NULL
-            ooct = first_layer[layer_ind]
-            layer_ind += 1
-            if layer_ind == initial_layer:
-                neighbors
-                break
-
-
-        for j in range(total_neighbors):
-            # Particle octree neighbor indices
-            if nind[0][j] == -1: continue
-            for n in range(j):
-                if nind[0][j] == nind[0][n]:
-                    nind[0][j] = -1
-        # This is allocated by the neighbors function, so we deallocate it.
-        if first_layer != NULL:
-            free(first_layer)
-        return total_neighbors
+        cdef OctNeighbors nbrs = self._get_oct_neighbors(
+            particle_octree, doff.shape[0], domain_id, oct_neighbors)
+        num_threads = max(num_threads, 1)
+        for i in range(positions.shape[0]):
+            if pdoms[i] < 0: continue
+            self.pos_setup(&raw_positions[i, 0], opos)
+            nbrs.find(opos)
+        cdef PyObject **queues = self._make_queues(num_threads)
+        cdef int tid
+        with nogil, parallel(num_threads=num_threads):
+            tid = threadid()
+            for i in prange(doff.shape[0], schedule="dynamic"):
+                if doff[i] < 0: continue
+                for j in range(pcount[i]):
+                    pind0 = pind[doff[i] + j]
+                    self.neighbor_process_particle(
+                        &raw_positions[pind0, 0], cart_positions,
+                        field_pointers, doff, pind, pcount, pind0, NULL, nbrs,
+                        <DistanceQueue> queues[tid])
+        free(queues)
 
     @cython.cdivision(True)
     @cython.boundscheck(False)
@@ -424,8 +495,9 @@ cdef class ParticleSmoothOperation:
 
     cdef void process(self, np.int64_t offset, int i, int j, int k,
                       int dim[3], np.float64_t cpos[3], np.float64_t **fields,
-                      np.float64_t **ifields, DistanceQueue dq):
-        raise NotImplementedError
+                      np.float64_t **ifields, DistanceQueue dq) nogil:
+        with gil:
+            raise NotImplementedError
 
     @cython.cdivision(True)
     @cython.boundscheck(False)
@@ -442,13 +514,13 @@ cdef class ParticleSmoothOperation:
                             np.float64_t[:,:] oct_left_edges,
                             np.float64_t[:,:] oct_dds,
                             DistanceQueue dq
-                            ):
+                            ) nogil:
         # We are now given the number of neighbors, the indices into the
         # domains for them, and the number of particles for each.
         cdef int ni, i, j, k
         cdef np.int64_t offset, pn, pc
-        cdef np.float64_t pos[3] 
-        cdef np.float64_t ex[2] 
+        cdef np.float64_t pos[3]
+        cdef np.float64_t ex[2]
         cdef np.float64_t DR[2]
         cdef np.float64_t cp, r2_trunc, r2, dist
         dq.neighbor_reset()
@@ -456,7 +528,7 @@ cdef class ParticleSmoothOperation:
             if nind[ni] == -1: continue
             # terminate early if all 8 corners of oct are farther away than
             # most distant currently known neighbor
-            if oct_left_edges != None and dq.curn == dq.maxn:
+            if oct_left_edges is not None and dq.curn == dq.maxn:
                 r2_trunc = dq.neighbors[dq.curn - 1].r2
                 # iterate over each dimension in the outer loop so we can
                 # consolidate temporary storage
@@ -502,21 +574,23 @@ cdef class ParticleSmoothOperation:
     cdef void neighbor_process(self, int dim[3], np.float64_t left_edge[3],
                                np.float64_t dds[3], np.float64_t[:,:] ppos,
                                np.float64_t **fields,
-                               np.int64_t [:] doffs, np.int64_t **nind,
+                               np.int64_t [:] doffs,
                                np.int64_t [:] pinds, np.int64_t[:] pcounts,
                                np.int64_t offset,
                                np.float64_t **index_fields,
-                               OctreeContainer octree, np.int64_t domain_id,
-                               int *nsize, np.float64_t[:,:] oct_left_edges,
+                               OctNeighbors nbrs,
+                               np.float64_t[:,:] oct_left_edges,
                                np.float64_t[:,:] oct_dds,
-                               DistanceQueue dq):
+                               DistanceQueue dq) nogil:
         # Note that we assume that fields[0] == smoothing length in the native
         # units supplied.  We can now iterate over every cell in the block and
         # every particle to find the nearest.  We will use a priority heap.
-        cdef int i, j, k, ntot, nntot, m, nneighbors
+        cdef int i, j, k
+        cdef np.int64_t nneighbors
+        cdef np.int64_t *nind
         cdef np.float64_t cpos[3]
         cdef np.float64_t opos[3]
-        cdef Oct* oct = NULL
+        cdef Oct* oct
         cpos[0] = left_edge[0] + 0.5*dds[0]
         for i in range(dim[0]):
             cpos[1] = left_edge[1] + 0.5*dds[1]
@@ -524,21 +598,15 @@ cdef class ParticleSmoothOperation:
                 cpos[2] = left_edge[2] + 0.5*dds[2]
                 for k in range(dim[2]):
                     self.pos_setup(cpos, opos)
-                    nneighbors = self.neighbor_search(opos, octree,
-                                    nind, nsize, nneighbors, domain_id, &oct, 0)
-                    self.neighbor_find(nneighbors, nind[0], doffs, pcounts,
-                                       pinds, ppos, opos, oct_left_edges,
-                                       oct_dds, dq)
-                    # Now we have all our neighbors in our neighbor list.
-                    if dq.curn <-1*dq.maxn:
-                        ntot = nntot = 0
-                        for m in range(nneighbors):
-                            if nind[0][m] < 0: continue
-                            nntot += 1
-                            ntot += pcounts[nind[0][m]]
-                        print("SOMETHING WRONG", dq.curn, nneighbors, ntot, nntot)
-                    self.process(offset, i, j, k, dim, opos, fields,
-                                 index_fields, dq)
+                    oct = nbrs.octree.get(opos)
+                    if oct != NULL:
+                        nind = nbrs.get(oct, &nneighbors)
+                        self.neighbor_find(nneighbors, nind, doffs, pcounts,
+                                           pinds, ppos, opos, oct_left_edges,
+                                           oct_dds, dq)
+                        # Now we have all our neighbors in our neighbor list.
+                        self.process(offset, i, j, k, dim, opos, fields,
+                                     index_fields, dq)
                     cpos[2] += dds[2]
                 cpos[1] += dds[1]
             cpos[0] += dds[0]
@@ -550,29 +618,29 @@ cdef class ParticleSmoothOperation:
     cdef void neighbor_process_particle(self, np.float64_t cpos[3],
                                np.float64_t[:,:] ppos,
                                np.float64_t **fields,
-                               np.int64_t[:] doffs, np.int64_t **nind,
+                               np.int64_t[:] doffs,
                                np.int64_t[:] pinds, np.int64_t[:] pcounts,
                                np.int64_t offset,
                                np.float64_t **index_fields,
-                               OctreeContainer octree,
-                               np.int64_t domain_id, int *nsize,
-                               DistanceQueue dq):
+                               OctNeighbors nbrs,
+                               DistanceQueue dq) nogil:
         # Note that we assume that fields[0] == smoothing length in the native
         # units supplied.  We can now iterate over every cell in the block and
         # every particle to find the nearest.  We will use a priority heap.
-        cdef int i, j, k, ntot, nntot, m
         cdef int dim[3]
-        cdef Oct *oct = NULL
-        cdef np.int64_t nneighbors = 0
-        i = j = k = 0
+        cdef Oct *oct
+        cdef np.int64_t nneighbors
+        cdef np.int64_t *nind
         dim[0] = dim[1] = dim[2] = 1
         cdef np.float64_t opos[3]
         self.pos_setup(cpos, opos)
-        nneighbors = self.neighbor_search(opos, octree,
-                        nind, nsize, nneighbors, domain_id, &oct, 0)
-        self.neighbor_find(nneighbors, nind[0], doffs, pcounts, pinds, ppos,
+        oct = nbrs.octree.get(opos)
+        if oct == NULL:
+            return
+        nind = nbrs.get(oct, &nneighbors)
+        self.neighbor_find(nneighbors, nind, doffs, pcounts, pinds, ppos,
                            opos, None, None, dq)
-        self.process(offset, i, j, k, dim, opos, fields, index_fields, dq)
+        self.process(offset, 0, 0, 0, dim, opos, fields, index_fields, dq)
 
 cdef class VolumeWeightedSmooth(ParticleSmoothOperation):
     # This smoothing function evaluates the field, *without* normalization, at
@@ -611,7 +679,7 @@ cdef class VolumeWeightedSmooth(ParticleSmoothOperation):
     @cython.initializedcheck(False)
     cdef void process(self, np.int64_t offset, int i, int j, int k,
                       int dim[3], np.float64_t cpos[3], np.float64_t **fields,
-                      np.float64_t **index_fields, DistanceQueue dq):
+                      np.float64_t **index_fields, DistanceQueue dq) nogil:
         # We have our i, j, k for our cell, as well as the cell position.
         # We also have a list of neighboring particles with particle numbers.
         cdef int n, fi
@@ -670,7 +738,7 @@ cdef class NearestNeighborSmooth(ParticleSmoothOperation):
     @cython.initializedcheck(False)
     cdef void process(self, np.int64_t offset, int i, int j, int k,
                       int dim[3], np.float64_t cpos[3], np.float64_t **fields,
-                      np.float64_t **index_fields, DistanceQueue dq):
+                      np.float64_t **index_fields, DistanceQueue dq) nogil:
         # We have our i, j, k for our cell, as well as the cell position.
         # We also have a list of neighboring particles with particle numbers.
         cdef np.int64_t pn
@@ -704,7 +772,7 @@ cdef class IDWInterpolationSmooth(ParticleSmoothOperation):
     @cython.initializedcheck(False)
     cdef void process(self, np.int64_t offset, int i, int j, int k,
                       int dim[3], np.float64_t cpos[3], np.float64_t **fields,
-                      np.float64_t **index_fields, DistanceQueue dq):
+                      np.float64_t **index_fields, DistanceQueue dq) nogil:
         # We have our i, j, k for our cell, as well as the cell position.
         # We also have a list of neighboring particles with particle numbers.
         cdef np.int64_t pn, ni, di
@@ -740,7 +808,7 @@ cdef class NthNeighborDistanceSmooth(ParticleSmoothOperation):
     @cython.initializedcheck(False)
     cdef void process(self, np.int64_t offset, int i, int j, int k,
                       int dim[3], np.float64_t cpos[3], np.float64_t **fields,
-                      np.float64_t **index_fields, DistanceQueue dq):
+                      np.float64_t **index_fields, DistanceQueue dq) nogil:
         cdef np.float64_t max_r
         # We assume "offset" here is the particle index.
         max_r = sqrt(dq.neighbors[dq.curn-1].r2)
@@ -761,7 +829,7 @@ cdef class SmoothedDensityEstimate(ParticleSmoothOperation):
     @cython.initializedcheck(False)
     cdef void process(self, np.int64_t offset, int i, int j, int k,
                       int dim[3], np.float64_t cpos[3], np.float64_t **fields,
-                      np.float64_t **index_fields, DistanceQueue dq):
+                      np.float64_t **index_fields, DistanceQueue dq) nogil:
         cdef np.float64_t r2, hsml, dens, mass, weight, lw
         cdef int pn
         # We assume "offset" here is the particle index.
@@ -1195,31 +1195,68 @@ cdef class RegionSelector(SelectorObject):
 region_selector = RegionSelector
 
 cdef class CutRegionSelector(SelectorObject):
-    cdef set _positions
+    # The centers of the selected cells, sorted lexicographically so that
+    # they can be looked up by bisection without the GIL.
+    cdef np.float64_t[:, ::1] _positions
+    cdef np.float64_t _left_edge[3]
+    cdef np.float64_t _right_edge[3]
     cdef tuple _conditionals
 
     def __init__(self, dobj):
+        cdef int i
         axis_name = dobj.ds.coordinates.axis_name
         positions = np.array([dobj['index', axis_name[0]],
                               dobj['index', axis_name[1]],
-                              dobj['index', axis_name[2]]]).T
+                              dobj['index', axis_name[2]]],
+                             dtype="float64").T
         self._conditionals = tuple(dobj.conditionals)
-        self._positions = set(tuple(position) for position in positions)
+        order = np.lexsort((positions[:, 2], positions[:, 1], positions[:, 0]))
+        self._positions = np.ascontiguousarray(positions[order])
+        for i in range(3):
+            if positions.shape[0] > 0:
+                self._left_edge[i] = positions[:, i].min()
+                self._right_edge[i] = positions[:, i].max()
+            else:
+                self._left_edge[i] = 1.0
+                self._right_edge[i] = -1.0
 
     cdef int select_bbox(self,  np.float64_t left_edge[3],
                      np.float64_t right_edge[3]) nogil:
+        # Only boxes that can contain one of the cell centers are selected.
+        cdef int i
+        for i in range(3):
+            if left_edge[i] > self._right_edge[i] or \
+               right_edge[i] < self._left_edge[i]:
+                return 0
         return 1
 
     cdef int select_bbox_dge(self,  np.float64_t left_edge[3],
                      np.float64_t right_edge[3]) nogil:
         return 1
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    @cython.cdivision(True)
     cdef int select_cell(self, np.float64_t pos[3], np.float64_t dds[3]) nogil:
-        with gil:
-            if (pos[0], pos[1], pos[2]) in self._positions:
+        cdef np.int64_t lo = 0, hi = self._positions.shape[0], mid
+        cdef int i, cmp
+        while lo < hi:
+            mid = (lo + hi) // 2
+            cmp = 0
+            for i in range(3):
+                if self._positions[mid, i] < pos[i]:
+                    cmp = -1
+                    break
+                elif self._positions[mid, i] > pos[i]:
+                    cmp = 1
+                    break
+            if cmp == 0:
                 return 1
+            elif cmp < 0:
+                lo = mid + 1
             else:
-                return 0
+                hi = mid
+        return 0
 
     cdef int select_point(self, np.float64_t pos[3]) nogil:
         return 1
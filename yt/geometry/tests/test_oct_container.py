@@ -0,0 +1,90 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from yt.geometry.oct_container import (
+    OctreeContainer,
+    RAMSESOctreeContainer,
+    read_octree_file_header,
+)
+from yt.geometry.selection_routines import AlwaysSelector
+from yt.testing import assert_array_equal, assert_equal, assert_raises, fake_octree_ds
+
+
+def _random_octs(prng, nn, max_level):
+    # Oct centers of a randomly refined unit box, level by level.
+    octs = []
+    dds = 1.0 / np.array(nn)
+    centers = np.stack(
+        np.meshgrid(*[(np.arange(n) + 0.5) / n for n in nn], indexing="ij"), axis=-1
+    ).reshape(-1, 3)
+    for level in range(max_level + 1):
+        octs.append(centers)
+        offsets = np.array(
+            [[i, j, k] for i in (-1, 1) for j in (-1, 1) for k in (-1, 1)]
+        )
+        cells = (centers[:, None, :] + offsets[None, :, :] * dds / 4).reshape(-1, 3)
+        centers = cells[prng.random_sample(cells.shape[0]) < 0.2]
+        dds = dds / 2
+    return octs
+
+
+def _compare_octrees(oct_handler, loaded):
+    selector = AlwaysSelector(None)
+    assert_equal(loaded.nocts, oct_handler.nocts)
+    assert_equal(loaded.num_domains, oct_handler.num_domains)
+    assert_equal(loaded.fill_style, oct_handler.fill_style)
+    assert_array_equal(loaded.domain_ind(selector), oct_handler.domain_ind(selector))
+    assert_array_equal(loaded.icoords(selector), oct_handler.icoords(selector))
+    assert_array_equal(loaded.fcoords(selector), oct_handler.fcoords(selector))
+    assert_array_equal(loaded.ires(selector), oct_handler.ires(selector))
+    for domain_id in range(1, oct_handler.num_domains + 1):
+        for a, b in zip(
+            loaded.file_index_octs(selector, domain_id),
+            oct_handler.file_index_octs(selector, domain_id),
+        ):
+            assert_array_equal(a, b)
+
+
+def test_save_and_load_ramses_octree():
+    prng = np.random.RandomState(0x4D3D3D3)
+    octs = _random_octs(prng, (2, 2, 2), 4)
+    domains = [prng.randint(1, 4, size=len(pos)) for pos in octs]
+    counts = np.zeros(3, dtype="int64")
+    for dom in domains:
+        counts += np.bincount(dom - 1, minlength=3)
+    oct_handler = RAMSESOctreeContainer((2, 2, 2), np.zeros(3), np.ones(3))
+    oct_handler.allocate_domains(counts, 8)
+    for level, (pos, dom) in enumerate(zip(octs, domains)):
+        for idom in range(1, 4):
+            oct_handler.add(idom, level, pos[dom == idom])
+    oct_handler.finalize()
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        fn = os.path.join(tmpdir, "octree.bin")
+        oct_handler.save_to_file(fn, metadata={"max_level": 4})
+        header = read_octree_file_header(fn)
+        assert_equal(header["metadata"], {"max_level": 4})
+        assert_equal(header["level_count"], [len(pos) for pos in octs])
+        loaded = RAMSESOctreeContainer.load_from_file(fn)
+        _compare_octrees(oct_handler, loaded)
+        selector = AlwaysSelector(None)
+        assert_equal(loaded.domain_identify(selector), [1, 2, 3])
+        assert_raises(TypeError, OctreeContainer.load_from_file, fn)
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+def test_save_and_load_octree():
+    ds = fake_octree_ds()
+    oct_handler = ds.index.oct_handler
+    tmpdir = tempfile.mkdtemp()
+    try:
+        fn = os.path.join(tmpdir, "octree.bin")
+        oct_handler.save_to_file(fn)
+        _compare_octrees(oct_handler, OctreeContainer.load_from_file(fn))
+    finally:
+        shutil.rmtree(tmpdir)
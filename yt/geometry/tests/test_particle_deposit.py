@@ -1,9 +1,20 @@
-from numpy.testing import assert_allclose, assert_array_less, assert_raises
+import numpy as np
+from numpy.testing import (
+    assert_allclose,
+    assert_array_equal,
+    assert_array_less,
+    assert_raises,
+)
 
 import yt
+from yt.geometry import particle_deposit
+from yt.geometry.oct_container import _ORDER_MAX
+from yt.geometry.particle_oct_container import ParticleOctreeContainer
+from yt.geometry.selection_routines import AlwaysSelector
 from yt.loaders import load
 from yt.testing import fake_random_ds, requires_file
 from yt.utilities.exceptions import YTBoundsDefinitionError
+from yt.utilities.lib.geometry_utils import get_morton_indices
 
 
 def test_cic_deposit():
@@ -15,6 +26,36 @@ def test_cic_deposit():
     assert_raises(YTBoundsDefinitionError, my_reg.__getitem__, f)
 
 
+def test_threaded_octree_deposit():
+    prng = np.random.RandomState(0x4D3D3D3)
+    pos = np.clip(prng.normal(0.5, 0.1, size=(20000, 3)), 0.0, 1.0 - 1e-12)
+    mass = prng.random_sample(pos.shape[0])
+    octree = ParticleOctreeContainer((1, 1, 1), np.zeros(3), np.ones(3))
+    octree.n_ref = 32
+    ipos = np.floor(pos * 2 ** _ORDER_MAX).astype("uint64")
+    octree.add(np.sort(get_morton_indices(ipos)))
+    octree.finalize()
+    dom_ind = octree.domain_ind(AlwaysSelector(None))
+    nvals = (2, 2, 2, (dom_ind >= 0).sum())
+    fields = {"count": [], "mesh_id": [], "weighted_mean": [mass, mass ** 2]}
+    for method in ["count", "sum", "std", "cic", "weighted_mean", "nearest", "mesh_id"]:
+        results = []
+        for num_threads in (1, 4):
+            op = getattr(particle_deposit, f"deposit_{method}")(nvals, "cubic")
+            op.initialize()
+            op.process_octree(
+                octree,
+                dom_ind,
+                pos,
+                fields.get(method, [mass]),
+                num_threads=num_threads,
+            )
+            results.append(op.finalize())
+        # Octs are handed out whole to each thread, so the result must be
+        # identical to the serial one and not only close to it.
+        assert_array_equal(results[0], results[1])
+
+
 RAMSES = "output_00080/info_00080.txt"
 RAMSES_small = "ramses_new_format/output_00002/info_00002.txt"
 ISOGAL = "IsolatedGalaxy/galaxy0030/galaxy0030"
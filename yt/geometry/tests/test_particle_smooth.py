@@ -0,0 +1,77 @@
+import numpy as np
+from numpy.testing import assert_allclose
+
+from yt.geometry import particle_smooth
+from yt.geometry.oct_container import _ORDER_MAX
+from yt.geometry.particle_oct_container import ParticleOctreeContainer
+from yt.geometry.selection_routines import AlwaysSelector
+from yt.testing import assert_array_equal, fake_octree_ds
+from yt.utilities.lib.geometry_utils import get_morton_indices
+
+
+def _make_octree(pos, n_ref):
+    octree = ParticleOctreeContainer((1, 1, 1), np.zeros(3), np.ones(3))
+    octree.n_ref = n_ref
+    ipos = np.floor(pos * 2 ** _ORDER_MAX).astype("uint64")
+    octree.add(np.sort(get_morton_indices(ipos)))
+    octree.finalize()
+    return octree, octree.domain_ind(AlwaysSelector(None))
+
+
+def test_threaded_particle_smooth():
+    prng = np.random.RandomState(0x4D3D3D3)
+    npart = 4000
+    pos = np.clip(prng.normal(0.5, 0.15, size=(npart, 3)), 0.0, 1.0 - 1e-12)
+    mass = prng.random_sample(npart)
+    octree, dom_ind = _make_octree(pos, 32)
+    nvals = (2, 2, 2, (dom_ind >= 0).sum())
+
+    distances = []
+    oct_neighbors = None
+    for num_threads in (1, 4):
+        dist = np.zeros(npart)
+        op = particle_smooth.nth_neighbor_smooth(nvals, 1, 8, "cubic")
+        op.initialize()
+        op.process_particles(
+            octree,
+            dom_ind,
+            pos,
+            [dist],
+            oct_neighbors=oct_neighbors,
+            num_threads=num_threads,
+        )
+        # The neighbor lists of the first pass are reused by the second one.
+        if oct_neighbors is not None:
+            assert op.oct_neighbors is oct_neighbors
+        oct_neighbors = op.oct_neighbors
+        distances.append(dist)
+    assert_array_equal(distances[0], distances[1])
+
+    # Compare with a brute force search in the periodic box
+    sub = np.arange(0, npart, 50)
+    dx = np.abs(pos[sub, None, :] - pos[None, :, :])
+    dx = np.minimum(dx, 1.0 - dx)
+    r = np.sort(np.sqrt((dx ** 2).sum(axis=-1)), axis=1)[:, 7]
+    assert_allclose(distances[0][sub], r, rtol=1e-12)
+
+    values = []
+    for num_threads in (1, 4):
+        op = particle_smooth.idw_smooth(nvals, 1, 8, "cubic")
+        op.initialize()
+        op.process_octree(octree, dom_ind, pos, pos, [mass], num_threads=num_threads)
+        values.append(op.finalize())
+    assert_array_equal(values[0], values[1])
+
+
+def test_particle_octree_cache():
+    ds = fake_octree_ds()
+    prng = np.random.RandomState(0x4D3D3D3)
+    for chunk in ds.all_data().chunks([], "io"):
+        subset = chunk._current_chunk.objs[0]
+        pos = ds.arr(prng.random_sample((100, 3)), "code_length")
+        octree = subset._get_particle_octree(pos, 8, 1, None)[0]
+        # The same positions reuse the octree, even from a new array
+        assert subset._get_particle_octree(pos.copy(), 8, 1, None)[0] is octree
+        # New positions in the same array do not
+        pos[:] = prng.random_sample((100, 3))
+        assert subset._get_particle_octree(pos, 8, 1, None)[0] is not octree
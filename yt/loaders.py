@@ -285,12 +285,14 @@ def load_uniform_grid(
     if nprocs > 1:
         temp = {}
         new_data = {}
+        # The grid fields all have the shape of the domain, which is split
+        # the same way with or without any of them.
+        psize = get_psize(domain_dimensions, nprocs)
+        grid_left_edges, grid_right_edges, shapes, slices = decompose_array(
+            tuple(domain_dimensions), psize, bbox
+        )
+        grid_dimensions = np.array([shape for shape in shapes], dtype="int32")
         for key in data.keys():
-            psize = get_psize(np.array(data[key].shape), nprocs)
-            grid_left_edges, grid_right_edges, shapes, slices = decompose_array(
-                data[key].shape, psize, bbox
-            )
-            grid_dimensions = np.array([shape for shape in shapes], dtype="int32")
             temp[key] = [data[key][slice] for slice in slices]
         for gid in range(nprocs):
             new_data[gid] = {}
@@ -1,7 +1,15 @@
+import os
+
 from nose.tools import assert_raises
 
 from yt import YTQuantity
-from yt.funcs import validate_axis, validate_center
+from yt.config import ytcfg
+from yt.funcs import (
+    resolve_num_threads,
+    threaded_map,
+    validate_axis,
+    validate_center,
+)
 from yt.testing import assert_equal, fake_amr_ds
 
 
@@ -51,3 +59,22 @@ def test_validate_center():
         "CustomCenter'."
     )
     assert_equal(str(ex.exception)[:50], desired[:50])
+
+
+def test_threaded_map():
+    items = list(range(100))
+    for num_threads in (None, 0, 1, 4):
+        res = threaded_map(lambda x: x ** 2, items, num_threads=num_threads)
+        assert_equal(res, [x ** 2 for x in items])
+    assert_equal(threaded_map(len, [], num_threads=4), [])
+
+
+def test_resolve_num_threads():
+    assert_equal(resolve_num_threads(3), 3)
+    assert_equal(resolve_num_threads(0), os.cpu_count() or 1)
+    old = ytcfg.getint("yt", "numthreads")
+    try:
+        ytcfg["yt", "numthreads"] = "2"
+        assert_equal(resolve_num_threads(), 2)
+    finally:
+        ytcfg["yt", "numthreads"] = str(old)
@@ -120,6 +120,7 @@ cdef class FortranFile:
         """
         cdef INT32_t s1, s2, size
         cdef np.ndarray data
+        cdef void *buf
 
         if self._closed:
             raise ValueError("I/O operation on closed file.")
@@ -134,7 +135,11 @@ cdef class FortranFile:
                              'size (%s) of multi-item record' % (s1, size))
 
         data = np.empty(s1 // size, dtype=dtype)
-        fread(<void *>data.data, size, s1 // size, self.cfile)
+        buf = <void *>data.data
+        # Release the GIL for the bulk of the read, so that several files
+        # can be read concurrently from different threads.
+        with nogil:
+            fread(buf, size, s1 // size, self.cfile)
         fread(&s2, INT32_SIZE, 1, self.cfile)
 
         if s1 != s2:
@@ -2,10 +2,12 @@ import os
 import shutil
 import tempfile
 
+import numpy as np
+
 from yt.frontends.gdf.data_structures import GDFDataset
 from yt.loaders import load
-from yt.testing import assert_equal, fake_random_ds, requires_module
-from yt.utilities.grid_data_format.writer import write_to_gdf
+from yt.testing import assert_allclose, assert_equal, fake_random_ds, requires_module
+from yt.utilities.grid_data_format.writer import write_slabs_to_gdf, write_to_gdf
 from yt.utilities.on_demand_imports import _h5py as h5py
 
 TEST_AUTHOR = "yt test runner"
@@ -41,3 +43,67 @@ def test_write_gdf():
 
     finally:
         shutil.rmtree(tmpdir)
+
+
+@requires_module("h5py")
+def test_write_covering_grid_gdf():
+    """Covering grids are written to GDF files a slab at a time"""
+    tmpdir = tempfile.mkdtemp()
+    tmpfile = os.path.join(tmpdir, "test_cg_gdf.h5")
+
+    try:
+        test_ds = fake_random_ds(32, nprocs=8)
+        cg = test_ds.covering_grid(0, [0.25, 0.0, 0.125], [16, 24, 20])
+        cg.write_to_gdf(
+            tmpfile,
+            ["density", "velocity_x"],
+            nprocs=4,
+            field_units={"density": "kg/m**3"},
+            slab_size=3,
+            num_threads=2,
+            compression="gzip",
+            data_author=TEST_AUTHOR,
+        )
+        gdf_ds = load(tmpfile)
+        assert_equal(gdf_ds.index.num_grids, 4)
+        assert_equal(gdf_ds.domain_dimensions, cg.ActiveDimensions)
+        gdf_cg = gdf_ds.covering_grid(0, gdf_ds.domain_left_edge, [16, 24, 20])
+        for field, units in (("density", "kg/m**3"), ("velocity_x", "cm/s")):
+            assert_allclose(gdf_cg[field].to_value(units), cg[field].to_value(units))
+
+        h5f = h5py.File(tmpfile, mode="r")
+        assert_equal(h5f["gridded_data_format"].attrs["data_author"], TEST_AUTHOR)
+        assert_equal(h5f["data/grid_0000000000/density"].compression, "gzip")
+        h5f.close()
+
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+@requires_module("h5py")
+def test_write_slabs_to_gdf_dtype():
+    """The field datasets take the type of the slabs"""
+    tmpdir = tempfile.mkdtemp()
+    tmpfile = os.path.join(tmpdir, "test_slabs_gdf.h5")
+
+    try:
+        test_ds = fake_random_ds(8, nprocs=2)
+        data = np.arange(8 ** 3, dtype="float32").reshape((8, 8, 8))
+        slabs = [
+            (start, {"density": data[:, :, start : start + 3]}) for start in (0, 3, 6)
+        ]
+        write_slabs_to_gdf(test_ds, tmpfile, {"density": "g/cm**3"}, slabs)
+
+        h5f = h5py.File(tmpfile, mode="r")
+        for grid in test_ds.index.grids:
+            dset = h5f["data/grid_%010i/density" % (grid.id - grid._id_offset)]
+            assert_equal(dset.dtype, np.dtype("float32"))
+            gi = grid.get_global_startindex()
+            dims = grid.ActiveDimensions
+            assert_equal(
+                dset[()], data[tuple(slice(i, i + n) for i, n in zip(gi, dims))]
+            )
+        h5f.close()
+
+    finally:
+        shutil.rmtree(tmpdir)
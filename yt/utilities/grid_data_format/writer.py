@@ -23,6 +23,8 @@ def write_to_gdf(
     dataset_units=None,
     particle_type_name="dark_matter",
     overwrite=False,
+    chunks=None,
+    compression=None,
     **kwargs,
 ):
     """
@@ -58,6 +60,12 @@ def write_to_gdf(
     overwrite : boolean, optional
         Whether or not to overwrite an already existing file. If False, attempting
         to overwrite an existing file will result in an exception.
+    chunks : tuple or True, optional
+        The shape of the HDF5 chunks of the field datasets, or True to let
+        h5py choose it. Default: None, for contiguous datasets.
+    compression : string, optional
+        The HDF5 compression filter of the field datasets, such as "gzip"
+        or "lzf". Default: None.
 
     Examples
     --------
@@ -92,7 +100,78 @@ def write_to_gdf(
     ) as f:
 
         # now add the fields one-by-one
-        _write_fields_to_gdf(ds, f, fields, particle_type_name)
+        _write_fields_to_gdf(
+            ds, f, fields, particle_type_name, chunks=chunks, compression=compression
+        )
+
+
+def write_slabs_to_gdf(
+    ds, gdf_path, field_units, slabs, chunks=None, compression=None, **kwargs
+):
+    """
+    Write the fields of a single level dataset, given a slab of planes along
+    z at a time, to the given path in the Grid Data Format.
+
+    Only the grids of *ds* are used, for the layout of the file: the data
+    are written as the slabs are generated, so that the fields never need to
+    be held in memory as a whole.
+
+    Parameters
+    ----------
+    ds : Dataset object
+        The single level dataset whose grids the data are split into.
+    gdf_path : string
+        The path of the file to output.
+    field_units : dictionary
+        The units of each of the fields, by name.
+    slabs : iterable of (int, dict) tuples
+        The index of the first plane of each slab along z and the arrays of
+        the fields in it, in order.
+    chunks, compression
+        The HDF5 chunking and compression of the field datasets.
+
+    All remaining keyword arguments are passed to
+    yt.utilities.grid_data_format.writer.write_to_gdf.
+    """
+    dataset_kwargs = dict(chunks=chunks, compression=compression)
+    with _create_new_gdf(ds, gdf_path, **kwargs) as f:
+        for field_name, units in field_units.items():
+            _add_field_type(f, field_name, None, units)
+        g = f["data"]
+        grids = [
+            (
+                g["grid_%010i" % (grid.id - grid._id_offset)],
+                grid.get_global_startindex(),
+                grid.ActiveDimensions,
+            )
+            for grid in ds.index.grids
+        ]
+
+        for i, (start, data) in enumerate(slabs):
+            if i == 0:
+                # The datasets take the type of the arrays of the first slab
+                for grid_group, _gi, dims in grids:
+                    for field_name in field_units:
+                        grid_group.create_dataset(
+                            field_name,
+                            dims,
+                            dtype=data[field_name].dtype,
+                            **dataset_kwargs,
+                        )
+            stop = start + next(iter(data.values())).shape[2]
+            for grid_group, gi, dims in grids:
+                lo = max(start, gi[2])
+                hi = min(stop, gi[2] + dims[2])
+                if lo >= hi:
+                    continue
+                dst = slice(lo - gi[2], hi - gi[2])
+                src = (
+                    slice(gi[0], gi[0] + dims[0]),
+                    slice(gi[1], gi[1] + dims[1]),
+                    slice(lo - start, hi - start),
+                )
+                for field_name, arr in data.items():
+                    grid_group[field_name][:, :, dst] = arr[src]
 
 
 def save_field(ds, fields, field_parameters=None):
@@ -130,38 +209,39 @@ def save_field(ds, fields, field_parameters=None):
         )
 
 
+def _add_field_type(fhandle, field_name, display_name, units):
+    # add field info to field_types group
+    g = fhandle["field_types"]
+    # create the subgroup with the field's name
+    try:
+        sg = g.create_group(field_name)
+    except ValueError:
+        print("Error - File already contains field called " + field_name)
+        sys.exit(1)
+
+    # check that they actually contain something...
+    if display_name:
+        sg.attrs["field_name"] = np.string_(display_name)
+    else:
+        sg.attrs["field_name"] = np.string_(field_name)
+    if units:
+        sg.attrs["field_units"] = np.string_(units)
+    else:
+        sg.attrs["field_units"] = np.string_("None")
+    # @todo: is this always true?
+    sg.attrs["staggering"] = 0
+
+
 def _write_fields_to_gdf(
-    ds, fhandle, fields, particle_type_name, field_parameters=None
+    ds, fhandle, fields, particle_type_name, field_parameters=None, **dataset_kwargs
 ):
 
     for field_name in fields:
-        # add field info to field_types group
-        g = fhandle["field_types"]
-        # create the subgroup with the field's name
         if isinstance(field_name, tuple):
             field_name = field_name[1]
         fi = ds._get_field_info(field_name)
-        try:
-            sg = g.create_group(field_name)
-        except ValueError:
-            print("Error - File already contains field called " + field_name)
-            sys.exit(1)
-
         # grab the display name and units from the field info container.
-        display_name = fi.display_name
-        units = fi.units
-
-        # check that they actually contain something...
-        if display_name:
-            sg.attrs["field_name"] = np.string_(display_name)
-        else:
-            sg.attrs["field_name"] = np.string_(field_name)
-        if units:
-            sg.attrs["field_units"] = np.string_(units)
-        else:
-            sg.attrs["field_units"] = np.string_("None")
-        # @todo: is this always true?
-        sg.attrs["staggering"] = 0
+        _add_field_type(fhandle, field_name, fi.display_name, fi.units)
 
     # first we must create the datasets on all processes.
     g = fhandle["data"]
@@ -179,11 +259,11 @@ def _write_fields_to_gdf(
 
             if fi.sampling_type == "particle":  # particle data
                 pt_group.create_dataset(
-                    field_name, grid.ActiveDimensions, dtype="float64"
+                    field_name, grid.ActiveDimensions, dtype="float64", **dataset_kwargs
                 )
             else:  # a field
                 grid_group.create_dataset(
-                    field_name, grid.ActiveDimensions, dtype="float64"
+                    field_name, grid.ActiveDimensions, dtype="float64", **dataset_kwargs
                 )
 
     # now add the actual data, grid by grid
@@ -0,0 +1,303 @@
+"""
+A pooled HTTP client for reading remote datasets.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+from yt.funcs import get_requests, mylog, resolve_num_threads, threaded_map
+
+
+class HTTPClient:
+    r"""A keep-alive HTTP client for reading remote data.
+
+    All requests go through a single ``requests.Session`` whose connection
+    pool is sized to the number of threads, so that connections are reused
+    rather than re-opened for every read. Byte ranges are read in blocks of
+    ``block_size`` bytes: contiguous missing blocks are coalesced into a
+    single ``Range`` request, long runs are split into requests of at most
+    ``max_request_size`` bytes, and independent requests are issued
+    concurrently.
+
+    If ``cache_dir`` is given, whole resources and fetched blocks are stored
+    on disk, so that re-reading the same part of a remote file does not go
+    back to the network. Whole resources are cached by URL; blocks are
+    cached by URL, block size and the ``ETag`` (or, failing that, the size
+    and modification time) reported by the server, so that clients with
+    different block sizes do not share blocks and changed resources are
+    fetched again.
+
+    Parameters
+    ----------
+    num_threads : int, optional
+        Number of concurrent requests and pooled connections. Defaults to
+        the ``numthreads`` configuration option.
+    cache_dir : string, optional
+        Directory in which to cache downloaded data. Default: None (no
+        on-disk caching).
+    block_size : int, optional
+        Granularity, in bytes, of range requests and of the on-disk cache.
+    max_request_size : int, optional
+        Largest number of bytes requested at once in a single range request.
+
+    Examples
+    --------
+
+    >>> client = HTTPClient(cache_dir="/tmp/yt_http_cache")
+    >>> header = client.read_range("http://example.com/data.sdf", 0, 1024)
+    """
+
+    def __init__(
+        self,
+        num_threads=None,
+        cache_dir=None,
+        block_size=256 * 1024,
+        max_request_size=16 * 1024 * 1024,
+    ):
+        requests = get_requests()
+        if requests is None:
+            raise ImportError("This functionality depends on the requests package")
+        self.num_threads = resolve_num_threads(num_threads)
+        self.block_size = int(block_size)
+        self.max_request_size = max(int(max_request_size), self.block_size)
+        self.cache_dir = cache_dir
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+        self.total_bytes = 0
+        self._lock = threading.Lock()
+        self._sizes = {}
+        self._validators = {}
+        pool_size = max(self.num_threads, 1)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self):
+        self.session.close()
+
+    def _cache_path(self, url, name):
+        if self.cache_dir is None:
+            return None
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, key, name)
+
+    def _cache_load(self, path):
+        if path is None or not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+
+    def _cache_store(self, path, content):
+        if path is None:
+            return
+        dirname = os.path.dirname(path)
+        os.makedirs(dirname, exist_ok=True)
+        # Write to a temporary file first, so that concurrent readers never
+        # see a partially written entry.
+        fd, tmp = tempfile.mkstemp(dir=dirname)
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp, path)
+
+    def _request(self, url, headers=None, allowed=(200, 206)):
+        mylog.debug("Requesting URL %s %s", url, headers or "")
+        resp = self.session.get(url, headers=headers)
+        if resp.status_code not in allowed:
+            raise RuntimeError(f"Request for {url} failed with {resp.status_code}")
+        with self._lock:
+            self.total_bytes += len(resp.content)
+        return resp
+
+    def get(self, url):
+        """Return the full content of *url* as bytes."""
+        path = self._cache_path(url, "full")
+        content = self._cache_load(path)
+        if content is None:
+            mylog.info("Loading URL %s", url)
+            content = self._request(url).content
+            self._cache_store(path, content)
+        return content
+
+    def get_many(self, urls):
+        """Return the content of each of *urls*, fetched concurrently."""
+        return threaded_map(self.get, list(urls), num_threads=self.num_threads)
+
+    def get_size(self, url):
+        """Return the size in bytes of the resource at *url*."""
+        if url in self._sizes:
+            return self._sizes[url]
+        resp = self.session.head(url, allow_redirects=True)
+        size = resp.headers.get("Content-Length")
+        if resp.status_code == 200:
+            validator = resp.headers.get("ETag")
+            if validator is None:
+                validator = f"{size}-{resp.headers.get('Last-Modified', '')}"
+            self._validators[url] = validator
+        if resp.status_code != 200 or size is None:
+            # Some servers do not answer HEAD requests properly; fall back on
+            # the total reported by a one-byte range request.
+            resp = self.session.get(url, headers={"Range": "bytes=0-0"})
+            content_range = resp.headers.get("Content-Range", "")
+            if resp.status_code == 206 and "/" in content_range:
+                size = content_range.rsplit("/", 1)[-1]
+            elif resp.status_code == 200:
+                size = len(resp.content)
+            else:
+                raise RuntimeError(f"Could not determine the size of {url}")
+        self._sizes[url] = int(size)
+        self._validators.setdefault(url, str(size))
+        return self._sizes[url]
+
+    def _block_path(self, url, index):
+        if self.cache_dir is None:
+            return None
+        if url not in self._validators:
+            self.get_size(url)
+        key = f"{self.block_size}-{self._validators[url]}"
+        key = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self._cache_path(url, os.path.join(key, f"{index}"))
+
+    def _fetch_blocks(self, url, first, count):
+        bs = self.block_size
+        start = first * bs
+        stop = start + count * bs
+        resp = self._request(
+            url,
+            headers={"Range": f"bytes={start}-{stop - 1}"},
+            allowed=(200, 206, 416),
+        )
+        content = resp.content
+        if resp.status_code == 416:
+            # The range starts past the end of the resource.
+            content = b""
+        elif resp.status_code == 200:
+            # The server ignored the range, so we got the whole resource.
+            content = content[start:stop]
+        blocks = {}
+        for i in range(count):
+            block = content[i * bs : (i + 1) * bs]
+            if len(block) == 0:
+                break
+            blocks[first + i] = block
+            self._cache_store(self._block_path(url, first + i), block)
+        return blocks
+
+    def read_ranges(self, url, ranges):
+        """Read several ``(start, stop)`` byte ranges of *url*.
+
+        The ranges are mapped onto blocks; blocks that are not cached are
+        fetched with as few range requests as possible, concurrently. A list
+        with the bytes of each range is returned, in the order requested.
+        """
+        bs = self.block_size
+        needed = set()
+        for start, stop in ranges:
+            if stop > start:
+                needed.update(range(start // bs, (stop - 1) // bs + 1))
+        blocks = {}
+        missing = []
+        for b in sorted(needed):
+            content = self._cache_load(self._block_path(url, b))
+            if content is None:
+                missing.append(b)
+            else:
+                blocks[b] = content
+        # Coalesce runs of consecutive missing blocks into single requests,
+        # splitting runs that would be too large.
+        max_blocks = self.max_request_size // bs
+        requests = []
+        for b in missing:
+            if requests:
+                first, count = requests[-1]
+                if b == first + count and count < max_blocks:
+                    requests[-1] = (first, count + 1)
+                    continue
+            requests.append((b, 1))
+        if requests:
+            mylog.debug(
+                "Fetching %s blocks of %s in %s requests",
+                len(missing),
+                url,
+                len(requests),
+            )
+        fetched = threaded_map(
+            lambda r: self._fetch_blocks(url, *r),
+            requests,
+            num_threads=self.num_threads,
+        )
+        for b in fetched:
+            blocks.update(b)
+        results = []
+        for start, stop in ranges:
+            if stop <= start:
+                results.append(b"")
+                continue
+            first, last = start // bs, (stop - 1) // bs
+            content = b"".join(blocks.get(b, b"") for b in range(first, last + 1))
+            results.append(content[start - first * bs : stop - first * bs])
+        return results
+
+    def read_range(self, url, start, stop):
+        """Read the bytes ``[start, stop)`` of *url*."""
+        return self.read_ranges(url, [(start, stop)])[0]
+
+
+class HTTPArray:
+    r"""A read-only, one-dimensional array backed by a remote file.
+
+    This behaves like a ``np.memmap`` of *shape* records of *dtype* starting
+    at byte *offset* of the file at *url*, with each access turned into a
+    range request through an :class:`HTTPClient`. The last block of records
+    read is kept, so that reading several fields of the same records of a
+    structured array only fetches them once.
+    """
+
+    def __init__(self, url, dtype="uint8", shape=None, offset=0, client=None):
+        self.url = url
+        self.client = client if client is not None else HTTPClient()
+        self.dtype = np.dtype(dtype)
+        self.offset = offset
+        if shape is None:
+            shape = (self.client.get_size(url) - offset) // self.dtype.itemsize
+        self.shape = int(shape)
+        self._last = None
+
+    def __len__(self):
+        return self.shape
+
+    def _read(self, start, stop):
+        if self._last is not None and self._last[:2] == (start, stop):
+            return self._last[2]
+        itemsize = self.dtype.itemsize
+        content = self.client.read_range(
+            self.url, self.offset + start * itemsize, self.offset + stop * itemsize
+        )
+        arr = np.frombuffer(content, dtype=self.dtype)
+        self._last = (start, stop, arr)
+        return arr
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            if key < 0:
+                key += self.shape
+            return self._read(key, key + 1)[0]
+        elif isinstance(key, slice):
+            start, stop, step = key.indices(self.shape)
+            if stop <= start:
+                return np.empty(0, dtype=self.dtype)
+            return self._read(start, stop)[::step]
+        key = np.asarray(key)
+        if key.dtype == bool:
+            key = np.flatnonzero(key)
+        key = np.where(key < 0, key + self.shape, key)
+        if key.size == 0:
+            return np.empty(0, dtype=self.dtype)
+        start = int(key.min())
+        return self._read(start, int(key.max()) + 1)[key - start]
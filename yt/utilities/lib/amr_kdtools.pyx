@@ -648,6 +648,25 @@ cdef class Node:
         assert(self.point_in_node(point))
         return self._find_node(point)
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def find_node_ids(self, np.float64_t[:, :] points):
+        """
+        Find the ids of the AMRKDTree nodes enclosing many positions, or -1
+        for those outside of this node
+        """
+        cdef np.int64_t i
+        cdef Node node
+        cdef np.ndarray[np.int64_t, ndim=1] ids
+        ids = np.empty(points.shape[0], dtype="int64")
+        for i in range(points.shape[0]):
+            if self.point_in_node(points[i, :]):
+                node = self._find_node(points[i, :])
+                ids[i] = node.node_id
+            else:
+                ids[i] = -1
+        return ids
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
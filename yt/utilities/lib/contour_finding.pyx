@@ -28,7 +28,7 @@ import sys
 
 
 cdef inline ContourID *contour_create(np.int64_t contour_id,
-                               ContourID *prev = NULL):
+                               ContourID *prev = NULL) nogil:
     node = <ContourID *> malloc(sizeof(ContourID))
     #print("Creating contour with id", contour_id)
     node.contour_id = contour_id
@@ -38,12 +38,12 @@ cdef inline ContourID *contour_create(np.int64_t contour_id,
     if prev != NULL: prev.next = node
     return node
 
-cdef inline void contour_delete(ContourID *node):
+cdef inline void contour_delete(ContourID *node) nogil:
     if node.prev != NULL: node.prev.next = node.next
     if node.next != NULL: node.next.prev = node.prev
     free(node)
 
-cdef inline ContourID *contour_find(ContourID *node):
+cdef inline ContourID *contour_find(ContourID *node) nogil:
     cdef ContourID *temp
     cdef ContourID *root
     root = node
@@ -62,7 +62,7 @@ cdef inline ContourID *contour_find(ContourID *node):
         node = temp
     return root
 
-cdef inline void contour_union(ContourID *node1, ContourID *node2):
+cdef inline void contour_union(ContourID *node1, ContourID *node2) nogil:
     if node1 == node2:
         return
     node1 = contour_find(node1)
@@ -126,6 +126,9 @@ cdef class ContourTree:
     # final, and we can go through and just update all of those.
     cdef ContourID *first
     cdef ContourID *last
+    # Maps contour ids to the address of their node, so that joins do not
+    # have to walk the list of contours.
+    cdef dict nodes
 
     def clear(self):
         # Here, we wipe out ALL of our contours, but not the pointers to them
@@ -137,9 +140,25 @@ cdef class ContourTree:
             free(cur)
             cur = next
         self.first = self.last = NULL
+        self.nodes = {}
 
     def __init__(self):
         self.first = self.last = NULL
+        self.nodes = {}
+
+    cdef ContourID *get_node(self, np.int64_t contour_id):
+        cdef ContourID *cur
+        if self.nodes is not None:
+            addr = self.nodes.get(contour_id)
+            if addr is not None:
+                return <ContourID *> <Py_ssize_t> addr
+        # Contours created outside of add_contour(s) are not in the index.
+        cur = self.first
+        while cur != NULL:
+            if cur.contour_id == contour_id:
+                return cur
+            cur = cur.next
+        return NULL
 
     @cython.boundscheck(False)
     @cython.wraparound(False)
@@ -153,110 +172,53 @@ cdef class ContourTree:
         for i in range(n):
             #print(i, contour_ids[i])
             cur = contour_create(contour_ids[i], cur)
+            self.nodes[contour_ids[i]] = <Py_ssize_t> cur
             if self.first == NULL: self.first = cur
         self.last = cur
 
     def add_contour(self, np.int64_t contour_id):
         self.last = contour_create(contour_id, self.last)
+        self.nodes[contour_id] = <Py_ssize_t> self.last
+        if self.first == NULL: self.first = self.last
 
     def cull_candidates(self, np.ndarray[np.int64_t, ndim=3] candidates):
         # This function looks at each preliminary contour ID belonging to a
-        # given collection of values, and then if need be it creates a new
-        # contour for it.
-        cdef int i, j, k, ni, nj, nk, nc
-        cdef CandidateContour *first = NULL
-        cdef CandidateContour *temp
-        cdef np.int64_t cid
-        nc = 0
-        ni = candidates.shape[0]
-        nj = candidates.shape[1]
-        nk = candidates.shape[2]
-        for i in range(ni):
-            for j in range(nj):
-                for k in range(nk):
-                    cid = candidates[i,j,k]
-                    if cid == -1: continue
-                    if candidate_contains(first, cid) == 0:
-                        nc += 1
-                        first = candidate_add(first, cid)
-        cdef np.ndarray[np.int64_t, ndim=1] contours
-        contours = np.empty(nc, dtype="int64")
-        i = 0
-        # This removes all the temporary contours for this set of contours and
-        # instead constructs a final list of them.
-        while first != NULL:
-            contours[i] = first.contour_id
-            i += 1
-            temp = first.next
-            free(first)
-            first = temp
-        return contours
+        # given collection of values, and returns the unique ones.
+        contours = np.unique(candidates)
+        return contours[contours != -1]
 
     def cull_joins(self, np.ndarray[np.int64_t, ndim=2] cjoins):
         # This coalesces contour IDs, so that we have only the final name
         # resolutions -- the .join_id from a candidate.  So many items will map
         # to a single join_id.
-        cdef int i, ni, nc
-        cdef CandidateContour *first = NULL
-        cdef CandidateContour *temp
-        cdef np.int64_t cid1, cid2
-        nc = 0
-        ni = cjoins.shape[0]
-        for i in range(ni):
-            cid1 = cjoins[i,0]
-            cid2 = cjoins[i,1]
-            if cid1 == -1: continue
-            if cid2 == -1: continue
-            if candidate_contains(first, cid1, cid2) == 0:
-                nc += 1
-                first = candidate_add(first, cid1, cid2)
-        cdef np.ndarray[np.int64_t, ndim=2] contours
-        contours = np.empty((nc,2), dtype="int64")
-        i = 0
-        while first != NULL:
-            contours[i,0] = first.contour_id
-            contours[i,1] = first.join_id
-            i += 1
-            temp = first.next
-            free(first)
-            first = temp
-        return contours
+        # Duplicate pairs are harmless, as joining two contours that already
+        # share a root does nothing, so only invalid and self joins are
+        # dropped here.
+        valid = ((cjoins[:, 0] != -1) & (cjoins[:, 1] != -1)
+                 & (cjoins[:, 0] != cjoins[:, 1]))
+        return np.ascontiguousarray(cjoins[valid])
 
     @cython.boundscheck(False)
     @cython.wraparound(False)
     def add_joins(self, np.ndarray[np.int64_t, ndim=2] join_tree):
-        cdef int i, n, ins
+        cdef int i, n
         cdef np.int64_t cid1, cid2
-        # Okay, this requires lots of iteration, unfortunately
-        cdef ContourID *cur
         cdef ContourID *c1
         cdef ContourID *c2
         n = join_tree.shape[0]
-        #print("Counting")
-        #print("Checking", self.count())
         for i in range(n):
-            ins = 0
             cid1 = join_tree[i, 0]
             cid2 = join_tree[i, 1]
-            c1 = c2 = NULL
-            cur = self.first
-            #print("Looking for ", cid1, cid2)
-            while c1 == NULL or c2 == NULL:
-                if cur.contour_id == cid1:
-                    c1 = contour_find(cur)
-                if cur.contour_id == cid2:
-                    c2 = contour_find(cur)
-                ins += 1
-                cur = cur.next
-                if cur == NULL: break
+            c1 = self.get_node(cid1)
+            c2 = self.get_node(cid2)
             if c1 == NULL or c2 == NULL:
                 if c1 == NULL: print("  Couldn't find ", cid1)
                 if c2 == NULL: print("  Couldn't find ", cid2)
-                print("  Inspected ", ins)
                 raise RuntimeError
-            else:
-                c1.count = c2.count = 0
-                contour_union(c1, c2)
+            c1 = contour_find(c1)
+            c2 = contour_find(c2)
+            c1.count = c2.count = 0
+            contour_union(c1, c2)
 
     def count(self):
         cdef int n = 0
@@ -297,12 +259,24 @@ cdef class TileContourTree:
 
     @cython.boundscheck(False)
     @cython.wraparound(False)
-    def identify_contours(self, np.ndarray[np.float64_t, ndim=3] values,
-                                np.ndarray[np.int64_t, ndim=3] contour_ids,
-                                np.ndarray[np.uint8_t, ndim=3] mask,
+    def identify_contours(self, np.float64_t[:, :, :] values,
+                                np.int64_t[:, :, :] contour_ids,
+                                np.uint8_t[:, :, :] mask,
                                 np.int64_t start):
         # This just looks at neighbor values and tries to identify which zones
-        # are touching by face within a given brick.
+        # are touching by face within a given brick.  The GIL is released, so
+        # that separate bricks can be processed concurrently.
+        cdef np.int64_t nc
+        with nogil:
+            nc = self._identify_contours(values, contour_ids, mask, start)
+        return nc
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef np.int64_t _identify_contours(self, np.float64_t[:, :, :] values,
+                                np.int64_t[:, :, :] contour_ids,
+                                np.uint8_t[:, :, :] mask,
+                                np.int64_t start) nogil:
         cdef int i, j, k, ni, nj, nk, offset
         cdef int off_i, off_j, off_k, oi, ok, oj
         cdef ContourID *cur = NULL
@@ -404,6 +378,8 @@ cdef void construct_boundary_relationships(Node trunk, ContourTree tree,
     cdef np.int64_t c1, c2
     cdef Node adj_node
     cdef VolumeContainer *vc1
+    cdef VolumeContainer *last_vc[2]
+    cdef np.int64_t adj_ind[2]
     cdef VolumeContainer *vc0 = vcs[nid]
     cdef int s = (vc0.dims[1]*vc0.dims[0]
                 + vc0.dims[0]*vc0.dims[2]
@@ -415,6 +391,8 @@ cdef void construct_boundary_relationships(Node trunk, ContourTree tree,
     cdef int my_pos[3]
     cdef np.float64_t spos[3]
 
+    last_vc[0] = last_vc[1] = NULL
+    adj_ind[0] = adj_ind[1] = -1
     for ax in range(3):
         ax0 = (ax + 1) % 3
         ax1 = (ax + 2) % 3
@@ -443,8 +421,14 @@ cdef void construct_boundary_relationships(Node trunk, ContourTree tree,
                                 pos[ax] = vc0.dims[ax]
                                 my_pos[ax] = vc0.dims[ax]-1
                             get_spos(vc0, pos[0], pos[1], pos[2], ax, spos)
-                            adj_node = trunk._find_node(spos)
-                            vc1 = vcs[adj_node.node_ind]
+                            # Neighbouring boundary cells usually fall in the
+                            # same brick, so only walk the tree when they
+                            # don't.
+                            vc1 = last_vc[side]
+                            if vc1 == NULL or not spos_contained(vc1, spos):
+                                adj_node = trunk._find_node(spos)
+                                adj_ind[side] = adj_node.node_ind
+                                vc1 = last_vc[side] = vcs[adj_ind[side]]
                             if spos_contained(vc1, spos):
                                 index = vc_index(vc0, my_pos[0],
                                                  my_pos[1], my_pos[2])
@@ -454,7 +438,7 @@ cdef void construct_boundary_relationships(Node trunk, ContourTree tree,
                                 m2 = vc1.mask[index]
                                 c2 = (<np.int64_t*>vc1.data[0])[index]
                                 if m1 == 1 and m2 == 1 and c1 > -1 and c2 > -1:
-                                    if examined[adj_node.node_ind] == 0:
+                                    if examined[adj_ind[side]] == 0:
                                         joins[ti,0] = i64max(c1,c2)
                                         joins[ti,1] = i64min(c1,c2)
                                     else:
@@ -508,6 +492,7 @@ cdef class ParticleContourTree(ContourTree):
         self.linking_length = linking_length
         self.linking_length2 = linking_length * linking_length
         self.first = self.last = NULL
+        self.nodes = {}
         for i in range(3):
             self.periodicity[i] = periodicity[i]
         self.minimum_count = minimum_count
@@ -484,6 +484,36 @@ void free_tree_nodes(Node* node) {
     }
 }
 
+// The split chosen for a node of the tree. Computing these requires
+// partitioning the points, which is the expensive part of building a tree,
+// and can be done independently for every subtree.
+class SplitPlan
+{
+public:
+  bool is_leaf;
+  uint32_t split_dim;
+  int64_t split_idx;
+  double split;
+  SplitPlan *less;
+  SplitPlan *greater;
+  SplitPlan() {
+    is_leaf = true;
+    split_dim = 0;
+    split_idx = 0;
+    split = 0.0;
+    less = NULL;
+    greater = NULL;
+  }
+};
+
+void free_split_plan(SplitPlan* plan) {
+  if (plan == NULL)
+    return;
+  free_split_plan(plan->less);
+  free_split_plan(plan->greater);
+  delete plan;
+}
+
 class KDTree
 {
 public:
@@ -698,8 +728,9 @@ public:
     }
   }
 
-  void build_tree(double* all_pts) {
+  void build_tree(double* all_pts, int nthreads = 1) {
     uint32_t d;
+    SplitPlan *plan = NULL;
     double *LE = (double*)malloc(ndim*sizeof(double));
     double *RE = (double*)malloc(ndim*sizeof(double));
     bool *PLE = (bool*)malloc(ndim*sizeof(bool));
@@ -723,8 +754,24 @@ public:
       left_nodes.push_back(NULL);
     }
 
+    if (nthreads > 1) {
+      // Partition the points first, with the subtrees handed out to
+      // separate threads down to a few levels below the number of threads,
+      // then create the nodes serially so that leaves are numbered exactly
+      // as in a serial build.
+      int depth = 2;
+      while ((1 << (depth - 2)) < nthreads)
+        depth++;
+#pragma omp parallel num_threads(nthreads)
+      {
+#pragma omp single
+        plan = plan_splits(0, npts, all_pts, mins, maxs, depth);
+      }
+    }
+
     root = build(0, npts, LE, RE, PLE, PRE, all_pts,
-                 mins, maxs, left_nodes);
+                 mins, maxs, left_nodes, plan);
+    free_split_plan(plan);
 
     free(LE);
     free(RE);
@@ -817,15 +864,55 @@ public:
     }
   }
 
+  SplitPlan* plan_splits(uint64_t Lidx, uint64_t n, double* all_pts,
+                         double *mins, double *maxes, int depth)
+  {
+    SplitPlan* plan = new SplitPlan();
+    if (n < leafsize)
+      return plan;
+    uint32_t dmax, d;
+    dmax = split(all_pts, all_idx, Lidx, n, ndim, mins, maxes,
+                 plan->split_idx, plan->split, use_sliding_midpoint);
+    if ((dmax >= ndim) || (maxes[dmax] == mins[dmax]))
+      // all points singular
+      return plan;
+    plan->is_leaf = false;
+    plan->split_dim = dmax;
+
+    uint64_t Nless = plan->split_idx-Lidx+1;
+    uint64_t Ngreater = n - Nless;
+    double *lessmaxes = (double*)malloc(ndim*sizeof(double));
+    double *greatermins = (double*)malloc(ndim*sizeof(double));
+    for (d = 0; d < ndim; d++) {
+      lessmaxes[d] = maxes[d];
+      greatermins[d] = mins[d];
+    }
+    lessmaxes[dmax] = plan->split;
+    greatermins[dmax] = plan->split;
+
+    // The two halves occupy disjoint ranges of all_idx
+#pragma omp task shared(plan) if(depth > 0)
+    plan->less = plan_splits(Lidx, Nless, all_pts, mins, lessmaxes,
+                             depth - 1);
+    plan->greater = plan_splits(Lidx+Nless, Ngreater, all_pts, greatermins,
+                                maxes, depth - 1);
+#pragma omp taskwait
+
+    free(lessmaxes);
+    free(greatermins);
+    return plan;
+  }
+
   Node* build(uint64_t Lidx, uint64_t n,
               double *LE, double *RE,
               bool *PLE, bool *PRE,
               double* all_pts,
               double *mins, double *maxes,
-              std::vector<Node*> left_nodes)
+              std::vector<Node*> left_nodes,
+              SplitPlan *plan = NULL)
   {
     // Create leaf
-    if (n < leafsize) {
+    if ((n < leafsize) || ((plan != NULL) && (plan->is_leaf))) {
       Node* out = new Node(ndim, LE, RE, PLE, PRE, Lidx, n, num_leaves,
 			   left_nodes);
       num_leaves++;
@@ -836,8 +923,14 @@ public:
       uint32_t dmax, d;
       int64_t split_idx = 0;
       double split_val = 0.0;
-      dmax = split(all_pts, all_idx, Lidx, n, ndim, mins, maxes,
-		   split_idx, split_val, use_sliding_midpoint);
+      if (plan != NULL) {
+        dmax = plan->split_dim;
+        split_idx = plan->split_idx;
+        split_val = plan->split;
+      } else {
+        dmax = split(all_pts, all_idx, Lidx, n, ndim, mins, maxes,
+                     split_idx, split_val, use_sliding_midpoint);
+      }
       if (maxes[dmax] == mins[dmax]) {
 	// all points singular
 	Node* out = new Node(ndim, LE, RE, PLE, PRE, Lidx, n, num_leaves,
@@ -875,11 +968,13 @@ public:
 
       // Build less and greater nodes
       Node* less = build(Lidx, Nless, LE, lessright, PLE, lessPRE,
-                         all_pts, mins, lessmaxes, left_nodes);
+                         all_pts, mins, lessmaxes, left_nodes,
+                         plan ? plan->less : NULL);
       greater_left_nodes[dmax] = less;
       Node* greater = build(Lidx+Nless, Ngreater, greaterleft, RE,
                             greaterPLE, PRE, all_pts,
-                            greatermins, maxes, greater_left_nodes);
+                            greatermins, maxes, greater_left_nodes,
+                            plan ? plan->greater : NULL);
 
       // Create innernode referencing child nodes
       Node* out = new Node(ndim, LE, RE, PLE, PRE, Lidx, dmax, split_val,
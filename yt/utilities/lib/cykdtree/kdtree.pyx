@@ -3,7 +3,8 @@
 # distutils: sources = yt/utilities/lib/cykdtree/c_utils.cpp
 # distutils: depends = yt/utilities/lib/cykdtree/c_kdtree.hpp, yt/utilities/lib/cykdtree/c_utils.hpp
 # distutils: language = c++
-# distutils: extra_compile_args = CPP03_FLAG
+# distutils: extra_compile_args = CPP03_FLAG OMP_ARGS
+# distutils: extra_link_args = OMP_ARGS
 import cython
 import numpy as np
 
@@ -167,6 +168,9 @@ cdef class PyKDTree:
         use_sliding_midpoint (bool, optional): If True, the sliding midpoint
             rule is used to perform splits. Otherwise, the median is used.
             Defaults to False.
+        nthreads (int, optional): Number of OpenMP threads used to partition
+            the points while building the tree. The resulting tree does not
+            depend on it. Defaults to 1.
 
     Raises:
         ValueError: If `leafsize < 2`. This currectly segfaults.
@@ -220,7 +224,8 @@ cdef class PyKDTree:
                  int leafsize = 10000,
                  int nleaves = 0,
                  data_version = None,
-                 use_sliding_midpoint = False):
+                 use_sliding_midpoint = False,
+                 int nthreads = 1):
         # Return with nothing set if points not provided
         if pts is None:
             return
@@ -262,7 +267,7 @@ cdef class PyKDTree:
             for i in range(self.ndim):
                 self._periodic[i] = <cbool>periodic[i]
         # Create tree and leaves
-        self._make_tree(&pts[0,0], <cbool>use_sliding_midpoint)
+        self._make_tree(&pts[0,0], <cbool>use_sliding_midpoint, nthreads)
         self._make_leaves()
 
     def __dealloc__(self):
@@ -309,12 +314,15 @@ cdef class PyKDTree:
                     np.sort(self._idx[self.leaves[i].slice]),
                     np.sort(solf._idx[solf.leaves[i].slice]))
 
-    cdef void _make_tree(self, double *pts, bool use_sliding_midpoint):
+    cdef void _make_tree(self, double *pts, bool use_sliding_midpoint,
+                         int nthreads):
         r"""Carry out creation of KDTree at C++ level."""
         cdef uint64_t[:] idx = np.arange(self.npts).astype('uint64')
         self._tree = new KDTree(pts, &idx[0], self.npts, self.ndim, self.leafsize,
                                 self._left_edge, self._right_edge, self._periodic,
-                                self.data_version, use_sliding_midpoint)
+                                self.data_version, use_sliding_midpoint, True)
+        with nogil:
+            self._tree.build_tree(pts, nthreads)
         self._idx = idx
 
     cdef void _make_leaves(self):
@@ -27,6 +27,30 @@ def test_PyKDTree(npts=100, ndim=2, periodic=False, use_sliding_midpoint=False):
     )
 
 
+@parametrize(ndim=(2, 3), periodic=(False, True), use_sliding_midpoint=(False, True))
+def test_PyKDTree_nthreads(ndim=2, periodic=False, use_sliding_midpoint=False):
+    pts, le, re, ls = make_points(2000, ndim)
+    tree = cykdtree.PyKDTree(
+        pts,
+        le,
+        re,
+        leafsize=ls,
+        periodic=periodic,
+        use_sliding_midpoint=use_sliding_midpoint,
+    )
+    for nthreads in (2, 5):
+        tree_threaded = cykdtree.PyKDTree(
+            pts,
+            le,
+            re,
+            leafsize=ls,
+            periodic=periodic,
+            use_sliding_midpoint=use_sliding_midpoint,
+            nthreads=nthreads,
+        )
+        tree.assert_equal(tree_threaded)
+
+
 def test_PyKDTree_errors():
     pts, le, re, ls = make_points(100, 2)
     assert_raises(ValueError, cykdtree.PyKDTree, pts, le, re, leafsize=1)
@@ -30,14 +30,14 @@ cdef np.float64_t r2dist(np.float64_t ppos[3],
                          np.float64_t cpos[3],
                          np.float64_t DW[3],
                          bint periodicity[3],
-                         np.float64_t max_dist2)
+                         np.float64_t max_dist2) nogil
 
 cdef class PriorityQueue:
     cdef int maxn
     cdef int curn
     cdef ItemList* items
-    cdef void item_reset(self)
-    cdef int item_insert(self, np.int64_t i, np.float64_t value)
+    cdef void item_reset(self) nogil
+    cdef int item_insert(self, np.int64_t i, np.float64_t value) nogil
 
 cdef class DistanceQueue(PriorityQueue):
     cdef np.float64_t DW[3]
@@ -45,5 +45,5 @@ cdef class DistanceQueue(PriorityQueue):
     cdef NeighborList* neighbors # flat array
     cdef void _setup(self, np.float64_t DW[3], bint periodicity[3])
     cdef void neighbor_eval(self, np.int64_t pn, np.float64_t ppos[3],
-                            np.float64_t cpos[3])
-    cdef void neighbor_reset(self)
+                            np.float64_t cpos[3]) nogil
+    cdef void neighbor_reset(self) nogil
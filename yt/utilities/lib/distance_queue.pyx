@@ -37,7 +37,7 @@ cdef np.float64_t r2dist(np.float64_t ppos[3],
                          np.float64_t cpos[3],
                          np.float64_t DW[3],
                          bint periodicity[3],
-                         np.float64_t max_dist2):
+                         np.float64_t max_dist2) nogil:
     cdef int i
     cdef np.float64_t r2, DR
     r2 = 0.0
@@ -72,13 +72,14 @@ cdef class PriorityQueue:
         self.items = <ItemList *> malloc(
             sizeof(ItemList) * self.maxn)
 
-    cdef void item_reset(self):
+    cdef void item_reset(self) nogil:
+        cdef int i
         for i in range(self.maxn):
             self.items[i].value = 1e300
             self.items[i].ind = -1
         self.curn = 0
 
-    cdef int item_insert(self, np.int64_t ind, np.float64_t value):
+    cdef int item_insert(self, np.int64_t ind, np.float64_t value) nogil:
         cdef int i, di
         if self.curn == 0:
             self.items[0].value = value
@@ -135,7 +136,7 @@ cdef class DistanceQueue:
         free(self.neighbors)
 
     cdef void neighbor_eval(self, np.int64_t pn, np.float64_t ppos[3],
-                            np.float64_t cpos[3]):
+                            np.float64_t cpos[3]) nogil:
         # Here's a python+numpy simulator of this:
         # http://paste.yt-project.org/show/5445/
         cdef np.float64_t r2, r2_trunc
@@ -150,7 +151,7 @@ cdef class DistanceQueue:
             return
         self.item_insert(pn, r2)
 
-    cdef void neighbor_reset(self):
+    cdef void neighbor_reset(self) nogil:
         self.item_reset()
 
     def find_nearest(self, np.float64_t[:] center, np.float64_t[:,:] points):
@@ -0,0 +1,21718 @@
+/* Generated by Cython 0.29.37 */
+
+/* BEGIN: Cython Metadata
+{
+    "distutils": {
+        "depends": [
+            "yt/utilities/lib/platform_dep.h"
+        ],
+        "include_dirs": [
+            "yt/utilities/lib"
+        ],
+        "libraries": [
+            "m"
+        ],
+        "name": "yt.utilities.lib.element_mappings",
+        "sources": [
+            "yt/utilities/lib/element_mappings.pyx"
+        ]
+    },
+    "module_name": "yt.utilities.lib.element_mappings"
+}
+END: Cython Metadata */
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
+    #error Cython requires Python 2.6+ or Python 3.3+.
+#else
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
+#define CYTHON_FUTURE_DIVISION 0
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef HAVE_LONG_LONG
+  #if PY_VERSION_HEX >= 0x02070000
+    #define HAVE_LONG_LONG
+  #endif
+#endif
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#ifdef PYPY_VERSION
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PYSTON_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_ASYNC_SLOTS
+  #define CYTHON_USE_ASYNC_SLOTS 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #elif !defined(CYTHON_USE_PYTYPE_LOOKUP)
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #if PY_MAJOR_VERSION < 3
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
+  #endif
+  #ifndef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
+  #endif
+  #ifndef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+#endif
+#if !defined(CYTHON_FAST_PYCCALL)
+#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_MAYBE_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_MAYBE_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#ifdef _MSC_VER
+    #ifndef _MSC_STDINT_H_
+        #if _MSC_VER < 1300
+           typedef unsigned char     uint8_t;
+           typedef unsigned int      uint32_t;
+        #else
+           typedef unsigned __int8   uint8_t;
+           typedef unsigned __int32  uint32_t;
+        #endif
+    #endif
+#else
+   #include <stdint.h>
+#endif
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus) && __cplusplus >= 201103L
+    #if __has_cpp_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH [[fallthrough]]
+    #elif __has_cpp_attribute(clang::fallthrough)
+      #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+    #elif __has_cpp_attribute(gnu::fallthrough)
+      #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__ ) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
+#endif
+
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#if PY_MAJOR_VERSION < 3
+  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyClass_Type
+#else
+  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#else
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
+  #define __Pyx_DefaultClassType PyType_Type
+#endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
+#ifndef Py_TPFLAGS_CHECKTYPES
+  #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+#endif
+#if CYTHON_FAST_PYCCALL
+#define __Pyx_PyFastCFunction_Check(func)\
+    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
+#else
+#define __Pyx_PyFastCFunction_Check(func) 0
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
+  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
+  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
+  #define PyMem_RawFree(p)             PyMem_Free(p)
+#endif
+#if CYTHON_COMPILING_IN_PYSTON
+  #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if !CYTHON_FAST_THREAD_STATE || PY_VERSION_HEX < 0x02070000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x03060000
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#elif PY_VERSION_HEX >= 0x03000000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_Current
+#endif
+#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
+#include "pythread.h"
+#define Py_tss_NEEDS_INIT 0
+typedef int Py_tss_t;
+static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
+  *key = PyThread_create_key();
+  return 0;
+}
+static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
+  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
+  *key = Py_tss_NEEDS_INIT;
+  return key;
+}
+static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
+  PyObject_Free(key);
+}
+static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
+  return *key != Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
+  PyThread_delete_key(*key);
+  *key = Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
+  return PyThread_set_key_value(*key, value);
+}
+static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
+  return PyThread_get_key_value(*key);
+}
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStr(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+#else
+#define __Pyx_PyDict_GetItemStr(dict, name)  PyDict_GetItem(dict, name)
+#endif
+#if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
+  #define CYTHON_PEP393_ENABLED 1
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         PyUnicode_KIND(u)
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+#else
+  #define CYTHON_PEP393_ENABLED 0
+  #define PyUnicode_1BYTE_KIND  1
+  #define PyUnicode_2BYTE_KIND  2
+  #define PyUnicode_4BYTE_KIND  4
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535 : 1114111)
+  #define __Pyx_PyUnicode_KIND(u)         (sizeof(Py_UNICODE))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = ch)
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_Contains)
+  #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyByteArray_Check)
+  #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
+  #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+#endif
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
+#else
+  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
+#endif
+#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
+  #define PyObject_ASCII(o)            PyObject_Repr(o)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBaseString_Type            PyUnicode_Type
+  #define PyStringObject               PyUnicodeObject
+  #define PyString_Type                PyUnicode_Type
+  #define PyString_Check               PyUnicode_Check
+  #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
+  #define PyObject_Unicode             PyObject_Str
+#endif
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
+  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
+#else
+  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
+  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
+#endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+#else
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyIntObject                  PyLongObject
+  #define PyInt_Type                   PyLong_Type
+  #define PyInt_Check(op)              PyLong_Check(op)
+  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
+  #define PyInt_FromString             PyLong_FromString
+  #define PyInt_FromUnicode            PyLong_FromUnicode
+  #define PyInt_FromLong               PyLong_FromLong
+  #define PyInt_FromSize_t             PyLong_FromSize_t
+  #define PyInt_FromSsize_t            PyLong_FromSsize_t
+  #define PyInt_AsLong                 PyLong_AsLong
+  #define PyInt_AS_LONG                PyLong_AS_LONG
+  #define PyInt_AsSsize_t              PyLong_AsSsize_t
+  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
+  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
+  #define PyNumber_Int                 PyNumber_Long
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBoolObject                 PyLongObject
+#endif
+#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
+  #ifndef PyUnicode_InternFromString
+    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+  #endif
+#endif
+#if PY_VERSION_HEX < 0x030200A4
+  typedef long Py_hash_t;
+  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
+#else
+  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
+#else
+  #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
+#endif
+#if CYTHON_USE_ASYNC_SLOTS
+  #if PY_VERSION_HEX >= 0x030500B1
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
+  #else
+    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
+  #endif
+#else
+  #define __Pyx_PyType_AsAsync(obj) NULL
+#endif
+#ifndef __Pyx_PyAsyncMethodsStruct
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+    } __Pyx_PyAsyncMethodsStruct;
+#endif
+
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#ifdef NAN
+#define __PYX_NAN() ((float) NAN)
+#else
+static CYTHON_INLINE float __PYX_NAN() {
+  float value;
+  memset(&value, 0xFF, sizeof(value));
+  return value;
+}
+#endif
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
+#ifndef __PYX_EXTERN_C
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
+
+#define __PYX_HAVE__yt__utilities__lib__element_mappings
+#define __PYX_HAVE_API__yt__utilities__lib__element_mappings
+/* Early includes */
+#include <string.h>
+#include <stdio.h>
+#include "numpy/arrayobject.h"
+#include "numpy/ndarrayobject.h"
+#include "numpy/ndarraytypes.h"
+#include "numpy/arrayscalars.h"
+#include "numpy/ufuncobject.h"
+
+    /* NumPy API declarations from "numpy/__init__.pxd" */
+    
+#include <math.h>
+#include "platform_dep.h"
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
+                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
+
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#else
+    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
+#endif
+#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyObject_AsWritableString(s)    ((char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
+    const Py_UNICODE *u_end = u;
+    while (*u_end++) ;
+    return (size_t)(u_end - u - 1);
+}
+#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
+#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
+#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#else
+#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#endif
+#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#else
+#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
+#endif
+#define __Pyx_PyNumber_Float(x) (PyFloat_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Float(x))
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+static int __Pyx_sys_getdefaultencoding_not_ascii;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    PyObject* ascii_chars_u = NULL;
+    PyObject* ascii_chars_b = NULL;
+    const char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    if (strcmp(default_encoding_c, "ascii") == 0) {
+        __Pyx_sys_getdefaultencoding_not_ascii = 0;
+    } else {
+        char ascii_chars[128];
+        int c;
+        for (c = 0; c < 128; c++) {
+            ascii_chars[c] = c;
+        }
+        __Pyx_sys_getdefaultencoding_not_ascii = 1;
+        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
+        if (!ascii_chars_u) goto bad;
+        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
+        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
+            PyErr_Format(
+                PyExc_ValueError,
+                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
+                default_encoding_c);
+            goto bad;
+        }
+        Py_DECREF(ascii_chars_u);
+        Py_DECREF(ascii_chars_b);
+    }
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    Py_XDECREF(ascii_chars_u);
+    Py_XDECREF(ascii_chars_b);
+    return -1;
+}
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#else
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+static char* __PYX_DEFAULT_STRING_ENCODING;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
+    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
+    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    return -1;
+}
+#endif
+#endif
+
+
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+
+static PyObject *__pyx_m = NULL;
+static PyObject *__pyx_d;
+static PyObject *__pyx_b;
+static PyObject *__pyx_cython_runtime = NULL;
+static PyObject *__pyx_empty_tuple;
+static PyObject *__pyx_empty_bytes;
+static PyObject *__pyx_empty_unicode;
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * __pyx_cfilenm= __FILE__;
+static const char *__pyx_filename;
+
+/* Header.proto */
+#if !defined(CYTHON_CCOMPLEX)
+  #if defined(__cplusplus)
+    #define CYTHON_CCOMPLEX 1
+  #elif (defined(_Complex_I) && !defined(_MSC_VER))
+    #define CYTHON_CCOMPLEX 1
+  #else
+    #define CYTHON_CCOMPLEX 0
+  #endif
+#endif
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    #include <complex>
+  #else
+    #include <complex.h>
+  #endif
+#endif
+#if CYTHON_CCOMPLEX && !defined(__cplusplus) && defined(__sun__) && defined(__GNUC__)
+  #undef _Complex_I
+  #define _Complex_I 1.0fj
+#endif
+
+
+static const char *__pyx_f[] = {
+  "yt/utilities/lib/element_mappings.pyx",
+  "stringsource",
+  "__init__.pxd",
+  "type.pxd",
+};
+/* BufferFormatStructs.proto */
+#define IS_UNSIGNED(type) (((type) -1) > 0)
+struct __Pyx_StructField_;
+#define __PYX_BUF_FLAGS_PACKED_STRUCT (1 << 0)
+typedef struct {
+  const char* name;
+  struct __Pyx_StructField_* fields;
+  size_t size;
+  size_t arraysize[8];
+  int ndim;
+  char typegroup;
+  char is_unsigned;
+  int flags;
+} __Pyx_TypeInfo;
+typedef struct __Pyx_StructField_ {
+  __Pyx_TypeInfo* type;
+  const char* name;
+  size_t offset;
+} __Pyx_StructField;
+typedef struct {
+  __Pyx_StructField* field;
+  size_t parent_offset;
+} __Pyx_BufFmt_StackElem;
+typedef struct {
+  __Pyx_StructField root;
+  __Pyx_BufFmt_StackElem* head;
+  size_t fmt_offset;
+  size_t new_count, enc_count;
+  size_t struct_alignment;
+  int is_complex;
+  char enc_type;
+  char new_packmode;
+  char enc_packmode;
+  char is_valid_array;
+} __Pyx_BufFmt_Context;
+
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":689
+ * # in Cython to enable them only on the right systems.
+ * 
+ * ctypedef npy_int8       int8_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_int16      int16_t
+ * ctypedef npy_int32      int32_t
+ */
+typedef npy_int8 __pyx_t_5numpy_int8_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":690
+ * 
+ * ctypedef npy_int8       int8_t
+ * ctypedef npy_int16      int16_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_int32      int32_t
+ * ctypedef npy_int64      int64_t
+ */
+typedef npy_int16 __pyx_t_5numpy_int16_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":691
+ * ctypedef npy_int8       int8_t
+ * ctypedef npy_int16      int16_t
+ * ctypedef npy_int32      int32_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_int64      int64_t
+ * #ctypedef npy_int96      int96_t
+ */
+typedef npy_int32 __pyx_t_5numpy_int32_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":692
+ * ctypedef npy_int16      int16_t
+ * ctypedef npy_int32      int32_t
+ * ctypedef npy_int64      int64_t             # <<<<<<<<<<<<<<
+ * #ctypedef npy_int96      int96_t
+ * #ctypedef npy_int128     int128_t
+ */
+typedef npy_int64 __pyx_t_5numpy_int64_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":696
+ * #ctypedef npy_int128     int128_t
+ * 
+ * ctypedef npy_uint8      uint8_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_uint16     uint16_t
+ * ctypedef npy_uint32     uint32_t
+ */
+typedef npy_uint8 __pyx_t_5numpy_uint8_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":697
+ * 
+ * ctypedef npy_uint8      uint8_t
+ * ctypedef npy_uint16     uint16_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_uint32     uint32_t
+ * ctypedef npy_uint64     uint64_t
+ */
+typedef npy_uint16 __pyx_t_5numpy_uint16_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":698
+ * ctypedef npy_uint8      uint8_t
+ * ctypedef npy_uint16     uint16_t
+ * ctypedef npy_uint32     uint32_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_uint64     uint64_t
+ * #ctypedef npy_uint96     uint96_t
+ */
+typedef npy_uint32 __pyx_t_5numpy_uint32_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":699
+ * ctypedef npy_uint16     uint16_t
+ * ctypedef npy_uint32     uint32_t
+ * ctypedef npy_uint64     uint64_t             # <<<<<<<<<<<<<<
+ * #ctypedef npy_uint96     uint96_t
+ * #ctypedef npy_uint128    uint128_t
+ */
+typedef npy_uint64 __pyx_t_5numpy_uint64_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":703
+ * #ctypedef npy_uint128    uint128_t
+ * 
+ * ctypedef npy_float32    float32_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_float64    float64_t
+ * #ctypedef npy_float80    float80_t
+ */
+typedef npy_float32 __pyx_t_5numpy_float32_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":704
+ * 
+ * ctypedef npy_float32    float32_t
+ * ctypedef npy_float64    float64_t             # <<<<<<<<<<<<<<
+ * #ctypedef npy_float80    float80_t
+ * #ctypedef npy_float128   float128_t
+ */
+typedef npy_float64 __pyx_t_5numpy_float64_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":713
+ * # The int types are mapped a bit surprising --
+ * # numpy.int corresponds to 'l' and numpy.long to 'q'
+ * ctypedef npy_long       int_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_longlong   long_t
+ * ctypedef npy_longlong   longlong_t
+ */
+typedef npy_long __pyx_t_5numpy_int_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":714
+ * # numpy.int corresponds to 'l' and numpy.long to 'q'
+ * ctypedef npy_long       int_t
+ * ctypedef npy_longlong   long_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_longlong   longlong_t
+ * 
+ */
+typedef npy_longlong __pyx_t_5numpy_long_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":715
+ * ctypedef npy_long       int_t
+ * ctypedef npy_longlong   long_t
+ * ctypedef npy_longlong   longlong_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_ulong      uint_t
+ */
+typedef npy_longlong __pyx_t_5numpy_longlong_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":717
+ * ctypedef npy_longlong   longlong_t
+ * 
+ * ctypedef npy_ulong      uint_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_ulonglong  ulong_t
+ * ctypedef npy_ulonglong  ulonglong_t
+ */
+typedef npy_ulong __pyx_t_5numpy_uint_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":718
+ * 
+ * ctypedef npy_ulong      uint_t
+ * ctypedef npy_ulonglong  ulong_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_ulonglong  ulonglong_t
+ * 
+ */
+typedef npy_ulonglong __pyx_t_5numpy_ulong_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":719
+ * ctypedef npy_ulong      uint_t
+ * ctypedef npy_ulonglong  ulong_t
+ * ctypedef npy_ulonglong  ulonglong_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_intp       intp_t
+ */
+typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":721
+ * ctypedef npy_ulonglong  ulonglong_t
+ * 
+ * ctypedef npy_intp       intp_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_uintp      uintp_t
+ * 
+ */
+typedef npy_intp __pyx_t_5numpy_intp_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":722
+ * 
+ * ctypedef npy_intp       intp_t
+ * ctypedef npy_uintp      uintp_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_double     float_t
+ */
+typedef npy_uintp __pyx_t_5numpy_uintp_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":724
+ * ctypedef npy_uintp      uintp_t
+ * 
+ * ctypedef npy_double     float_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_double     double_t
+ * ctypedef npy_longdouble longdouble_t
+ */
+typedef npy_double __pyx_t_5numpy_float_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":725
+ * 
+ * ctypedef npy_double     float_t
+ * ctypedef npy_double     double_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_longdouble longdouble_t
+ * 
+ */
+typedef npy_double __pyx_t_5numpy_double_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":726
+ * ctypedef npy_double     float_t
+ * ctypedef npy_double     double_t
+ * ctypedef npy_longdouble longdouble_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_cfloat      cfloat_t
+ */
+typedef npy_longdouble __pyx_t_5numpy_longdouble_t;
+/* Declarations.proto */
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    typedef ::std::complex< float > __pyx_t_float_complex;
+  #else
+    typedef float _Complex __pyx_t_float_complex;
+  #endif
+#else
+    typedef struct { float real, imag; } __pyx_t_float_complex;
+#endif
+static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float, float);
+
+/* Declarations.proto */
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    typedef ::std::complex< double > __pyx_t_double_complex;
+  #else
+    typedef double _Complex __pyx_t_double_complex;
+  #endif
+#else
+    typedef struct { double real, imag; } __pyx_t_double_complex;
+#endif
+static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double, double);
+
+
+/*--- Type declarations ---*/
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler;
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler1D;
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler2D;
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D;
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D;
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D;
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_W1Sampler3D;
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_S2Sampler3D;
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D;
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D;
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D;
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_T2Sampler2D;
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":728
+ * ctypedef npy_longdouble longdouble_t
+ * 
+ * ctypedef npy_cfloat      cfloat_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_cdouble     cdouble_t
+ * ctypedef npy_clongdouble clongdouble_t
+ */
+typedef npy_cfloat __pyx_t_5numpy_cfloat_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":729
+ * 
+ * ctypedef npy_cfloat      cfloat_t
+ * ctypedef npy_cdouble     cdouble_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_clongdouble clongdouble_t
+ * 
+ */
+typedef npy_cdouble __pyx_t_5numpy_cdouble_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":730
+ * ctypedef npy_cfloat      cfloat_t
+ * ctypedef npy_cdouble     cdouble_t
+ * ctypedef npy_clongdouble clongdouble_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_cdouble     complex_t
+ */
+typedef npy_clongdouble __pyx_t_5numpy_clongdouble_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":732
+ * ctypedef npy_clongdouble clongdouble_t
+ * 
+ * ctypedef npy_cdouble     complex_t             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):
+ */
+typedef npy_cdouble __pyx_t_5numpy_complex_t;
+
+/* "yt/utilities/lib/element_mappings.pxd":99
+ * #          once it is converged.
+ * #
+ * ctypedef void (*func_type)(double* fx,             # <<<<<<<<<<<<<<
+ *                            double* x,
+ *                            double* vertices,
+ */
+typedef void (*__pyx_t_2yt_9utilities_3lib_16element_mappings_func_type)(double *, double *, double *, double *);
+
+/* "yt/utilities/lib/element_mappings.pxd":119
+ * #     tcol     - the third column of the jaocobian
+ * #
+ * ctypedef void (*jac_type3D)(double* rcol,             # <<<<<<<<<<<<<<
+ *                             double* scol,
+ *                             double* tcol,
+ */
+typedef void (*__pyx_t_2yt_9utilities_3lib_16element_mappings_jac_type3D)(double *, double *, double *, double *, double *, double *);
+
+/* "yt/utilities/lib/element_mappings.pxd":141
+ * #     scol     - the second column of the jacobian
+ * #
+ * ctypedef void (*jac_type2D)(double* rcol,             # <<<<<<<<<<<<<<
+ *                             double* scol,
+ *                             double* x,
+ */
+typedef void (*__pyx_t_2yt_9utilities_3lib_16element_mappings_jac_type2D)(double *, double *, double *, double *, double *);
+
+/* "yt/utilities/lib/element_mappings.pxd":10
+ * 
+ * 
+ * cdef class ElementSampler:             # <<<<<<<<<<<<<<
+ * 
+ *     # how close a point has to be to the element
+ */
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_ElementSampler *__pyx_vtab;
+  __pyx_t_5numpy_float64_t inclusion_tol;
+  int num_mapped_coords;
+};
+
+
+/* "yt/utilities/lib/element_mappings.pxd":39
+ * 
+ * 
+ * cdef class P1Sampler1D(ElementSampler):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void map_real_to_unit(self,
+ */
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler1D {
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler __pyx_base;
+};
+
+
+/* "yt/utilities/lib/element_mappings.pxd":54
+ * 
+ * 
+ * cdef class P1Sampler2D(ElementSampler):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void map_real_to_unit(self,
+ */
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler2D {
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler __pyx_base;
+};
+
+
+/* "yt/utilities/lib/element_mappings.pxd":69
+ * 
+ * 
+ * cdef class P1Sampler3D(ElementSampler):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void map_real_to_unit(self,
+ */
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D {
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler __pyx_base;
+};
+
+
+/* "yt/utilities/lib/element_mappings.pxd":148
+ * 
+ * 
+ * cdef class NonlinearSolveSampler3D(ElementSampler):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int dim
+ */
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D {
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler __pyx_base;
+  int dim;
+  int max_iter;
+  __pyx_t_5numpy_float64_t tolerance;
+  __pyx_t_2yt_9utilities_3lib_16element_mappings_func_type func;
+  __pyx_t_2yt_9utilities_3lib_16element_mappings_jac_type3D jac;
+};
+
+
+/* "yt/utilities/lib/element_mappings.pxd":162
+ * 
+ * 
+ * cdef class Q1Sampler3D(NonlinearSolveSampler3D):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void map_real_to_unit(self,
+ */
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D {
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D __pyx_base;
+};
+
+
+/* "yt/utilities/lib/element_mappings.pxd":179
+ * 
+ * 
+ * cdef class W1Sampler3D(NonlinearSolveSampler3D):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void map_real_to_unit(self,
+ */
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_W1Sampler3D {
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D __pyx_base;
+};
+
+
+/* "yt/utilities/lib/element_mappings.pxd":197
+ * 
+ * 
+ * cdef class S2Sampler3D(NonlinearSolveSampler3D):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void map_real_to_unit(self,
+ */
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_S2Sampler3D {
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D __pyx_base;
+};
+
+
+/* "yt/utilities/lib/element_mappings.pxd":215
+ * 
+ * 
+ * cdef class NonlinearSolveSampler2D(ElementSampler):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int dim
+ */
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D {
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler __pyx_base;
+  int dim;
+  int max_iter;
+  __pyx_t_5numpy_float64_t tolerance;
+  __pyx_t_2yt_9utilities_3lib_16element_mappings_func_type func;
+  __pyx_t_2yt_9utilities_3lib_16element_mappings_jac_type2D jac;
+};
+
+
+/* "yt/utilities/lib/element_mappings.pxd":229
+ * 
+ * 
+ * cdef class Q1Sampler2D(NonlinearSolveSampler2D):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void map_real_to_unit(self,
+ */
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D {
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D __pyx_base;
+};
+
+
+/* "yt/utilities/lib/element_mappings.pxd":244
+ * 
+ * 
+ * cdef class Q2Sampler2D(NonlinearSolveSampler2D):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void map_real_to_unit(self,
+ */
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D {
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D __pyx_base;
+};
+
+
+/* "yt/utilities/lib/element_mappings.pxd":259
+ * 
+ * 
+ * cdef class T2Sampler2D(NonlinearSolveSampler2D):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void map_real_to_unit(self,
+ */
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_T2Sampler2D {
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D __pyx_base;
+};
+
+
+/* "yt/utilities/lib/element_mappings.pxd":273
+ *     cdef int check_inside(self, double* mapped_coord) nogil
+ * 
+ * cdef class Tet2Sampler3D(NonlinearSolveSampler3D):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void map_real_to_unit(self,
+ */
+struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D {
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D __pyx_base;
+};
+
+
+
+/* "yt/utilities/lib/element_mappings.pyx":61
+ * 
+ * 
+ * cdef class ElementSampler:             # <<<<<<<<<<<<<<
+ *     '''
+ * 
+ */
+
+struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_ElementSampler {
+  void (*map_real_to_unit)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *, double *, double *);
+  double (*sample_at_unit_point)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *, double *);
+  double (*sample_at_real_point)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *, double *, double *);
+  int (*check_inside)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *);
+  int (*check_mesh_lines)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *);
+};
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_ElementSampler *__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_ElementSampler;
+
+
+/* "yt/utilities/lib/element_mappings.pyx":119
+ * 
+ * 
+ * cdef class P1Sampler1D(ElementSampler):             # <<<<<<<<<<<<<<
+ *     '''
+ * 
+ */
+
+struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_P1Sampler1D {
+  struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_ElementSampler __pyx_base;
+};
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_P1Sampler1D *__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_P1Sampler1D;
+
+
+/* "yt/utilities/lib/element_mappings.pyx":154
+ * 
+ * 
+ * cdef class P1Sampler2D(ElementSampler):             # <<<<<<<<<<<<<<
+ *     '''
+ * 
+ */
+
+struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_P1Sampler2D {
+  struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_ElementSampler __pyx_base;
+};
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_P1Sampler2D *__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_P1Sampler2D;
+
+
+/* "yt/utilities/lib/element_mappings.pyx":225
+ * 
+ * 
+ * cdef class P1Sampler3D(ElementSampler):             # <<<<<<<<<<<<<<
+ *     '''
+ * 
+ */
+
+struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_P1Sampler3D {
+  struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_ElementSampler __pyx_base;
+};
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_P1Sampler3D;
+
+
+/* "yt/utilities/lib/element_mappings.pyx":319
+ * 
+ * 
+ * cdef class NonlinearSolveSampler3D(ElementSampler):             # <<<<<<<<<<<<<<
+ * 
+ *     '''
+ */
+
+struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D {
+  struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_ElementSampler __pyx_base;
+};
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D *__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D;
+
+
+/* "yt/utilities/lib/element_mappings.pyx":426
+ * 
+ * 
+ * cdef class Q1Sampler3D(NonlinearSolveSampler3D):             # <<<<<<<<<<<<<<
+ * 
+ *     '''
+ */
+
+struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D {
+  struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D __pyx_base;
+};
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D *__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D;
+
+
+/* "yt/utilities/lib/element_mappings.pyx":702
+ * 
+ * 
+ * cdef class W1Sampler3D(NonlinearSolveSampler3D):             # <<<<<<<<<<<<<<
+ * 
+ *     '''
+ */
+
+struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_W1Sampler3D {
+  struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D __pyx_base;
+};
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_W1Sampler3D *__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_W1Sampler3D;
+
+
+/* "yt/utilities/lib/element_mappings.pyx":487
+ * 
+ * 
+ * cdef class S2Sampler3D(NonlinearSolveSampler3D):             # <<<<<<<<<<<<<<
+ * 
+ *     '''
+ */
+
+struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_S2Sampler3D {
+  struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D __pyx_base;
+};
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_S2Sampler3D *__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_S2Sampler3D;
+
+
+/* "yt/utilities/lib/element_mappings.pyx":776
+ * 
+ * 
+ * cdef class NonlinearSolveSampler2D(ElementSampler):             # <<<<<<<<<<<<<<
+ * 
+ *     '''
+ */
+
+struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D {
+  struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_ElementSampler __pyx_base;
+};
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D *__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D;
+
+
+/* "yt/utilities/lib/element_mappings.pyx":876
+ * 
+ * 
+ * cdef class Q1Sampler2D(NonlinearSolveSampler2D):             # <<<<<<<<<<<<<<
+ * 
+ *     '''
+ */
+
+struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D {
+  struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D __pyx_base;
+};
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D *__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D;
+
+
+/* "yt/utilities/lib/element_mappings.pyx":916
+ *         return 1
+ * 
+ * cdef class Q2Sampler2D(NonlinearSolveSampler2D):             # <<<<<<<<<<<<<<
+ * 
+ *     '''
+ */
+
+struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D {
+  struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D __pyx_base;
+};
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D *__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D;
+
+
+/* "yt/utilities/lib/element_mappings.pyx":973
+ * 
+ * 
+ * cdef class T2Sampler2D(NonlinearSolveSampler2D):             # <<<<<<<<<<<<<<
+ * 
+ *     '''
+ */
+
+struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_T2Sampler2D {
+  struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D __pyx_base;
+};
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_T2Sampler2D *__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_T2Sampler2D;
+
+
+/* "yt/utilities/lib/element_mappings.pyx":1022
+ *         return 1
+ * 
+ * cdef class Tet2Sampler3D(NonlinearSolveSampler3D):             # <<<<<<<<<<<<<<
+ * 
+ *     '''
+ */
+
+struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D {
+  struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D __pyx_base;
+};
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D *__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D;
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, int);
+    void (*DECREF)(void*, PyObject*, int);
+    void (*GOTREF)(void*, PyObject*, int);
+    void (*GIVEREF)(void*, PyObject*, int);
+    void* (*SetupContext)(const char*, int, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+#ifdef WITH_THREAD
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+          }
+#else
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
+#endif
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
+
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* RaiseArgTupleInvalid.proto */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
+
+/* KeywordStringCheck.proto */
+static int __Pyx_CheckKeywordStrings(PyObject *kwdict, const char* function_name, int kw_allowed);
+
+/* PyErrExceptionMatches.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* GetAttr.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *, PyObject *);
+
+/* GetAttr3.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *, PyObject *, PyObject *);
+
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
+#endif
+
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectCallNoArg.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+#else
+#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
+#endif
+
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* RaiseDoubleKeywords.proto */
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
+
+/* ParseKeywords.proto */
+static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
+    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
+    const char* function_name);
+
+/* ArgTypeTest.proto */
+#define __Pyx_ArgTypeTest(obj, type, none_allowed, name, exact)\
+    ((likely((Py_TYPE(obj) == type) | (none_allowed && (obj == Py_None)))) ? 1 :\
+        __Pyx__ArgTypeTest(obj, type, name, exact))
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact);
+
+/* IsLittleEndian.proto */
+static CYTHON_INLINE int __Pyx_Is_Little_Endian(void);
+
+/* BufferFormatCheck.proto */
+static const char* __Pyx_BufFmt_CheckString(__Pyx_BufFmt_Context* ctx, const char* ts);
+static void __Pyx_BufFmt_Init(__Pyx_BufFmt_Context* ctx,
+                              __Pyx_BufFmt_StackElem* stack,
+                              __Pyx_TypeInfo* type);
+
+/* BufferGetAndValidate.proto */
+#define __Pyx_GetBufferAndValidate(buf, obj, dtype, flags, nd, cast, stack)\
+    ((obj == Py_None || obj == NULL) ?\
+    (__Pyx_ZeroBuffer(buf), 0) :\
+    __Pyx__GetBufferAndValidate(buf, obj, dtype, flags, nd, cast, stack))
+static int  __Pyx__GetBufferAndValidate(Py_buffer* buf, PyObject* obj,
+    __Pyx_TypeInfo* dtype, int flags, int nd, int cast, __Pyx_BufFmt_StackElem* stack);
+static void __Pyx_ZeroBuffer(Py_buffer* buf);
+static CYTHON_INLINE void __Pyx_SafeReleaseBuffer(Py_buffer* info);
+static Py_ssize_t __Pyx_minusones[] = { -1, -1, -1, -1, -1, -1, -1, -1 };
+static Py_ssize_t __Pyx_zeros[] = { 0, 0, 0, 0, 0, 0, 0, 0 };
+
+/* PySequenceContains.proto */
+static CYTHON_INLINE int __Pyx_PySequence_ContainsTF(PyObject* item, PyObject* seq, int eq) {
+    int result = PySequence_Contains(seq, item);
+    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
+}
+
+/* Import.proto */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
+
+/* ImportFrom.proto */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
+
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck);
+
+/* HasAttr.proto */
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *, PyObject *);
+
+/* GetTopmostException.proto */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
+#endif
+
+/* SaveResetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#define __Pyx_ExceptionReset(type, value, tb)  __Pyx__ExceptionReset(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+#else
+#define __Pyx_ExceptionSave(type, value, tb)   PyErr_GetExcInfo(type, value, tb)
+#define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
+#endif
+
+/* GetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_GetException(type, value, tb)  __Pyx__GetException(__pyx_tstate, type, value, tb)
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
+/* PyObject_GenericGetAttrNoDict.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttrNoDict PyObject_GenericGetAttr
+#endif
+
+/* PyObject_GenericGetAttr.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttr PyObject_GenericGetAttr
+#endif
+
+/* SetVTable.proto */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable);
+
+/* PyObjectGetAttrStrNoError.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+
+/* SetupReduce.proto */
+static int __Pyx_setup_reduce(PyObject* type_obj);
+
+/* TypeImport.proto */
+#ifndef __PYX_HAVE_RT_ImportType_proto_0_29_37
+#define __PYX_HAVE_RT_ImportType_proto_0_29_37
+#if __STDC_VERSION__ >= 201112L
+#include <stdalign.h>
+#endif
+#if __STDC_VERSION__ >= 201112L || __cplusplus >= 201103L
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) alignof(s)
+#else
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) sizeof(void*)
+#endif
+enum __Pyx_ImportType_CheckSize_0_29_37 {
+   __Pyx_ImportType_CheckSize_Error_0_29_37 = 0,
+   __Pyx_ImportType_CheckSize_Warn_0_29_37 = 1,
+   __Pyx_ImportType_CheckSize_Ignore_0_29_37 = 2
+};
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject* module, const char *module_name, const char *class_name, size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size);
+#endif
+
+/* CLineInTraceback.proto */
+#ifdef CYTHON_CLINE_IN_TRACEBACK
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#else
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#endif
+
+/* CodeObjectCache.proto */
+typedef struct {
+    PyCodeObject* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+};
+static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static PyCodeObject *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
+
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
+
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* BufferStructDeclare.proto */
+typedef struct {
+  Py_ssize_t shape, strides, suboffsets;
+} __Pyx_Buf_DimInfo;
+typedef struct {
+  size_t refcount;
+  Py_buffer pybuffer;
+} __Pyx_Buffer;
+typedef struct {
+  __Pyx_Buffer *rcbuffer;
+  char *data;
+  __Pyx_Buf_DimInfo diminfo[8];
+} __Pyx_LocalBuf_ND;
+
+#if PY_MAJOR_VERSION < 3
+    static int __Pyx_GetBuffer(PyObject *obj, Py_buffer *view, int flags);
+    static void __Pyx_ReleaseBuffer(Py_buffer *view);
+#else
+    #define __Pyx_GetBuffer PyObject_GetBuffer
+    #define __Pyx_ReleaseBuffer PyBuffer_Release
+#endif
+
+
+/* RealImag.proto */
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    #define __Pyx_CREAL(z) ((z).real())
+    #define __Pyx_CIMAG(z) ((z).imag())
+  #else
+    #define __Pyx_CREAL(z) (__real__(z))
+    #define __Pyx_CIMAG(z) (__imag__(z))
+  #endif
+#else
+    #define __Pyx_CREAL(z) ((z).real)
+    #define __Pyx_CIMAG(z) ((z).imag)
+#endif
+#if defined(__cplusplus) && CYTHON_CCOMPLEX\
+        && (defined(_WIN32) || defined(__clang__) || (defined(__GNUC__) && (__GNUC__ >= 5 || __GNUC__ == 4 && __GNUC_MINOR__ >= 4 )) || __cplusplus >= 201103)
+    #define __Pyx_SET_CREAL(z,x) ((z).real(x))
+    #define __Pyx_SET_CIMAG(z,y) ((z).imag(y))
+#else
+    #define __Pyx_SET_CREAL(z,x) __Pyx_CREAL(z) = (x)
+    #define __Pyx_SET_CIMAG(z,y) __Pyx_CIMAG(z) = (y)
+#endif
+
+/* Arithmetic.proto */
+#if CYTHON_CCOMPLEX
+    #define __Pyx_c_eq_float(a, b)   ((a)==(b))
+    #define __Pyx_c_sum_float(a, b)  ((a)+(b))
+    #define __Pyx_c_diff_float(a, b) ((a)-(b))
+    #define __Pyx_c_prod_float(a, b) ((a)*(b))
+    #define __Pyx_c_quot_float(a, b) ((a)/(b))
+    #define __Pyx_c_neg_float(a)     (-(a))
+  #ifdef __cplusplus
+    #define __Pyx_c_is_zero_float(z) ((z)==(float)0)
+    #define __Pyx_c_conj_float(z)    (::std::conj(z))
+    #if 1
+        #define __Pyx_c_abs_float(z)     (::std::abs(z))
+        #define __Pyx_c_pow_float(a, b)  (::std::pow(a, b))
+    #endif
+  #else
+    #define __Pyx_c_is_zero_float(z) ((z)==0)
+    #define __Pyx_c_conj_float(z)    (conjf(z))
+    #if 1
+        #define __Pyx_c_abs_float(z)     (cabsf(z))
+        #define __Pyx_c_pow_float(a, b)  (cpowf(a, b))
+    #endif
+ #endif
+#else
+    static CYTHON_INLINE int __Pyx_c_eq_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_sum_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_diff_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_prod_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_quot_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_neg_float(__pyx_t_float_complex);
+    static CYTHON_INLINE int __Pyx_c_is_zero_float(__pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_conj_float(__pyx_t_float_complex);
+    #if 1
+        static CYTHON_INLINE float __Pyx_c_abs_float(__pyx_t_float_complex);
+        static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_pow_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    #endif
+#endif
+
+/* Arithmetic.proto */
+#if CYTHON_CCOMPLEX
+    #define __Pyx_c_eq_double(a, b)   ((a)==(b))
+    #define __Pyx_c_sum_double(a, b)  ((a)+(b))
+    #define __Pyx_c_diff_double(a, b) ((a)-(b))
+    #define __Pyx_c_prod_double(a, b) ((a)*(b))
+    #define __Pyx_c_quot_double(a, b) ((a)/(b))
+    #define __Pyx_c_neg_double(a)     (-(a))
+  #ifdef __cplusplus
+    #define __Pyx_c_is_zero_double(z) ((z)==(double)0)
+    #define __Pyx_c_conj_double(z)    (::std::conj(z))
+    #if 1
+        #define __Pyx_c_abs_double(z)     (::std::abs(z))
+        #define __Pyx_c_pow_double(a, b)  (::std::pow(a, b))
+    #endif
+  #else
+    #define __Pyx_c_is_zero_double(z) ((z)==0)
+    #define __Pyx_c_conj_double(z)    (conj(z))
+    #if 1
+        #define __Pyx_c_abs_double(z)     (cabs(z))
+        #define __Pyx_c_pow_double(a, b)  (cpow(a, b))
+    #endif
+ #endif
+#else
+    static CYTHON_INLINE int __Pyx_c_eq_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_sum_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_diff_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_prod_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_quot_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_neg_double(__pyx_t_double_complex);
+    static CYTHON_INLINE int __Pyx_c_is_zero_double(__pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_conj_double(__pyx_t_double_complex);
+    #if 1
+        static CYTHON_INLINE double __Pyx_c_abs_double(__pyx_t_double_complex);
+        static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_pow_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    #endif
+#endif
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
+#endif
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(void);
+
+/* FunctionImport.proto */
+static int __Pyx_ImportFunction_0_29_37(PyObject *module, const char *funcname, void (**f)(void), const char *sig);
+
+/* InitStrings.proto */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
+
+static void __pyx_f_2yt_9utilities_3lib_16element_mappings_14ElementSampler_map_real_to_unit(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *__pyx_v_self, CYTHON_UNUSED double *__pyx_v_mapped_x, CYTHON_UNUSED double *__pyx_v_vertices, CYTHON_UNUSED double *__pyx_v_physical_x); /* proto*/
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_14ElementSampler_sample_at_unit_point(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *__pyx_v_self, CYTHON_UNUSED double *__pyx_v_coord, CYTHON_UNUSED double *__pyx_v_vals); /* proto*/
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_14ElementSampler_check_inside(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *__pyx_v_self, CYTHON_UNUSED double *__pyx_v_mapped_coord); /* proto*/
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_14ElementSampler_check_mesh_lines(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *__pyx_v_self, CYTHON_UNUSED double *__pyx_v_mapped_coord); /* proto*/
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_14ElementSampler_sample_at_real_point(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *__pyx_v_self, double *__pyx_v_vertices, double *__pyx_v_field_values, double *__pyx_v_physical_x); /* proto*/
+static void __pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D_map_real_to_unit(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler1D *__pyx_v_self, double *__pyx_v_mapped_x, double *__pyx_v_vertices, double *__pyx_v_physical_x); /* proto*/
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D_sample_at_unit_point(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler1D *__pyx_v_self, double *__pyx_v_coord, double *__pyx_v_vals); /* proto*/
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D_check_inside(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler1D *__pyx_v_self, double *__pyx_v_mapped_coord); /* proto*/
+static void __pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D_map_real_to_unit(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler2D *__pyx_v_self, double *__pyx_v_mapped_x, double *__pyx_v_vertices, double *__pyx_v_physical_x); /* proto*/
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D_sample_at_unit_point(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler2D *__pyx_v_self, double *__pyx_v_coord, double *__pyx_v_vals); /* proto*/
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D_check_inside(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler2D *__pyx_v_self, double *__pyx_v_mapped_coord); /* proto*/
+static void __pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_map_real_to_unit(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *__pyx_v_self, double *__pyx_v_mapped_x, double *__pyx_v_vertices, double *__pyx_v_physical_x); /* proto*/
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_sample_at_unit_point(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *__pyx_v_self, double *__pyx_v_coord, double *__pyx_v_vals); /* proto*/
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_check_inside(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *__pyx_v_self, double *__pyx_v_mapped_coord); /* proto*/
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_check_mesh_lines(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *__pyx_v_self, double *__pyx_v_mapped_coord); /* proto*/
+static void __pyx_f_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler3D_map_real_to_unit(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D *__pyx_v_self, double *__pyx_v_mapped_x, double *__pyx_v_vertices, double *__pyx_v_physical_x); /* proto*/
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D_sample_at_unit_point(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D *__pyx_v_self, double *__pyx_v_coord, double *__pyx_v_vals); /* proto*/
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D_check_inside(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D *__pyx_v_self, double *__pyx_v_mapped_coord); /* proto*/
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D_check_mesh_lines(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D *__pyx_v_self, double *__pyx_v_mapped_coord); /* proto*/
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D_sample_at_unit_point(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_S2Sampler3D *__pyx_v_self, double *__pyx_v_coord, double *__pyx_v_vals); /* proto*/
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D_check_inside(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_S2Sampler3D *__pyx_v_self, double *__pyx_v_mapped_coord); /* proto*/
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D_check_mesh_lines(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_S2Sampler3D *__pyx_v_self, double *__pyx_v_mapped_coord); /* proto*/
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D_sample_at_unit_point(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_W1Sampler3D *__pyx_v_self, double *__pyx_v_coord, double *__pyx_v_vals); /* proto*/
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D_check_inside(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_W1Sampler3D *__pyx_v_self, double *__pyx_v_mapped_coord); /* proto*/
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D_check_mesh_lines(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_W1Sampler3D *__pyx_v_self, double *__pyx_v_mapped_coord); /* proto*/
+static void __pyx_f_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler2D_map_real_to_unit(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D *__pyx_v_self, double *__pyx_v_mapped_x, double *__pyx_v_vertices, double *__pyx_v_physical_x); /* proto*/
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_11Q1Sampler2D_sample_at_unit_point(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D *__pyx_v_self, double *__pyx_v_coord, double *__pyx_v_vals); /* proto*/
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11Q1Sampler2D_check_inside(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D *__pyx_v_self, double *__pyx_v_mapped_coord); /* proto*/
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_11Q2Sampler2D_sample_at_unit_point(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D *__pyx_v_self, double *__pyx_v_coord, double *__pyx_v_vals); /* proto*/
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11Q2Sampler2D_check_inside(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D *__pyx_v_self, double *__pyx_v_mapped_coord); /* proto*/
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_11T2Sampler2D_sample_at_unit_point(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_T2Sampler2D *__pyx_v_self, double *__pyx_v_coord, double *__pyx_v_vals); /* proto*/
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11T2Sampler2D_check_inside(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_T2Sampler2D *__pyx_v_self, double *__pyx_v_mapped_coord); /* proto*/
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D_sample_at_unit_point(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D *__pyx_v_self, double *__pyx_v_coord, double *__pyx_v_vals); /* proto*/
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D_check_inside(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D *__pyx_v_self, double *__pyx_v_mapped_coord); /* proto*/
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D_check_mesh_lines(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D *__pyx_v_self, double *__pyx_v_mapped_coord); /* proto*/
+
+/* Module declarations from 'cython' */
+
+/* Module declarations from 'cpython.buffer' */
+
+/* Module declarations from 'libc.string' */
+
+/* Module declarations from 'libc.stdio' */
+
+/* Module declarations from '__builtin__' */
+
+/* Module declarations from 'cpython.type' */
+static PyTypeObject *__pyx_ptype_7cpython_4type_type = 0;
+
+/* Module declarations from 'cpython' */
+
+/* Module declarations from 'cpython.object' */
+
+/* Module declarations from 'cpython.ref' */
+
+/* Module declarations from 'cpython.mem' */
+
+/* Module declarations from 'numpy' */
+
+/* Module declarations from 'numpy' */
+static PyTypeObject *__pyx_ptype_5numpy_dtype = 0;
+static PyTypeObject *__pyx_ptype_5numpy_flatiter = 0;
+static PyTypeObject *__pyx_ptype_5numpy_broadcast = 0;
+static PyTypeObject *__pyx_ptype_5numpy_ndarray = 0;
+static PyTypeObject *__pyx_ptype_5numpy_generic = 0;
+static PyTypeObject *__pyx_ptype_5numpy_number = 0;
+static PyTypeObject *__pyx_ptype_5numpy_integer = 0;
+static PyTypeObject *__pyx_ptype_5numpy_signedinteger = 0;
+static PyTypeObject *__pyx_ptype_5numpy_unsignedinteger = 0;
+static PyTypeObject *__pyx_ptype_5numpy_inexact = 0;
+static PyTypeObject *__pyx_ptype_5numpy_floating = 0;
+static PyTypeObject *__pyx_ptype_5numpy_complexfloating = 0;
+static PyTypeObject *__pyx_ptype_5numpy_flexible = 0;
+static PyTypeObject *__pyx_ptype_5numpy_character = 0;
+static PyTypeObject *__pyx_ptype_5numpy_ufunc = 0;
+
+/* Module declarations from 'libc.math' */
+
+/* Module declarations from 'yt.utilities.lib.autogenerated_element_samplers' */
+static void (*__pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_Q1Function3D)(double *, double *, double *, double *); /*proto*/
+static void (*__pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_Q1Jacobian3D)(double *, double *, double *, double *, double *, double *); /*proto*/
+static void (*__pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_Q1Function2D)(double *, double *, double *, double *); /*proto*/
+static void (*__pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_Q1Jacobian2D)(double *, double *, double *, double *, double *); /*proto*/
+static void (*__pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_Q2Function2D)(double *, double *, double *, double *); /*proto*/
+static void (*__pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_Q2Jacobian2D)(double *, double *, double *, double *, double *); /*proto*/
+static void (*__pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_Tet2Function3D)(double *, double *, double *, double *); /*proto*/
+static void (*__pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_Tet2Jacobian3D)(double *, double *, double *, double *, double *, double *); /*proto*/
+static void (*__pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_T2Function2D)(double *, double *, double *, double *); /*proto*/
+static void (*__pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_T2Jacobian2D)(double *, double *, double *, double *, double *); /*proto*/
+static void (*__pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_W1Function3D)(double *, double *, double *, double *); /*proto*/
+static void (*__pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_W1Jacobian3D)(double *, double *, double *, double *, double *, double *); /*proto*/
+
+/* Module declarations from 'yt.utilities.lib.element_mappings' */
+static PyTypeObject *__pyx_ptype_2yt_9utilities_3lib_16element_mappings_ElementSampler = 0;
+static PyTypeObject *__pyx_ptype_2yt_9utilities_3lib_16element_mappings_P1Sampler1D = 0;
+static PyTypeObject *__pyx_ptype_2yt_9utilities_3lib_16element_mappings_P1Sampler2D = 0;
+static PyTypeObject *__pyx_ptype_2yt_9utilities_3lib_16element_mappings_P1Sampler3D = 0;
+static PyTypeObject *__pyx_ptype_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D = 0;
+static PyTypeObject *__pyx_ptype_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D = 0;
+static PyTypeObject *__pyx_ptype_2yt_9utilities_3lib_16element_mappings_W1Sampler3D = 0;
+static PyTypeObject *__pyx_ptype_2yt_9utilities_3lib_16element_mappings_S2Sampler3D = 0;
+static PyTypeObject *__pyx_ptype_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D = 0;
+static PyTypeObject *__pyx_ptype_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D = 0;
+static PyTypeObject *__pyx_ptype_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D = 0;
+static PyTypeObject *__pyx_ptype_2yt_9utilities_3lib_16element_mappings_T2Sampler2D = 0;
+static PyTypeObject *__pyx_ptype_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D = 0;
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_determinant_3x3(double *, double *, double *); /*proto*/
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_maxnorm(double *, int); /*proto*/
+static CYTHON_INLINE void __pyx_f_2yt_9utilities_3lib_16element_mappings_S2Function3D(double *, double *, double *, double *); /*proto*/
+static CYTHON_INLINE void __pyx_f_2yt_9utilities_3lib_16element_mappings_S2Jacobian3D(double *, double *, double *, double *, double *, double *); /*proto*/
+static PyObject *__pyx_f_2yt_9utilities_3lib_16element_mappings___pyx_unpickle_ElementSampler__set_state(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, PyObject *); /*proto*/
+static PyObject *__pyx_f_2yt_9utilities_3lib_16element_mappings___pyx_unpickle_P1Sampler1D__set_state(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler1D *, PyObject *); /*proto*/
+static PyObject *__pyx_f_2yt_9utilities_3lib_16element_mappings___pyx_unpickle_P1Sampler2D__set_state(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler2D *, PyObject *); /*proto*/
+static PyObject *__pyx_f_2yt_9utilities_3lib_16element_mappings___pyx_unpickle_P1Sampler3D__set_state(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *, PyObject *); /*proto*/
+static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t = { "float64_t", NULL, sizeof(__pyx_t_5numpy_float64_t), { 0 }, 0, 'R', 0, 0 };
+#define __Pyx_MODULE_NAME "yt.utilities.lib.element_mappings"
+extern int __pyx_module_is_main_yt__utilities__lib__element_mappings;
+int __pyx_module_is_main_yt__utilities__lib__element_mappings = 0;
+
+/* Implementation of 'yt.utilities.lib.element_mappings' */
+static PyObject *__pyx_builtin_range;
+static PyObject *__pyx_builtin_super;
+static PyObject *__pyx_builtin_TypeError;
+static PyObject *__pyx_builtin_ImportError;
+static const char __pyx_k_np[] = "np";
+static const char __pyx_k_new[] = "__new__";
+static const char __pyx_k_val[] = "val";
+static const char __pyx_k_dict[] = "__dict__";
+static const char __pyx_k_init[] = "__init__";
+static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_name[] = "__name__";
+static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_numpy[] = "numpy";
+static const char __pyx_k_range[] = "range";
+static const char __pyx_k_super[] = "super";
+static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_pickle[] = "pickle";
+static const char __pyx_k_reduce[] = "__reduce__";
+static const char __pyx_k_update[] = "update";
+static const char __pyx_k_sampler[] = "sampler";
+static const char __pyx_k_getstate[] = "__getstate__";
+static const char __pyx_k_pyx_type[] = "__pyx_type";
+static const char __pyx_k_setstate[] = "__setstate__";
+static const char __pyx_k_vertices[] = "vertices";
+static const char __pyx_k_TypeError[] = "TypeError";
+static const char __pyx_k_pyx_state[] = "__pyx_state";
+static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
+static const char __pyx_k_physical_x[] = "physical_x";
+static const char __pyx_k_pyx_result[] = "__pyx_result";
+static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
+static const char __pyx_k_ImportError[] = "ImportError";
+static const char __pyx_k_P1Sampler1D[] = "P1Sampler1D";
+static const char __pyx_k_P1Sampler2D[] = "P1Sampler2D";
+static const char __pyx_k_P1Sampler3D[] = "P1Sampler3D";
+static const char __pyx_k_PickleError[] = "PickleError";
+static const char __pyx_k_Q1Sampler2D[] = "Q1Sampler2D";
+static const char __pyx_k_Q1Sampler3D[] = "Q1Sampler3D";
+static const char __pyx_k_Q2Sampler2D[] = "Q2Sampler2D";
+static const char __pyx_k_S2Sampler3D[] = "S2Sampler3D";
+static const char __pyx_k_T2Sampler2D[] = "T2Sampler2D";
+static const char __pyx_k_W1Sampler3D[] = "W1Sampler3D";
+static const char __pyx_k_field_values[] = "field_values";
+static const char __pyx_k_pyx_checksum[] = "__pyx_checksum";
+static const char __pyx_k_stringsource[] = "stringsource";
+static const char __pyx_k_Tet2Sampler3D[] = "Tet2Sampler3D";
+static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
+static const char __pyx_k_ElementSampler[] = "ElementSampler";
+static const char __pyx_k_pyx_PickleError[] = "__pyx_PickleError";
+static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
+static const char __pyx_k_test_hex_sampler[] = "test_hex_sampler";
+static const char __pyx_k_test_tri_sampler[] = "test_tri_sampler";
+static const char __pyx_k_test_quad_sampler[] = "test_quad_sampler";
+static const char __pyx_k_test_tet2_sampler[] = "test_tet2_sampler";
+static const char __pyx_k_test_tri2_sampler[] = "test_tri2_sampler";
+static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_test_hex20_sampler[] = "test_hex20_sampler";
+static const char __pyx_k_test_quad2_sampler[] = "test_quad2_sampler";
+static const char __pyx_k_test_tetra_sampler[] = "test_tetra_sampler";
+static const char __pyx_k_test_wedge_sampler[] = "test_wedge_sampler";
+static const char __pyx_k_test_linear1D_sampler[] = "test_linear1D_sampler";
+static const char __pyx_k_NonlinearSolveSampler2D[] = "NonlinearSolveSampler2D";
+static const char __pyx_k_NonlinearSolveSampler3D[] = "NonlinearSolveSampler3D";
+static const char __pyx_k_pyx_unpickle_P1Sampler1D[] = "__pyx_unpickle_P1Sampler1D";
+static const char __pyx_k_pyx_unpickle_P1Sampler2D[] = "__pyx_unpickle_P1Sampler2D";
+static const char __pyx_k_pyx_unpickle_P1Sampler3D[] = "__pyx_unpickle_P1Sampler3D";
+static const char __pyx_k_pyx_unpickle_ElementSampler[] = "__pyx_unpickle_ElementSampler";
+static const char __pyx_k_This_file_contains_coordinate_m[] = "\nThis file contains coordinate mappings between physical coordinates and those\ndefined on unit elements, as well as doing the corresponding intracell\ninterpolation on finite element data.\n\n\n";
+static const char __pyx_k_numpy_core_multiarray_failed_to[] = "numpy.core.multiarray failed to import";
+static const char __pyx_k_Incompatible_checksums_0x_x_vs_0[] = "Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))";
+static const char __pyx_k_numpy_core_umath_failed_to_impor[] = "numpy.core.umath failed to import";
+static const char __pyx_k_self_func_self_jac_cannot_be_con[] = "self.func,self.jac cannot be converted to a Python object for pickling";
+static const char __pyx_k_yt_utilities_lib_element_mapping[] = "yt/utilities/lib/element_mappings.pyx";
+static const char __pyx_k_yt_utilities_lib_element_mapping_2[] = "yt.utilities.lib.element_mappings";
+static PyObject *__pyx_n_s_ElementSampler;
+static PyObject *__pyx_n_s_ImportError;
+static PyObject *__pyx_kp_s_Incompatible_checksums_0x_x_vs_0;
+static PyObject *__pyx_n_s_NonlinearSolveSampler2D;
+static PyObject *__pyx_n_s_NonlinearSolveSampler3D;
+static PyObject *__pyx_n_s_P1Sampler1D;
+static PyObject *__pyx_n_s_P1Sampler2D;
+static PyObject *__pyx_n_s_P1Sampler3D;
+static PyObject *__pyx_n_s_PickleError;
+static PyObject *__pyx_n_s_Q1Sampler2D;
+static PyObject *__pyx_n_s_Q1Sampler3D;
+static PyObject *__pyx_n_s_Q2Sampler2D;
+static PyObject *__pyx_n_s_S2Sampler3D;
+static PyObject *__pyx_n_s_T2Sampler2D;
+static PyObject *__pyx_n_s_Tet2Sampler3D;
+static PyObject *__pyx_n_s_TypeError;
+static PyObject *__pyx_n_s_W1Sampler3D;
+static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_s_dict;
+static PyObject *__pyx_n_s_field_values;
+static PyObject *__pyx_n_s_getstate;
+static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_init;
+static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_name;
+static PyObject *__pyx_n_s_new;
+static PyObject *__pyx_n_s_np;
+static PyObject *__pyx_n_s_numpy;
+static PyObject *__pyx_kp_s_numpy_core_multiarray_failed_to;
+static PyObject *__pyx_kp_s_numpy_core_umath_failed_to_impor;
+static PyObject *__pyx_n_s_physical_x;
+static PyObject *__pyx_n_s_pickle;
+static PyObject *__pyx_n_s_pyx_PickleError;
+static PyObject *__pyx_n_s_pyx_checksum;
+static PyObject *__pyx_n_s_pyx_result;
+static PyObject *__pyx_n_s_pyx_state;
+static PyObject *__pyx_n_s_pyx_type;
+static PyObject *__pyx_n_s_pyx_unpickle_ElementSampler;
+static PyObject *__pyx_n_s_pyx_unpickle_P1Sampler1D;
+static PyObject *__pyx_n_s_pyx_unpickle_P1Sampler2D;
+static PyObject *__pyx_n_s_pyx_unpickle_P1Sampler3D;
+static PyObject *__pyx_n_s_pyx_vtable;
+static PyObject *__pyx_n_s_range;
+static PyObject *__pyx_n_s_reduce;
+static PyObject *__pyx_n_s_reduce_cython;
+static PyObject *__pyx_n_s_reduce_ex;
+static PyObject *__pyx_n_s_sampler;
+static PyObject *__pyx_kp_s_self_func_self_jac_cannot_be_con;
+static PyObject *__pyx_n_s_setstate;
+static PyObject *__pyx_n_s_setstate_cython;
+static PyObject *__pyx_kp_s_stringsource;
+static PyObject *__pyx_n_s_super;
+static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_n_s_test_hex20_sampler;
+static PyObject *__pyx_n_s_test_hex_sampler;
+static PyObject *__pyx_n_s_test_linear1D_sampler;
+static PyObject *__pyx_n_s_test_quad2_sampler;
+static PyObject *__pyx_n_s_test_quad_sampler;
+static PyObject *__pyx_n_s_test_tet2_sampler;
+static PyObject *__pyx_n_s_test_tetra_sampler;
+static PyObject *__pyx_n_s_test_tri2_sampler;
+static PyObject *__pyx_n_s_test_tri_sampler;
+static PyObject *__pyx_n_s_test_wedge_sampler;
+static PyObject *__pyx_n_s_update;
+static PyObject *__pyx_n_s_val;
+static PyObject *__pyx_n_s_vertices;
+static PyObject *__pyx_kp_s_yt_utilities_lib_element_mapping;
+static PyObject *__pyx_n_s_yt_utilities_lib_element_mapping_2;
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_14ElementSampler___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_14ElementSampler_2__reduce_cython__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_14ElementSampler_4__setstate_cython__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler1D *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D_2__reduce_cython__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler1D *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D_4__setstate_cython__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler1D *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler2D *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D_2__reduce_cython__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler2D *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D_4__setstate_cython__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler2D *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_2__reduce_cython__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_4__setstate_cython__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler3D___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler3D_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler3D_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_S2Sampler3D *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_S2Sampler3D *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_S2Sampler3D *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_W1Sampler3D *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_W1Sampler3D *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_W1Sampler3D *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler2D___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler2D_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler2D_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q1Sampler2D___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q1Sampler2D_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q1Sampler2D_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q2Sampler2D___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q2Sampler2D_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q2Sampler2D_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_11T2Sampler2D___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_T2Sampler2D *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11T2Sampler2D_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_T2Sampler2D *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11T2Sampler2D_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_T2Sampler2D *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_test_hex_sampler(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_vertices, PyArrayObject *__pyx_v_field_values, PyArrayObject *__pyx_v_physical_x); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_2test_hex20_sampler(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_vertices, PyArrayObject *__pyx_v_field_values, PyArrayObject *__pyx_v_physical_x); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_4test_tetra_sampler(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_vertices, PyArrayObject *__pyx_v_field_values, PyArrayObject *__pyx_v_physical_x); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_6test_wedge_sampler(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_vertices, PyArrayObject *__pyx_v_field_values, PyArrayObject *__pyx_v_physical_x); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_8test_linear1D_sampler(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_vertices, PyArrayObject *__pyx_v_field_values, PyArrayObject *__pyx_v_physical_x); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_10test_tri_sampler(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_vertices, PyArrayObject *__pyx_v_field_values, PyArrayObject *__pyx_v_physical_x); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_12test_quad_sampler(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_vertices, PyArrayObject *__pyx_v_field_values, PyArrayObject *__pyx_v_physical_x); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_14test_quad2_sampler(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_vertices, PyArrayObject *__pyx_v_field_values, PyArrayObject *__pyx_v_physical_x); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_16test_tri2_sampler(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_vertices, PyArrayObject *__pyx_v_field_values, PyArrayObject *__pyx_v_physical_x); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_18test_tet2_sampler(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_vertices, PyArrayObject *__pyx_v_field_values, PyArrayObject *__pyx_v_physical_x); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_20__pyx_unpickle_ElementSampler(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_22__pyx_unpickle_P1Sampler1D(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_24__pyx_unpickle_P1Sampler2D(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_26__pyx_unpickle_P1Sampler3D(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_ElementSampler(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_P1Sampler1D(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_P1Sampler2D(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_P1Sampler3D(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_W1Sampler3D(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_S2Sampler3D(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_T2Sampler2D(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_int_131557558;
+static PyObject *__pyx_int_171418803;
+static PyObject *__pyx_int_182318436;
+static PyObject *__pyx_tuple_;
+static PyObject *__pyx_tuple__2;
+static PyObject *__pyx_tuple__3;
+static PyObject *__pyx_tuple__4;
+static PyObject *__pyx_tuple__5;
+static PyObject *__pyx_tuple__6;
+static PyObject *__pyx_tuple__7;
+static PyObject *__pyx_tuple__8;
+static PyObject *__pyx_tuple__9;
+static PyObject *__pyx_tuple__10;
+static PyObject *__pyx_tuple__11;
+static PyObject *__pyx_tuple__12;
+static PyObject *__pyx_tuple__13;
+static PyObject *__pyx_tuple__14;
+static PyObject *__pyx_tuple__15;
+static PyObject *__pyx_tuple__16;
+static PyObject *__pyx_tuple__17;
+static PyObject *__pyx_tuple__18;
+static PyObject *__pyx_tuple__19;
+static PyObject *__pyx_tuple__20;
+static PyObject *__pyx_tuple__21;
+static PyObject *__pyx_tuple__22;
+static PyObject *__pyx_tuple__24;
+static PyObject *__pyx_tuple__26;
+static PyObject *__pyx_tuple__28;
+static PyObject *__pyx_tuple__30;
+static PyObject *__pyx_tuple__32;
+static PyObject *__pyx_tuple__34;
+static PyObject *__pyx_tuple__36;
+static PyObject *__pyx_tuple__38;
+static PyObject *__pyx_tuple__40;
+static PyObject *__pyx_tuple__42;
+static PyObject *__pyx_tuple__44;
+static PyObject *__pyx_tuple__46;
+static PyObject *__pyx_tuple__48;
+static PyObject *__pyx_codeobj__23;
+static PyObject *__pyx_codeobj__25;
+static PyObject *__pyx_codeobj__27;
+static PyObject *__pyx_codeobj__29;
+static PyObject *__pyx_codeobj__31;
+static PyObject *__pyx_codeobj__33;
+static PyObject *__pyx_codeobj__35;
+static PyObject *__pyx_codeobj__37;
+static PyObject *__pyx_codeobj__39;
+static PyObject *__pyx_codeobj__41;
+static PyObject *__pyx_codeobj__43;
+static PyObject *__pyx_codeobj__45;
+static PyObject *__pyx_codeobj__47;
+static PyObject *__pyx_codeobj__49;
+/* Late includes */
+
+/* "yt/utilities/lib/element_mappings.pyx":41
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * cdef double determinant_3x3(double* col0,             # <<<<<<<<<<<<<<
+ *                             double* col1,
+ *                             double* col2) nogil:
+ */
+
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_determinant_3x3(double *__pyx_v_col0, double *__pyx_v_col1, double *__pyx_v_col2) {
+  double __pyx_r;
+
+  /* "yt/utilities/lib/element_mappings.pyx":46
+ *     return col0[0]*col1[1]*col2[2] - col0[0]*col1[2]*col2[1] - \
+ *            col0[1]*col1[0]*col2[2] + col0[1]*col1[2]*col2[0] + \
+ *            col0[2]*col1[0]*col2[1] - col0[2]*col1[1]*col2[0]             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = ((((((((__pyx_v_col0[0]) * (__pyx_v_col1[1])) * (__pyx_v_col2[2])) - (((__pyx_v_col0[0]) * (__pyx_v_col1[2])) * (__pyx_v_col2[1]))) - (((__pyx_v_col0[1]) * (__pyx_v_col1[0])) * (__pyx_v_col2[2]))) + (((__pyx_v_col0[1]) * (__pyx_v_col1[2])) * (__pyx_v_col2[0]))) + (((__pyx_v_col0[2]) * (__pyx_v_col1[0])) * (__pyx_v_col2[1]))) - (((__pyx_v_col0[2]) * (__pyx_v_col1[1])) * (__pyx_v_col2[0])));
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":41
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * cdef double determinant_3x3(double* col0,             # <<<<<<<<<<<<<<
+ *                             double* col1,
+ *                             double* col2) nogil:
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":52
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * cdef double maxnorm(double* f, int dim) nogil:             # <<<<<<<<<<<<<<
+ *     cdef double err
+ *     cdef int i
+ */
+
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_maxnorm(double *__pyx_v_f, int __pyx_v_dim) {
+  double __pyx_v_err;
+  int __pyx_v_i;
+  double __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+
+  /* "yt/utilities/lib/element_mappings.pyx":55
+ *     cdef double err
+ *     cdef int i
+ *     err = fabs(f[0])             # <<<<<<<<<<<<<<
+ *     for i in range(1, dim):
+ *         err = fmax(err, fabs(f[i]))
+ */
+  __pyx_v_err = fabs((__pyx_v_f[0]));
+
+  /* "yt/utilities/lib/element_mappings.pyx":56
+ *     cdef int i
+ *     err = fabs(f[0])
+ *     for i in range(1, dim):             # <<<<<<<<<<<<<<
+ *         err = fmax(err, fabs(f[i]))
+ *     return err
+ */
+  __pyx_t_1 = __pyx_v_dim;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 1; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "yt/utilities/lib/element_mappings.pyx":57
+ *     err = fabs(f[0])
+ *     for i in range(1, dim):
+ *         err = fmax(err, fabs(f[i]))             # <<<<<<<<<<<<<<
+ *     return err
+ * 
+ */
+    __pyx_v_err = fmax(__pyx_v_err, fabs((__pyx_v_f[__pyx_v_i])));
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":58
+ *     for i in range(1, dim):
+ *         err = fmax(err, fabs(f[i]))
+ *     return err             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = __pyx_v_err;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":52
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * cdef double maxnorm(double* f, int dim) nogil:             # <<<<<<<<<<<<<<
+ *     cdef double err
+ *     cdef int i
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":72
+ *     '''
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         self.inclusion_tol = 1.0e-8
+ * 
+ */
+
+/* Python wrapper */
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_14ElementSampler_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_14ElementSampler_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
+    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
+  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_14ElementSampler___init__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_14ElementSampler___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "yt/utilities/lib/element_mappings.pyx":73
+ * 
+ *     def __init__(self):
+ *         self.inclusion_tol = 1.0e-8             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_v_self->inclusion_tol = 1.0e-8;
+
+  /* "yt/utilities/lib/element_mappings.pyx":72
+ *     '''
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         self.inclusion_tol = 1.0e-8
+ * 
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":78
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef void map_real_to_unit(self,             # <<<<<<<<<<<<<<
+ *                                double* mapped_x,
+ *                                double* vertices,
+ */
+
+static void __pyx_f_2yt_9utilities_3lib_16element_mappings_14ElementSampler_map_real_to_unit(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *__pyx_v_self, CYTHON_UNUSED double *__pyx_v_mapped_x, CYTHON_UNUSED double *__pyx_v_vertices, CYTHON_UNUSED double *__pyx_v_physical_x) {
+
+  /* function exit code */
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":87
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef double sample_at_unit_point(self,             # <<<<<<<<<<<<<<
+ *                                      double* coord,
+ *                                      double* vals) nogil:
+ */
+
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_14ElementSampler_sample_at_unit_point(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *__pyx_v_self, CYTHON_UNUSED double *__pyx_v_coord, CYTHON_UNUSED double *__pyx_v_vals) {
+  double __pyx_r;
+
+  /* function exit code */
+  __pyx_r = 0;
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":95
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         pass
+ * 
+ */
+
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_14ElementSampler_check_inside(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *__pyx_v_self, CYTHON_UNUSED double *__pyx_v_mapped_coord) {
+  int __pyx_r;
+
+  /* function exit code */
+  __pyx_r = 0;
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":101
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_mesh_lines(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         pass
+ * 
+ */
+
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_14ElementSampler_check_mesh_lines(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *__pyx_v_self, CYTHON_UNUSED double *__pyx_v_mapped_coord) {
+  int __pyx_r;
+
+  /* function exit code */
+  __pyx_r = 0;
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":107
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef double sample_at_real_point(self,             # <<<<<<<<<<<<<<
+ *                                      double* vertices,
+ *                                      double* field_values,
+ */
+
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_14ElementSampler_sample_at_real_point(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *__pyx_v_self, double *__pyx_v_vertices, double *__pyx_v_field_values, double *__pyx_v_physical_x) {
+  double __pyx_v_val;
+  double __pyx_v_mapped_coord[4];
+  double __pyx_r;
+
+  /* "yt/utilities/lib/element_mappings.pyx":114
+ *         cdef double mapped_coord[4]
+ * 
+ *         self.map_real_to_unit(mapped_coord, vertices, physical_x)             # <<<<<<<<<<<<<<
+ *         val = self.sample_at_unit_point(mapped_coord, field_values)
+ *         return val
+ */
+  ((struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_ElementSampler *)__pyx_v_self->__pyx_vtab)->map_real_to_unit(__pyx_v_self, __pyx_v_mapped_coord, __pyx_v_vertices, __pyx_v_physical_x);
+
+  /* "yt/utilities/lib/element_mappings.pyx":115
+ * 
+ *         self.map_real_to_unit(mapped_coord, vertices, physical_x)
+ *         val = self.sample_at_unit_point(mapped_coord, field_values)             # <<<<<<<<<<<<<<
+ *         return val
+ * 
+ */
+  __pyx_v_val = ((struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_ElementSampler *)__pyx_v_self->__pyx_vtab)->sample_at_unit_point(__pyx_v_self, __pyx_v_mapped_coord, __pyx_v_field_values);
+
+  /* "yt/utilities/lib/element_mappings.pyx":116
+ *         self.map_real_to_unit(mapped_coord, vertices, physical_x)
+ *         val = self.sample_at_unit_point(mapped_coord, field_values)
+ *         return val             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = __pyx_v_val;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":107
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef double sample_at_real_point(self,             # <<<<<<<<<<<<<<
+ *                                      double* vertices,
+ *                                      double* field_values,
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_14ElementSampler_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_14ElementSampler_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_14ElementSampler_2__reduce_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_14ElementSampler_2__reduce_cython__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *__pyx_v_self) {
+  PyObject *__pyx_v_state = 0;
+  PyObject *__pyx_v__dict = 0;
+  int __pyx_v_use_setstate;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":5
+ *     cdef object _dict
+ *     cdef bint use_setstate
+ *     state = (self.inclusion_tol, self.num_mapped_coords)             # <<<<<<<<<<<<<<
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ */
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->inclusion_tol); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_self->num_mapped_coords); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2);
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_v_state = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "(tree fragment)":6
+ *     cdef bint use_setstate
+ *     state = (self.inclusion_tol, self.num_mapped_coords)
+ *     _dict = getattr(self, '__dict__', None)             # <<<<<<<<<<<<<<
+ *     if _dict is not None:
+ *         state += (_dict,)
+ */
+  __pyx_t_3 = __Pyx_GetAttr3(((PyObject *)__pyx_v_self), __pyx_n_s_dict, Py_None); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v__dict = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "(tree fragment)":7
+ *     state = (self.inclusion_tol, self.num_mapped_coords)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+  __pyx_t_4 = (__pyx_v__dict != Py_None);
+  __pyx_t_5 = (__pyx_t_4 != 0);
+  if (__pyx_t_5) {
+
+    /* "(tree fragment)":8
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ *         state += (_dict,)             # <<<<<<<<<<<<<<
+ *         use_setstate = True
+ *     else:
+ */
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_v__dict);
+    __Pyx_GIVEREF(__pyx_v__dict);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v__dict);
+    __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_v_state, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF_SET(__pyx_v_state, ((PyObject*)__pyx_t_2));
+    __pyx_t_2 = 0;
+
+    /* "(tree fragment)":9
+ *     if _dict is not None:
+ *         state += (_dict,)
+ *         use_setstate = True             # <<<<<<<<<<<<<<
+ *     else:
+ *         use_setstate = False
+ */
+    __pyx_v_use_setstate = 1;
+
+    /* "(tree fragment)":7
+ *     state = (self.inclusion_tol, self.num_mapped_coords)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+    goto __pyx_L3;
+  }
+
+  /* "(tree fragment)":11
+ *         use_setstate = True
+ *     else:
+ *         use_setstate = False             # <<<<<<<<<<<<<<
+ *     if use_setstate:
+ *         return __pyx_unpickle_ElementSampler, (type(self), 0xa37a4b3, None), state
+ */
+  /*else*/ {
+    __pyx_v_use_setstate = 0;
+  }
+  __pyx_L3:;
+
+  /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = False
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_ElementSampler, (type(self), 0xa37a4b3, None), state
+ *     else:
+ */
+  __pyx_t_5 = (__pyx_v_use_setstate != 0);
+  if (__pyx_t_5) {
+
+    /* "(tree fragment)":13
+ *         use_setstate = False
+ *     if use_setstate:
+ *         return __pyx_unpickle_ElementSampler, (type(self), 0xa37a4b3, None), state             # <<<<<<<<<<<<<<
+ *     else:
+ *         return __pyx_unpickle_ElementSampler, (type(self), 0xa37a4b3, state)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_pyx_unpickle_ElementSampler); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_171418803);
+    __Pyx_GIVEREF(__pyx_int_171418803);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_171418803);
+    __Pyx_INCREF(Py_None);
+    __Pyx_GIVEREF(Py_None);
+    PyTuple_SET_ITEM(__pyx_t_3, 2, Py_None);
+    __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_3);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_state);
+    __pyx_t_2 = 0;
+    __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+
+    /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = False
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_ElementSampler, (type(self), 0xa37a4b3, None), state
+ *     else:
+ */
+  }
+
+  /* "(tree fragment)":15
+ *         return __pyx_unpickle_ElementSampler, (type(self), 0xa37a4b3, None), state
+ *     else:
+ *         return __pyx_unpickle_ElementSampler, (type(self), 0xa37a4b3, state)             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_ElementSampler__set_state(self, __pyx_state)
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_pyx_unpickle_ElementSampler); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_171418803);
+    __Pyx_GIVEREF(__pyx_int_171418803);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_171418803);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_v_state);
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_3);
+    __pyx_t_1 = 0;
+    __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+  }
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.ElementSampler.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_state);
+  __Pyx_XDECREF(__pyx_v__dict);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_ElementSampler, (type(self), 0xa37a4b3, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_ElementSampler__set_state(self, __pyx_state)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_14ElementSampler_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_14ElementSampler_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_14ElementSampler_4__setstate_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_14ElementSampler_4__setstate_cython__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":17
+ *         return __pyx_unpickle_ElementSampler, (type(self), 0xa37a4b3, state)
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_ElementSampler__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
+ */
+  if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 17, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_2yt_9utilities_3lib_16element_mappings___pyx_unpickle_ElementSampler__set_state(__pyx_v_self, ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_ElementSampler, (type(self), 0xa37a4b3, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_ElementSampler__set_state(self, __pyx_state)
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.ElementSampler.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":126
+ *     '''
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         super(P1Sampler1D, self).__init__()
+ *         self.num_mapped_coords = 1
+ */
+
+/* Python wrapper */
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
+    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
+  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D___init__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler1D *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler1D *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "yt/utilities/lib/element_mappings.pyx":127
+ * 
+ *     def __init__(self):
+ *         super(P1Sampler1D, self).__init__()             # <<<<<<<<<<<<<<
+ *         self.num_mapped_coords = 1
+ * 
+ */
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 127, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_P1Sampler1D));
+  __Pyx_GIVEREF(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_P1Sampler1D));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_P1Sampler1D));
+  __Pyx_INCREF(((PyObject *)__pyx_v_self));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self));
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 127, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 127, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 127, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":128
+ *     def __init__(self):
+ *         super(P1Sampler1D, self).__init__()
+ *         self.num_mapped_coords = 1             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_v_self->__pyx_base.num_mapped_coords = 1;
+
+  /* "yt/utilities/lib/element_mappings.pyx":126
+ *     '''
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         super(P1Sampler1D, self).__init__()
+ *         self.num_mapped_coords = 1
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.P1Sampler1D.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":133
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef void map_real_to_unit(self, double* mapped_x,             # <<<<<<<<<<<<<<
+ *                                double* vertices, double* physical_x) nogil:
+ *         mapped_x[0] = -1.0 + 2.0*(physical_x[0] - vertices[0]) / (vertices[1] - vertices[0])
+ */
+
+static void __pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D_map_real_to_unit(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler1D *__pyx_v_self, double *__pyx_v_mapped_x, double *__pyx_v_vertices, double *__pyx_v_physical_x) {
+
+  /* "yt/utilities/lib/element_mappings.pyx":135
+ *     cdef void map_real_to_unit(self, double* mapped_x,
+ *                                double* vertices, double* physical_x) nogil:
+ *         mapped_x[0] = -1.0 + 2.0*(physical_x[0] - vertices[0]) / (vertices[1] - vertices[0])             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  (__pyx_v_mapped_x[0]) = (-1.0 + ((2.0 * ((__pyx_v_physical_x[0]) - (__pyx_v_vertices[0]))) / ((__pyx_v_vertices[1]) - (__pyx_v_vertices[0]))));
+
+  /* "yt/utilities/lib/element_mappings.pyx":133
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef void map_real_to_unit(self, double* mapped_x,             # <<<<<<<<<<<<<<
+ *                                double* vertices, double* physical_x) nogil:
+ *         mapped_x[0] = -1.0 + 2.0*(physical_x[0] - vertices[0]) / (vertices[1] - vertices[0])
+ */
+
+  /* function exit code */
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":140
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef double sample_at_unit_point(self,             # <<<<<<<<<<<<<<
+ *                                      double* coord,
+ *                                      double* vals) nogil:
+ */
+
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D_sample_at_unit_point(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler1D *__pyx_v_self, double *__pyx_v_coord, double *__pyx_v_vals) {
+  double __pyx_r;
+
+  /* "yt/utilities/lib/element_mappings.pyx":143
+ *                                      double* coord,
+ *                                      double* vals) nogil:
+ *         return vals[0] * (1 - coord[0]) / 2.0 + vals[1] * (1.0 + coord[0]) / 2.0             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_r = ((((__pyx_v_vals[0]) * (1.0 - (__pyx_v_coord[0]))) / 2.0) + (((__pyx_v_vals[1]) * (1.0 + (__pyx_v_coord[0]))) / 2.0));
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":140
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef double sample_at_unit_point(self,             # <<<<<<<<<<<<<<
+ *                                      double* coord,
+ *                                      double* vals) nogil:
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":148
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol):
+ *             return 0
+ */
+
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D_check_inside(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler1D *__pyx_v_self, double *__pyx_v_mapped_coord) {
+  int __pyx_r;
+  int __pyx_t_1;
+
+  /* "yt/utilities/lib/element_mappings.pyx":149
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol):             # <<<<<<<<<<<<<<
+ *             return 0
+ *         return 1
+ */
+  __pyx_t_1 = (((fabs((__pyx_v_mapped_coord[0])) - 1.0) > __pyx_v_self->__pyx_base.inclusion_tol) != 0);
+  if (__pyx_t_1) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":150
+ *     cdef int check_inside(self, double* mapped_coord) nogil:
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol):
+ *             return 0             # <<<<<<<<<<<<<<
+ *         return 1
+ * 
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "yt/utilities/lib/element_mappings.pyx":149
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol):             # <<<<<<<<<<<<<<
+ *             return 0
+ *         return 1
+ */
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":151
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol):
+ *             return 0
+ *         return 1             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":148
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol):
+ *             return 0
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D_2__reduce_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler1D *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D_2__reduce_cython__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler1D *__pyx_v_self) {
+  PyObject *__pyx_v_state = 0;
+  PyObject *__pyx_v__dict = 0;
+  int __pyx_v_use_setstate;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":5
+ *     cdef object _dict
+ *     cdef bint use_setstate
+ *     state = (self.inclusion_tol, self.num_mapped_coords)             # <<<<<<<<<<<<<<
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ */
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->__pyx_base.inclusion_tol); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_self->__pyx_base.num_mapped_coords); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2);
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_v_state = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "(tree fragment)":6
+ *     cdef bint use_setstate
+ *     state = (self.inclusion_tol, self.num_mapped_coords)
+ *     _dict = getattr(self, '__dict__', None)             # <<<<<<<<<<<<<<
+ *     if _dict is not None:
+ *         state += (_dict,)
+ */
+  __pyx_t_3 = __Pyx_GetAttr3(((PyObject *)__pyx_v_self), __pyx_n_s_dict, Py_None); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v__dict = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "(tree fragment)":7
+ *     state = (self.inclusion_tol, self.num_mapped_coords)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+  __pyx_t_4 = (__pyx_v__dict != Py_None);
+  __pyx_t_5 = (__pyx_t_4 != 0);
+  if (__pyx_t_5) {
+
+    /* "(tree fragment)":8
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ *         state += (_dict,)             # <<<<<<<<<<<<<<
+ *         use_setstate = True
+ *     else:
+ */
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_v__dict);
+    __Pyx_GIVEREF(__pyx_v__dict);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v__dict);
+    __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_v_state, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF_SET(__pyx_v_state, ((PyObject*)__pyx_t_2));
+    __pyx_t_2 = 0;
+
+    /* "(tree fragment)":9
+ *     if _dict is not None:
+ *         state += (_dict,)
+ *         use_setstate = True             # <<<<<<<<<<<<<<
+ *     else:
+ *         use_setstate = False
+ */
+    __pyx_v_use_setstate = 1;
+
+    /* "(tree fragment)":7
+ *     state = (self.inclusion_tol, self.num_mapped_coords)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+    goto __pyx_L3;
+  }
+
+  /* "(tree fragment)":11
+ *         use_setstate = True
+ *     else:
+ *         use_setstate = False             # <<<<<<<<<<<<<<
+ *     if use_setstate:
+ *         return __pyx_unpickle_P1Sampler1D, (type(self), 0xa37a4b3, None), state
+ */
+  /*else*/ {
+    __pyx_v_use_setstate = 0;
+  }
+  __pyx_L3:;
+
+  /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = False
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_P1Sampler1D, (type(self), 0xa37a4b3, None), state
+ *     else:
+ */
+  __pyx_t_5 = (__pyx_v_use_setstate != 0);
+  if (__pyx_t_5) {
+
+    /* "(tree fragment)":13
+ *         use_setstate = False
+ *     if use_setstate:
+ *         return __pyx_unpickle_P1Sampler1D, (type(self), 0xa37a4b3, None), state             # <<<<<<<<<<<<<<
+ *     else:
+ *         return __pyx_unpickle_P1Sampler1D, (type(self), 0xa37a4b3, state)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_pyx_unpickle_P1Sampler1D); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_171418803);
+    __Pyx_GIVEREF(__pyx_int_171418803);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_171418803);
+    __Pyx_INCREF(Py_None);
+    __Pyx_GIVEREF(Py_None);
+    PyTuple_SET_ITEM(__pyx_t_3, 2, Py_None);
+    __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_3);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_state);
+    __pyx_t_2 = 0;
+    __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+
+    /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = False
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_P1Sampler1D, (type(self), 0xa37a4b3, None), state
+ *     else:
+ */
+  }
+
+  /* "(tree fragment)":15
+ *         return __pyx_unpickle_P1Sampler1D, (type(self), 0xa37a4b3, None), state
+ *     else:
+ *         return __pyx_unpickle_P1Sampler1D, (type(self), 0xa37a4b3, state)             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_P1Sampler1D__set_state(self, __pyx_state)
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_pyx_unpickle_P1Sampler1D); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_171418803);
+    __Pyx_GIVEREF(__pyx_int_171418803);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_171418803);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_v_state);
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_3);
+    __pyx_t_1 = 0;
+    __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+  }
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.P1Sampler1D.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_state);
+  __Pyx_XDECREF(__pyx_v__dict);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_P1Sampler1D, (type(self), 0xa37a4b3, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_P1Sampler1D__set_state(self, __pyx_state)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D_4__setstate_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler1D *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D_4__setstate_cython__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler1D *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":17
+ *         return __pyx_unpickle_P1Sampler1D, (type(self), 0xa37a4b3, state)
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_P1Sampler1D__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
+ */
+  if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 17, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_2yt_9utilities_3lib_16element_mappings___pyx_unpickle_P1Sampler1D__set_state(__pyx_v_self, ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_P1Sampler1D, (type(self), 0xa37a4b3, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_P1Sampler1D__set_state(self, __pyx_state)
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.P1Sampler1D.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":163
+ *     '''
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         super(P1Sampler2D, self).__init__()
+ *         self.num_mapped_coords = 3
+ */
+
+/* Python wrapper */
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
+    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
+  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D___init__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler2D *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler2D *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "yt/utilities/lib/element_mappings.pyx":164
+ * 
+ *     def __init__(self):
+ *         super(P1Sampler2D, self).__init__()             # <<<<<<<<<<<<<<
+ *         self.num_mapped_coords = 3
+ * 
+ */
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 164, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_P1Sampler2D));
+  __Pyx_GIVEREF(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_P1Sampler2D));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_P1Sampler2D));
+  __Pyx_INCREF(((PyObject *)__pyx_v_self));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self));
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 164, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 164, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 164, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":165
+ *     def __init__(self):
+ *         super(P1Sampler2D, self).__init__()
+ *         self.num_mapped_coords = 3             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_v_self->__pyx_base.num_mapped_coords = 3;
+
+  /* "yt/utilities/lib/element_mappings.pyx":163
+ *     '''
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         super(P1Sampler2D, self).__init__()
+ *         self.num_mapped_coords = 3
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.P1Sampler2D.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":171
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef void map_real_to_unit(self, double* mapped_x,             # <<<<<<<<<<<<<<
+ *                                double* vertices, double* physical_x) nogil:
+ * 
+ */
+
+static void __pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D_map_real_to_unit(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler2D *__pyx_v_self, double *__pyx_v_mapped_x, double *__pyx_v_vertices, double *__pyx_v_physical_x) {
+  double __pyx_v_col0[3];
+  double __pyx_v_col1[3];
+  double __pyx_v_col2[3];
+  double __pyx_v_det;
+
+  /* "yt/utilities/lib/element_mappings.pyx":178
+ *         cdef double[3] col2
+ * 
+ *         col0[0] = vertices[0]             # <<<<<<<<<<<<<<
+ *         col0[1] = vertices[1]
+ *         col0[2] = 1.0
+ */
+  (__pyx_v_col0[0]) = (__pyx_v_vertices[0]);
+
+  /* "yt/utilities/lib/element_mappings.pyx":179
+ * 
+ *         col0[0] = vertices[0]
+ *         col0[1] = vertices[1]             # <<<<<<<<<<<<<<
+ *         col0[2] = 1.0
+ * 
+ */
+  (__pyx_v_col0[1]) = (__pyx_v_vertices[1]);
+
+  /* "yt/utilities/lib/element_mappings.pyx":180
+ *         col0[0] = vertices[0]
+ *         col0[1] = vertices[1]
+ *         col0[2] = 1.0             # <<<<<<<<<<<<<<
+ * 
+ *         col1[0] = vertices[2]
+ */
+  (__pyx_v_col0[2]) = 1.0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":182
+ *         col0[2] = 1.0
+ * 
+ *         col1[0] = vertices[2]             # <<<<<<<<<<<<<<
+ *         col1[1] = vertices[3]
+ *         col1[2] = 1.0
+ */
+  (__pyx_v_col1[0]) = (__pyx_v_vertices[2]);
+
+  /* "yt/utilities/lib/element_mappings.pyx":183
+ * 
+ *         col1[0] = vertices[2]
+ *         col1[1] = vertices[3]             # <<<<<<<<<<<<<<
+ *         col1[2] = 1.0
+ * 
+ */
+  (__pyx_v_col1[1]) = (__pyx_v_vertices[3]);
+
+  /* "yt/utilities/lib/element_mappings.pyx":184
+ *         col1[0] = vertices[2]
+ *         col1[1] = vertices[3]
+ *         col1[2] = 1.0             # <<<<<<<<<<<<<<
+ * 
+ *         col2[0] = vertices[4]
+ */
+  (__pyx_v_col1[2]) = 1.0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":186
+ *         col1[2] = 1.0
+ * 
+ *         col2[0] = vertices[4]             # <<<<<<<<<<<<<<
+ *         col2[1] = vertices[5]
+ *         col2[2] = 1.0
+ */
+  (__pyx_v_col2[0]) = (__pyx_v_vertices[4]);
+
+  /* "yt/utilities/lib/element_mappings.pyx":187
+ * 
+ *         col2[0] = vertices[4]
+ *         col2[1] = vertices[5]             # <<<<<<<<<<<<<<
+ *         col2[2] = 1.0
+ * 
+ */
+  (__pyx_v_col2[1]) = (__pyx_v_vertices[5]);
+
+  /* "yt/utilities/lib/element_mappings.pyx":188
+ *         col2[0] = vertices[4]
+ *         col2[1] = vertices[5]
+ *         col2[2] = 1.0             # <<<<<<<<<<<<<<
+ * 
+ *         det = determinant_3x3(col0, col1, col2)
+ */
+  (__pyx_v_col2[2]) = 1.0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":190
+ *         col2[2] = 1.0
+ * 
+ *         det = determinant_3x3(col0, col1, col2)             # <<<<<<<<<<<<<<
+ * 
+ *         mapped_x[0] = ((vertices[3] - vertices[5])*physical_x[0] + \
+ */
+  __pyx_v_det = __pyx_f_2yt_9utilities_3lib_16element_mappings_determinant_3x3(__pyx_v_col0, __pyx_v_col1, __pyx_v_col2);
+
+  /* "yt/utilities/lib/element_mappings.pyx":192
+ *         det = determinant_3x3(col0, col1, col2)
+ * 
+ *         mapped_x[0] = ((vertices[3] - vertices[5])*physical_x[0] + \             # <<<<<<<<<<<<<<
+ *                        (vertices[4] - vertices[2])*physical_x[1] + \
+ *                        (vertices[2]*vertices[5] - vertices[4]*vertices[3])) / det
+ */
+  (__pyx_v_mapped_x[0]) = ((((((__pyx_v_vertices[3]) - (__pyx_v_vertices[5])) * (__pyx_v_physical_x[0])) + (((__pyx_v_vertices[4]) - (__pyx_v_vertices[2])) * (__pyx_v_physical_x[1]))) + (((__pyx_v_vertices[2]) * (__pyx_v_vertices[5])) - ((__pyx_v_vertices[4]) * (__pyx_v_vertices[3])))) / __pyx_v_det);
+
+  /* "yt/utilities/lib/element_mappings.pyx":196
+ *                        (vertices[2]*vertices[5] - vertices[4]*vertices[3])) / det
+ * 
+ *         mapped_x[1] = ((vertices[5] - vertices[1])*physical_x[0] + \             # <<<<<<<<<<<<<<
+ *                        (vertices[0] - vertices[4])*physical_x[1] + \
+ *                        (vertices[4]*vertices[1] - vertices[0]*vertices[5])) / det
+ */
+  (__pyx_v_mapped_x[1]) = ((((((__pyx_v_vertices[5]) - (__pyx_v_vertices[1])) * (__pyx_v_physical_x[0])) + (((__pyx_v_vertices[0]) - (__pyx_v_vertices[4])) * (__pyx_v_physical_x[1]))) + (((__pyx_v_vertices[4]) * (__pyx_v_vertices[1])) - ((__pyx_v_vertices[0]) * (__pyx_v_vertices[5])))) / __pyx_v_det);
+
+  /* "yt/utilities/lib/element_mappings.pyx":200
+ *                        (vertices[4]*vertices[1] - vertices[0]*vertices[5])) / det
+ * 
+ *         mapped_x[2] = 1.0 - mapped_x[1] - mapped_x[0]             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  (__pyx_v_mapped_x[2]) = ((1.0 - (__pyx_v_mapped_x[1])) - (__pyx_v_mapped_x[0]));
+
+  /* "yt/utilities/lib/element_mappings.pyx":171
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef void map_real_to_unit(self, double* mapped_x,             # <<<<<<<<<<<<<<
+ *                                double* vertices, double* physical_x) nogil:
+ * 
+ */
+
+  /* function exit code */
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":206
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef double sample_at_unit_point(self,             # <<<<<<<<<<<<<<
+ *                                      double* coord,
+ *                                      double* vals) nogil:
+ */
+
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D_sample_at_unit_point(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler2D *__pyx_v_self, double *__pyx_v_coord, double *__pyx_v_vals) {
+  double __pyx_r;
+
+  /* "yt/utilities/lib/element_mappings.pyx":209
+ *                                      double* coord,
+ *                                      double* vals) nogil:
+ *         return vals[0]*coord[0] + vals[1]*coord[1] + vals[2]*coord[2]             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_r = ((((__pyx_v_vals[0]) * (__pyx_v_coord[0])) + ((__pyx_v_vals[1]) * (__pyx_v_coord[1]))) + ((__pyx_v_vals[2]) * (__pyx_v_coord[2])));
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":206
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef double sample_at_unit_point(self,             # <<<<<<<<<<<<<<
+ *                                      double* coord,
+ *                                      double* vals) nogil:
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":214
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         # for triangles, we check whether all mapped_coords are
+ *         # between 0 and 1, to within the inclusion tolerance
+ */
+
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D_check_inside(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler2D *__pyx_v_self, double *__pyx_v_mapped_coord) {
+  int __pyx_v_i;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+
+  /* "yt/utilities/lib/element_mappings.pyx":218
+ *         # between 0 and 1, to within the inclusion tolerance
+ *         cdef int i
+ *         for i in range(3):             # <<<<<<<<<<<<<<
+ *             if (mapped_coord[i] < -self.inclusion_tol or
+ *                 mapped_coord[i] - 1.0 > self.inclusion_tol):
+ */
+  for (__pyx_t_1 = 0; __pyx_t_1 < 3; __pyx_t_1+=1) {
+    __pyx_v_i = __pyx_t_1;
+
+    /* "yt/utilities/lib/element_mappings.pyx":219
+ *         cdef int i
+ *         for i in range(3):
+ *             if (mapped_coord[i] < -self.inclusion_tol or             # <<<<<<<<<<<<<<
+ *                 mapped_coord[i] - 1.0 > self.inclusion_tol):
+ *                 return 0
+ */
+    __pyx_t_3 = (((__pyx_v_mapped_coord[__pyx_v_i]) < (-__pyx_v_self->__pyx_base.inclusion_tol)) != 0);
+    if (!__pyx_t_3) {
+    } else {
+      __pyx_t_2 = __pyx_t_3;
+      goto __pyx_L6_bool_binop_done;
+    }
+
+    /* "yt/utilities/lib/element_mappings.pyx":220
+ *         for i in range(3):
+ *             if (mapped_coord[i] < -self.inclusion_tol or
+ *                 mapped_coord[i] - 1.0 > self.inclusion_tol):             # <<<<<<<<<<<<<<
+ *                 return 0
+ *         return 1
+ */
+    __pyx_t_3 = ((((__pyx_v_mapped_coord[__pyx_v_i]) - 1.0) > __pyx_v_self->__pyx_base.inclusion_tol) != 0);
+    __pyx_t_2 = __pyx_t_3;
+    __pyx_L6_bool_binop_done:;
+
+    /* "yt/utilities/lib/element_mappings.pyx":219
+ *         cdef int i
+ *         for i in range(3):
+ *             if (mapped_coord[i] < -self.inclusion_tol or             # <<<<<<<<<<<<<<
+ *                 mapped_coord[i] - 1.0 > self.inclusion_tol):
+ *                 return 0
+ */
+    if (__pyx_t_2) {
+
+      /* "yt/utilities/lib/element_mappings.pyx":221
+ *             if (mapped_coord[i] < -self.inclusion_tol or
+ *                 mapped_coord[i] - 1.0 > self.inclusion_tol):
+ *                 return 0             # <<<<<<<<<<<<<<
+ *         return 1
+ * 
+ */
+      __pyx_r = 0;
+      goto __pyx_L0;
+
+      /* "yt/utilities/lib/element_mappings.pyx":219
+ *         cdef int i
+ *         for i in range(3):
+ *             if (mapped_coord[i] < -self.inclusion_tol or             # <<<<<<<<<<<<<<
+ *                 mapped_coord[i] - 1.0 > self.inclusion_tol):
+ *                 return 0
+ */
+    }
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":222
+ *                 mapped_coord[i] - 1.0 > self.inclusion_tol):
+ *                 return 0
+ *         return 1             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":214
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         # for triangles, we check whether all mapped_coords are
+ *         # between 0 and 1, to within the inclusion tolerance
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D_2__reduce_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler2D *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D_2__reduce_cython__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler2D *__pyx_v_self) {
+  PyObject *__pyx_v_state = 0;
+  PyObject *__pyx_v__dict = 0;
+  int __pyx_v_use_setstate;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":5
+ *     cdef object _dict
+ *     cdef bint use_setstate
+ *     state = (self.inclusion_tol, self.num_mapped_coords)             # <<<<<<<<<<<<<<
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ */
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->__pyx_base.inclusion_tol); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_self->__pyx_base.num_mapped_coords); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2);
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_v_state = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "(tree fragment)":6
+ *     cdef bint use_setstate
+ *     state = (self.inclusion_tol, self.num_mapped_coords)
+ *     _dict = getattr(self, '__dict__', None)             # <<<<<<<<<<<<<<
+ *     if _dict is not None:
+ *         state += (_dict,)
+ */
+  __pyx_t_3 = __Pyx_GetAttr3(((PyObject *)__pyx_v_self), __pyx_n_s_dict, Py_None); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v__dict = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "(tree fragment)":7
+ *     state = (self.inclusion_tol, self.num_mapped_coords)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+  __pyx_t_4 = (__pyx_v__dict != Py_None);
+  __pyx_t_5 = (__pyx_t_4 != 0);
+  if (__pyx_t_5) {
+
+    /* "(tree fragment)":8
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ *         state += (_dict,)             # <<<<<<<<<<<<<<
+ *         use_setstate = True
+ *     else:
+ */
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_v__dict);
+    __Pyx_GIVEREF(__pyx_v__dict);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v__dict);
+    __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_v_state, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF_SET(__pyx_v_state, ((PyObject*)__pyx_t_2));
+    __pyx_t_2 = 0;
+
+    /* "(tree fragment)":9
+ *     if _dict is not None:
+ *         state += (_dict,)
+ *         use_setstate = True             # <<<<<<<<<<<<<<
+ *     else:
+ *         use_setstate = False
+ */
+    __pyx_v_use_setstate = 1;
+
+    /* "(tree fragment)":7
+ *     state = (self.inclusion_tol, self.num_mapped_coords)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+    goto __pyx_L3;
+  }
+
+  /* "(tree fragment)":11
+ *         use_setstate = True
+ *     else:
+ *         use_setstate = False             # <<<<<<<<<<<<<<
+ *     if use_setstate:
+ *         return __pyx_unpickle_P1Sampler2D, (type(self), 0xa37a4b3, None), state
+ */
+  /*else*/ {
+    __pyx_v_use_setstate = 0;
+  }
+  __pyx_L3:;
+
+  /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = False
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_P1Sampler2D, (type(self), 0xa37a4b3, None), state
+ *     else:
+ */
+  __pyx_t_5 = (__pyx_v_use_setstate != 0);
+  if (__pyx_t_5) {
+
+    /* "(tree fragment)":13
+ *         use_setstate = False
+ *     if use_setstate:
+ *         return __pyx_unpickle_P1Sampler2D, (type(self), 0xa37a4b3, None), state             # <<<<<<<<<<<<<<
+ *     else:
+ *         return __pyx_unpickle_P1Sampler2D, (type(self), 0xa37a4b3, state)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_pyx_unpickle_P1Sampler2D); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_171418803);
+    __Pyx_GIVEREF(__pyx_int_171418803);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_171418803);
+    __Pyx_INCREF(Py_None);
+    __Pyx_GIVEREF(Py_None);
+    PyTuple_SET_ITEM(__pyx_t_3, 2, Py_None);
+    __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_3);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_state);
+    __pyx_t_2 = 0;
+    __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+
+    /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = False
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_P1Sampler2D, (type(self), 0xa37a4b3, None), state
+ *     else:
+ */
+  }
+
+  /* "(tree fragment)":15
+ *         return __pyx_unpickle_P1Sampler2D, (type(self), 0xa37a4b3, None), state
+ *     else:
+ *         return __pyx_unpickle_P1Sampler2D, (type(self), 0xa37a4b3, state)             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_P1Sampler2D__set_state(self, __pyx_state)
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_pyx_unpickle_P1Sampler2D); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_171418803);
+    __Pyx_GIVEREF(__pyx_int_171418803);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_171418803);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_v_state);
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_3);
+    __pyx_t_1 = 0;
+    __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+  }
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.P1Sampler2D.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_state);
+  __Pyx_XDECREF(__pyx_v__dict);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_P1Sampler2D, (type(self), 0xa37a4b3, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_P1Sampler2D__set_state(self, __pyx_state)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D_4__setstate_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler2D *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D_4__setstate_cython__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler2D *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":17
+ *         return __pyx_unpickle_P1Sampler2D, (type(self), 0xa37a4b3, state)
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_P1Sampler2D__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
+ */
+  if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 17, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_2yt_9utilities_3lib_16element_mappings___pyx_unpickle_P1Sampler2D__set_state(__pyx_v_self, ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_P1Sampler2D, (type(self), 0xa37a4b3, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_P1Sampler2D__set_state(self, __pyx_state)
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.P1Sampler2D.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":234
+ * 
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         super(P1Sampler3D, self).__init__()
+ *         self.num_mapped_coords = 4
+ */
+
+/* Python wrapper */
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
+    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
+  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D___init__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "yt/utilities/lib/element_mappings.pyx":235
+ * 
+ *     def __init__(self):
+ *         super(P1Sampler3D, self).__init__()             # <<<<<<<<<<<<<<
+ *         self.num_mapped_coords = 4
+ * 
+ */
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 235, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_P1Sampler3D));
+  __Pyx_GIVEREF(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_P1Sampler3D));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_P1Sampler3D));
+  __Pyx_INCREF(((PyObject *)__pyx_v_self));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self));
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 235, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 235, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 235, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":236
+ *     def __init__(self):
+ *         super(P1Sampler3D, self).__init__()
+ *         self.num_mapped_coords = 4             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_v_self->__pyx_base.num_mapped_coords = 4;
+
+  /* "yt/utilities/lib/element_mappings.pyx":234
+ * 
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         super(P1Sampler3D, self).__init__()
+ *         self.num_mapped_coords = 4
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.P1Sampler3D.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":241
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef void map_real_to_unit(self, double* mapped_x,             # <<<<<<<<<<<<<<
+ *                                double* vertices, double* physical_x) nogil:
+ * 
+ */
+
+static void __pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_map_real_to_unit(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *__pyx_v_self, double *__pyx_v_mapped_x, double *__pyx_v_vertices, double *__pyx_v_physical_x) {
+  int __pyx_v_i;
+  double __pyx_v_d;
+  double __pyx_v_bvec[3];
+  double __pyx_v_col0[3];
+  double __pyx_v_col1[3];
+  double __pyx_v_col2[3];
+  int __pyx_t_1;
+
+  /* "yt/utilities/lib/element_mappings.pyx":253
+ *         # here, we express positions relative to the 4th element,
+ *         # which is selected by vertices[9]
+ *         for i in range(3):             # <<<<<<<<<<<<<<
+ *             bvec[i] = physical_x[i]       - vertices[9 + i]
+ *             col0[i] = vertices[0 + i]     - vertices[9 + i]
+ */
+  for (__pyx_t_1 = 0; __pyx_t_1 < 3; __pyx_t_1+=1) {
+    __pyx_v_i = __pyx_t_1;
+
+    /* "yt/utilities/lib/element_mappings.pyx":254
+ *         # which is selected by vertices[9]
+ *         for i in range(3):
+ *             bvec[i] = physical_x[i]       - vertices[9 + i]             # <<<<<<<<<<<<<<
+ *             col0[i] = vertices[0 + i]     - vertices[9 + i]
+ *             col1[i] = vertices[3 + i]     - vertices[9 + i]
+ */
+    (__pyx_v_bvec[__pyx_v_i]) = ((__pyx_v_physical_x[__pyx_v_i]) - (__pyx_v_vertices[(9 + __pyx_v_i)]));
+
+    /* "yt/utilities/lib/element_mappings.pyx":255
+ *         for i in range(3):
+ *             bvec[i] = physical_x[i]       - vertices[9 + i]
+ *             col0[i] = vertices[0 + i]     - vertices[9 + i]             # <<<<<<<<<<<<<<
+ *             col1[i] = vertices[3 + i]     - vertices[9 + i]
+ *             col2[i] = vertices[6 + i]     - vertices[9 + i]
+ */
+    (__pyx_v_col0[__pyx_v_i]) = ((__pyx_v_vertices[(0 + __pyx_v_i)]) - (__pyx_v_vertices[(9 + __pyx_v_i)]));
+
+    /* "yt/utilities/lib/element_mappings.pyx":256
+ *             bvec[i] = physical_x[i]       - vertices[9 + i]
+ *             col0[i] = vertices[0 + i]     - vertices[9 + i]
+ *             col1[i] = vertices[3 + i]     - vertices[9 + i]             # <<<<<<<<<<<<<<
+ *             col2[i] = vertices[6 + i]     - vertices[9 + i]
+ * 
+ */
+    (__pyx_v_col1[__pyx_v_i]) = ((__pyx_v_vertices[(3 + __pyx_v_i)]) - (__pyx_v_vertices[(9 + __pyx_v_i)]));
+
+    /* "yt/utilities/lib/element_mappings.pyx":257
+ *             col0[i] = vertices[0 + i]     - vertices[9 + i]
+ *             col1[i] = vertices[3 + i]     - vertices[9 + i]
+ *             col2[i] = vertices[6 + i]     - vertices[9 + i]             # <<<<<<<<<<<<<<
+ * 
+ *         d = determinant_3x3(col0, col1, col2)
+ */
+    (__pyx_v_col2[__pyx_v_i]) = ((__pyx_v_vertices[(6 + __pyx_v_i)]) - (__pyx_v_vertices[(9 + __pyx_v_i)]));
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":259
+ *             col2[i] = vertices[6 + i]     - vertices[9 + i]
+ * 
+ *         d = determinant_3x3(col0, col1, col2)             # <<<<<<<<<<<<<<
+ *         mapped_x[0] = determinant_3x3(bvec, col1, col2)/d
+ *         mapped_x[1] = determinant_3x3(col0, bvec, col2)/d
+ */
+  __pyx_v_d = __pyx_f_2yt_9utilities_3lib_16element_mappings_determinant_3x3(__pyx_v_col0, __pyx_v_col1, __pyx_v_col2);
+
+  /* "yt/utilities/lib/element_mappings.pyx":260
+ * 
+ *         d = determinant_3x3(col0, col1, col2)
+ *         mapped_x[0] = determinant_3x3(bvec, col1, col2)/d             # <<<<<<<<<<<<<<
+ *         mapped_x[1] = determinant_3x3(col0, bvec, col2)/d
+ *         mapped_x[2] = determinant_3x3(col0, col1, bvec)/d
+ */
+  (__pyx_v_mapped_x[0]) = (__pyx_f_2yt_9utilities_3lib_16element_mappings_determinant_3x3(__pyx_v_bvec, __pyx_v_col1, __pyx_v_col2) / __pyx_v_d);
+
+  /* "yt/utilities/lib/element_mappings.pyx":261
+ *         d = determinant_3x3(col0, col1, col2)
+ *         mapped_x[0] = determinant_3x3(bvec, col1, col2)/d
+ *         mapped_x[1] = determinant_3x3(col0, bvec, col2)/d             # <<<<<<<<<<<<<<
+ *         mapped_x[2] = determinant_3x3(col0, col1, bvec)/d
+ *         mapped_x[3] = 1.0 - mapped_x[0] - mapped_x[1] - mapped_x[2]
+ */
+  (__pyx_v_mapped_x[1]) = (__pyx_f_2yt_9utilities_3lib_16element_mappings_determinant_3x3(__pyx_v_col0, __pyx_v_bvec, __pyx_v_col2) / __pyx_v_d);
+
+  /* "yt/utilities/lib/element_mappings.pyx":262
+ *         mapped_x[0] = determinant_3x3(bvec, col1, col2)/d
+ *         mapped_x[1] = determinant_3x3(col0, bvec, col2)/d
+ *         mapped_x[2] = determinant_3x3(col0, col1, bvec)/d             # <<<<<<<<<<<<<<
+ *         mapped_x[3] = 1.0 - mapped_x[0] - mapped_x[1] - mapped_x[2]
+ * 
+ */
+  (__pyx_v_mapped_x[2]) = (__pyx_f_2yt_9utilities_3lib_16element_mappings_determinant_3x3(__pyx_v_col0, __pyx_v_col1, __pyx_v_bvec) / __pyx_v_d);
+
+  /* "yt/utilities/lib/element_mappings.pyx":263
+ *         mapped_x[1] = determinant_3x3(col0, bvec, col2)/d
+ *         mapped_x[2] = determinant_3x3(col0, col1, bvec)/d
+ *         mapped_x[3] = 1.0 - mapped_x[0] - mapped_x[1] - mapped_x[2]             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  (__pyx_v_mapped_x[3]) = (((1.0 - (__pyx_v_mapped_x[0])) - (__pyx_v_mapped_x[1])) - (__pyx_v_mapped_x[2]));
+
+  /* "yt/utilities/lib/element_mappings.pyx":241
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef void map_real_to_unit(self, double* mapped_x,             # <<<<<<<<<<<<<<
+ *                                double* vertices, double* physical_x) nogil:
+ * 
+ */
+
+  /* function exit code */
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":268
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef double sample_at_unit_point(self,             # <<<<<<<<<<<<<<
+ *                                      double* coord,
+ *                                      double* vals) nogil:
+ */
+
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_sample_at_unit_point(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *__pyx_v_self, double *__pyx_v_coord, double *__pyx_v_vals) {
+  double __pyx_r;
+
+  /* "yt/utilities/lib/element_mappings.pyx":272
+ *                                      double* vals) nogil:
+ *         return vals[0]*coord[0] + vals[1]*coord[1] + \
+ *             vals[2]*coord[2] + vals[3]*coord[3]             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_r = (((((__pyx_v_vals[0]) * (__pyx_v_coord[0])) + ((__pyx_v_vals[1]) * (__pyx_v_coord[1]))) + ((__pyx_v_vals[2]) * (__pyx_v_coord[2]))) + ((__pyx_v_vals[3]) * (__pyx_v_coord[3])));
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":268
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef double sample_at_unit_point(self,             # <<<<<<<<<<<<<<
+ *                                      double* coord,
+ *                                      double* vals) nogil:
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":277
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         # for tetrahedra, we check whether all mapped coordinates
+ *         # are within 0 and 1, to within the inclusion tolerance
+ */
+
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_check_inside(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *__pyx_v_self, double *__pyx_v_mapped_coord) {
+  int __pyx_v_i;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+
+  /* "yt/utilities/lib/element_mappings.pyx":281
+ *         # are within 0 and 1, to within the inclusion tolerance
+ *         cdef int i
+ *         for i in range(4):             # <<<<<<<<<<<<<<
+ *             if (mapped_coord[i] < -self.inclusion_tol or
+ *                 mapped_coord[i] - 1.0 > self.inclusion_tol):
+ */
+  for (__pyx_t_1 = 0; __pyx_t_1 < 4; __pyx_t_1+=1) {
+    __pyx_v_i = __pyx_t_1;
+
+    /* "yt/utilities/lib/element_mappings.pyx":282
+ *         cdef int i
+ *         for i in range(4):
+ *             if (mapped_coord[i] < -self.inclusion_tol or             # <<<<<<<<<<<<<<
+ *                 mapped_coord[i] - 1.0 > self.inclusion_tol):
+ *                 return 0
+ */
+    __pyx_t_3 = (((__pyx_v_mapped_coord[__pyx_v_i]) < (-__pyx_v_self->__pyx_base.inclusion_tol)) != 0);
+    if (!__pyx_t_3) {
+    } else {
+      __pyx_t_2 = __pyx_t_3;
+      goto __pyx_L6_bool_binop_done;
+    }
+
+    /* "yt/utilities/lib/element_mappings.pyx":283
+ *         for i in range(4):
+ *             if (mapped_coord[i] < -self.inclusion_tol or
+ *                 mapped_coord[i] - 1.0 > self.inclusion_tol):             # <<<<<<<<<<<<<<
+ *                 return 0
+ *         return 1
+ */
+    __pyx_t_3 = ((((__pyx_v_mapped_coord[__pyx_v_i]) - 1.0) > __pyx_v_self->__pyx_base.inclusion_tol) != 0);
+    __pyx_t_2 = __pyx_t_3;
+    __pyx_L6_bool_binop_done:;
+
+    /* "yt/utilities/lib/element_mappings.pyx":282
+ *         cdef int i
+ *         for i in range(4):
+ *             if (mapped_coord[i] < -self.inclusion_tol or             # <<<<<<<<<<<<<<
+ *                 mapped_coord[i] - 1.0 > self.inclusion_tol):
+ *                 return 0
+ */
+    if (__pyx_t_2) {
+
+      /* "yt/utilities/lib/element_mappings.pyx":284
+ *             if (mapped_coord[i] < -self.inclusion_tol or
+ *                 mapped_coord[i] - 1.0 > self.inclusion_tol):
+ *                 return 0             # <<<<<<<<<<<<<<
+ *         return 1
+ * 
+ */
+      __pyx_r = 0;
+      goto __pyx_L0;
+
+      /* "yt/utilities/lib/element_mappings.pyx":282
+ *         cdef int i
+ *         for i in range(4):
+ *             if (mapped_coord[i] < -self.inclusion_tol or             # <<<<<<<<<<<<<<
+ *                 mapped_coord[i] - 1.0 > self.inclusion_tol):
+ *                 return 0
+ */
+    }
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":285
+ *                 mapped_coord[i] - 1.0 > self.inclusion_tol):
+ *                 return 0
+ *         return 1             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":277
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         # for tetrahedra, we check whether all mapped coordinates
+ *         # are within 0 and 1, to within the inclusion tolerance
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":290
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_mesh_lines(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         cdef double u, v, w
+ *         cdef double thresh = 2.0e-2
+ */
+
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_check_mesh_lines(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *__pyx_v_self, double *__pyx_v_mapped_coord) {
+  double __pyx_v_u;
+  double __pyx_v_v;
+  double __pyx_v_w;
+  double __pyx_v_thresh;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "yt/utilities/lib/element_mappings.pyx":292
+ *     cdef int check_mesh_lines(self, double* mapped_coord) nogil:
+ *         cdef double u, v, w
+ *         cdef double thresh = 2.0e-2             # <<<<<<<<<<<<<<
+ *         if mapped_coord[0] == 0:
+ *             u = mapped_coord[1]
+ */
+  __pyx_v_thresh = 2.0e-2;
+
+  /* "yt/utilities/lib/element_mappings.pyx":293
+ *         cdef double u, v, w
+ *         cdef double thresh = 2.0e-2
+ *         if mapped_coord[0] == 0:             # <<<<<<<<<<<<<<
+ *             u = mapped_coord[1]
+ *             v = mapped_coord[2]
+ */
+  __pyx_t_1 = (((__pyx_v_mapped_coord[0]) == 0.0) != 0);
+  if (__pyx_t_1) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":294
+ *         cdef double thresh = 2.0e-2
+ *         if mapped_coord[0] == 0:
+ *             u = mapped_coord[1]             # <<<<<<<<<<<<<<
+ *             v = mapped_coord[2]
+ *             w = mapped_coord[3]
+ */
+    __pyx_v_u = (__pyx_v_mapped_coord[1]);
+
+    /* "yt/utilities/lib/element_mappings.pyx":295
+ *         if mapped_coord[0] == 0:
+ *             u = mapped_coord[1]
+ *             v = mapped_coord[2]             # <<<<<<<<<<<<<<
+ *             w = mapped_coord[3]
+ *         elif mapped_coord[1] == 0:
+ */
+    __pyx_v_v = (__pyx_v_mapped_coord[2]);
+
+    /* "yt/utilities/lib/element_mappings.pyx":296
+ *             u = mapped_coord[1]
+ *             v = mapped_coord[2]
+ *             w = mapped_coord[3]             # <<<<<<<<<<<<<<
+ *         elif mapped_coord[1] == 0:
+ *             u = mapped_coord[2]
+ */
+    __pyx_v_w = (__pyx_v_mapped_coord[3]);
+
+    /* "yt/utilities/lib/element_mappings.pyx":293
+ *         cdef double u, v, w
+ *         cdef double thresh = 2.0e-2
+ *         if mapped_coord[0] == 0:             # <<<<<<<<<<<<<<
+ *             u = mapped_coord[1]
+ *             v = mapped_coord[2]
+ */
+    goto __pyx_L3;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":297
+ *             v = mapped_coord[2]
+ *             w = mapped_coord[3]
+ *         elif mapped_coord[1] == 0:             # <<<<<<<<<<<<<<
+ *             u = mapped_coord[2]
+ *             v = mapped_coord[3]
+ */
+  __pyx_t_1 = (((__pyx_v_mapped_coord[1]) == 0.0) != 0);
+  if (__pyx_t_1) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":298
+ *             w = mapped_coord[3]
+ *         elif mapped_coord[1] == 0:
+ *             u = mapped_coord[2]             # <<<<<<<<<<<<<<
+ *             v = mapped_coord[3]
+ *             w = mapped_coord[0]
+ */
+    __pyx_v_u = (__pyx_v_mapped_coord[2]);
+
+    /* "yt/utilities/lib/element_mappings.pyx":299
+ *         elif mapped_coord[1] == 0:
+ *             u = mapped_coord[2]
+ *             v = mapped_coord[3]             # <<<<<<<<<<<<<<
+ *             w = mapped_coord[0]
+ *         elif mapped_coord[2] == 0:
+ */
+    __pyx_v_v = (__pyx_v_mapped_coord[3]);
+
+    /* "yt/utilities/lib/element_mappings.pyx":300
+ *             u = mapped_coord[2]
+ *             v = mapped_coord[3]
+ *             w = mapped_coord[0]             # <<<<<<<<<<<<<<
+ *         elif mapped_coord[2] == 0:
+ *             u = mapped_coord[1]
+ */
+    __pyx_v_w = (__pyx_v_mapped_coord[0]);
+
+    /* "yt/utilities/lib/element_mappings.pyx":297
+ *             v = mapped_coord[2]
+ *             w = mapped_coord[3]
+ *         elif mapped_coord[1] == 0:             # <<<<<<<<<<<<<<
+ *             u = mapped_coord[2]
+ *             v = mapped_coord[3]
+ */
+    goto __pyx_L3;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":301
+ *             v = mapped_coord[3]
+ *             w = mapped_coord[0]
+ *         elif mapped_coord[2] == 0:             # <<<<<<<<<<<<<<
+ *             u = mapped_coord[1]
+ *             v = mapped_coord[3]
+ */
+  __pyx_t_1 = (((__pyx_v_mapped_coord[2]) == 0.0) != 0);
+  if (__pyx_t_1) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":302
+ *             w = mapped_coord[0]
+ *         elif mapped_coord[2] == 0:
+ *             u = mapped_coord[1]             # <<<<<<<<<<<<<<
+ *             v = mapped_coord[3]
+ *             w = mapped_coord[0]
+ */
+    __pyx_v_u = (__pyx_v_mapped_coord[1]);
+
+    /* "yt/utilities/lib/element_mappings.pyx":303
+ *         elif mapped_coord[2] == 0:
+ *             u = mapped_coord[1]
+ *             v = mapped_coord[3]             # <<<<<<<<<<<<<<
+ *             w = mapped_coord[0]
+ *         else:
+ */
+    __pyx_v_v = (__pyx_v_mapped_coord[3]);
+
+    /* "yt/utilities/lib/element_mappings.pyx":304
+ *             u = mapped_coord[1]
+ *             v = mapped_coord[3]
+ *             w = mapped_coord[0]             # <<<<<<<<<<<<<<
+ *         else:
+ *             u = mapped_coord[1]
+ */
+    __pyx_v_w = (__pyx_v_mapped_coord[0]);
+
+    /* "yt/utilities/lib/element_mappings.pyx":301
+ *             v = mapped_coord[3]
+ *             w = mapped_coord[0]
+ *         elif mapped_coord[2] == 0:             # <<<<<<<<<<<<<<
+ *             u = mapped_coord[1]
+ *             v = mapped_coord[3]
+ */
+    goto __pyx_L3;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":306
+ *             w = mapped_coord[0]
+ *         else:
+ *             u = mapped_coord[1]             # <<<<<<<<<<<<<<
+ *             v = mapped_coord[2]
+ *             w = mapped_coord[0]
+ */
+  /*else*/ {
+    __pyx_v_u = (__pyx_v_mapped_coord[1]);
+
+    /* "yt/utilities/lib/element_mappings.pyx":307
+ *         else:
+ *             u = mapped_coord[1]
+ *             v = mapped_coord[2]             # <<<<<<<<<<<<<<
+ *             w = mapped_coord[0]
+ *         if ((u < thresh) or
+ */
+    __pyx_v_v = (__pyx_v_mapped_coord[2]);
+
+    /* "yt/utilities/lib/element_mappings.pyx":308
+ *             u = mapped_coord[1]
+ *             v = mapped_coord[2]
+ *             w = mapped_coord[0]             # <<<<<<<<<<<<<<
+ *         if ((u < thresh) or
+ *             (v < thresh) or
+ */
+    __pyx_v_w = (__pyx_v_mapped_coord[0]);
+  }
+  __pyx_L3:;
+
+  /* "yt/utilities/lib/element_mappings.pyx":309
+ *             v = mapped_coord[2]
+ *             w = mapped_coord[0]
+ *         if ((u < thresh) or             # <<<<<<<<<<<<<<
+ *             (v < thresh) or
+ *             (w < thresh) or
+ */
+  __pyx_t_2 = ((__pyx_v_u < __pyx_v_thresh) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L5_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":310
+ *             w = mapped_coord[0]
+ *         if ((u < thresh) or
+ *             (v < thresh) or             # <<<<<<<<<<<<<<
+ *             (w < thresh) or
+ *             (fabs(u - 1) < thresh) or
+ */
+  __pyx_t_2 = ((__pyx_v_v < __pyx_v_thresh) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L5_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":311
+ *         if ((u < thresh) or
+ *             (v < thresh) or
+ *             (w < thresh) or             # <<<<<<<<<<<<<<
+ *             (fabs(u - 1) < thresh) or
+ *             (fabs(v - 1) < thresh) or
+ */
+  __pyx_t_2 = ((__pyx_v_w < __pyx_v_thresh) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L5_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":312
+ *             (v < thresh) or
+ *             (w < thresh) or
+ *             (fabs(u - 1) < thresh) or             # <<<<<<<<<<<<<<
+ *             (fabs(v - 1) < thresh) or
+ *             (fabs(w - 1) < thresh)):
+ */
+  __pyx_t_2 = ((fabs((__pyx_v_u - 1.0)) < __pyx_v_thresh) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L5_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":313
+ *             (w < thresh) or
+ *             (fabs(u - 1) < thresh) or
+ *             (fabs(v - 1) < thresh) or             # <<<<<<<<<<<<<<
+ *             (fabs(w - 1) < thresh)):
+ *             return 1
+ */
+  __pyx_t_2 = ((fabs((__pyx_v_v - 1.0)) < __pyx_v_thresh) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L5_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":314
+ *             (fabs(u - 1) < thresh) or
+ *             (fabs(v - 1) < thresh) or
+ *             (fabs(w - 1) < thresh)):             # <<<<<<<<<<<<<<
+ *             return 1
+ *         return -1
+ */
+  __pyx_t_2 = ((fabs((__pyx_v_w - 1.0)) < __pyx_v_thresh) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L5_bool_binop_done:;
+
+  /* "yt/utilities/lib/element_mappings.pyx":309
+ *             v = mapped_coord[2]
+ *             w = mapped_coord[0]
+ *         if ((u < thresh) or             # <<<<<<<<<<<<<<
+ *             (v < thresh) or
+ *             (w < thresh) or
+ */
+  if (__pyx_t_1) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":315
+ *             (fabs(v - 1) < thresh) or
+ *             (fabs(w - 1) < thresh)):
+ *             return 1             # <<<<<<<<<<<<<<
+ *         return -1
+ * 
+ */
+    __pyx_r = 1;
+    goto __pyx_L0;
+
+    /* "yt/utilities/lib/element_mappings.pyx":309
+ *             v = mapped_coord[2]
+ *             w = mapped_coord[0]
+ *         if ((u < thresh) or             # <<<<<<<<<<<<<<
+ *             (v < thresh) or
+ *             (w < thresh) or
+ */
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":316
+ *             (fabs(w - 1) < thresh)):
+ *             return 1
+ *         return -1             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = -1;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":290
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_mesh_lines(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         cdef double u, v, w
+ *         cdef double thresh = 2.0e-2
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_2__reduce_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_2__reduce_cython__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *__pyx_v_self) {
+  PyObject *__pyx_v_state = 0;
+  PyObject *__pyx_v__dict = 0;
+  int __pyx_v_use_setstate;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":5
+ *     cdef object _dict
+ *     cdef bint use_setstate
+ *     state = (self.inclusion_tol, self.num_mapped_coords)             # <<<<<<<<<<<<<<
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ */
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->__pyx_base.inclusion_tol); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_self->__pyx_base.num_mapped_coords); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2);
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_v_state = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "(tree fragment)":6
+ *     cdef bint use_setstate
+ *     state = (self.inclusion_tol, self.num_mapped_coords)
+ *     _dict = getattr(self, '__dict__', None)             # <<<<<<<<<<<<<<
+ *     if _dict is not None:
+ *         state += (_dict,)
+ */
+  __pyx_t_3 = __Pyx_GetAttr3(((PyObject *)__pyx_v_self), __pyx_n_s_dict, Py_None); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v__dict = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "(tree fragment)":7
+ *     state = (self.inclusion_tol, self.num_mapped_coords)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+  __pyx_t_4 = (__pyx_v__dict != Py_None);
+  __pyx_t_5 = (__pyx_t_4 != 0);
+  if (__pyx_t_5) {
+
+    /* "(tree fragment)":8
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ *         state += (_dict,)             # <<<<<<<<<<<<<<
+ *         use_setstate = True
+ *     else:
+ */
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_v__dict);
+    __Pyx_GIVEREF(__pyx_v__dict);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v__dict);
+    __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_v_state, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF_SET(__pyx_v_state, ((PyObject*)__pyx_t_2));
+    __pyx_t_2 = 0;
+
+    /* "(tree fragment)":9
+ *     if _dict is not None:
+ *         state += (_dict,)
+ *         use_setstate = True             # <<<<<<<<<<<<<<
+ *     else:
+ *         use_setstate = False
+ */
+    __pyx_v_use_setstate = 1;
+
+    /* "(tree fragment)":7
+ *     state = (self.inclusion_tol, self.num_mapped_coords)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+    goto __pyx_L3;
+  }
+
+  /* "(tree fragment)":11
+ *         use_setstate = True
+ *     else:
+ *         use_setstate = False             # <<<<<<<<<<<<<<
+ *     if use_setstate:
+ *         return __pyx_unpickle_P1Sampler3D, (type(self), 0xa37a4b3, None), state
+ */
+  /*else*/ {
+    __pyx_v_use_setstate = 0;
+  }
+  __pyx_L3:;
+
+  /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = False
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_P1Sampler3D, (type(self), 0xa37a4b3, None), state
+ *     else:
+ */
+  __pyx_t_5 = (__pyx_v_use_setstate != 0);
+  if (__pyx_t_5) {
+
+    /* "(tree fragment)":13
+ *         use_setstate = False
+ *     if use_setstate:
+ *         return __pyx_unpickle_P1Sampler3D, (type(self), 0xa37a4b3, None), state             # <<<<<<<<<<<<<<
+ *     else:
+ *         return __pyx_unpickle_P1Sampler3D, (type(self), 0xa37a4b3, state)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_pyx_unpickle_P1Sampler3D); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_171418803);
+    __Pyx_GIVEREF(__pyx_int_171418803);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_171418803);
+    __Pyx_INCREF(Py_None);
+    __Pyx_GIVEREF(Py_None);
+    PyTuple_SET_ITEM(__pyx_t_3, 2, Py_None);
+    __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_3);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_state);
+    __pyx_t_2 = 0;
+    __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+
+    /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = False
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_P1Sampler3D, (type(self), 0xa37a4b3, None), state
+ *     else:
+ */
+  }
+
+  /* "(tree fragment)":15
+ *         return __pyx_unpickle_P1Sampler3D, (type(self), 0xa37a4b3, None), state
+ *     else:
+ *         return __pyx_unpickle_P1Sampler3D, (type(self), 0xa37a4b3, state)             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_P1Sampler3D__set_state(self, __pyx_state)
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_pyx_unpickle_P1Sampler3D); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_171418803);
+    __Pyx_GIVEREF(__pyx_int_171418803);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_171418803);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_v_state);
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_3);
+    __pyx_t_1 = 0;
+    __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+  }
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.P1Sampler3D.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_state);
+  __Pyx_XDECREF(__pyx_v__dict);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_P1Sampler3D, (type(self), 0xa37a4b3, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_P1Sampler3D__set_state(self, __pyx_state)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_4__setstate_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_4__setstate_cython__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":17
+ *         return __pyx_unpickle_P1Sampler3D, (type(self), 0xa37a4b3, state)
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_P1Sampler3D__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
+ */
+  if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 17, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_2yt_9utilities_3lib_16element_mappings___pyx_unpickle_P1Sampler3D__set_state(__pyx_v_self, ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_P1Sampler3D, (type(self), 0xa37a4b3, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_P1Sampler3D__set_state(self, __pyx_state)
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.P1Sampler3D.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":332
+ *     '''
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         super(NonlinearSolveSampler3D, self).__init__()
+ *         self.tolerance = 1.0e-9
+ */
+
+/* Python wrapper */
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler3D_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler3D_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
+    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
+  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler3D___init__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler3D___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "yt/utilities/lib/element_mappings.pyx":333
+ * 
+ *     def __init__(self):
+ *         super(NonlinearSolveSampler3D, self).__init__()             # <<<<<<<<<<<<<<
+ *         self.tolerance = 1.0e-9
+ *         self.max_iter = 10
+ */
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 333, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D));
+  __Pyx_GIVEREF(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D));
+  __Pyx_INCREF(((PyObject *)__pyx_v_self));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self));
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 333, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 333, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 333, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":334
+ *     def __init__(self):
+ *         super(NonlinearSolveSampler3D, self).__init__()
+ *         self.tolerance = 1.0e-9             # <<<<<<<<<<<<<<
+ *         self.max_iter = 10
+ * 
+ */
+  __pyx_v_self->tolerance = 1.0e-9;
+
+  /* "yt/utilities/lib/element_mappings.pyx":335
+ *         super(NonlinearSolveSampler3D, self).__init__()
+ *         self.tolerance = 1.0e-9
+ *         self.max_iter = 10             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_v_self->max_iter = 10;
+
+  /* "yt/utilities/lib/element_mappings.pyx":332
+ *     '''
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         super(NonlinearSolveSampler3D, self).__init__()
+ *         self.tolerance = 1.0e-9
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.NonlinearSolveSampler3D.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":340
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef void map_real_to_unit(self,             # <<<<<<<<<<<<<<
+ *                                double* mapped_x,
+ *                                double* vertices,
+ */
+
+static void __pyx_f_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler3D_map_real_to_unit(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D *__pyx_v_self, double *__pyx_v_mapped_x, double *__pyx_v_vertices, double *__pyx_v_physical_x) {
+  int __pyx_v_i;
+  double __pyx_v_d;
+  double __pyx_v_lam;
+  double __pyx_v_f[3];
+  double __pyx_v_r[3];
+  double __pyx_v_s[3];
+  double __pyx_v_t[3];
+  double __pyx_v_x[3];
+  double __pyx_v_xk[3];
+  double __pyx_v_s_n[3];
+  int __pyx_v_iterations;
+  double __pyx_v_err_c;
+  double __pyx_v_err_plus;
+  double __pyx_v_alpha;
+  double __pyx_v_min_lam;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+
+  /* "yt/utilities/lib/element_mappings.pyx":375
+ *         cdef double[3] t
+ *         cdef double[3] x, xk, s_n
+ *         cdef int iterations = 0             # <<<<<<<<<<<<<<
+ *         cdef double err_c, err_plus
+ *         cdef double alpha = 1e-4
+ */
+  __pyx_v_iterations = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":377
+ *         cdef int iterations = 0
+ *         cdef double err_c, err_plus
+ *         cdef double alpha = 1e-4             # <<<<<<<<<<<<<<
+ *         cdef double min_lam = 1e-6
+ * 
+ */
+  __pyx_v_alpha = 1e-4;
+
+  /* "yt/utilities/lib/element_mappings.pyx":378
+ *         cdef double err_c, err_plus
+ *         cdef double alpha = 1e-4
+ *         cdef double min_lam = 1e-6             # <<<<<<<<<<<<<<
+ * 
+ *         # initial guess
+ */
+  __pyx_v_min_lam = 1e-6;
+
+  /* "yt/utilities/lib/element_mappings.pyx":381
+ * 
+ *         # initial guess
+ *         for i in range(3):             # <<<<<<<<<<<<<<
+ *             x[i] = 0.0
+ * 
+ */
+  for (__pyx_t_1 = 0; __pyx_t_1 < 3; __pyx_t_1+=1) {
+    __pyx_v_i = __pyx_t_1;
+
+    /* "yt/utilities/lib/element_mappings.pyx":382
+ *         # initial guess
+ *         for i in range(3):
+ *             x[i] = 0.0             # <<<<<<<<<<<<<<
+ * 
+ *         # initial error norm
+ */
+    (__pyx_v_x[__pyx_v_i]) = 0.0;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":385
+ * 
+ *         # initial error norm
+ *         self.func(f, x, vertices, physical_x)             # <<<<<<<<<<<<<<
+ *         err_c = maxnorm(f, 3)
+ * 
+ */
+  __pyx_v_self->func(__pyx_v_f, __pyx_v_x, __pyx_v_vertices, __pyx_v_physical_x);
+
+  /* "yt/utilities/lib/element_mappings.pyx":386
+ *         # initial error norm
+ *         self.func(f, x, vertices, physical_x)
+ *         err_c = maxnorm(f, 3)             # <<<<<<<<<<<<<<
+ * 
+ *         # begin Newton iteration
+ */
+  __pyx_v_err_c = __pyx_f_2yt_9utilities_3lib_16element_mappings_maxnorm(__pyx_v_f, 3);
+
+  /* "yt/utilities/lib/element_mappings.pyx":389
+ * 
+ *         # begin Newton iteration
+ *         while (err_c > self.tolerance and iterations < self.max_iter):             # <<<<<<<<<<<<<<
+ *             self.jac(r, s, t, x, vertices, physical_x)
+ *             d = determinant_3x3(r, s, t)
+ */
+  while (1) {
+    __pyx_t_3 = ((__pyx_v_err_c > __pyx_v_self->tolerance) != 0);
+    if (__pyx_t_3) {
+    } else {
+      __pyx_t_2 = __pyx_t_3;
+      goto __pyx_L7_bool_binop_done;
+    }
+    __pyx_t_3 = ((__pyx_v_iterations < __pyx_v_self->max_iter) != 0);
+    __pyx_t_2 = __pyx_t_3;
+    __pyx_L7_bool_binop_done:;
+    if (!__pyx_t_2) break;
+
+    /* "yt/utilities/lib/element_mappings.pyx":390
+ *         # begin Newton iteration
+ *         while (err_c > self.tolerance and iterations < self.max_iter):
+ *             self.jac(r, s, t, x, vertices, physical_x)             # <<<<<<<<<<<<<<
+ *             d = determinant_3x3(r, s, t)
+ * 
+ */
+    __pyx_v_self->jac(__pyx_v_r, __pyx_v_s, __pyx_v_t, __pyx_v_x, __pyx_v_vertices, __pyx_v_physical_x);
+
+    /* "yt/utilities/lib/element_mappings.pyx":391
+ *         while (err_c > self.tolerance and iterations < self.max_iter):
+ *             self.jac(r, s, t, x, vertices, physical_x)
+ *             d = determinant_3x3(r, s, t)             # <<<<<<<<<<<<<<
+ * 
+ *             s_n[0] = - (determinant_3x3(f, s, t)/d)
+ */
+    __pyx_v_d = __pyx_f_2yt_9utilities_3lib_16element_mappings_determinant_3x3(__pyx_v_r, __pyx_v_s, __pyx_v_t);
+
+    /* "yt/utilities/lib/element_mappings.pyx":393
+ *             d = determinant_3x3(r, s, t)
+ * 
+ *             s_n[0] = - (determinant_3x3(f, s, t)/d)             # <<<<<<<<<<<<<<
+ *             s_n[1] = - (determinant_3x3(r, f, t)/d)
+ *             s_n[2] = - (determinant_3x3(r, s, f)/d)
+ */
+    (__pyx_v_s_n[0]) = (-(__pyx_f_2yt_9utilities_3lib_16element_mappings_determinant_3x3(__pyx_v_f, __pyx_v_s, __pyx_v_t) / __pyx_v_d));
+
+    /* "yt/utilities/lib/element_mappings.pyx":394
+ * 
+ *             s_n[0] = - (determinant_3x3(f, s, t)/d)
+ *             s_n[1] = - (determinant_3x3(r, f, t)/d)             # <<<<<<<<<<<<<<
+ *             s_n[2] = - (determinant_3x3(r, s, f)/d)
+ *             xk[0] = x[0] + s_n[0]
+ */
+    (__pyx_v_s_n[1]) = (-(__pyx_f_2yt_9utilities_3lib_16element_mappings_determinant_3x3(__pyx_v_r, __pyx_v_f, __pyx_v_t) / __pyx_v_d));
+
+    /* "yt/utilities/lib/element_mappings.pyx":395
+ *             s_n[0] = - (determinant_3x3(f, s, t)/d)
+ *             s_n[1] = - (determinant_3x3(r, f, t)/d)
+ *             s_n[2] = - (determinant_3x3(r, s, f)/d)             # <<<<<<<<<<<<<<
+ *             xk[0] = x[0] + s_n[0]
+ *             xk[1] = x[1] + s_n[1]
+ */
+    (__pyx_v_s_n[2]) = (-(__pyx_f_2yt_9utilities_3lib_16element_mappings_determinant_3x3(__pyx_v_r, __pyx_v_s, __pyx_v_f) / __pyx_v_d));
+
+    /* "yt/utilities/lib/element_mappings.pyx":396
+ *             s_n[1] = - (determinant_3x3(r, f, t)/d)
+ *             s_n[2] = - (determinant_3x3(r, s, f)/d)
+ *             xk[0] = x[0] + s_n[0]             # <<<<<<<<<<<<<<
+ *             xk[1] = x[1] + s_n[1]
+ *             xk[2] = x[2] + s_n[2]
+ */
+    (__pyx_v_xk[0]) = ((__pyx_v_x[0]) + (__pyx_v_s_n[0]));
+
+    /* "yt/utilities/lib/element_mappings.pyx":397
+ *             s_n[2] = - (determinant_3x3(r, s, f)/d)
+ *             xk[0] = x[0] + s_n[0]
+ *             xk[1] = x[1] + s_n[1]             # <<<<<<<<<<<<<<
+ *             xk[2] = x[2] + s_n[2]
+ *             self.func(f, xk, vertices, physical_x)
+ */
+    (__pyx_v_xk[1]) = ((__pyx_v_x[1]) + (__pyx_v_s_n[1]));
+
+    /* "yt/utilities/lib/element_mappings.pyx":398
+ *             xk[0] = x[0] + s_n[0]
+ *             xk[1] = x[1] + s_n[1]
+ *             xk[2] = x[2] + s_n[2]             # <<<<<<<<<<<<<<
+ *             self.func(f, xk, vertices, physical_x)
+ *             err_plus = maxnorm(f, 3)
+ */
+    (__pyx_v_xk[2]) = ((__pyx_v_x[2]) + (__pyx_v_s_n[2]));
+
+    /* "yt/utilities/lib/element_mappings.pyx":399
+ *             xk[1] = x[1] + s_n[1]
+ *             xk[2] = x[2] + s_n[2]
+ *             self.func(f, xk, vertices, physical_x)             # <<<<<<<<<<<<<<
+ *             err_plus = maxnorm(f, 3)
+ * 
+ */
+    __pyx_v_self->func(__pyx_v_f, __pyx_v_xk, __pyx_v_vertices, __pyx_v_physical_x);
+
+    /* "yt/utilities/lib/element_mappings.pyx":400
+ *             xk[2] = x[2] + s_n[2]
+ *             self.func(f, xk, vertices, physical_x)
+ *             err_plus = maxnorm(f, 3)             # <<<<<<<<<<<<<<
+ * 
+ *             lam = 1
+ */
+    __pyx_v_err_plus = __pyx_f_2yt_9utilities_3lib_16element_mappings_maxnorm(__pyx_v_f, 3);
+
+    /* "yt/utilities/lib/element_mappings.pyx":402
+ *             err_plus = maxnorm(f, 3)
+ * 
+ *             lam = 1             # <<<<<<<<<<<<<<
+ *             while err_plus > err_c * (1. - alpha * lam) and lam > min_lam:
+ *                 lam = lam / 2
+ */
+    __pyx_v_lam = 1.0;
+
+    /* "yt/utilities/lib/element_mappings.pyx":403
+ * 
+ *             lam = 1
+ *             while err_plus > err_c * (1. - alpha * lam) and lam > min_lam:             # <<<<<<<<<<<<<<
+ *                 lam = lam / 2
+ *                 xk[0] = x[0] + lam * s_n[0]
+ */
+    while (1) {
+      __pyx_t_3 = ((__pyx_v_err_plus > (__pyx_v_err_c * (1. - (__pyx_v_alpha * __pyx_v_lam)))) != 0);
+      if (__pyx_t_3) {
+      } else {
+        __pyx_t_2 = __pyx_t_3;
+        goto __pyx_L11_bool_binop_done;
+      }
+      __pyx_t_3 = ((__pyx_v_lam > __pyx_v_min_lam) != 0);
+      __pyx_t_2 = __pyx_t_3;
+      __pyx_L11_bool_binop_done:;
+      if (!__pyx_t_2) break;
+
+      /* "yt/utilities/lib/element_mappings.pyx":404
+ *             lam = 1
+ *             while err_plus > err_c * (1. - alpha * lam) and lam > min_lam:
+ *                 lam = lam / 2             # <<<<<<<<<<<<<<
+ *                 xk[0] = x[0] + lam * s_n[0]
+ *                 xk[1] = x[1] + lam * s_n[1]
+ */
+      __pyx_v_lam = (__pyx_v_lam / 2.0);
+
+      /* "yt/utilities/lib/element_mappings.pyx":405
+ *             while err_plus > err_c * (1. - alpha * lam) and lam > min_lam:
+ *                 lam = lam / 2
+ *                 xk[0] = x[0] + lam * s_n[0]             # <<<<<<<<<<<<<<
+ *                 xk[1] = x[1] + lam * s_n[1]
+ *                 xk[2] = x[2] + lam * s_n[2]
+ */
+      (__pyx_v_xk[0]) = ((__pyx_v_x[0]) + (__pyx_v_lam * (__pyx_v_s_n[0])));
+
+      /* "yt/utilities/lib/element_mappings.pyx":406
+ *                 lam = lam / 2
+ *                 xk[0] = x[0] + lam * s_n[0]
+ *                 xk[1] = x[1] + lam * s_n[1]             # <<<<<<<<<<<<<<
+ *                 xk[2] = x[2] + lam * s_n[2]
+ *                 self.func(f, xk, vertices, physical_x)
+ */
+      (__pyx_v_xk[1]) = ((__pyx_v_x[1]) + (__pyx_v_lam * (__pyx_v_s_n[1])));
+
+      /* "yt/utilities/lib/element_mappings.pyx":407
+ *                 xk[0] = x[0] + lam * s_n[0]
+ *                 xk[1] = x[1] + lam * s_n[1]
+ *                 xk[2] = x[2] + lam * s_n[2]             # <<<<<<<<<<<<<<
+ *                 self.func(f, xk, vertices, physical_x)
+ *                 err_plus = maxnorm(f, 3)
+ */
+      (__pyx_v_xk[2]) = ((__pyx_v_x[2]) + (__pyx_v_lam * (__pyx_v_s_n[2])));
+
+      /* "yt/utilities/lib/element_mappings.pyx":408
+ *                 xk[1] = x[1] + lam * s_n[1]
+ *                 xk[2] = x[2] + lam * s_n[2]
+ *                 self.func(f, xk, vertices, physical_x)             # <<<<<<<<<<<<<<
+ *                 err_plus = maxnorm(f, 3)
+ * 
+ */
+      __pyx_v_self->func(__pyx_v_f, __pyx_v_xk, __pyx_v_vertices, __pyx_v_physical_x);
+
+      /* "yt/utilities/lib/element_mappings.pyx":409
+ *                 xk[2] = x[2] + lam * s_n[2]
+ *                 self.func(f, xk, vertices, physical_x)
+ *                 err_plus = maxnorm(f, 3)             # <<<<<<<<<<<<<<
+ * 
+ *             x[0] = xk[0]
+ */
+      __pyx_v_err_plus = __pyx_f_2yt_9utilities_3lib_16element_mappings_maxnorm(__pyx_v_f, 3);
+    }
+
+    /* "yt/utilities/lib/element_mappings.pyx":411
+ *                 err_plus = maxnorm(f, 3)
+ * 
+ *             x[0] = xk[0]             # <<<<<<<<<<<<<<
+ *             x[1] = xk[1]
+ *             x[2] = xk[2]
+ */
+    (__pyx_v_x[0]) = (__pyx_v_xk[0]);
+
+    /* "yt/utilities/lib/element_mappings.pyx":412
+ * 
+ *             x[0] = xk[0]
+ *             x[1] = xk[1]             # <<<<<<<<<<<<<<
+ *             x[2] = xk[2]
+ *             err_c = err_plus
+ */
+    (__pyx_v_x[1]) = (__pyx_v_xk[1]);
+
+    /* "yt/utilities/lib/element_mappings.pyx":413
+ *             x[0] = xk[0]
+ *             x[1] = xk[1]
+ *             x[2] = xk[2]             # <<<<<<<<<<<<<<
+ *             err_c = err_plus
+ *             iterations += 1
+ */
+    (__pyx_v_x[2]) = (__pyx_v_xk[2]);
+
+    /* "yt/utilities/lib/element_mappings.pyx":414
+ *             x[1] = xk[1]
+ *             x[2] = xk[2]
+ *             err_c = err_plus             # <<<<<<<<<<<<<<
+ *             iterations += 1
+ * 
+ */
+    __pyx_v_err_c = __pyx_v_err_plus;
+
+    /* "yt/utilities/lib/element_mappings.pyx":415
+ *             x[2] = xk[2]
+ *             err_c = err_plus
+ *             iterations += 1             # <<<<<<<<<<<<<<
+ * 
+ *         if (err_c > self.tolerance):
+ */
+    __pyx_v_iterations = (__pyx_v_iterations + 1);
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":417
+ *             iterations += 1
+ * 
+ *         if (err_c > self.tolerance):             # <<<<<<<<<<<<<<
+ *             # we did not converge, set bogus value
+ *             for i in range(3):
+ */
+  __pyx_t_2 = ((__pyx_v_err_c > __pyx_v_self->tolerance) != 0);
+  if (__pyx_t_2) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":419
+ *         if (err_c > self.tolerance):
+ *             # we did not converge, set bogus value
+ *             for i in range(3):             # <<<<<<<<<<<<<<
+ *                 mapped_x[i] = -99.0
+ *         else:
+ */
+    for (__pyx_t_1 = 0; __pyx_t_1 < 3; __pyx_t_1+=1) {
+      __pyx_v_i = __pyx_t_1;
+
+      /* "yt/utilities/lib/element_mappings.pyx":420
+ *             # we did not converge, set bogus value
+ *             for i in range(3):
+ *                 mapped_x[i] = -99.0             # <<<<<<<<<<<<<<
+ *         else:
+ *             for i in range(3):
+ */
+      (__pyx_v_mapped_x[__pyx_v_i]) = -99.0;
+    }
+
+    /* "yt/utilities/lib/element_mappings.pyx":417
+ *             iterations += 1
+ * 
+ *         if (err_c > self.tolerance):             # <<<<<<<<<<<<<<
+ *             # we did not converge, set bogus value
+ *             for i in range(3):
+ */
+    goto __pyx_L13;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":422
+ *                 mapped_x[i] = -99.0
+ *         else:
+ *             for i in range(3):             # <<<<<<<<<<<<<<
+ *                 mapped_x[i] = x[i]
+ * 
+ */
+  /*else*/ {
+    for (__pyx_t_1 = 0; __pyx_t_1 < 3; __pyx_t_1+=1) {
+      __pyx_v_i = __pyx_t_1;
+
+      /* "yt/utilities/lib/element_mappings.pyx":423
+ *         else:
+ *             for i in range(3):
+ *                 mapped_x[i] = x[i]             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+      (__pyx_v_mapped_x[__pyx_v_i]) = (__pyx_v_x[__pyx_v_i]);
+    }
+  }
+  __pyx_L13:;
+
+  /* "yt/utilities/lib/element_mappings.pyx":340
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef void map_real_to_unit(self,             # <<<<<<<<<<<<<<
+ *                                double* mapped_x,
+ *                                double* vertices,
+ */
+
+  /* function exit code */
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler3D_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler3D_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler3D_2__reduce_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler3D_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.NonlinearSolveSampler3D.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler3D_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler3D_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler3D_4__setstate_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler3D_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.NonlinearSolveSampler3D.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":434
+ *     '''
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         super(Q1Sampler3D, self).__init__()
+ *         self.num_mapped_coords = 3
+ */
+
+/* Python wrapper */
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
+    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
+  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D___init__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "yt/utilities/lib/element_mappings.pyx":435
+ * 
+ *     def __init__(self):
+ *         super(Q1Sampler3D, self).__init__()             # <<<<<<<<<<<<<<
+ *         self.num_mapped_coords = 3
+ *         self.dim = 3
+ */
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 435, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D));
+  __Pyx_GIVEREF(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D));
+  __Pyx_INCREF(((PyObject *)__pyx_v_self));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self));
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 435, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 435, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 435, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":436
+ *     def __init__(self):
+ *         super(Q1Sampler3D, self).__init__()
+ *         self.num_mapped_coords = 3             # <<<<<<<<<<<<<<
+ *         self.dim = 3
+ *         self.func = Q1Function3D
+ */
+  __pyx_v_self->__pyx_base.__pyx_base.num_mapped_coords = 3;
+
+  /* "yt/utilities/lib/element_mappings.pyx":437
+ *         super(Q1Sampler3D, self).__init__()
+ *         self.num_mapped_coords = 3
+ *         self.dim = 3             # <<<<<<<<<<<<<<
+ *         self.func = Q1Function3D
+ *         self.jac = Q1Jacobian3D
+ */
+  __pyx_v_self->__pyx_base.dim = 3;
+
+  /* "yt/utilities/lib/element_mappings.pyx":438
+ *         self.num_mapped_coords = 3
+ *         self.dim = 3
+ *         self.func = Q1Function3D             # <<<<<<<<<<<<<<
+ *         self.jac = Q1Jacobian3D
+ * 
+ */
+  __pyx_v_self->__pyx_base.func = __pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_Q1Function3D;
+
+  /* "yt/utilities/lib/element_mappings.pyx":439
+ *         self.dim = 3
+ *         self.func = Q1Function3D
+ *         self.jac = Q1Jacobian3D             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_v_self->__pyx_base.jac = __pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_Q1Jacobian3D;
+
+  /* "yt/utilities/lib/element_mappings.pyx":434
+ *     '''
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         super(Q1Sampler3D, self).__init__()
+ *         self.num_mapped_coords = 3
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.Q1Sampler3D.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":444
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef double sample_at_unit_point(self, double* coord, double* vals) nogil:             # <<<<<<<<<<<<<<
+ *         cdef double F, rm, rp, sm, sp, tm, tp
+ * 
+ */
+
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D_sample_at_unit_point(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D *__pyx_v_self, double *__pyx_v_coord, double *__pyx_v_vals) {
+  double __pyx_v_F;
+  double __pyx_v_rm;
+  double __pyx_v_rp;
+  double __pyx_v_sm;
+  double __pyx_v_sp;
+  double __pyx_v_tm;
+  double __pyx_v_tp;
+  double __pyx_r;
+
+  /* "yt/utilities/lib/element_mappings.pyx":447
+ *         cdef double F, rm, rp, sm, sp, tm, tp
+ * 
+ *         rm = 1.0 - coord[0]             # <<<<<<<<<<<<<<
+ *         rp = 1.0 + coord[0]
+ *         sm = 1.0 - coord[1]
+ */
+  __pyx_v_rm = (1.0 - (__pyx_v_coord[0]));
+
+  /* "yt/utilities/lib/element_mappings.pyx":448
+ * 
+ *         rm = 1.0 - coord[0]
+ *         rp = 1.0 + coord[0]             # <<<<<<<<<<<<<<
+ *         sm = 1.0 - coord[1]
+ *         sp = 1.0 + coord[1]
+ */
+  __pyx_v_rp = (1.0 + (__pyx_v_coord[0]));
+
+  /* "yt/utilities/lib/element_mappings.pyx":449
+ *         rm = 1.0 - coord[0]
+ *         rp = 1.0 + coord[0]
+ *         sm = 1.0 - coord[1]             # <<<<<<<<<<<<<<
+ *         sp = 1.0 + coord[1]
+ *         tm = 1.0 - coord[2]
+ */
+  __pyx_v_sm = (1.0 - (__pyx_v_coord[1]));
+
+  /* "yt/utilities/lib/element_mappings.pyx":450
+ *         rp = 1.0 + coord[0]
+ *         sm = 1.0 - coord[1]
+ *         sp = 1.0 + coord[1]             # <<<<<<<<<<<<<<
+ *         tm = 1.0 - coord[2]
+ *         tp = 1.0 + coord[2]
+ */
+  __pyx_v_sp = (1.0 + (__pyx_v_coord[1]));
+
+  /* "yt/utilities/lib/element_mappings.pyx":451
+ *         sm = 1.0 - coord[1]
+ *         sp = 1.0 + coord[1]
+ *         tm = 1.0 - coord[2]             # <<<<<<<<<<<<<<
+ *         tp = 1.0 + coord[2]
+ * 
+ */
+  __pyx_v_tm = (1.0 - (__pyx_v_coord[2]));
+
+  /* "yt/utilities/lib/element_mappings.pyx":452
+ *         sp = 1.0 + coord[1]
+ *         tm = 1.0 - coord[2]
+ *         tp = 1.0 + coord[2]             # <<<<<<<<<<<<<<
+ * 
+ *         F = vals[0]*rm*sm*tm + vals[1]*rp*sm*tm + vals[2]*rp*sp*tm + vals[3]*rm*sp*tm + \
+ */
+  __pyx_v_tp = (1.0 + (__pyx_v_coord[2]));
+
+  /* "yt/utilities/lib/element_mappings.pyx":455
+ * 
+ *         F = vals[0]*rm*sm*tm + vals[1]*rp*sm*tm + vals[2]*rp*sp*tm + vals[3]*rm*sp*tm + \
+ *             vals[4]*rm*sm*tp + vals[5]*rp*sm*tp + vals[6]*rp*sp*tp + vals[7]*rm*sp*tp             # <<<<<<<<<<<<<<
+ *         return 0.125*F
+ * 
+ */
+  __pyx_v_F = (((((((((((__pyx_v_vals[0]) * __pyx_v_rm) * __pyx_v_sm) * __pyx_v_tm) + ((((__pyx_v_vals[1]) * __pyx_v_rp) * __pyx_v_sm) * __pyx_v_tm)) + ((((__pyx_v_vals[2]) * __pyx_v_rp) * __pyx_v_sp) * __pyx_v_tm)) + ((((__pyx_v_vals[3]) * __pyx_v_rm) * __pyx_v_sp) * __pyx_v_tm)) + ((((__pyx_v_vals[4]) * __pyx_v_rm) * __pyx_v_sm) * __pyx_v_tp)) + ((((__pyx_v_vals[5]) * __pyx_v_rp) * __pyx_v_sm) * __pyx_v_tp)) + ((((__pyx_v_vals[6]) * __pyx_v_rp) * __pyx_v_sp) * __pyx_v_tp)) + ((((__pyx_v_vals[7]) * __pyx_v_rm) * __pyx_v_sp) * __pyx_v_tp));
+
+  /* "yt/utilities/lib/element_mappings.pyx":456
+ *         F = vals[0]*rm*sm*tm + vals[1]*rp*sm*tm + vals[2]*rp*sp*tm + vals[3]*rm*sp*tm + \
+ *             vals[4]*rm*sm*tp + vals[5]*rp*sm*tp + vals[6]*rp*sp*tp + vals[7]*rm*sp*tp
+ *         return 0.125*F             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_r = (0.125 * __pyx_v_F);
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":444
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef double sample_at_unit_point(self, double* coord, double* vals) nogil:             # <<<<<<<<<<<<<<
+ *         cdef double F, rm, rp, sm, sp, tm, tp
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":461
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         # for hexes, the mapped coordinates all go from -1 to 1
+ *         # if we are inside the element.
+ */
+
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D_check_inside(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D *__pyx_v_self, double *__pyx_v_mapped_coord) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "yt/utilities/lib/element_mappings.pyx":464
+ *         # for hexes, the mapped coordinates all go from -1 to 1
+ *         # if we are inside the element.
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol or             # <<<<<<<<<<<<<<
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol or
+ *             fabs(mapped_coord[2]) - 1.0 > self.inclusion_tol):
+ */
+  __pyx_t_2 = (((fabs((__pyx_v_mapped_coord[0])) - 1.0) > __pyx_v_self->__pyx_base.__pyx_base.inclusion_tol) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":465
+ *         # if we are inside the element.
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol or
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol or             # <<<<<<<<<<<<<<
+ *             fabs(mapped_coord[2]) - 1.0 > self.inclusion_tol):
+ *             return 0
+ */
+  __pyx_t_2 = (((fabs((__pyx_v_mapped_coord[1])) - 1.0) > __pyx_v_self->__pyx_base.__pyx_base.inclusion_tol) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":466
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol or
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol or
+ *             fabs(mapped_coord[2]) - 1.0 > self.inclusion_tol):             # <<<<<<<<<<<<<<
+ *             return 0
+ *         return 1
+ */
+  __pyx_t_2 = (((fabs((__pyx_v_mapped_coord[2])) - 1.0) > __pyx_v_self->__pyx_base.__pyx_base.inclusion_tol) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+
+  /* "yt/utilities/lib/element_mappings.pyx":464
+ *         # for hexes, the mapped coordinates all go from -1 to 1
+ *         # if we are inside the element.
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol or             # <<<<<<<<<<<<<<
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol or
+ *             fabs(mapped_coord[2]) - 1.0 > self.inclusion_tol):
+ */
+  if (__pyx_t_1) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":467
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol or
+ *             fabs(mapped_coord[2]) - 1.0 > self.inclusion_tol):
+ *             return 0             # <<<<<<<<<<<<<<
+ *         return 1
+ * 
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "yt/utilities/lib/element_mappings.pyx":464
+ *         # for hexes, the mapped coordinates all go from -1 to 1
+ *         # if we are inside the element.
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol or             # <<<<<<<<<<<<<<
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol or
+ *             fabs(mapped_coord[2]) - 1.0 > self.inclusion_tol):
+ */
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":468
+ *             fabs(mapped_coord[2]) - 1.0 > self.inclusion_tol):
+ *             return 0
+ *         return 1             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":461
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         # for hexes, the mapped coordinates all go from -1 to 1
+ *         # if we are inside the element.
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":473
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_mesh_lines(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         if (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and
+ *             fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1):
+ */
+
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D_check_mesh_lines(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D *__pyx_v_self, double *__pyx_v_mapped_coord) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "yt/utilities/lib/element_mappings.pyx":474
+ *     @cython.cdivision(True)
+ *     cdef int check_mesh_lines(self, double* mapped_coord) nogil:
+ *         if (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and             # <<<<<<<<<<<<<<
+ *             fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1):
+ *             return 1
+ */
+  __pyx_t_2 = ((fabs((fabs((__pyx_v_mapped_coord[0])) - 1.0)) < 1e-1) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":475
+ *     cdef int check_mesh_lines(self, double* mapped_coord) nogil:
+ *         if (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and
+ *             fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1):             # <<<<<<<<<<<<<<
+ *             return 1
+ *         elif (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and
+ */
+  __pyx_t_2 = ((fabs((fabs((__pyx_v_mapped_coord[1])) - 1.0)) < 1e-1) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+
+  /* "yt/utilities/lib/element_mappings.pyx":474
+ *     @cython.cdivision(True)
+ *     cdef int check_mesh_lines(self, double* mapped_coord) nogil:
+ *         if (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and             # <<<<<<<<<<<<<<
+ *             fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1):
+ *             return 1
+ */
+  if (__pyx_t_1) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":476
+ *         if (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and
+ *             fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1):
+ *             return 1             # <<<<<<<<<<<<<<
+ *         elif (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ */
+    __pyx_r = 1;
+    goto __pyx_L0;
+
+    /* "yt/utilities/lib/element_mappings.pyx":474
+ *     @cython.cdivision(True)
+ *     cdef int check_mesh_lines(self, double* mapped_coord) nogil:
+ *         if (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and             # <<<<<<<<<<<<<<
+ *             fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1):
+ *             return 1
+ */
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":477
+ *             fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1):
+ *             return 1
+ *         elif (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and             # <<<<<<<<<<<<<<
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ *             return 1
+ */
+  __pyx_t_2 = ((fabs((fabs((__pyx_v_mapped_coord[0])) - 1.0)) < 1e-1) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L6_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":478
+ *             return 1
+ *         elif (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):             # <<<<<<<<<<<<<<
+ *             return 1
+ *         elif (fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1 and
+ */
+  __pyx_t_2 = ((fabs((fabs((__pyx_v_mapped_coord[2])) - 1.0)) < 1e-1) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L6_bool_binop_done:;
+
+  /* "yt/utilities/lib/element_mappings.pyx":477
+ *             fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1):
+ *             return 1
+ *         elif (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and             # <<<<<<<<<<<<<<
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ *             return 1
+ */
+  if (__pyx_t_1) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":479
+ *         elif (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ *             return 1             # <<<<<<<<<<<<<<
+ *         elif (fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1 and
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ */
+    __pyx_r = 1;
+    goto __pyx_L0;
+
+    /* "yt/utilities/lib/element_mappings.pyx":477
+ *             fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1):
+ *             return 1
+ *         elif (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and             # <<<<<<<<<<<<<<
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ *             return 1
+ */
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":480
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ *             return 1
+ *         elif (fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1 and             # <<<<<<<<<<<<<<
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ *             return 1
+ */
+  __pyx_t_2 = ((fabs((fabs((__pyx_v_mapped_coord[1])) - 1.0)) < 1e-1) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L8_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":481
+ *             return 1
+ *         elif (fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1 and
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):             # <<<<<<<<<<<<<<
+ *             return 1
+ *         else:
+ */
+  __pyx_t_2 = ((fabs((fabs((__pyx_v_mapped_coord[2])) - 1.0)) < 1e-1) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L8_bool_binop_done:;
+
+  /* "yt/utilities/lib/element_mappings.pyx":480
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ *             return 1
+ *         elif (fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1 and             # <<<<<<<<<<<<<<
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ *             return 1
+ */
+  if (__pyx_t_1) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":482
+ *         elif (fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1 and
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ *             return 1             # <<<<<<<<<<<<<<
+ *         else:
+ *             return -1
+ */
+    __pyx_r = 1;
+    goto __pyx_L0;
+
+    /* "yt/utilities/lib/element_mappings.pyx":480
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ *             return 1
+ *         elif (fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1 and             # <<<<<<<<<<<<<<
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ *             return 1
+ */
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":484
+ *             return 1
+ *         else:
+ *             return -1             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  /*else*/ {
+    __pyx_r = -1;
+    goto __pyx_L0;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":473
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_mesh_lines(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         if (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and
+ *             fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1):
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D_2__reduce_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.Q1Sampler3D.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D_4__setstate_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.Q1Sampler3D.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":495
+ *     '''
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         super(S2Sampler3D, self).__init__()
+ *         self.num_mapped_coords = 3
+ */
+
+/* Python wrapper */
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
+    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
+  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D___init__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_S2Sampler3D *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_S2Sampler3D *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "yt/utilities/lib/element_mappings.pyx":496
+ * 
+ *     def __init__(self):
+ *         super(S2Sampler3D, self).__init__()             # <<<<<<<<<<<<<<
+ *         self.num_mapped_coords = 3
+ *         self.dim = 3
+ */
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 496, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_S2Sampler3D));
+  __Pyx_GIVEREF(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_S2Sampler3D));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_S2Sampler3D));
+  __Pyx_INCREF(((PyObject *)__pyx_v_self));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self));
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 496, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 496, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 496, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":497
+ *     def __init__(self):
+ *         super(S2Sampler3D, self).__init__()
+ *         self.num_mapped_coords = 3             # <<<<<<<<<<<<<<
+ *         self.dim = 3
+ *         self.func = S2Function3D
+ */
+  __pyx_v_self->__pyx_base.__pyx_base.num_mapped_coords = 3;
+
+  /* "yt/utilities/lib/element_mappings.pyx":498
+ *         super(S2Sampler3D, self).__init__()
+ *         self.num_mapped_coords = 3
+ *         self.dim = 3             # <<<<<<<<<<<<<<
+ *         self.func = S2Function3D
+ *         self.jac = S2Jacobian3D
+ */
+  __pyx_v_self->__pyx_base.dim = 3;
+
+  /* "yt/utilities/lib/element_mappings.pyx":499
+ *         self.num_mapped_coords = 3
+ *         self.dim = 3
+ *         self.func = S2Function3D             # <<<<<<<<<<<<<<
+ *         self.jac = S2Jacobian3D
+ * 
+ */
+  __pyx_v_self->__pyx_base.func = __pyx_f_2yt_9utilities_3lib_16element_mappings_S2Function3D;
+
+  /* "yt/utilities/lib/element_mappings.pyx":500
+ *         self.dim = 3
+ *         self.func = S2Function3D
+ *         self.jac = S2Jacobian3D             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_v_self->__pyx_base.jac = __pyx_f_2yt_9utilities_3lib_16element_mappings_S2Jacobian3D;
+
+  /* "yt/utilities/lib/element_mappings.pyx":495
+ *     '''
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         super(S2Sampler3D, self).__init__()
+ *         self.num_mapped_coords = 3
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.S2Sampler3D.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":505
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef double sample_at_unit_point(self, double* coord, double* vals) nogil:             # <<<<<<<<<<<<<<
+ *         cdef double F, r, s, t, rm, rp, sm, sp, tm, tp
+ * 
+ */
+
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D_sample_at_unit_point(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_S2Sampler3D *__pyx_v_self, double *__pyx_v_coord, double *__pyx_v_vals) {
+  double __pyx_v_F;
+  double __pyx_v_r;
+  double __pyx_v_s;
+  double __pyx_v_t;
+  double __pyx_v_rm;
+  double __pyx_v_rp;
+  double __pyx_v_sm;
+  double __pyx_v_sp;
+  double __pyx_v_tm;
+  double __pyx_v_tp;
+  double __pyx_r;
+
+  /* "yt/utilities/lib/element_mappings.pyx":508
+ *         cdef double F, r, s, t, rm, rp, sm, sp, tm, tp
+ * 
+ *         r = coord[0]             # <<<<<<<<<<<<<<
+ *         rm = 1.0 - r
+ *         rp = 1.0 + r
+ */
+  __pyx_v_r = (__pyx_v_coord[0]);
+
+  /* "yt/utilities/lib/element_mappings.pyx":509
+ * 
+ *         r = coord[0]
+ *         rm = 1.0 - r             # <<<<<<<<<<<<<<
+ *         rp = 1.0 + r
+ * 
+ */
+  __pyx_v_rm = (1.0 - __pyx_v_r);
+
+  /* "yt/utilities/lib/element_mappings.pyx":510
+ *         r = coord[0]
+ *         rm = 1.0 - r
+ *         rp = 1.0 + r             # <<<<<<<<<<<<<<
+ * 
+ *         s = coord[1]
+ */
+  __pyx_v_rp = (1.0 + __pyx_v_r);
+
+  /* "yt/utilities/lib/element_mappings.pyx":512
+ *         rp = 1.0 + r
+ * 
+ *         s = coord[1]             # <<<<<<<<<<<<<<
+ *         sm = 1.0 - s
+ *         sp = 1.0 + s
+ */
+  __pyx_v_s = (__pyx_v_coord[1]);
+
+  /* "yt/utilities/lib/element_mappings.pyx":513
+ * 
+ *         s = coord[1]
+ *         sm = 1.0 - s             # <<<<<<<<<<<<<<
+ *         sp = 1.0 + s
+ * 
+ */
+  __pyx_v_sm = (1.0 - __pyx_v_s);
+
+  /* "yt/utilities/lib/element_mappings.pyx":514
+ *         s = coord[1]
+ *         sm = 1.0 - s
+ *         sp = 1.0 + s             # <<<<<<<<<<<<<<
+ * 
+ *         t = coord[2]
+ */
+  __pyx_v_sp = (1.0 + __pyx_v_s);
+
+  /* "yt/utilities/lib/element_mappings.pyx":516
+ *         sp = 1.0 + s
+ * 
+ *         t = coord[2]             # <<<<<<<<<<<<<<
+ *         tm = 1.0 - t
+ *         tp = 1.0 + t
+ */
+  __pyx_v_t = (__pyx_v_coord[2]);
+
+  /* "yt/utilities/lib/element_mappings.pyx":517
+ * 
+ *         t = coord[2]
+ *         tm = 1.0 - t             # <<<<<<<<<<<<<<
+ *         tp = 1.0 + t
+ * 
+ */
+  __pyx_v_tm = (1.0 - __pyx_v_t);
+
+  /* "yt/utilities/lib/element_mappings.pyx":518
+ *         t = coord[2]
+ *         tm = 1.0 - t
+ *         tp = 1.0 + t             # <<<<<<<<<<<<<<
+ * 
+ *         F = rm*sm*tm*(-r - s - t - 2.0)*vals[0] \
+ */
+  __pyx_v_tp = (1.0 + __pyx_v_t);
+
+  /* "yt/utilities/lib/element_mappings.pyx":539
+ *           + 2.0*rp*(1.0 - s*s)*tp*vals[17] \
+ *           + 2.0*(1.0 - r*r)*sp*tp*vals[18] \
+ *           + 2.0*rm*(1.0 - s*s)*tp*vals[19]             # <<<<<<<<<<<<<<
+ *         return 0.125*F
+ * 
+ */
+  __pyx_v_F = (((((((((((((((((((((((__pyx_v_rm * __pyx_v_sm) * __pyx_v_tm) * ((((-__pyx_v_r) - __pyx_v_s) - __pyx_v_t) - 2.0)) * (__pyx_v_vals[0])) + ((((__pyx_v_rp * __pyx_v_sm) * __pyx_v_tm) * (((__pyx_v_r - __pyx_v_s) - __pyx_v_t) - 2.0)) * (__pyx_v_vals[1]))) + ((((__pyx_v_rp * __pyx_v_sp) * __pyx_v_tm) * (((__pyx_v_r + __pyx_v_s) - __pyx_v_t) - 2.0)) * (__pyx_v_vals[2]))) + ((((__pyx_v_rm * __pyx_v_sp) * __pyx_v_tm) * ((((-__pyx_v_r) + __pyx_v_s) - __pyx_v_t) - 2.0)) * (__pyx_v_vals[3]))) + ((((__pyx_v_rm * __pyx_v_sm) * __pyx_v_tp) * ((((-__pyx_v_r) - __pyx_v_s) + __pyx_v_t) - 2.0)) * (__pyx_v_vals[4]))) + ((((__pyx_v_rp * __pyx_v_sm) * __pyx_v_tp) * (((__pyx_v_r - __pyx_v_s) + __pyx_v_t) - 2.0)) * (__pyx_v_vals[5]))) + ((((__pyx_v_rp * __pyx_v_sp) * __pyx_v_tp) * (((__pyx_v_r + __pyx_v_s) + __pyx_v_t) - 2.0)) * (__pyx_v_vals[6]))) + ((((__pyx_v_rm * __pyx_v_sp) * __pyx_v_tp) * ((((-__pyx_v_r) + __pyx_v_s) + __pyx_v_t) - 2.0)) * (__pyx_v_vals[7]))) + ((((2.0 * (1.0 - (__pyx_v_r * __pyx_v_r))) * __pyx_v_sm) * __pyx_v_tm) * (__pyx_v_vals[8]))) + ((((2.0 * __pyx_v_rp) * (1.0 - (__pyx_v_s * __pyx_v_s))) * __pyx_v_tm) * (__pyx_v_vals[9]))) + ((((2.0 * (1.0 - (__pyx_v_r * __pyx_v_r))) * __pyx_v_sp) * __pyx_v_tm) * (__pyx_v_vals[10]))) + ((((2.0 * __pyx_v_rm) * (1.0 - (__pyx_v_s * __pyx_v_s))) * __pyx_v_tm) * (__pyx_v_vals[11]))) + ((((2.0 * __pyx_v_rm) * __pyx_v_sm) * (1.0 - (__pyx_v_t * __pyx_v_t))) * (__pyx_v_vals[12]))) + ((((2.0 * __pyx_v_rp) * __pyx_v_sm) * (1.0 - (__pyx_v_t * __pyx_v_t))) * (__pyx_v_vals[13]))) + ((((2.0 * __pyx_v_rp) * __pyx_v_sp) * (1.0 - (__pyx_v_t * __pyx_v_t))) * (__pyx_v_vals[14]))) + ((((2.0 * __pyx_v_rm) * __pyx_v_sp) * (1.0 - (__pyx_v_t * __pyx_v_t))) * (__pyx_v_vals[15]))) + ((((2.0 * (1.0 - (__pyx_v_r * __pyx_v_r))) * __pyx_v_sm) * __pyx_v_tp) * (__pyx_v_vals[16]))) + ((((2.0 * __pyx_v_rp) * (1.0 - (__pyx_v_s * __pyx_v_s))) * __pyx_v_tp) * (__pyx_v_vals[17]))) + ((((2.0 * (1.0 - (__pyx_v_r * __pyx_v_r))) * __pyx_v_sp) * __pyx_v_tp) * (__pyx_v_vals[18]))) + ((((2.0 * __pyx_v_rm) * (1.0 - (__pyx_v_s * __pyx_v_s))) * __pyx_v_tp) * (__pyx_v_vals[19])));
+
+  /* "yt/utilities/lib/element_mappings.pyx":540
+ *           + 2.0*(1.0 - r*r)*sp*tp*vals[18] \
+ *           + 2.0*rm*(1.0 - s*s)*tp*vals[19]
+ *         return 0.125*F             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_r = (0.125 * __pyx_v_F);
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":505
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef double sample_at_unit_point(self, double* coord, double* vals) nogil:             # <<<<<<<<<<<<<<
+ *         cdef double F, r, s, t, rm, rp, sm, sp, tm, tp
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":545
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol or
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol or
+ */
+
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D_check_inside(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_S2Sampler3D *__pyx_v_self, double *__pyx_v_mapped_coord) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "yt/utilities/lib/element_mappings.pyx":546
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol or             # <<<<<<<<<<<<<<
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol or
+ *             fabs(mapped_coord[2]) - 1.0 > self.inclusion_tol):
+ */
+  __pyx_t_2 = (((fabs((__pyx_v_mapped_coord[0])) - 1.0) > __pyx_v_self->__pyx_base.__pyx_base.inclusion_tol) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":547
+ *     cdef int check_inside(self, double* mapped_coord) nogil:
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol or
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol or             # <<<<<<<<<<<<<<
+ *             fabs(mapped_coord[2]) - 1.0 > self.inclusion_tol):
+ *             return 0
+ */
+  __pyx_t_2 = (((fabs((__pyx_v_mapped_coord[1])) - 1.0) > __pyx_v_self->__pyx_base.__pyx_base.inclusion_tol) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":548
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol or
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol or
+ *             fabs(mapped_coord[2]) - 1.0 > self.inclusion_tol):             # <<<<<<<<<<<<<<
+ *             return 0
+ *         return 1
+ */
+  __pyx_t_2 = (((fabs((__pyx_v_mapped_coord[2])) - 1.0) > __pyx_v_self->__pyx_base.__pyx_base.inclusion_tol) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+
+  /* "yt/utilities/lib/element_mappings.pyx":546
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol or             # <<<<<<<<<<<<<<
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol or
+ *             fabs(mapped_coord[2]) - 1.0 > self.inclusion_tol):
+ */
+  if (__pyx_t_1) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":549
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol or
+ *             fabs(mapped_coord[2]) - 1.0 > self.inclusion_tol):
+ *             return 0             # <<<<<<<<<<<<<<
+ *         return 1
+ * 
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "yt/utilities/lib/element_mappings.pyx":546
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol or             # <<<<<<<<<<<<<<
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol or
+ *             fabs(mapped_coord[2]) - 1.0 > self.inclusion_tol):
+ */
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":550
+ *             fabs(mapped_coord[2]) - 1.0 > self.inclusion_tol):
+ *             return 0
+ *         return 1             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":545
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol or
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol or
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":555
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_mesh_lines(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         if (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and
+ *             fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1):
+ */
+
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D_check_mesh_lines(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_S2Sampler3D *__pyx_v_self, double *__pyx_v_mapped_coord) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "yt/utilities/lib/element_mappings.pyx":556
+ *     @cython.cdivision(True)
+ *     cdef int check_mesh_lines(self, double* mapped_coord) nogil:
+ *         if (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and             # <<<<<<<<<<<<<<
+ *             fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1):
+ *             return 1
+ */
+  __pyx_t_2 = ((fabs((fabs((__pyx_v_mapped_coord[0])) - 1.0)) < 1e-1) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":557
+ *     cdef int check_mesh_lines(self, double* mapped_coord) nogil:
+ *         if (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and
+ *             fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1):             # <<<<<<<<<<<<<<
+ *             return 1
+ *         elif (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and
+ */
+  __pyx_t_2 = ((fabs((fabs((__pyx_v_mapped_coord[1])) - 1.0)) < 1e-1) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+
+  /* "yt/utilities/lib/element_mappings.pyx":556
+ *     @cython.cdivision(True)
+ *     cdef int check_mesh_lines(self, double* mapped_coord) nogil:
+ *         if (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and             # <<<<<<<<<<<<<<
+ *             fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1):
+ *             return 1
+ */
+  if (__pyx_t_1) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":558
+ *         if (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and
+ *             fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1):
+ *             return 1             # <<<<<<<<<<<<<<
+ *         elif (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ */
+    __pyx_r = 1;
+    goto __pyx_L0;
+
+    /* "yt/utilities/lib/element_mappings.pyx":556
+ *     @cython.cdivision(True)
+ *     cdef int check_mesh_lines(self, double* mapped_coord) nogil:
+ *         if (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and             # <<<<<<<<<<<<<<
+ *             fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1):
+ *             return 1
+ */
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":559
+ *             fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1):
+ *             return 1
+ *         elif (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and             # <<<<<<<<<<<<<<
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ *             return 1
+ */
+  __pyx_t_2 = ((fabs((fabs((__pyx_v_mapped_coord[0])) - 1.0)) < 1e-1) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L6_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":560
+ *             return 1
+ *         elif (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):             # <<<<<<<<<<<<<<
+ *             return 1
+ *         elif (fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1 and
+ */
+  __pyx_t_2 = ((fabs((fabs((__pyx_v_mapped_coord[2])) - 1.0)) < 1e-1) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L6_bool_binop_done:;
+
+  /* "yt/utilities/lib/element_mappings.pyx":559
+ *             fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1):
+ *             return 1
+ *         elif (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and             # <<<<<<<<<<<<<<
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ *             return 1
+ */
+  if (__pyx_t_1) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":561
+ *         elif (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ *             return 1             # <<<<<<<<<<<<<<
+ *         elif (fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1 and
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ */
+    __pyx_r = 1;
+    goto __pyx_L0;
+
+    /* "yt/utilities/lib/element_mappings.pyx":559
+ *             fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1):
+ *             return 1
+ *         elif (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and             # <<<<<<<<<<<<<<
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ *             return 1
+ */
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":562
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ *             return 1
+ *         elif (fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1 and             # <<<<<<<<<<<<<<
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ *             return 1
+ */
+  __pyx_t_2 = ((fabs((fabs((__pyx_v_mapped_coord[1])) - 1.0)) < 1e-1) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L8_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":563
+ *             return 1
+ *         elif (fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1 and
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):             # <<<<<<<<<<<<<<
+ *             return 1
+ *         else:
+ */
+  __pyx_t_2 = ((fabs((fabs((__pyx_v_mapped_coord[2])) - 1.0)) < 1e-1) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L8_bool_binop_done:;
+
+  /* "yt/utilities/lib/element_mappings.pyx":562
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ *             return 1
+ *         elif (fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1 and             # <<<<<<<<<<<<<<
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ *             return 1
+ */
+  if (__pyx_t_1) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":564
+ *         elif (fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1 and
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ *             return 1             # <<<<<<<<<<<<<<
+ *         else:
+ *             return -1
+ */
+    __pyx_r = 1;
+    goto __pyx_L0;
+
+    /* "yt/utilities/lib/element_mappings.pyx":562
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ *             return 1
+ *         elif (fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1 and             # <<<<<<<<<<<<<<
+ *               fabs(fabs(mapped_coord[2]) - 1.0) < 1e-1):
+ *             return 1
+ */
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":566
+ *             return 1
+ *         else:
+ *             return -1             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  /*else*/ {
+    __pyx_r = -1;
+    goto __pyx_L0;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":555
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_mesh_lines(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         if (fabs(fabs(mapped_coord[0]) - 1.0) < 1e-1 and
+ *             fabs(fabs(mapped_coord[1]) - 1.0) < 1e-1):
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D_2__reduce_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_S2Sampler3D *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_S2Sampler3D *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.S2Sampler3D.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D_4__setstate_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_S2Sampler3D *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_S2Sampler3D *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.S2Sampler3D.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":572
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * cdef inline void S2Function3D(double* fx,             # <<<<<<<<<<<<<<
+ *                               double* x,
+ *                               double* vertices,
+ */
+
+static CYTHON_INLINE void __pyx_f_2yt_9utilities_3lib_16element_mappings_S2Function3D(double *__pyx_v_fx, double *__pyx_v_x, double *__pyx_v_vertices, double *__pyx_v_phys_x) {
+  int __pyx_v_i;
+  double __pyx_v_r;
+  double __pyx_v_s;
+  double __pyx_v_t;
+  double __pyx_v_rm;
+  double __pyx_v_rp;
+  double __pyx_v_sm;
+  double __pyx_v_sp;
+  double __pyx_v_tm;
+  double __pyx_v_tp;
+  int __pyx_t_1;
+
+  /* "yt/utilities/lib/element_mappings.pyx":579
+ *         cdef double r, s, t, rm, rp, sm, sp, tm, tp
+ * 
+ *         r = x[0]             # <<<<<<<<<<<<<<
+ *         rm = 1.0 - r
+ *         rp = 1.0 + r
+ */
+  __pyx_v_r = (__pyx_v_x[0]);
+
+  /* "yt/utilities/lib/element_mappings.pyx":580
+ * 
+ *         r = x[0]
+ *         rm = 1.0 - r             # <<<<<<<<<<<<<<
+ *         rp = 1.0 + r
+ * 
+ */
+  __pyx_v_rm = (1.0 - __pyx_v_r);
+
+  /* "yt/utilities/lib/element_mappings.pyx":581
+ *         r = x[0]
+ *         rm = 1.0 - r
+ *         rp = 1.0 + r             # <<<<<<<<<<<<<<
+ * 
+ *         s = x[1]
+ */
+  __pyx_v_rp = (1.0 + __pyx_v_r);
+
+  /* "yt/utilities/lib/element_mappings.pyx":583
+ *         rp = 1.0 + r
+ * 
+ *         s = x[1]             # <<<<<<<<<<<<<<
+ *         sm = 1.0 - s
+ *         sp = 1.0 + s
+ */
+  __pyx_v_s = (__pyx_v_x[1]);
+
+  /* "yt/utilities/lib/element_mappings.pyx":584
+ * 
+ *         s = x[1]
+ *         sm = 1.0 - s             # <<<<<<<<<<<<<<
+ *         sp = 1.0 + s
+ * 
+ */
+  __pyx_v_sm = (1.0 - __pyx_v_s);
+
+  /* "yt/utilities/lib/element_mappings.pyx":585
+ *         s = x[1]
+ *         sm = 1.0 - s
+ *         sp = 1.0 + s             # <<<<<<<<<<<<<<
+ * 
+ *         t = x[2]
+ */
+  __pyx_v_sp = (1.0 + __pyx_v_s);
+
+  /* "yt/utilities/lib/element_mappings.pyx":587
+ *         sp = 1.0 + s
+ * 
+ *         t = x[2]             # <<<<<<<<<<<<<<
+ *         tm = 1.0 - t
+ *         tp = 1.0 + t
+ */
+  __pyx_v_t = (__pyx_v_x[2]);
+
+  /* "yt/utilities/lib/element_mappings.pyx":588
+ * 
+ *         t = x[2]
+ *         tm = 1.0 - t             # <<<<<<<<<<<<<<
+ *         tp = 1.0 + t
+ * 
+ */
+  __pyx_v_tm = (1.0 - __pyx_v_t);
+
+  /* "yt/utilities/lib/element_mappings.pyx":589
+ *         t = x[2]
+ *         tm = 1.0 - t
+ *         tp = 1.0 + t             # <<<<<<<<<<<<<<
+ * 
+ *         for i in range(3):
+ */
+  __pyx_v_tp = (1.0 + __pyx_v_t);
+
+  /* "yt/utilities/lib/element_mappings.pyx":591
+ *         tp = 1.0 + t
+ * 
+ *         for i in range(3):             # <<<<<<<<<<<<<<
+ *             fx[i] = rm*sm*tm*(-r - s - t - 2.0)*vertices[0 + i]  \
+ *                   + rp*sm*tm*( r - s - t - 2.0)*vertices[3 + i]  \
+ */
+  for (__pyx_t_1 = 0; __pyx_t_1 < 3; __pyx_t_1+=1) {
+    __pyx_v_i = __pyx_t_1;
+
+    /* "yt/utilities/lib/element_mappings.pyx":592
+ * 
+ *         for i in range(3):
+ *             fx[i] = rm*sm*tm*(-r - s - t - 2.0)*vertices[0 + i]  \             # <<<<<<<<<<<<<<
+ *                   + rp*sm*tm*( r - s - t - 2.0)*vertices[3 + i]  \
+ *                   + rp*sp*tm*( r + s - t - 2.0)*vertices[6 + i]  \
+ */
+    (__pyx_v_fx[__pyx_v_i]) = ((((((((((((((((((((((((__pyx_v_rm * __pyx_v_sm) * __pyx_v_tm) * ((((-__pyx_v_r) - __pyx_v_s) - __pyx_v_t) - 2.0)) * (__pyx_v_vertices[(0 + __pyx_v_i)])) + ((((__pyx_v_rp * __pyx_v_sm) * __pyx_v_tm) * (((__pyx_v_r - __pyx_v_s) - __pyx_v_t) - 2.0)) * (__pyx_v_vertices[(3 + __pyx_v_i)]))) + ((((__pyx_v_rp * __pyx_v_sp) * __pyx_v_tm) * (((__pyx_v_r + __pyx_v_s) - __pyx_v_t) - 2.0)) * (__pyx_v_vertices[(6 + __pyx_v_i)]))) + ((((__pyx_v_rm * __pyx_v_sp) * __pyx_v_tm) * ((((-__pyx_v_r) + __pyx_v_s) - __pyx_v_t) - 2.0)) * (__pyx_v_vertices[(9 + __pyx_v_i)]))) + ((((__pyx_v_rm * __pyx_v_sm) * __pyx_v_tp) * ((((-__pyx_v_r) - __pyx_v_s) + __pyx_v_t) - 2.0)) * (__pyx_v_vertices[(12 + __pyx_v_i)]))) + ((((__pyx_v_rp * __pyx_v_sm) * __pyx_v_tp) * (((__pyx_v_r - __pyx_v_s) + __pyx_v_t) - 2.0)) * (__pyx_v_vertices[(15 + __pyx_v_i)]))) + ((((__pyx_v_rp * __pyx_v_sp) * __pyx_v_tp) * (((__pyx_v_r + __pyx_v_s) + __pyx_v_t) - 2.0)) * (__pyx_v_vertices[(18 + __pyx_v_i)]))) + ((((__pyx_v_rm * __pyx_v_sp) * __pyx_v_tp) * ((((-__pyx_v_r) + __pyx_v_s) + __pyx_v_t) - 2.0)) * (__pyx_v_vertices[(21 + __pyx_v_i)]))) + ((((2.0 * (1.0 - (__pyx_v_r * __pyx_v_r))) * __pyx_v_sm) * __pyx_v_tm) * (__pyx_v_vertices[(24 + __pyx_v_i)]))) + ((((2.0 * __pyx_v_rp) * (1.0 - (__pyx_v_s * __pyx_v_s))) * __pyx_v_tm) * (__pyx_v_vertices[(27 + __pyx_v_i)]))) + ((((2.0 * (1.0 - (__pyx_v_r * __pyx_v_r))) * __pyx_v_sp) * __pyx_v_tm) * (__pyx_v_vertices[(30 + __pyx_v_i)]))) + ((((2.0 * __pyx_v_rm) * (1.0 - (__pyx_v_s * __pyx_v_s))) * __pyx_v_tm) * (__pyx_v_vertices[(33 + __pyx_v_i)]))) + ((((2.0 * __pyx_v_rm) * __pyx_v_sm) * (1.0 - (__pyx_v_t * __pyx_v_t))) * (__pyx_v_vertices[(36 + __pyx_v_i)]))) + ((((2.0 * __pyx_v_rp) * __pyx_v_sm) * (1.0 - (__pyx_v_t * __pyx_v_t))) * (__pyx_v_vertices[(39 + __pyx_v_i)]))) + ((((2.0 * __pyx_v_rp) * __pyx_v_sp) * (1.0 - (__pyx_v_t * __pyx_v_t))) * (__pyx_v_vertices[(42 + __pyx_v_i)]))) + ((((2.0 * __pyx_v_rm) * __pyx_v_sp) * (1.0 - (__pyx_v_t * __pyx_v_t))) * (__pyx_v_vertices[(45 + __pyx_v_i)]))) + ((((2.0 * (1.0 - (__pyx_v_r * __pyx_v_r))) * __pyx_v_sm) * __pyx_v_tp) * (__pyx_v_vertices[(48 + __pyx_v_i)]))) + ((((2.0 * __pyx_v_rp) * (1.0 - (__pyx_v_s * __pyx_v_s))) * __pyx_v_tp) * (__pyx_v_vertices[(51 + __pyx_v_i)]))) + ((((2.0 * (1.0 - (__pyx_v_r * __pyx_v_r))) * __pyx_v_sp) * __pyx_v_tp) * (__pyx_v_vertices[(54 + __pyx_v_i)]))) + ((((2.0 * __pyx_v_rm) * (1.0 - (__pyx_v_s * __pyx_v_s))) * __pyx_v_tp) * (__pyx_v_vertices[(57 + __pyx_v_i)]))) - (8.0 * (__pyx_v_phys_x[__pyx_v_i])));
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":572
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * cdef inline void S2Function3D(double* fx,             # <<<<<<<<<<<<<<
+ *                               double* x,
+ *                               double* vertices,
+ */
+
+  /* function exit code */
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":618
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * cdef inline void S2Jacobian3D(double* rcol,             # <<<<<<<<<<<<<<
+ *                               double* scol,
+ *                               double* tcol,
+ */
+
+static CYTHON_INLINE void __pyx_f_2yt_9utilities_3lib_16element_mappings_S2Jacobian3D(double *__pyx_v_rcol, double *__pyx_v_scol, double *__pyx_v_tcol, double *__pyx_v_x, double *__pyx_v_vertices, CYTHON_UNUSED double *__pyx_v_phys_x) {
+  int __pyx_v_i;
+  double __pyx_v_r;
+  double __pyx_v_s;
+  double __pyx_v_t;
+  double __pyx_v_rm;
+  double __pyx_v_rp;
+  double __pyx_v_sm;
+  double __pyx_v_sp;
+  double __pyx_v_tm;
+  double __pyx_v_tp;
+  int __pyx_t_1;
+
+  /* "yt/utilities/lib/element_mappings.pyx":627
+ *         cdef double r, s, t, rm, rp, sm, sp, tm, tp
+ * 
+ *         r = x[0]             # <<<<<<<<<<<<<<
+ *         rm = 1.0 - r
+ *         rp = 1.0 + r
+ */
+  __pyx_v_r = (__pyx_v_x[0]);
+
+  /* "yt/utilities/lib/element_mappings.pyx":628
+ * 
+ *         r = x[0]
+ *         rm = 1.0 - r             # <<<<<<<<<<<<<<
+ *         rp = 1.0 + r
+ * 
+ */
+  __pyx_v_rm = (1.0 - __pyx_v_r);
+
+  /* "yt/utilities/lib/element_mappings.pyx":629
+ *         r = x[0]
+ *         rm = 1.0 - r
+ *         rp = 1.0 + r             # <<<<<<<<<<<<<<
+ * 
+ *         s = x[1]
+ */
+  __pyx_v_rp = (1.0 + __pyx_v_r);
+
+  /* "yt/utilities/lib/element_mappings.pyx":631
+ *         rp = 1.0 + r
+ * 
+ *         s = x[1]             # <<<<<<<<<<<<<<
+ *         sm = 1.0 - s
+ *         sp = 1.0 + s
+ */
+  __pyx_v_s = (__pyx_v_x[1]);
+
+  /* "yt/utilities/lib/element_mappings.pyx":632
+ * 
+ *         s = x[1]
+ *         sm = 1.0 - s             # <<<<<<<<<<<<<<
+ *         sp = 1.0 + s
+ * 
+ */
+  __pyx_v_sm = (1.0 - __pyx_v_s);
+
+  /* "yt/utilities/lib/element_mappings.pyx":633
+ *         s = x[1]
+ *         sm = 1.0 - s
+ *         sp = 1.0 + s             # <<<<<<<<<<<<<<
+ * 
+ *         t = x[2]
+ */
+  __pyx_v_sp = (1.0 + __pyx_v_s);
+
+  /* "yt/utilities/lib/element_mappings.pyx":635
+ *         sp = 1.0 + s
+ * 
+ *         t = x[2]             # <<<<<<<<<<<<<<
+ *         tm = 1.0 - t
+ *         tp = 1.0 + t
+ */
+  __pyx_v_t = (__pyx_v_x[2]);
+
+  /* "yt/utilities/lib/element_mappings.pyx":636
+ * 
+ *         t = x[2]
+ *         tm = 1.0 - t             # <<<<<<<<<<<<<<
+ *         tp = 1.0 + t
+ * 
+ */
+  __pyx_v_tm = (1.0 - __pyx_v_t);
+
+  /* "yt/utilities/lib/element_mappings.pyx":637
+ *         t = x[2]
+ *         tm = 1.0 - t
+ *         tp = 1.0 + t             # <<<<<<<<<<<<<<
+ * 
+ *         for i in range(3):
+ */
+  __pyx_v_tp = (1.0 + __pyx_v_t);
+
+  /* "yt/utilities/lib/element_mappings.pyx":639
+ *         tp = 1.0 + t
+ * 
+ *         for i in range(3):             # <<<<<<<<<<<<<<
+ *             rcol[i] = (sm*tm*(r + s + t + 2.0) - rm*sm*tm)*vertices[0  + i] \
+ *                     + (sm*tm*(r - s - t - 2.0) + rp*sm*tm)*vertices[3  + i] \
+ */
+  for (__pyx_t_1 = 0; __pyx_t_1 < 3; __pyx_t_1+=1) {
+    __pyx_v_i = __pyx_t_1;
+
+    /* "yt/utilities/lib/element_mappings.pyx":640
+ * 
+ *         for i in range(3):
+ *             rcol[i] = (sm*tm*(r + s + t + 2.0) - rm*sm*tm)*vertices[0  + i] \             # <<<<<<<<<<<<<<
+ *                     + (sm*tm*(r - s - t - 2.0) + rp*sm*tm)*vertices[3  + i] \
+ *                     + (sp*tm*(r + s - t - 2.0) + rp*sp*tm)*vertices[6  + i] \
+ */
+    (__pyx_v_rcol[__pyx_v_i]) = (((((((((((((((((((((((__pyx_v_sm * __pyx_v_tm) * (((__pyx_v_r + __pyx_v_s) + __pyx_v_t) + 2.0)) - ((__pyx_v_rm * __pyx_v_sm) * __pyx_v_tm)) * (__pyx_v_vertices[(0 + __pyx_v_i)])) + ((((__pyx_v_sm * __pyx_v_tm) * (((__pyx_v_r - __pyx_v_s) - __pyx_v_t) - 2.0)) + ((__pyx_v_rp * __pyx_v_sm) * __pyx_v_tm)) * (__pyx_v_vertices[(3 + __pyx_v_i)]))) + ((((__pyx_v_sp * __pyx_v_tm) * (((__pyx_v_r + __pyx_v_s) - __pyx_v_t) - 2.0)) + ((__pyx_v_rp * __pyx_v_sp) * __pyx_v_tm)) * (__pyx_v_vertices[(6 + __pyx_v_i)]))) + ((((__pyx_v_sp * __pyx_v_tm) * (((__pyx_v_r - __pyx_v_s) + __pyx_v_t) + 2.0)) - ((__pyx_v_rm * __pyx_v_sp) * __pyx_v_tm)) * (__pyx_v_vertices[(9 + __pyx_v_i)]))) + ((((__pyx_v_sm * __pyx_v_tp) * (((__pyx_v_r + __pyx_v_s) - __pyx_v_t) + 2.0)) - ((__pyx_v_rm * __pyx_v_sm) * __pyx_v_tp)) * (__pyx_v_vertices[(12 + __pyx_v_i)]))) + ((((__pyx_v_sm * __pyx_v_tp) * (((__pyx_v_r - __pyx_v_s) + __pyx_v_t) - 2.0)) + ((__pyx_v_rp * __pyx_v_sm) * __pyx_v_tp)) * (__pyx_v_vertices[(15 + __pyx_v_i)]))) + ((((__pyx_v_sp * __pyx_v_tp) * (((__pyx_v_r + __pyx_v_s) + __pyx_v_t) - 2.0)) + ((__pyx_v_rp * __pyx_v_sp) * __pyx_v_tp)) * (__pyx_v_vertices[(18 + __pyx_v_i)]))) + ((((__pyx_v_sp * __pyx_v_tp) * (((__pyx_v_r - __pyx_v_s) - __pyx_v_t) + 2.0)) - ((__pyx_v_rm * __pyx_v_sp) * __pyx_v_tp)) * (__pyx_v_vertices[(21 + __pyx_v_i)]))) - ((((4.0 * __pyx_v_r) * __pyx_v_sm) * __pyx_v_tm) * (__pyx_v_vertices[(24 + __pyx_v_i)]))) + (((2.0 * (1.0 - (__pyx_v_s * __pyx_v_s))) * __pyx_v_tm) * (__pyx_v_vertices[(27 + __pyx_v_i)]))) - ((((4.0 * __pyx_v_r) * __pyx_v_sp) * __pyx_v_tm) * (__pyx_v_vertices[(30 + __pyx_v_i)]))) - (((2.0 * (1.0 - (__pyx_v_s * __pyx_v_s))) * __pyx_v_tm) * (__pyx_v_vertices[(33 + __pyx_v_i)]))) - (((2.0 * __pyx_v_sm) * (1.0 - (__pyx_v_t * __pyx_v_t))) * (__pyx_v_vertices[(36 + __pyx_v_i)]))) + (((2.0 * __pyx_v_sm) * (1.0 - (__pyx_v_t * __pyx_v_t))) * (__pyx_v_vertices[(39 + __pyx_v_i)]))) + (((2.0 * __pyx_v_sp) * (1.0 - (__pyx_v_t * __pyx_v_t))) * (__pyx_v_vertices[(42 + __pyx_v_i)]))) - (((2.0 * __pyx_v_sp) * (1.0 - (__pyx_v_t * __pyx_v_t))) * (__pyx_v_vertices[(45 + __pyx_v_i)]))) - ((((4.0 * __pyx_v_r) * __pyx_v_sm) * __pyx_v_tp) * (__pyx_v_vertices[(48 + __pyx_v_i)]))) + (((2.0 * (1.0 - (__pyx_v_s * __pyx_v_s))) * __pyx_v_tp) * (__pyx_v_vertices[(51 + __pyx_v_i)]))) - ((((4.0 * __pyx_v_r) * __pyx_v_sp) * __pyx_v_tp) * (__pyx_v_vertices[(54 + __pyx_v_i)]))) - (((2.0 * (1.0 - (__pyx_v_s * __pyx_v_s))) * __pyx_v_tp) * (__pyx_v_vertices[(57 + __pyx_v_i)])));
+
+    /* "yt/utilities/lib/element_mappings.pyx":660
+ *                     - 4.0*r*sp*tp*vertices[54 + i] \
+ *                     - 2.0*(1.0 - s*s)*tp*vertices[57 + i]
+ *             scol[i] = ( rm*tm*(r + s + t + 2.0) - rm*sm*tm)*vertices[0  + i] \             # <<<<<<<<<<<<<<
+ *                     + (-rp*tm*(r - s - t - 2.0) - rp*sm*tm)*vertices[3  + i] \
+ *                     + ( rp*tm*(r + s - t - 2.0) + rp*sp*tm)*vertices[6  + i] \
+ */
+    (__pyx_v_scol[__pyx_v_i]) = (((((((((((((((((((((((__pyx_v_rm * __pyx_v_tm) * (((__pyx_v_r + __pyx_v_s) + __pyx_v_t) + 2.0)) - ((__pyx_v_rm * __pyx_v_sm) * __pyx_v_tm)) * (__pyx_v_vertices[(0 + __pyx_v_i)])) + (((((-__pyx_v_rp) * __pyx_v_tm) * (((__pyx_v_r - __pyx_v_s) - __pyx_v_t) - 2.0)) - ((__pyx_v_rp * __pyx_v_sm) * __pyx_v_tm)) * (__pyx_v_vertices[(3 + __pyx_v_i)]))) + ((((__pyx_v_rp * __pyx_v_tm) * (((__pyx_v_r + __pyx_v_s) - __pyx_v_t) - 2.0)) + ((__pyx_v_rp * __pyx_v_sp) * __pyx_v_tm)) * (__pyx_v_vertices[(6 + __pyx_v_i)]))) + (((((-__pyx_v_rm) * __pyx_v_tm) * (((__pyx_v_r - __pyx_v_s) + __pyx_v_t) + 2.0)) + ((__pyx_v_rm * __pyx_v_sp) * __pyx_v_tm)) * (__pyx_v_vertices[(9 + __pyx_v_i)]))) + ((((__pyx_v_rm * __pyx_v_tp) * (((__pyx_v_r + __pyx_v_s) - __pyx_v_t) + 2.0)) - ((__pyx_v_rm * __pyx_v_sm) * __pyx_v_tp)) * (__pyx_v_vertices[(12 + __pyx_v_i)]))) + (((((-__pyx_v_rp) * __pyx_v_tp) * (((__pyx_v_r - __pyx_v_s) + __pyx_v_t) - 2.0)) - ((__pyx_v_rp * __pyx_v_sm) * __pyx_v_tp)) * (__pyx_v_vertices[(15 + __pyx_v_i)]))) + ((((__pyx_v_rp * __pyx_v_tp) * (((__pyx_v_r + __pyx_v_s) + __pyx_v_t) - 2.0)) + ((__pyx_v_rp * __pyx_v_sp) * __pyx_v_tp)) * (__pyx_v_vertices[(18 + __pyx_v_i)]))) + (((((-__pyx_v_rm) * __pyx_v_tp) * (((__pyx_v_r - __pyx_v_s) - __pyx_v_t) + 2.0)) + ((__pyx_v_rm * __pyx_v_sp) * __pyx_v_tp)) * (__pyx_v_vertices[(21 + __pyx_v_i)]))) - (((2.0 * (1.0 - (__pyx_v_r * __pyx_v_r))) * __pyx_v_tm) * (__pyx_v_vertices[(24 + __pyx_v_i)]))) - ((((4.0 * __pyx_v_rp) * __pyx_v_s) * __pyx_v_tm) * (__pyx_v_vertices[(27 + __pyx_v_i)]))) + (((2.0 * (1.0 - (__pyx_v_r * __pyx_v_r))) * __pyx_v_tm) * (__pyx_v_vertices[(30 + __pyx_v_i)]))) - ((((4.0 * __pyx_v_rm) * __pyx_v_s) * __pyx_v_tm) * (__pyx_v_vertices[(33 + __pyx_v_i)]))) - (((2.0 * __pyx_v_rm) * (1.0 - (__pyx_v_t * __pyx_v_t))) * (__pyx_v_vertices[(36 + __pyx_v_i)]))) - (((2.0 * __pyx_v_rp) * (1.0 - (__pyx_v_t * __pyx_v_t))) * (__pyx_v_vertices[(39 + __pyx_v_i)]))) + (((2.0 * __pyx_v_rp) * (1.0 - (__pyx_v_t * __pyx_v_t))) * (__pyx_v_vertices[(42 + __pyx_v_i)]))) + (((2.0 * __pyx_v_rm) * (1.0 - (__pyx_v_t * __pyx_v_t))) * (__pyx_v_vertices[(45 + __pyx_v_i)]))) - (((2.0 * (1.0 - (__pyx_v_r * __pyx_v_r))) * __pyx_v_tp) * (__pyx_v_vertices[(48 + __pyx_v_i)]))) - ((((4.0 * __pyx_v_rp) * __pyx_v_s) * __pyx_v_tp) * (__pyx_v_vertices[(51 + __pyx_v_i)]))) + (((2.0 * (1.0 - (__pyx_v_r * __pyx_v_r))) * __pyx_v_tp) * (__pyx_v_vertices[(54 + __pyx_v_i)]))) - ((((4.0 * __pyx_v_rm) * __pyx_v_s) * __pyx_v_tp) * (__pyx_v_vertices[(57 + __pyx_v_i)])));
+
+    /* "yt/utilities/lib/element_mappings.pyx":680
+ *                     + 2.0*(1.0 - r*r)*tp*vertices[54 + i] \
+ *                     - 4.0*rm*s*tp*vertices[57 + i]
+ *             tcol[i] = ( rm*sm*(r + s + t + 2.0) - rm*sm*tm)*vertices[0  + i] \             # <<<<<<<<<<<<<<
+ *                     + (-rp*sm*(r - s - t - 2.0) - rp*sm*tm)*vertices[3  + i] \
+ *                     + (-rp*sp*(r + s - t - 2.0) - rp*sp*tm)*vertices[6  + i] \
+ */
+    (__pyx_v_tcol[__pyx_v_i]) = (((((((((((((((((((((((__pyx_v_rm * __pyx_v_sm) * (((__pyx_v_r + __pyx_v_s) + __pyx_v_t) + 2.0)) - ((__pyx_v_rm * __pyx_v_sm) * __pyx_v_tm)) * (__pyx_v_vertices[(0 + __pyx_v_i)])) + (((((-__pyx_v_rp) * __pyx_v_sm) * (((__pyx_v_r - __pyx_v_s) - __pyx_v_t) - 2.0)) - ((__pyx_v_rp * __pyx_v_sm) * __pyx_v_tm)) * (__pyx_v_vertices[(3 + __pyx_v_i)]))) + (((((-__pyx_v_rp) * __pyx_v_sp) * (((__pyx_v_r + __pyx_v_s) - __pyx_v_t) - 2.0)) - ((__pyx_v_rp * __pyx_v_sp) * __pyx_v_tm)) * (__pyx_v_vertices[(6 + __pyx_v_i)]))) + ((((__pyx_v_rm * __pyx_v_sp) * (((__pyx_v_r - __pyx_v_s) + __pyx_v_t) + 2.0)) - ((__pyx_v_rm * __pyx_v_sp) * __pyx_v_tm)) * (__pyx_v_vertices[(9 + __pyx_v_i)]))) + (((((-__pyx_v_rm) * __pyx_v_sm) * (((__pyx_v_r + __pyx_v_s) - __pyx_v_t) + 2.0)) + ((__pyx_v_rm * __pyx_v_sm) * __pyx_v_tp)) * (__pyx_v_vertices[(12 + __pyx_v_i)]))) + ((((__pyx_v_rp * __pyx_v_sm) * (((__pyx_v_r - __pyx_v_s) + __pyx_v_t) - 2.0)) + ((__pyx_v_rp * __pyx_v_sm) * __pyx_v_tp)) * (__pyx_v_vertices[(15 + __pyx_v_i)]))) + ((((__pyx_v_rp * __pyx_v_sp) * (((__pyx_v_r + __pyx_v_s) + __pyx_v_t) - 2.0)) + ((__pyx_v_rp * __pyx_v_sp) * __pyx_v_tp)) * (__pyx_v_vertices[(18 + __pyx_v_i)]))) + (((((-__pyx_v_rm) * __pyx_v_sp) * (((__pyx_v_r - __pyx_v_s) - __pyx_v_t) + 2.0)) + ((__pyx_v_rm * __pyx_v_sp) * __pyx_v_tp)) * (__pyx_v_vertices[(21 + __pyx_v_i)]))) - (((2.0 * (1.0 - (__pyx_v_r * __pyx_v_r))) * __pyx_v_sm) * (__pyx_v_vertices[(24 + __pyx_v_i)]))) - (((2.0 * __pyx_v_rp) * (1.0 - (__pyx_v_s * __pyx_v_s))) * (__pyx_v_vertices[(27 + __pyx_v_i)]))) - (((2.0 * (1.0 - (__pyx_v_r * __pyx_v_r))) * __pyx_v_sp) * (__pyx_v_vertices[(30 + __pyx_v_i)]))) - (((2.0 * __pyx_v_rm) * (1.0 - (__pyx_v_s * __pyx_v_s))) * (__pyx_v_vertices[(33 + __pyx_v_i)]))) - ((((4.0 * __pyx_v_rm) * __pyx_v_sm) * __pyx_v_t) * (__pyx_v_vertices[(36 + __pyx_v_i)]))) - ((((4.0 * __pyx_v_rp) * __pyx_v_sm) * __pyx_v_t) * (__pyx_v_vertices[(39 + __pyx_v_i)]))) - ((((4.0 * __pyx_v_rp) * __pyx_v_sp) * __pyx_v_t) * (__pyx_v_vertices[(42 + __pyx_v_i)]))) - ((((4.0 * __pyx_v_rm) * __pyx_v_sp) * __pyx_v_t) * (__pyx_v_vertices[(45 + __pyx_v_i)]))) + (((2.0 * (1.0 - (__pyx_v_r * __pyx_v_r))) * __pyx_v_sm) * (__pyx_v_vertices[(48 + __pyx_v_i)]))) + (((2.0 * __pyx_v_rp) * (1.0 - (__pyx_v_s * __pyx_v_s))) * (__pyx_v_vertices[(51 + __pyx_v_i)]))) + (((2.0 * (1.0 - (__pyx_v_r * __pyx_v_r))) * __pyx_v_sp) * (__pyx_v_vertices[(54 + __pyx_v_i)]))) + (((2.0 * __pyx_v_rm) * (1.0 - (__pyx_v_s * __pyx_v_s))) * (__pyx_v_vertices[(57 + __pyx_v_i)])));
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":618
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * cdef inline void S2Jacobian3D(double* rcol,             # <<<<<<<<<<<<<<
+ *                               double* scol,
+ *                               double* tcol,
+ */
+
+  /* function exit code */
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":710
+ *     '''
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         super(W1Sampler3D, self).__init__()
+ *         self.num_mapped_coords = 3
+ */
+
+/* Python wrapper */
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
+    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
+  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D___init__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_W1Sampler3D *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_W1Sampler3D *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "yt/utilities/lib/element_mappings.pyx":711
+ * 
+ *     def __init__(self):
+ *         super(W1Sampler3D, self).__init__()             # <<<<<<<<<<<<<<
+ *         self.num_mapped_coords = 3
+ *         self.dim = 3
+ */
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 711, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_W1Sampler3D));
+  __Pyx_GIVEREF(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_W1Sampler3D));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_W1Sampler3D));
+  __Pyx_INCREF(((PyObject *)__pyx_v_self));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self));
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 711, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 711, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 711, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":712
+ *     def __init__(self):
+ *         super(W1Sampler3D, self).__init__()
+ *         self.num_mapped_coords = 3             # <<<<<<<<<<<<<<
+ *         self.dim = 3
+ *         self.func = W1Function3D
+ */
+  __pyx_v_self->__pyx_base.__pyx_base.num_mapped_coords = 3;
+
+  /* "yt/utilities/lib/element_mappings.pyx":713
+ *         super(W1Sampler3D, self).__init__()
+ *         self.num_mapped_coords = 3
+ *         self.dim = 3             # <<<<<<<<<<<<<<
+ *         self.func = W1Function3D
+ *         self.jac = W1Jacobian3D
+ */
+  __pyx_v_self->__pyx_base.dim = 3;
+
+  /* "yt/utilities/lib/element_mappings.pyx":714
+ *         self.num_mapped_coords = 3
+ *         self.dim = 3
+ *         self.func = W1Function3D             # <<<<<<<<<<<<<<
+ *         self.jac = W1Jacobian3D
+ * 
+ */
+  __pyx_v_self->__pyx_base.func = __pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_W1Function3D;
+
+  /* "yt/utilities/lib/element_mappings.pyx":715
+ *         self.dim = 3
+ *         self.func = W1Function3D
+ *         self.jac = W1Jacobian3D             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_v_self->__pyx_base.jac = __pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_W1Jacobian3D;
+
+  /* "yt/utilities/lib/element_mappings.pyx":710
+ *     '''
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         super(W1Sampler3D, self).__init__()
+ *         self.num_mapped_coords = 3
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.W1Sampler3D.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":720
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef double sample_at_unit_point(self, double* coord, double* vals) nogil:             # <<<<<<<<<<<<<<
+ *         cdef double F
+ * 
+ */
+
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D_sample_at_unit_point(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_W1Sampler3D *__pyx_v_self, double *__pyx_v_coord, double *__pyx_v_vals) {
+  double __pyx_v_F;
+  double __pyx_r;
+
+  /* "yt/utilities/lib/element_mappings.pyx":727
+ *             vals[2]*coord[1]*(1.0 - coord[2]) + \
+ *             vals[3]*(1.0 - coord[0] - coord[1])*(1.0 + coord[2]) + \
+ *             vals[4]*coord[0]*(1.0 + coord[2]) + \             # <<<<<<<<<<<<<<
+ *             vals[5]*coord[1]*(1.0 + coord[2])
+ * 
+ */
+  __pyx_v_F = ((((((((__pyx_v_vals[0]) * ((1.0 - (__pyx_v_coord[0])) - (__pyx_v_coord[1]))) * (1.0 - (__pyx_v_coord[2]))) + (((__pyx_v_vals[1]) * (__pyx_v_coord[0])) * (1.0 - (__pyx_v_coord[2])))) + (((__pyx_v_vals[2]) * (__pyx_v_coord[1])) * (1.0 - (__pyx_v_coord[2])))) + (((__pyx_v_vals[3]) * ((1.0 - (__pyx_v_coord[0])) - (__pyx_v_coord[1]))) * (1.0 + (__pyx_v_coord[2])))) + (((__pyx_v_vals[4]) * (__pyx_v_coord[0])) * (1.0 + (__pyx_v_coord[2])))) + (((__pyx_v_vals[5]) * (__pyx_v_coord[1])) * (1.0 + (__pyx_v_coord[2]))));
+
+  /* "yt/utilities/lib/element_mappings.pyx":730
+ *             vals[5]*coord[1]*(1.0 + coord[2])
+ * 
+ *         return F / 2.0             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_r = (__pyx_v_F / 2.0);
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":720
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef double sample_at_unit_point(self, double* coord, double* vals) nogil:             # <<<<<<<<<<<<<<
+ *         cdef double F
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":735
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         # for wedges the bounds of the mapped coordinates are:
+ *         #     0 <= mapped_coord[0] <= 1 - mapped_coord[1]
+ */
+
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D_check_inside(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_W1Sampler3D *__pyx_v_self, double *__pyx_v_mapped_coord) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "yt/utilities/lib/element_mappings.pyx":740
+ *         #     0 <= mapped_coord[1]
+ *         #    -1 <= mapped_coord[2] <= 1
+ *         if (mapped_coord[0] < -self.inclusion_tol or             # <<<<<<<<<<<<<<
+ *             mapped_coord[0] + mapped_coord[1] - 1.0 > self.inclusion_tol):
+ *             return 0
+ */
+  __pyx_t_2 = (((__pyx_v_mapped_coord[0]) < (-__pyx_v_self->__pyx_base.__pyx_base.inclusion_tol)) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":741
+ *         #    -1 <= mapped_coord[2] <= 1
+ *         if (mapped_coord[0] < -self.inclusion_tol or
+ *             mapped_coord[0] + mapped_coord[1] - 1.0 > self.inclusion_tol):             # <<<<<<<<<<<<<<
+ *             return 0
+ *         if (mapped_coord[1] < -self.inclusion_tol):
+ */
+  __pyx_t_2 = (((((__pyx_v_mapped_coord[0]) + (__pyx_v_mapped_coord[1])) - 1.0) > __pyx_v_self->__pyx_base.__pyx_base.inclusion_tol) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+
+  /* "yt/utilities/lib/element_mappings.pyx":740
+ *         #     0 <= mapped_coord[1]
+ *         #    -1 <= mapped_coord[2] <= 1
+ *         if (mapped_coord[0] < -self.inclusion_tol or             # <<<<<<<<<<<<<<
+ *             mapped_coord[0] + mapped_coord[1] - 1.0 > self.inclusion_tol):
+ *             return 0
+ */
+  if (__pyx_t_1) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":742
+ *         if (mapped_coord[0] < -self.inclusion_tol or
+ *             mapped_coord[0] + mapped_coord[1] - 1.0 > self.inclusion_tol):
+ *             return 0             # <<<<<<<<<<<<<<
+ *         if (mapped_coord[1] < -self.inclusion_tol):
+ *             return 0
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "yt/utilities/lib/element_mappings.pyx":740
+ *         #     0 <= mapped_coord[1]
+ *         #    -1 <= mapped_coord[2] <= 1
+ *         if (mapped_coord[0] < -self.inclusion_tol or             # <<<<<<<<<<<<<<
+ *             mapped_coord[0] + mapped_coord[1] - 1.0 > self.inclusion_tol):
+ *             return 0
+ */
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":743
+ *             mapped_coord[0] + mapped_coord[1] - 1.0 > self.inclusion_tol):
+ *             return 0
+ *         if (mapped_coord[1] < -self.inclusion_tol):             # <<<<<<<<<<<<<<
+ *             return 0
+ *         if (fabs(mapped_coord[2]) - 1.0 > self.inclusion_tol):
+ */
+  __pyx_t_1 = (((__pyx_v_mapped_coord[1]) < (-__pyx_v_self->__pyx_base.__pyx_base.inclusion_tol)) != 0);
+  if (__pyx_t_1) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":744
+ *             return 0
+ *         if (mapped_coord[1] < -self.inclusion_tol):
+ *             return 0             # <<<<<<<<<<<<<<
+ *         if (fabs(mapped_coord[2]) - 1.0 > self.inclusion_tol):
+ *             return 0
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "yt/utilities/lib/element_mappings.pyx":743
+ *             mapped_coord[0] + mapped_coord[1] - 1.0 > self.inclusion_tol):
+ *             return 0
+ *         if (mapped_coord[1] < -self.inclusion_tol):             # <<<<<<<<<<<<<<
+ *             return 0
+ *         if (fabs(mapped_coord[2]) - 1.0 > self.inclusion_tol):
+ */
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":745
+ *         if (mapped_coord[1] < -self.inclusion_tol):
+ *             return 0
+ *         if (fabs(mapped_coord[2]) - 1.0 > self.inclusion_tol):             # <<<<<<<<<<<<<<
+ *             return 0
+ *         return 1
+ */
+  __pyx_t_1 = (((fabs((__pyx_v_mapped_coord[2])) - 1.0) > __pyx_v_self->__pyx_base.__pyx_base.inclusion_tol) != 0);
+  if (__pyx_t_1) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":746
+ *             return 0
+ *         if (fabs(mapped_coord[2]) - 1.0 > self.inclusion_tol):
+ *             return 0             # <<<<<<<<<<<<<<
+ *         return 1
+ * 
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "yt/utilities/lib/element_mappings.pyx":745
+ *         if (mapped_coord[1] < -self.inclusion_tol):
+ *             return 0
+ *         if (fabs(mapped_coord[2]) - 1.0 > self.inclusion_tol):             # <<<<<<<<<<<<<<
+ *             return 0
+ *         return 1
+ */
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":747
+ *         if (fabs(mapped_coord[2]) - 1.0 > self.inclusion_tol):
+ *             return 0
+ *         return 1             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":735
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         # for wedges the bounds of the mapped coordinates are:
+ *         #     0 <= mapped_coord[0] <= 1 - mapped_coord[1]
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":752
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_mesh_lines(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         cdef double r, s, t
+ *         cdef double thresh = 5.0e-2
+ */
+
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D_check_mesh_lines(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_W1Sampler3D *__pyx_v_self, double *__pyx_v_mapped_coord) {
+  double __pyx_v_r;
+  double __pyx_v_s;
+  CYTHON_UNUSED double __pyx_v_t;
+  double __pyx_v_thresh;
+  int __pyx_v_near_edge_r;
+  int __pyx_v_near_edge_s;
+  int __pyx_v_near_edge_t;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+
+  /* "yt/utilities/lib/element_mappings.pyx":754
+ *     cdef int check_mesh_lines(self, double* mapped_coord) nogil:
+ *         cdef double r, s, t
+ *         cdef double thresh = 5.0e-2             # <<<<<<<<<<<<<<
+ *         r = mapped_coord[0]
+ *         s = mapped_coord[1]
+ */
+  __pyx_v_thresh = 5.0e-2;
+
+  /* "yt/utilities/lib/element_mappings.pyx":755
+ *         cdef double r, s, t
+ *         cdef double thresh = 5.0e-2
+ *         r = mapped_coord[0]             # <<<<<<<<<<<<<<
+ *         s = mapped_coord[1]
+ *         t = mapped_coord[2]
+ */
+  __pyx_v_r = (__pyx_v_mapped_coord[0]);
+
+  /* "yt/utilities/lib/element_mappings.pyx":756
+ *         cdef double thresh = 5.0e-2
+ *         r = mapped_coord[0]
+ *         s = mapped_coord[1]             # <<<<<<<<<<<<<<
+ *         t = mapped_coord[2]
+ * 
+ */
+  __pyx_v_s = (__pyx_v_mapped_coord[1]);
+
+  /* "yt/utilities/lib/element_mappings.pyx":757
+ *         r = mapped_coord[0]
+ *         s = mapped_coord[1]
+ *         t = mapped_coord[2]             # <<<<<<<<<<<<<<
+ * 
+ *         cdef int near_edge_r, near_edge_s, near_edge_t
+ */
+  __pyx_v_t = (__pyx_v_mapped_coord[2]);
+
+  /* "yt/utilities/lib/element_mappings.pyx":760
+ * 
+ *         cdef int near_edge_r, near_edge_s, near_edge_t
+ *         near_edge_r = (r < thresh) or (fabs(r + s - 1.0) < thresh)             # <<<<<<<<<<<<<<
+ *         near_edge_s = (s < thresh)
+ *         near_edge_t = fabs(fabs(mapped_coord[2]) - 1.0) < thresh
+ */
+  __pyx_t_2 = (__pyx_v_r < __pyx_v_thresh);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L3_bool_binop_done;
+  }
+  __pyx_t_2 = (fabs(((__pyx_v_r + __pyx_v_s) - 1.0)) < __pyx_v_thresh);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L3_bool_binop_done:;
+  __pyx_v_near_edge_r = __pyx_t_1;
+
+  /* "yt/utilities/lib/element_mappings.pyx":761
+ *         cdef int near_edge_r, near_edge_s, near_edge_t
+ *         near_edge_r = (r < thresh) or (fabs(r + s - 1.0) < thresh)
+ *         near_edge_s = (s < thresh)             # <<<<<<<<<<<<<<
+ *         near_edge_t = fabs(fabs(mapped_coord[2]) - 1.0) < thresh
+ * 
+ */
+  __pyx_v_near_edge_s = (__pyx_v_s < __pyx_v_thresh);
+
+  /* "yt/utilities/lib/element_mappings.pyx":762
+ *         near_edge_r = (r < thresh) or (fabs(r + s - 1.0) < thresh)
+ *         near_edge_s = (s < thresh)
+ *         near_edge_t = fabs(fabs(mapped_coord[2]) - 1.0) < thresh             # <<<<<<<<<<<<<<
+ * 
+ *         # we use ray.instID to pass back whether the ray is near the
+ */
+  __pyx_v_near_edge_t = (fabs((fabs((__pyx_v_mapped_coord[2])) - 1.0)) < __pyx_v_thresh);
+
+  /* "yt/utilities/lib/element_mappings.pyx":766
+ *         # we use ray.instID to pass back whether the ray is near the
+ *         # element boundary or not (used to annotate mesh lines)
+ *         if (near_edge_r and near_edge_s):             # <<<<<<<<<<<<<<
+ *             return 1
+ *         elif (near_edge_r and near_edge_t):
+ */
+  __pyx_t_3 = (__pyx_v_near_edge_r != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+    goto __pyx_L6_bool_binop_done;
+  }
+  __pyx_t_3 = (__pyx_v_near_edge_s != 0);
+  __pyx_t_2 = __pyx_t_3;
+  __pyx_L6_bool_binop_done:;
+  if (__pyx_t_2) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":767
+ *         # element boundary or not (used to annotate mesh lines)
+ *         if (near_edge_r and near_edge_s):
+ *             return 1             # <<<<<<<<<<<<<<
+ *         elif (near_edge_r and near_edge_t):
+ *             return 1
+ */
+    __pyx_r = 1;
+    goto __pyx_L0;
+
+    /* "yt/utilities/lib/element_mappings.pyx":766
+ *         # we use ray.instID to pass back whether the ray is near the
+ *         # element boundary or not (used to annotate mesh lines)
+ *         if (near_edge_r and near_edge_s):             # <<<<<<<<<<<<<<
+ *             return 1
+ *         elif (near_edge_r and near_edge_t):
+ */
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":768
+ *         if (near_edge_r and near_edge_s):
+ *             return 1
+ *         elif (near_edge_r and near_edge_t):             # <<<<<<<<<<<<<<
+ *             return 1
+ *         elif (near_edge_s and near_edge_t):
+ */
+  __pyx_t_3 = (__pyx_v_near_edge_r != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+    goto __pyx_L8_bool_binop_done;
+  }
+  __pyx_t_3 = (__pyx_v_near_edge_t != 0);
+  __pyx_t_2 = __pyx_t_3;
+  __pyx_L8_bool_binop_done:;
+  if (__pyx_t_2) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":769
+ *             return 1
+ *         elif (near_edge_r and near_edge_t):
+ *             return 1             # <<<<<<<<<<<<<<
+ *         elif (near_edge_s and near_edge_t):
+ *             return 1
+ */
+    __pyx_r = 1;
+    goto __pyx_L0;
+
+    /* "yt/utilities/lib/element_mappings.pyx":768
+ *         if (near_edge_r and near_edge_s):
+ *             return 1
+ *         elif (near_edge_r and near_edge_t):             # <<<<<<<<<<<<<<
+ *             return 1
+ *         elif (near_edge_s and near_edge_t):
+ */
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":770
+ *         elif (near_edge_r and near_edge_t):
+ *             return 1
+ *         elif (near_edge_s and near_edge_t):             # <<<<<<<<<<<<<<
+ *             return 1
+ *         else:
+ */
+  __pyx_t_3 = (__pyx_v_near_edge_s != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+    goto __pyx_L10_bool_binop_done;
+  }
+  __pyx_t_3 = (__pyx_v_near_edge_t != 0);
+  __pyx_t_2 = __pyx_t_3;
+  __pyx_L10_bool_binop_done:;
+  if (__pyx_t_2) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":771
+ *             return 1
+ *         elif (near_edge_s and near_edge_t):
+ *             return 1             # <<<<<<<<<<<<<<
+ *         else:
+ *             return -1
+ */
+    __pyx_r = 1;
+    goto __pyx_L0;
+
+    /* "yt/utilities/lib/element_mappings.pyx":770
+ *         elif (near_edge_r and near_edge_t):
+ *             return 1
+ *         elif (near_edge_s and near_edge_t):             # <<<<<<<<<<<<<<
+ *             return 1
+ *         else:
+ */
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":773
+ *             return 1
+ *         else:
+ *             return -1             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  /*else*/ {
+    __pyx_r = -1;
+    goto __pyx_L0;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":752
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_mesh_lines(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         cdef double r, s, t
+ *         cdef double thresh = 5.0e-2
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D_2__reduce_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_W1Sampler3D *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_W1Sampler3D *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.W1Sampler3D.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D_4__setstate_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_W1Sampler3D *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_W1Sampler3D *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.W1Sampler3D.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":789
+ *     '''
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         super(NonlinearSolveSampler2D, self).__init__()
+ *         self.tolerance = 1.0e-9
+ */
+
+/* Python wrapper */
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler2D_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler2D_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
+    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
+  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler2D___init__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler2D___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "yt/utilities/lib/element_mappings.pyx":790
+ * 
+ *     def __init__(self):
+ *         super(NonlinearSolveSampler2D, self).__init__()             # <<<<<<<<<<<<<<
+ *         self.tolerance = 1.0e-9
+ *         self.max_iter = 10
+ */
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 790, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D));
+  __Pyx_GIVEREF(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D));
+  __Pyx_INCREF(((PyObject *)__pyx_v_self));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self));
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 790, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 790, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 790, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":791
+ *     def __init__(self):
+ *         super(NonlinearSolveSampler2D, self).__init__()
+ *         self.tolerance = 1.0e-9             # <<<<<<<<<<<<<<
+ *         self.max_iter = 10
+ * 
+ */
+  __pyx_v_self->tolerance = 1.0e-9;
+
+  /* "yt/utilities/lib/element_mappings.pyx":792
+ *         super(NonlinearSolveSampler2D, self).__init__()
+ *         self.tolerance = 1.0e-9
+ *         self.max_iter = 10             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_v_self->max_iter = 10;
+
+  /* "yt/utilities/lib/element_mappings.pyx":789
+ *     '''
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         super(NonlinearSolveSampler2D, self).__init__()
+ *         self.tolerance = 1.0e-9
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.NonlinearSolveSampler2D.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":797
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef void map_real_to_unit(self,             # <<<<<<<<<<<<<<
+ *                                double* mapped_x,
+ *                                double* vertices,
+ */
+
+static void __pyx_f_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler2D_map_real_to_unit(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D *__pyx_v_self, double *__pyx_v_mapped_x, double *__pyx_v_vertices, double *__pyx_v_physical_x) {
+  int __pyx_v_i;
+  double __pyx_v_d;
+  double __pyx_v_lam;
+  double __pyx_v_f[2];
+  double __pyx_v_x[2];
+  double __pyx_v_xk[2];
+  double __pyx_v_s_n[2];
+  double __pyx_v_A[4];
+  int __pyx_v_iterations;
+  double __pyx_v_err_c;
+  double __pyx_v_err_plus;
+  double __pyx_v_alpha;
+  double __pyx_v_min_lam;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+
+  /* "yt/utilities/lib/element_mappings.pyx":829
+ *         cdef double[2] x, xk, s_n
+ *         cdef double[4] A
+ *         cdef int iterations = 0             # <<<<<<<<<<<<<<
+ *         cdef double err_c, err_plus
+ *         cdef double alpha = 1e-4
+ */
+  __pyx_v_iterations = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":831
+ *         cdef int iterations = 0
+ *         cdef double err_c, err_plus
+ *         cdef double alpha = 1e-4             # <<<<<<<<<<<<<<
+ *         cdef double min_lam = 1e-6
+ * 
+ */
+  __pyx_v_alpha = 1e-4;
+
+  /* "yt/utilities/lib/element_mappings.pyx":832
+ *         cdef double err_c, err_plus
+ *         cdef double alpha = 1e-4
+ *         cdef double min_lam = 1e-6             # <<<<<<<<<<<<<<
+ * 
+ *         # initial guess
+ */
+  __pyx_v_min_lam = 1e-6;
+
+  /* "yt/utilities/lib/element_mappings.pyx":835
+ * 
+ *         # initial guess
+ *         for i in range(2):             # <<<<<<<<<<<<<<
+ *             x[i] = 0.0
+ * 
+ */
+  for (__pyx_t_1 = 0; __pyx_t_1 < 2; __pyx_t_1+=1) {
+    __pyx_v_i = __pyx_t_1;
+
+    /* "yt/utilities/lib/element_mappings.pyx":836
+ *         # initial guess
+ *         for i in range(2):
+ *             x[i] = 0.0             # <<<<<<<<<<<<<<
+ * 
+ *         # initial error norm
+ */
+    (__pyx_v_x[__pyx_v_i]) = 0.0;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":839
+ * 
+ *         # initial error norm
+ *         self.func(f, x, vertices, physical_x)             # <<<<<<<<<<<<<<
+ *         err_c = maxnorm(f, 2)
+ * 
+ */
+  __pyx_v_self->func(__pyx_v_f, __pyx_v_x, __pyx_v_vertices, __pyx_v_physical_x);
+
+  /* "yt/utilities/lib/element_mappings.pyx":840
+ *         # initial error norm
+ *         self.func(f, x, vertices, physical_x)
+ *         err_c = maxnorm(f, 2)             # <<<<<<<<<<<<<<
+ * 
+ *         # begin Newton iteration
+ */
+  __pyx_v_err_c = __pyx_f_2yt_9utilities_3lib_16element_mappings_maxnorm(__pyx_v_f, 2);
+
+  /* "yt/utilities/lib/element_mappings.pyx":843
+ * 
+ *         # begin Newton iteration
+ *         while (err_c > self.tolerance and iterations < self.max_iter):             # <<<<<<<<<<<<<<
+ *             self.jac(&A[0], &A[2], x, vertices, physical_x)
+ *             d = (A[0]*A[3] - A[1]*A[2])
+ */
+  while (1) {
+    __pyx_t_3 = ((__pyx_v_err_c > __pyx_v_self->tolerance) != 0);
+    if (__pyx_t_3) {
+    } else {
+      __pyx_t_2 = __pyx_t_3;
+      goto __pyx_L7_bool_binop_done;
+    }
+    __pyx_t_3 = ((__pyx_v_iterations < __pyx_v_self->max_iter) != 0);
+    __pyx_t_2 = __pyx_t_3;
+    __pyx_L7_bool_binop_done:;
+    if (!__pyx_t_2) break;
+
+    /* "yt/utilities/lib/element_mappings.pyx":844
+ *         # begin Newton iteration
+ *         while (err_c > self.tolerance and iterations < self.max_iter):
+ *             self.jac(&A[0], &A[2], x, vertices, physical_x)             # <<<<<<<<<<<<<<
+ *             d = (A[0]*A[3] - A[1]*A[2])
+ * 
+ */
+    __pyx_v_self->jac((&(__pyx_v_A[0])), (&(__pyx_v_A[2])), __pyx_v_x, __pyx_v_vertices, __pyx_v_physical_x);
+
+    /* "yt/utilities/lib/element_mappings.pyx":845
+ *         while (err_c > self.tolerance and iterations < self.max_iter):
+ *             self.jac(&A[0], &A[2], x, vertices, physical_x)
+ *             d = (A[0]*A[3] - A[1]*A[2])             # <<<<<<<<<<<<<<
+ * 
+ *             s_n[0] = -( A[3]*f[0] - A[2]*f[1]) / d
+ */
+    __pyx_v_d = (((__pyx_v_A[0]) * (__pyx_v_A[3])) - ((__pyx_v_A[1]) * (__pyx_v_A[2])));
+
+    /* "yt/utilities/lib/element_mappings.pyx":847
+ *             d = (A[0]*A[3] - A[1]*A[2])
+ * 
+ *             s_n[0] = -( A[3]*f[0] - A[2]*f[1]) / d             # <<<<<<<<<<<<<<
+ *             s_n[1] = -(-A[1]*f[0] + A[0]*f[1]) / d
+ *             xk[0] = x[0] + s_n[0]
+ */
+    (__pyx_v_s_n[0]) = ((-(((__pyx_v_A[3]) * (__pyx_v_f[0])) - ((__pyx_v_A[2]) * (__pyx_v_f[1])))) / __pyx_v_d);
+
+    /* "yt/utilities/lib/element_mappings.pyx":848
+ * 
+ *             s_n[0] = -( A[3]*f[0] - A[2]*f[1]) / d
+ *             s_n[1] = -(-A[1]*f[0] + A[0]*f[1]) / d             # <<<<<<<<<<<<<<
+ *             xk[0] = x[0] + s_n[0]
+ *             xk[1] = x[1] + s_n[1]
+ */
+    (__pyx_v_s_n[1]) = ((-(((-(__pyx_v_A[1])) * (__pyx_v_f[0])) + ((__pyx_v_A[0]) * (__pyx_v_f[1])))) / __pyx_v_d);
+
+    /* "yt/utilities/lib/element_mappings.pyx":849
+ *             s_n[0] = -( A[3]*f[0] - A[2]*f[1]) / d
+ *             s_n[1] = -(-A[1]*f[0] + A[0]*f[1]) / d
+ *             xk[0] = x[0] + s_n[0]             # <<<<<<<<<<<<<<
+ *             xk[1] = x[1] + s_n[1]
+ *             self.func(f, xk, vertices, physical_x)
+ */
+    (__pyx_v_xk[0]) = ((__pyx_v_x[0]) + (__pyx_v_s_n[0]));
+
+    /* "yt/utilities/lib/element_mappings.pyx":850
+ *             s_n[1] = -(-A[1]*f[0] + A[0]*f[1]) / d
+ *             xk[0] = x[0] + s_n[0]
+ *             xk[1] = x[1] + s_n[1]             # <<<<<<<<<<<<<<
+ *             self.func(f, xk, vertices, physical_x)
+ *             err_plus = maxnorm(f, 2)
+ */
+    (__pyx_v_xk[1]) = ((__pyx_v_x[1]) + (__pyx_v_s_n[1]));
+
+    /* "yt/utilities/lib/element_mappings.pyx":851
+ *             xk[0] = x[0] + s_n[0]
+ *             xk[1] = x[1] + s_n[1]
+ *             self.func(f, xk, vertices, physical_x)             # <<<<<<<<<<<<<<
+ *             err_plus = maxnorm(f, 2)
+ * 
+ */
+    __pyx_v_self->func(__pyx_v_f, __pyx_v_xk, __pyx_v_vertices, __pyx_v_physical_x);
+
+    /* "yt/utilities/lib/element_mappings.pyx":852
+ *             xk[1] = x[1] + s_n[1]
+ *             self.func(f, xk, vertices, physical_x)
+ *             err_plus = maxnorm(f, 2)             # <<<<<<<<<<<<<<
+ * 
+ *             lam = 1
+ */
+    __pyx_v_err_plus = __pyx_f_2yt_9utilities_3lib_16element_mappings_maxnorm(__pyx_v_f, 2);
+
+    /* "yt/utilities/lib/element_mappings.pyx":854
+ *             err_plus = maxnorm(f, 2)
+ * 
+ *             lam = 1             # <<<<<<<<<<<<<<
+ *             while err_plus > err_c * (1. - alpha * lam) and lam > min_lam:
+ *                 lam = lam / 2
+ */
+    __pyx_v_lam = 1.0;
+
+    /* "yt/utilities/lib/element_mappings.pyx":855
+ * 
+ *             lam = 1
+ *             while err_plus > err_c * (1. - alpha * lam) and lam > min_lam:             # <<<<<<<<<<<<<<
+ *                 lam = lam / 2
+ *                 xk[0] = x[0] + lam * s_n[0]
+ */
+    while (1) {
+      __pyx_t_3 = ((__pyx_v_err_plus > (__pyx_v_err_c * (1. - (__pyx_v_alpha * __pyx_v_lam)))) != 0);
+      if (__pyx_t_3) {
+      } else {
+        __pyx_t_2 = __pyx_t_3;
+        goto __pyx_L11_bool_binop_done;
+      }
+      __pyx_t_3 = ((__pyx_v_lam > __pyx_v_min_lam) != 0);
+      __pyx_t_2 = __pyx_t_3;
+      __pyx_L11_bool_binop_done:;
+      if (!__pyx_t_2) break;
+
+      /* "yt/utilities/lib/element_mappings.pyx":856
+ *             lam = 1
+ *             while err_plus > err_c * (1. - alpha * lam) and lam > min_lam:
+ *                 lam = lam / 2             # <<<<<<<<<<<<<<
+ *                 xk[0] = x[0] + lam * s_n[0]
+ *                 xk[1] = x[1] + lam * s_n[1]
+ */
+      __pyx_v_lam = (__pyx_v_lam / 2.0);
+
+      /* "yt/utilities/lib/element_mappings.pyx":857
+ *             while err_plus > err_c * (1. - alpha * lam) and lam > min_lam:
+ *                 lam = lam / 2
+ *                 xk[0] = x[0] + lam * s_n[0]             # <<<<<<<<<<<<<<
+ *                 xk[1] = x[1] + lam * s_n[1]
+ *                 self.func(f, xk, vertices, physical_x)
+ */
+      (__pyx_v_xk[0]) = ((__pyx_v_x[0]) + (__pyx_v_lam * (__pyx_v_s_n[0])));
+
+      /* "yt/utilities/lib/element_mappings.pyx":858
+ *                 lam = lam / 2
+ *                 xk[0] = x[0] + lam * s_n[0]
+ *                 xk[1] = x[1] + lam * s_n[1]             # <<<<<<<<<<<<<<
+ *                 self.func(f, xk, vertices, physical_x)
+ *                 err_plus = maxnorm(f, 2)
+ */
+      (__pyx_v_xk[1]) = ((__pyx_v_x[1]) + (__pyx_v_lam * (__pyx_v_s_n[1])));
+
+      /* "yt/utilities/lib/element_mappings.pyx":859
+ *                 xk[0] = x[0] + lam * s_n[0]
+ *                 xk[1] = x[1] + lam * s_n[1]
+ *                 self.func(f, xk, vertices, physical_x)             # <<<<<<<<<<<<<<
+ *                 err_plus = maxnorm(f, 2)
+ * 
+ */
+      __pyx_v_self->func(__pyx_v_f, __pyx_v_xk, __pyx_v_vertices, __pyx_v_physical_x);
+
+      /* "yt/utilities/lib/element_mappings.pyx":860
+ *                 xk[1] = x[1] + lam * s_n[1]
+ *                 self.func(f, xk, vertices, physical_x)
+ *                 err_plus = maxnorm(f, 2)             # <<<<<<<<<<<<<<
+ * 
+ *             x[0] = xk[0]
+ */
+      __pyx_v_err_plus = __pyx_f_2yt_9utilities_3lib_16element_mappings_maxnorm(__pyx_v_f, 2);
+    }
+
+    /* "yt/utilities/lib/element_mappings.pyx":862
+ *                 err_plus = maxnorm(f, 2)
+ * 
+ *             x[0] = xk[0]             # <<<<<<<<<<<<<<
+ *             x[1] = xk[1]
+ *             err_c = err_plus
+ */
+    (__pyx_v_x[0]) = (__pyx_v_xk[0]);
+
+    /* "yt/utilities/lib/element_mappings.pyx":863
+ * 
+ *             x[0] = xk[0]
+ *             x[1] = xk[1]             # <<<<<<<<<<<<<<
+ *             err_c = err_plus
+ *             iterations += 1
+ */
+    (__pyx_v_x[1]) = (__pyx_v_xk[1]);
+
+    /* "yt/utilities/lib/element_mappings.pyx":864
+ *             x[0] = xk[0]
+ *             x[1] = xk[1]
+ *             err_c = err_plus             # <<<<<<<<<<<<<<
+ *             iterations += 1
+ * 
+ */
+    __pyx_v_err_c = __pyx_v_err_plus;
+
+    /* "yt/utilities/lib/element_mappings.pyx":865
+ *             x[1] = xk[1]
+ *             err_c = err_plus
+ *             iterations += 1             # <<<<<<<<<<<<<<
+ * 
+ *         if (err_c > self.tolerance):
+ */
+    __pyx_v_iterations = (__pyx_v_iterations + 1);
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":867
+ *             iterations += 1
+ * 
+ *         if (err_c > self.tolerance):             # <<<<<<<<<<<<<<
+ *             # we did not converge, set bogus value
+ *             for i in range(2):
+ */
+  __pyx_t_2 = ((__pyx_v_err_c > __pyx_v_self->tolerance) != 0);
+  if (__pyx_t_2) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":869
+ *         if (err_c > self.tolerance):
+ *             # we did not converge, set bogus value
+ *             for i in range(2):             # <<<<<<<<<<<<<<
+ *                 mapped_x[i] = -99.0
+ *         else:
+ */
+    for (__pyx_t_1 = 0; __pyx_t_1 < 2; __pyx_t_1+=1) {
+      __pyx_v_i = __pyx_t_1;
+
+      /* "yt/utilities/lib/element_mappings.pyx":870
+ *             # we did not converge, set bogus value
+ *             for i in range(2):
+ *                 mapped_x[i] = -99.0             # <<<<<<<<<<<<<<
+ *         else:
+ *             for i in range(2):
+ */
+      (__pyx_v_mapped_x[__pyx_v_i]) = -99.0;
+    }
+
+    /* "yt/utilities/lib/element_mappings.pyx":867
+ *             iterations += 1
+ * 
+ *         if (err_c > self.tolerance):             # <<<<<<<<<<<<<<
+ *             # we did not converge, set bogus value
+ *             for i in range(2):
+ */
+    goto __pyx_L13;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":872
+ *                 mapped_x[i] = -99.0
+ *         else:
+ *             for i in range(2):             # <<<<<<<<<<<<<<
+ *                 mapped_x[i] = x[i]
+ * 
+ */
+  /*else*/ {
+    for (__pyx_t_1 = 0; __pyx_t_1 < 2; __pyx_t_1+=1) {
+      __pyx_v_i = __pyx_t_1;
+
+      /* "yt/utilities/lib/element_mappings.pyx":873
+ *         else:
+ *             for i in range(2):
+ *                 mapped_x[i] = x[i]             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+      (__pyx_v_mapped_x[__pyx_v_i]) = (__pyx_v_x[__pyx_v_i]);
+    }
+  }
+  __pyx_L13:;
+
+  /* "yt/utilities/lib/element_mappings.pyx":797
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef void map_real_to_unit(self,             # <<<<<<<<<<<<<<
+ *                                double* mapped_x,
+ *                                double* vertices,
+ */
+
+  /* function exit code */
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler2D_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler2D_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler2D_2__reduce_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler2D_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.NonlinearSolveSampler2D.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler2D_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler2D_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler2D_4__setstate_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler2D_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.NonlinearSolveSampler2D.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":884
+ *     '''
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         super(Q1Sampler2D, self).__init__()
+ *         self.num_mapped_coords = 2
+ */
+
+/* Python wrapper */
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q1Sampler2D_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q1Sampler2D_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
+    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
+  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q1Sampler2D___init__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q1Sampler2D___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "yt/utilities/lib/element_mappings.pyx":885
+ * 
+ *     def __init__(self):
+ *         super(Q1Sampler2D, self).__init__()             # <<<<<<<<<<<<<<
+ *         self.num_mapped_coords = 2
+ *         self.dim = 2
+ */
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 885, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D));
+  __Pyx_GIVEREF(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D));
+  __Pyx_INCREF(((PyObject *)__pyx_v_self));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self));
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 885, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 885, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 885, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":886
+ *     def __init__(self):
+ *         super(Q1Sampler2D, self).__init__()
+ *         self.num_mapped_coords = 2             # <<<<<<<<<<<<<<
+ *         self.dim = 2
+ *         self.func = Q1Function2D
+ */
+  __pyx_v_self->__pyx_base.__pyx_base.num_mapped_coords = 2;
+
+  /* "yt/utilities/lib/element_mappings.pyx":887
+ *         super(Q1Sampler2D, self).__init__()
+ *         self.num_mapped_coords = 2
+ *         self.dim = 2             # <<<<<<<<<<<<<<
+ *         self.func = Q1Function2D
+ *         self.jac = Q1Jacobian2D
+ */
+  __pyx_v_self->__pyx_base.dim = 2;
+
+  /* "yt/utilities/lib/element_mappings.pyx":888
+ *         self.num_mapped_coords = 2
+ *         self.dim = 2
+ *         self.func = Q1Function2D             # <<<<<<<<<<<<<<
+ *         self.jac = Q1Jacobian2D
+ * 
+ */
+  __pyx_v_self->__pyx_base.func = __pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_Q1Function2D;
+
+  /* "yt/utilities/lib/element_mappings.pyx":889
+ *         self.dim = 2
+ *         self.func = Q1Function2D
+ *         self.jac = Q1Jacobian2D             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_v_self->__pyx_base.jac = __pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_Q1Jacobian2D;
+
+  /* "yt/utilities/lib/element_mappings.pyx":884
+ *     '''
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         super(Q1Sampler2D, self).__init__()
+ *         self.num_mapped_coords = 2
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.Q1Sampler2D.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":894
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef double sample_at_unit_point(self, double* coord, double* vals) nogil:             # <<<<<<<<<<<<<<
+ *         cdef double F, rm, rp, sm, sp
+ * 
+ */
+
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_11Q1Sampler2D_sample_at_unit_point(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D *__pyx_v_self, double *__pyx_v_coord, double *__pyx_v_vals) {
+  double __pyx_v_F;
+  double __pyx_v_rm;
+  double __pyx_v_rp;
+  double __pyx_v_sm;
+  double __pyx_v_sp;
+  double __pyx_r;
+
+  /* "yt/utilities/lib/element_mappings.pyx":897
+ *         cdef double F, rm, rp, sm, sp
+ * 
+ *         rm = 1.0 - coord[0]             # <<<<<<<<<<<<<<
+ *         rp = 1.0 + coord[0]
+ *         sm = 1.0 - coord[1]
+ */
+  __pyx_v_rm = (1.0 - (__pyx_v_coord[0]));
+
+  /* "yt/utilities/lib/element_mappings.pyx":898
+ * 
+ *         rm = 1.0 - coord[0]
+ *         rp = 1.0 + coord[0]             # <<<<<<<<<<<<<<
+ *         sm = 1.0 - coord[1]
+ *         sp = 1.0 + coord[1]
+ */
+  __pyx_v_rp = (1.0 + (__pyx_v_coord[0]));
+
+  /* "yt/utilities/lib/element_mappings.pyx":899
+ *         rm = 1.0 - coord[0]
+ *         rp = 1.0 + coord[0]
+ *         sm = 1.0 - coord[1]             # <<<<<<<<<<<<<<
+ *         sp = 1.0 + coord[1]
+ * 
+ */
+  __pyx_v_sm = (1.0 - (__pyx_v_coord[1]));
+
+  /* "yt/utilities/lib/element_mappings.pyx":900
+ *         rp = 1.0 + coord[0]
+ *         sm = 1.0 - coord[1]
+ *         sp = 1.0 + coord[1]             # <<<<<<<<<<<<<<
+ * 
+ *         F = vals[0]*rm*sm + vals[1]*rp*sm + vals[2]*rp*sp + vals[3]*rm*sp
+ */
+  __pyx_v_sp = (1.0 + (__pyx_v_coord[1]));
+
+  /* "yt/utilities/lib/element_mappings.pyx":902
+ *         sp = 1.0 + coord[1]
+ * 
+ *         F = vals[0]*rm*sm + vals[1]*rp*sm + vals[2]*rp*sp + vals[3]*rm*sp             # <<<<<<<<<<<<<<
+ *         return 0.25*F
+ * 
+ */
+  __pyx_v_F = ((((((__pyx_v_vals[0]) * __pyx_v_rm) * __pyx_v_sm) + (((__pyx_v_vals[1]) * __pyx_v_rp) * __pyx_v_sm)) + (((__pyx_v_vals[2]) * __pyx_v_rp) * __pyx_v_sp)) + (((__pyx_v_vals[3]) * __pyx_v_rm) * __pyx_v_sp));
+
+  /* "yt/utilities/lib/element_mappings.pyx":903
+ * 
+ *         F = vals[0]*rm*sm + vals[1]*rp*sm + vals[2]*rp*sp + vals[3]*rm*sp
+ *         return 0.25*F             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_r = (0.25 * __pyx_v_F);
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":894
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef double sample_at_unit_point(self, double* coord, double* vals) nogil:             # <<<<<<<<<<<<<<
+ *         cdef double F, rm, rp, sm, sp
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":908
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         # for quads, we check whether the mapped_coord is between
+ *         # -1 and 1 in both directions.
+ */
+
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11Q1Sampler2D_check_inside(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D *__pyx_v_self, double *__pyx_v_mapped_coord) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "yt/utilities/lib/element_mappings.pyx":911
+ *         # for quads, we check whether the mapped_coord is between
+ *         # -1 and 1 in both directions.
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol or             # <<<<<<<<<<<<<<
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol):
+ *             return 0
+ */
+  __pyx_t_2 = (((fabs((__pyx_v_mapped_coord[0])) - 1.0) > __pyx_v_self->__pyx_base.__pyx_base.inclusion_tol) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":912
+ *         # -1 and 1 in both directions.
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol or
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol):             # <<<<<<<<<<<<<<
+ *             return 0
+ *         return 1
+ */
+  __pyx_t_2 = (((fabs((__pyx_v_mapped_coord[1])) - 1.0) > __pyx_v_self->__pyx_base.__pyx_base.inclusion_tol) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+
+  /* "yt/utilities/lib/element_mappings.pyx":911
+ *         # for quads, we check whether the mapped_coord is between
+ *         # -1 and 1 in both directions.
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol or             # <<<<<<<<<<<<<<
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol):
+ *             return 0
+ */
+  if (__pyx_t_1) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":913
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol or
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol):
+ *             return 0             # <<<<<<<<<<<<<<
+ *         return 1
+ * 
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "yt/utilities/lib/element_mappings.pyx":911
+ *         # for quads, we check whether the mapped_coord is between
+ *         # -1 and 1 in both directions.
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol or             # <<<<<<<<<<<<<<
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol):
+ *             return 0
+ */
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":914
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol):
+ *             return 0
+ *         return 1             # <<<<<<<<<<<<<<
+ * 
+ * cdef class Q2Sampler2D(NonlinearSolveSampler2D):
+ */
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":908
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         # for quads, we check whether the mapped_coord is between
+ *         # -1 and 1 in both directions.
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q1Sampler2D_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q1Sampler2D_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q1Sampler2D_2__reduce_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q1Sampler2D_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.Q1Sampler2D.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q1Sampler2D_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q1Sampler2D_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q1Sampler2D_4__setstate_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q1Sampler2D_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.Q1Sampler2D.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":924
+ *     '''
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         super(Q2Sampler2D, self).__init__()
+ *         self.num_mapped_coords = 2
+ */
+
+/* Python wrapper */
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q2Sampler2D_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q2Sampler2D_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
+    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
+  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q2Sampler2D___init__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q2Sampler2D___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "yt/utilities/lib/element_mappings.pyx":925
+ * 
+ *     def __init__(self):
+ *         super(Q2Sampler2D, self).__init__()             # <<<<<<<<<<<<<<
+ *         self.num_mapped_coords = 2
+ *         self.dim = 2
+ */
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 925, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D));
+  __Pyx_GIVEREF(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D));
+  __Pyx_INCREF(((PyObject *)__pyx_v_self));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self));
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 925, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 925, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 925, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":926
+ *     def __init__(self):
+ *         super(Q2Sampler2D, self).__init__()
+ *         self.num_mapped_coords = 2             # <<<<<<<<<<<<<<
+ *         self.dim = 2
+ *         self.func = Q2Function2D
+ */
+  __pyx_v_self->__pyx_base.__pyx_base.num_mapped_coords = 2;
+
+  /* "yt/utilities/lib/element_mappings.pyx":927
+ *         super(Q2Sampler2D, self).__init__()
+ *         self.num_mapped_coords = 2
+ *         self.dim = 2             # <<<<<<<<<<<<<<
+ *         self.func = Q2Function2D
+ *         self.jac = Q2Jacobian2D
+ */
+  __pyx_v_self->__pyx_base.dim = 2;
+
+  /* "yt/utilities/lib/element_mappings.pyx":928
+ *         self.num_mapped_coords = 2
+ *         self.dim = 2
+ *         self.func = Q2Function2D             # <<<<<<<<<<<<<<
+ *         self.jac = Q2Jacobian2D
+ * 
+ */
+  __pyx_v_self->__pyx_base.func = __pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_Q2Function2D;
+
+  /* "yt/utilities/lib/element_mappings.pyx":929
+ *         self.dim = 2
+ *         self.func = Q2Function2D
+ *         self.jac = Q2Jacobian2D             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_v_self->__pyx_base.jac = __pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_Q2Jacobian2D;
+
+  /* "yt/utilities/lib/element_mappings.pyx":924
+ *     '''
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         super(Q2Sampler2D, self).__init__()
+ *         self.num_mapped_coords = 2
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.Q2Sampler2D.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":934
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef double sample_at_unit_point(self, double* coord, double* vals) nogil:             # <<<<<<<<<<<<<<
+ *         cdef double F, rm, rp, sm, sp
+ *         cdef double[9] phi
+ */
+
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_11Q2Sampler2D_sample_at_unit_point(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D *__pyx_v_self, double *__pyx_v_coord, double *__pyx_v_vals) {
+  double __pyx_v_phi[9];
+  double __pyx_v_rv;
+  double __pyx_v_zet;
+  double __pyx_v_eta;
+  double __pyx_v_zetm;
+  double __pyx_v_zetp;
+  double __pyx_v_etam;
+  double __pyx_v_etap;
+  long __pyx_v_i;
+  double __pyx_r;
+  long __pyx_t_1;
+
+  /* "yt/utilities/lib/element_mappings.pyx":937
+ *         cdef double F, rm, rp, sm, sp
+ *         cdef double[9] phi
+ *         cdef double rv = 0             # <<<<<<<<<<<<<<
+ * 
+ *         zet = coord[0]
+ */
+  __pyx_v_rv = 0.0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":939
+ *         cdef double rv = 0
+ * 
+ *         zet = coord[0]             # <<<<<<<<<<<<<<
+ *         eta = coord[1]
+ *         zetm = coord[0] - 1.
+ */
+  __pyx_v_zet = (__pyx_v_coord[0]);
+
+  /* "yt/utilities/lib/element_mappings.pyx":940
+ * 
+ *         zet = coord[0]
+ *         eta = coord[1]             # <<<<<<<<<<<<<<
+ *         zetm = coord[0] - 1.
+ *         zetp = coord[0] + 1.
+ */
+  __pyx_v_eta = (__pyx_v_coord[1]);
+
+  /* "yt/utilities/lib/element_mappings.pyx":941
+ *         zet = coord[0]
+ *         eta = coord[1]
+ *         zetm = coord[0] - 1.             # <<<<<<<<<<<<<<
+ *         zetp = coord[0] + 1.
+ *         etam = coord[1] - 1.
+ */
+  __pyx_v_zetm = ((__pyx_v_coord[0]) - 1.);
+
+  /* "yt/utilities/lib/element_mappings.pyx":942
+ *         eta = coord[1]
+ *         zetm = coord[0] - 1.
+ *         zetp = coord[0] + 1.             # <<<<<<<<<<<<<<
+ *         etam = coord[1] - 1.
+ *         etap = coord[1] + 1.
+ */
+  __pyx_v_zetp = ((__pyx_v_coord[0]) + 1.);
+
+  /* "yt/utilities/lib/element_mappings.pyx":943
+ *         zetm = coord[0] - 1.
+ *         zetp = coord[0] + 1.
+ *         etam = coord[1] - 1.             # <<<<<<<<<<<<<<
+ *         etap = coord[1] + 1.
+ * 
+ */
+  __pyx_v_etam = ((__pyx_v_coord[1]) - 1.);
+
+  /* "yt/utilities/lib/element_mappings.pyx":944
+ *         zetp = coord[0] + 1.
+ *         etam = coord[1] - 1.
+ *         etap = coord[1] + 1.             # <<<<<<<<<<<<<<
+ * 
+ *         phi[0] = zet * zetm * eta * etam / 4.
+ */
+  __pyx_v_etap = ((__pyx_v_coord[1]) + 1.);
+
+  /* "yt/utilities/lib/element_mappings.pyx":946
+ *         etap = coord[1] + 1.
+ * 
+ *         phi[0] = zet * zetm * eta * etam / 4.             # <<<<<<<<<<<<<<
+ *         phi[1] = zet * zetp * eta * etam / 4.
+ *         phi[2] = zet * zetp * eta * etap / 4.
+ */
+  (__pyx_v_phi[0]) = ((((__pyx_v_zet * __pyx_v_zetm) * __pyx_v_eta) * __pyx_v_etam) / 4.);
+
+  /* "yt/utilities/lib/element_mappings.pyx":947
+ * 
+ *         phi[0] = zet * zetm * eta * etam / 4.
+ *         phi[1] = zet * zetp * eta * etam / 4.             # <<<<<<<<<<<<<<
+ *         phi[2] = zet * zetp * eta * etap / 4.
+ *         phi[3] = zet * zetm * eta * etap / 4.
+ */
+  (__pyx_v_phi[1]) = ((((__pyx_v_zet * __pyx_v_zetp) * __pyx_v_eta) * __pyx_v_etam) / 4.);
+
+  /* "yt/utilities/lib/element_mappings.pyx":948
+ *         phi[0] = zet * zetm * eta * etam / 4.
+ *         phi[1] = zet * zetp * eta * etam / 4.
+ *         phi[2] = zet * zetp * eta * etap / 4.             # <<<<<<<<<<<<<<
+ *         phi[3] = zet * zetm * eta * etap / 4.
+ *         phi[4] = zetp * zetm * eta * etam / -2.
+ */
+  (__pyx_v_phi[2]) = ((((__pyx_v_zet * __pyx_v_zetp) * __pyx_v_eta) * __pyx_v_etap) / 4.);
+
+  /* "yt/utilities/lib/element_mappings.pyx":949
+ *         phi[1] = zet * zetp * eta * etam / 4.
+ *         phi[2] = zet * zetp * eta * etap / 4.
+ *         phi[3] = zet * zetm * eta * etap / 4.             # <<<<<<<<<<<<<<
+ *         phi[4] = zetp * zetm * eta * etam / -2.
+ *         phi[5] = zet * zetp * etap * etam / -2.
+ */
+  (__pyx_v_phi[3]) = ((((__pyx_v_zet * __pyx_v_zetm) * __pyx_v_eta) * __pyx_v_etap) / 4.);
+
+  /* "yt/utilities/lib/element_mappings.pyx":950
+ *         phi[2] = zet * zetp * eta * etap / 4.
+ *         phi[3] = zet * zetm * eta * etap / 4.
+ *         phi[4] = zetp * zetm * eta * etam / -2.             # <<<<<<<<<<<<<<
+ *         phi[5] = zet * zetp * etap * etam / -2.
+ *         phi[6] = zetp * zetm * eta * etap / -2.
+ */
+  (__pyx_v_phi[4]) = ((((__pyx_v_zetp * __pyx_v_zetm) * __pyx_v_eta) * __pyx_v_etam) / -2.);
+
+  /* "yt/utilities/lib/element_mappings.pyx":951
+ *         phi[3] = zet * zetm * eta * etap / 4.
+ *         phi[4] = zetp * zetm * eta * etam / -2.
+ *         phi[5] = zet * zetp * etap * etam / -2.             # <<<<<<<<<<<<<<
+ *         phi[6] = zetp * zetm * eta * etap / -2.
+ *         phi[7] = zet * zetm * etap * etam / -2.
+ */
+  (__pyx_v_phi[5]) = ((((__pyx_v_zet * __pyx_v_zetp) * __pyx_v_etap) * __pyx_v_etam) / -2.);
+
+  /* "yt/utilities/lib/element_mappings.pyx":952
+ *         phi[4] = zetp * zetm * eta * etam / -2.
+ *         phi[5] = zet * zetp * etap * etam / -2.
+ *         phi[6] = zetp * zetm * eta * etap / -2.             # <<<<<<<<<<<<<<
+ *         phi[7] = zet * zetm * etap * etam / -2.
+ *         phi[8] = zetp * zetm * etap * etam
+ */
+  (__pyx_v_phi[6]) = ((((__pyx_v_zetp * __pyx_v_zetm) * __pyx_v_eta) * __pyx_v_etap) / -2.);
+
+  /* "yt/utilities/lib/element_mappings.pyx":953
+ *         phi[5] = zet * zetp * etap * etam / -2.
+ *         phi[6] = zetp * zetm * eta * etap / -2.
+ *         phi[7] = zet * zetm * etap * etam / -2.             # <<<<<<<<<<<<<<
+ *         phi[8] = zetp * zetm * etap * etam
+ * 
+ */
+  (__pyx_v_phi[7]) = ((((__pyx_v_zet * __pyx_v_zetm) * __pyx_v_etap) * __pyx_v_etam) / -2.);
+
+  /* "yt/utilities/lib/element_mappings.pyx":954
+ *         phi[6] = zetp * zetm * eta * etap / -2.
+ *         phi[7] = zet * zetm * etap * etam / -2.
+ *         phi[8] = zetp * zetm * etap * etam             # <<<<<<<<<<<<<<
+ * 
+ *         for i in range(9):
+ */
+  (__pyx_v_phi[8]) = (((__pyx_v_zetp * __pyx_v_zetm) * __pyx_v_etap) * __pyx_v_etam);
+
+  /* "yt/utilities/lib/element_mappings.pyx":956
+ *         phi[8] = zetp * zetm * etap * etam
+ * 
+ *         for i in range(9):             # <<<<<<<<<<<<<<
+ *             rv += vals[i] * phi[i]
+ * 
+ */
+  for (__pyx_t_1 = 0; __pyx_t_1 < 9; __pyx_t_1+=1) {
+    __pyx_v_i = __pyx_t_1;
+
+    /* "yt/utilities/lib/element_mappings.pyx":957
+ * 
+ *         for i in range(9):
+ *             rv += vals[i] * phi[i]             # <<<<<<<<<<<<<<
+ * 
+ *         return rv
+ */
+    __pyx_v_rv = (__pyx_v_rv + ((__pyx_v_vals[__pyx_v_i]) * (__pyx_v_phi[__pyx_v_i])));
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":959
+ *             rv += vals[i] * phi[i]
+ * 
+ *         return rv             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_r = __pyx_v_rv;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":934
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef double sample_at_unit_point(self, double* coord, double* vals) nogil:             # <<<<<<<<<<<<<<
+ *         cdef double F, rm, rp, sm, sp
+ *         cdef double[9] phi
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":964
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         # for quads, we check whether the mapped_coord is between
+ *         # -1 and 1 in both directions.
+ */
+
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11Q2Sampler2D_check_inside(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D *__pyx_v_self, double *__pyx_v_mapped_coord) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "yt/utilities/lib/element_mappings.pyx":967
+ *         # for quads, we check whether the mapped_coord is between
+ *         # -1 and 1 in both directions.
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol or             # <<<<<<<<<<<<<<
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol):
+ *             return 0
+ */
+  __pyx_t_2 = (((fabs((__pyx_v_mapped_coord[0])) - 1.0) > __pyx_v_self->__pyx_base.__pyx_base.inclusion_tol) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":968
+ *         # -1 and 1 in both directions.
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol or
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol):             # <<<<<<<<<<<<<<
+ *             return 0
+ *         return 1
+ */
+  __pyx_t_2 = (((fabs((__pyx_v_mapped_coord[1])) - 1.0) > __pyx_v_self->__pyx_base.__pyx_base.inclusion_tol) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+
+  /* "yt/utilities/lib/element_mappings.pyx":967
+ *         # for quads, we check whether the mapped_coord is between
+ *         # -1 and 1 in both directions.
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol or             # <<<<<<<<<<<<<<
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol):
+ *             return 0
+ */
+  if (__pyx_t_1) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":969
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol or
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol):
+ *             return 0             # <<<<<<<<<<<<<<
+ *         return 1
+ * 
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "yt/utilities/lib/element_mappings.pyx":967
+ *         # for quads, we check whether the mapped_coord is between
+ *         # -1 and 1 in both directions.
+ *         if (fabs(mapped_coord[0]) - 1.0 > self.inclusion_tol or             # <<<<<<<<<<<<<<
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol):
+ *             return 0
+ */
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":970
+ *             fabs(mapped_coord[1]) - 1.0 > self.inclusion_tol):
+ *             return 0
+ *         return 1             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":964
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         # for quads, we check whether the mapped_coord is between
+ *         # -1 and 1 in both directions.
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q2Sampler2D_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q2Sampler2D_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q2Sampler2D_2__reduce_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q2Sampler2D_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.Q2Sampler2D.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q2Sampler2D_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q2Sampler2D_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q2Sampler2D_4__setstate_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11Q2Sampler2D_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__14, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.Q2Sampler2D.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":982
+ *     '''
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         super(T2Sampler2D, self).__init__()
+ *         self.num_mapped_coords = 2
+ */
+
+/* Python wrapper */
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_11T2Sampler2D_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_11T2Sampler2D_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
+    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
+  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11T2Sampler2D___init__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_T2Sampler2D *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_11T2Sampler2D___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_T2Sampler2D *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "yt/utilities/lib/element_mappings.pyx":983
+ * 
+ *     def __init__(self):
+ *         super(T2Sampler2D, self).__init__()             # <<<<<<<<<<<<<<
+ *         self.num_mapped_coords = 2
+ *         self.dim = 2
+ */
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 983, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_T2Sampler2D));
+  __Pyx_GIVEREF(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_T2Sampler2D));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_T2Sampler2D));
+  __Pyx_INCREF(((PyObject *)__pyx_v_self));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self));
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 983, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 983, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 983, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":984
+ *     def __init__(self):
+ *         super(T2Sampler2D, self).__init__()
+ *         self.num_mapped_coords = 2             # <<<<<<<<<<<<<<
+ *         self.dim = 2
+ *         self.func = T2Function2D
+ */
+  __pyx_v_self->__pyx_base.__pyx_base.num_mapped_coords = 2;
+
+  /* "yt/utilities/lib/element_mappings.pyx":985
+ *         super(T2Sampler2D, self).__init__()
+ *         self.num_mapped_coords = 2
+ *         self.dim = 2             # <<<<<<<<<<<<<<
+ *         self.func = T2Function2D
+ *         self.jac = T2Jacobian2D
+ */
+  __pyx_v_self->__pyx_base.dim = 2;
+
+  /* "yt/utilities/lib/element_mappings.pyx":986
+ *         self.num_mapped_coords = 2
+ *         self.dim = 2
+ *         self.func = T2Function2D             # <<<<<<<<<<<<<<
+ *         self.jac = T2Jacobian2D
+ * 
+ */
+  __pyx_v_self->__pyx_base.func = __pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_T2Function2D;
+
+  /* "yt/utilities/lib/element_mappings.pyx":987
+ *         self.dim = 2
+ *         self.func = T2Function2D
+ *         self.jac = T2Jacobian2D             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_v_self->__pyx_base.jac = __pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_T2Jacobian2D;
+
+  /* "yt/utilities/lib/element_mappings.pyx":982
+ *     '''
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         super(T2Sampler2D, self).__init__()
+ *         self.num_mapped_coords = 2
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.T2Sampler2D.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":992
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef double sample_at_unit_point(self, double* coord, double* vals) nogil:             # <<<<<<<<<<<<<<
+ *         cdef double phi0, phi1, phi2, phi3, phi4, phi5, c0sq, c1sq, c0c1
+ * 
+ */
+
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_11T2Sampler2D_sample_at_unit_point(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_T2Sampler2D *__pyx_v_self, double *__pyx_v_coord, double *__pyx_v_vals) {
+  double __pyx_v_phi0;
+  double __pyx_v_phi1;
+  double __pyx_v_phi2;
+  double __pyx_v_phi3;
+  double __pyx_v_phi4;
+  double __pyx_v_phi5;
+  double __pyx_v_c0sq;
+  double __pyx_v_c1sq;
+  double __pyx_v_c0c1;
+  double __pyx_r;
+
+  /* "yt/utilities/lib/element_mappings.pyx":995
+ *         cdef double phi0, phi1, phi2, phi3, phi4, phi5, c0sq, c1sq, c0c1
+ * 
+ *         c0sq = coord[0] * coord[0]             # <<<<<<<<<<<<<<
+ *         c1sq = coord[1] * coord[1]
+ *         c0c1 = coord[0] * coord[1]
+ */
+  __pyx_v_c0sq = ((__pyx_v_coord[0]) * (__pyx_v_coord[0]));
+
+  /* "yt/utilities/lib/element_mappings.pyx":996
+ * 
+ *         c0sq = coord[0] * coord[0]
+ *         c1sq = coord[1] * coord[1]             # <<<<<<<<<<<<<<
+ *         c0c1 = coord[0] * coord[1]
+ * 
+ */
+  __pyx_v_c1sq = ((__pyx_v_coord[1]) * (__pyx_v_coord[1]));
+
+  /* "yt/utilities/lib/element_mappings.pyx":997
+ *         c0sq = coord[0] * coord[0]
+ *         c1sq = coord[1] * coord[1]
+ *         c0c1 = coord[0] * coord[1]             # <<<<<<<<<<<<<<
+ * 
+ *         phi0 = 1 - 3 * coord[0] + 2 * c0sq - 3 * coord[1] + \
+ */
+  __pyx_v_c0c1 = ((__pyx_v_coord[0]) * (__pyx_v_coord[1]));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1000
+ * 
+ *         phi0 = 1 - 3 * coord[0] + 2 * c0sq - 3 * coord[1] + \
+ *                2 * c1sq + 4 * c0c1             # <<<<<<<<<<<<<<
+ *         phi1 = -coord[0] + 2 * c0sq
+ *         phi2 = -coord[1] + 2 * c1sq
+ */
+  __pyx_v_phi0 = (((((1.0 - (3.0 * (__pyx_v_coord[0]))) + (2.0 * __pyx_v_c0sq)) - (3.0 * (__pyx_v_coord[1]))) + (2.0 * __pyx_v_c1sq)) + (4.0 * __pyx_v_c0c1));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1001
+ *         phi0 = 1 - 3 * coord[0] + 2 * c0sq - 3 * coord[1] + \
+ *                2 * c1sq + 4 * c0c1
+ *         phi1 = -coord[0] + 2 * c0sq             # <<<<<<<<<<<<<<
+ *         phi2 = -coord[1] + 2 * c1sq
+ *         phi3 = 4 * coord[0] - 4 * c0sq - 4 * c0c1
+ */
+  __pyx_v_phi1 = ((-(__pyx_v_coord[0])) + (2.0 * __pyx_v_c0sq));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1002
+ *                2 * c1sq + 4 * c0c1
+ *         phi1 = -coord[0] + 2 * c0sq
+ *         phi2 = -coord[1] + 2 * c1sq             # <<<<<<<<<<<<<<
+ *         phi3 = 4 * coord[0] - 4 * c0sq - 4 * c0c1
+ *         phi4 = 4 * c0c1
+ */
+  __pyx_v_phi2 = ((-(__pyx_v_coord[1])) + (2.0 * __pyx_v_c1sq));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1003
+ *         phi1 = -coord[0] + 2 * c0sq
+ *         phi2 = -coord[1] + 2 * c1sq
+ *         phi3 = 4 * coord[0] - 4 * c0sq - 4 * c0c1             # <<<<<<<<<<<<<<
+ *         phi4 = 4 * c0c1
+ *         phi5 = 4 * coord[1] - 4 * c1sq - 4 * c0c1
+ */
+  __pyx_v_phi3 = (((4.0 * (__pyx_v_coord[0])) - (4.0 * __pyx_v_c0sq)) - (4.0 * __pyx_v_c0c1));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1004
+ *         phi2 = -coord[1] + 2 * c1sq
+ *         phi3 = 4 * coord[0] - 4 * c0sq - 4 * c0c1
+ *         phi4 = 4 * c0c1             # <<<<<<<<<<<<<<
+ *         phi5 = 4 * coord[1] - 4 * c1sq - 4 * c0c1
+ * 
+ */
+  __pyx_v_phi4 = (4.0 * __pyx_v_c0c1);
+
+  /* "yt/utilities/lib/element_mappings.pyx":1005
+ *         phi3 = 4 * coord[0] - 4 * c0sq - 4 * c0c1
+ *         phi4 = 4 * c0c1
+ *         phi5 = 4 * coord[1] - 4 * c1sq - 4 * c0c1             # <<<<<<<<<<<<<<
+ * 
+ *         return vals[0]*phi0 + vals[1]*phi1 + vals[2]*phi2 + vals[3]*phi3 + \
+ */
+  __pyx_v_phi5 = (((4.0 * (__pyx_v_coord[1])) - (4.0 * __pyx_v_c1sq)) - (4.0 * __pyx_v_c0c1));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1008
+ * 
+ *         return vals[0]*phi0 + vals[1]*phi1 + vals[2]*phi2 + vals[3]*phi3 + \
+ *                vals[4]*phi4 + vals[5]*phi5             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_r = (((((((__pyx_v_vals[0]) * __pyx_v_phi0) + ((__pyx_v_vals[1]) * __pyx_v_phi1)) + ((__pyx_v_vals[2]) * __pyx_v_phi2)) + ((__pyx_v_vals[3]) * __pyx_v_phi3)) + ((__pyx_v_vals[4]) * __pyx_v_phi4)) + ((__pyx_v_vals[5]) * __pyx_v_phi5));
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":992
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef double sample_at_unit_point(self, double* coord, double* vals) nogil:             # <<<<<<<<<<<<<<
+ *         cdef double phi0, phi1, phi2, phi3, phi4, phi5, c0sq, c1sq, c0c1
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":1013
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         # for canonical tris, we check whether the mapped_coords are between
+ *         # 0 and 1.
+ */
+
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_11T2Sampler2D_check_inside(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_T2Sampler2D *__pyx_v_self, double *__pyx_v_mapped_coord) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1016
+ *         # for canonical tris, we check whether the mapped_coords are between
+ *         # 0 and 1.
+ *         if (mapped_coord[0] < -self.inclusion_tol or \             # <<<<<<<<<<<<<<
+ *             mapped_coord[1] < -self.inclusion_tol or \
+ *             mapped_coord[0] + mapped_coord[1] - 1.0 > self.inclusion_tol):
+ */
+  __pyx_t_2 = (((__pyx_v_mapped_coord[0]) < (-__pyx_v_self->__pyx_base.__pyx_base.inclusion_tol)) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":1017
+ *         # 0 and 1.
+ *         if (mapped_coord[0] < -self.inclusion_tol or \
+ *             mapped_coord[1] < -self.inclusion_tol or \             # <<<<<<<<<<<<<<
+ *             mapped_coord[0] + mapped_coord[1] - 1.0 > self.inclusion_tol):
+ *             return 0
+ */
+  __pyx_t_2 = (((__pyx_v_mapped_coord[1]) < (-__pyx_v_self->__pyx_base.__pyx_base.inclusion_tol)) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":1018
+ *         if (mapped_coord[0] < -self.inclusion_tol or \
+ *             mapped_coord[1] < -self.inclusion_tol or \
+ *             mapped_coord[0] + mapped_coord[1] - 1.0 > self.inclusion_tol):             # <<<<<<<<<<<<<<
+ *             return 0
+ *         return 1
+ */
+  __pyx_t_2 = (((((__pyx_v_mapped_coord[0]) + (__pyx_v_mapped_coord[1])) - 1.0) > __pyx_v_self->__pyx_base.__pyx_base.inclusion_tol) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1016
+ *         # for canonical tris, we check whether the mapped_coords are between
+ *         # 0 and 1.
+ *         if (mapped_coord[0] < -self.inclusion_tol or \             # <<<<<<<<<<<<<<
+ *             mapped_coord[1] < -self.inclusion_tol or \
+ *             mapped_coord[0] + mapped_coord[1] - 1.0 > self.inclusion_tol):
+ */
+  if (__pyx_t_1) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":1019
+ *             mapped_coord[1] < -self.inclusion_tol or \
+ *             mapped_coord[0] + mapped_coord[1] - 1.0 > self.inclusion_tol):
+ *             return 0             # <<<<<<<<<<<<<<
+ *         return 1
+ * 
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "yt/utilities/lib/element_mappings.pyx":1016
+ *         # for canonical tris, we check whether the mapped_coords are between
+ *         # 0 and 1.
+ *         if (mapped_coord[0] < -self.inclusion_tol or \             # <<<<<<<<<<<<<<
+ *             mapped_coord[1] < -self.inclusion_tol or \
+ *             mapped_coord[0] + mapped_coord[1] - 1.0 > self.inclusion_tol):
+ */
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":1020
+ *             mapped_coord[0] + mapped_coord[1] - 1.0 > self.inclusion_tol):
+ *             return 0
+ *         return 1             # <<<<<<<<<<<<<<
+ * 
+ * cdef class Tet2Sampler3D(NonlinearSolveSampler3D):
+ */
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1013
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         # for canonical tris, we check whether the mapped_coords are between
+ *         # 0 and 1.
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11T2Sampler2D_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11T2Sampler2D_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11T2Sampler2D_2__reduce_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_T2Sampler2D *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11T2Sampler2D_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_T2Sampler2D *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.T2Sampler2D.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11T2Sampler2D_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11T2Sampler2D_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_11T2Sampler2D_4__setstate_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_T2Sampler2D *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_11T2Sampler2D_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_T2Sampler2D *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__16, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.T2Sampler2D.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":1031
+ *     '''
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         super(Tet2Sampler3D, self).__init__()
+ *         self.num_mapped_coords = 3
+ */
+
+/* Python wrapper */
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
+    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
+  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D___init__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D___init__(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "yt/utilities/lib/element_mappings.pyx":1032
+ * 
+ *     def __init__(self):
+ *         super(Tet2Sampler3D, self).__init__()             # <<<<<<<<<<<<<<
+ *         self.num_mapped_coords = 3
+ *         self.dim = 3
+ */
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1032, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D));
+  __Pyx_GIVEREF(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D));
+  __Pyx_INCREF(((PyObject *)__pyx_v_self));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self));
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 1032, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1032, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1032, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1033
+ *     def __init__(self):
+ *         super(Tet2Sampler3D, self).__init__()
+ *         self.num_mapped_coords = 3             # <<<<<<<<<<<<<<
+ *         self.dim = 3
+ *         self.func = Tet2Function3D
+ */
+  __pyx_v_self->__pyx_base.__pyx_base.num_mapped_coords = 3;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1034
+ *         super(Tet2Sampler3D, self).__init__()
+ *         self.num_mapped_coords = 3
+ *         self.dim = 3             # <<<<<<<<<<<<<<
+ *         self.func = Tet2Function3D
+ *         self.jac = Tet2Jacobian3D
+ */
+  __pyx_v_self->__pyx_base.dim = 3;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1035
+ *         self.num_mapped_coords = 3
+ *         self.dim = 3
+ *         self.func = Tet2Function3D             # <<<<<<<<<<<<<<
+ *         self.jac = Tet2Jacobian3D
+ * 
+ */
+  __pyx_v_self->__pyx_base.func = __pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_Tet2Function3D;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1036
+ *         self.dim = 3
+ *         self.func = Tet2Function3D
+ *         self.jac = Tet2Jacobian3D             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_v_self->__pyx_base.jac = __pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_Tet2Jacobian3D;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1031
+ *     '''
+ * 
+ *     def __init__(self):             # <<<<<<<<<<<<<<
+ *         super(Tet2Sampler3D, self).__init__()
+ *         self.num_mapped_coords = 3
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.Tet2Sampler3D.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":1041
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef double sample_at_unit_point(self, double* coord, double* vals) nogil:             # <<<<<<<<<<<<<<
+ *         cdef double[10] phi
+ *         cdef double coordsq[3]
+ */
+
+static double __pyx_f_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D_sample_at_unit_point(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D *__pyx_v_self, double *__pyx_v_coord, double *__pyx_v_vals) {
+  double __pyx_v_phi[10];
+  double __pyx_v_coordsq[3];
+  int __pyx_v_i;
+  double __pyx_v_return_value;
+  double __pyx_r;
+  int __pyx_t_1;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1045
+ *         cdef double coordsq[3]
+ *         cdef int i
+ *         cdef double return_value = 0             # <<<<<<<<<<<<<<
+ * 
+ *         for i in range(3):
+ */
+  __pyx_v_return_value = 0.0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1047
+ *         cdef double return_value = 0
+ * 
+ *         for i in range(3):             # <<<<<<<<<<<<<<
+ *             coordsq[i] = coord[i] * coord[i]
+ * 
+ */
+  for (__pyx_t_1 = 0; __pyx_t_1 < 3; __pyx_t_1+=1) {
+    __pyx_v_i = __pyx_t_1;
+
+    /* "yt/utilities/lib/element_mappings.pyx":1048
+ * 
+ *         for i in range(3):
+ *             coordsq[i] = coord[i] * coord[i]             # <<<<<<<<<<<<<<
+ * 
+ *         phi[0] = 1 - 3 * coord[0] + 2 * coordsq[0] - 3 * coord[1] + \
+ */
+    (__pyx_v_coordsq[__pyx_v_i]) = ((__pyx_v_coord[__pyx_v_i]) * (__pyx_v_coord[__pyx_v_i]));
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":1050
+ *             coordsq[i] = coord[i] * coord[i]
+ * 
+ *         phi[0] = 1 - 3 * coord[0] + 2 * coordsq[0] - 3 * coord[1] + \             # <<<<<<<<<<<<<<
+ *                  2 * coordsq[1] - 3 * coord[2] + 2 * coordsq[2] + \
+ *                  4 * coord[0] * coord[1] + 4 * coord[0] * coord[2] + \
+ */
+  (__pyx_v_phi[0]) = (((((((((1.0 - (3.0 * (__pyx_v_coord[0]))) + (2.0 * (__pyx_v_coordsq[0]))) - (3.0 * (__pyx_v_coord[1]))) + (2.0 * (__pyx_v_coordsq[1]))) - (3.0 * (__pyx_v_coord[2]))) + (2.0 * (__pyx_v_coordsq[2]))) + ((4.0 * (__pyx_v_coord[0])) * (__pyx_v_coord[1]))) + ((4.0 * (__pyx_v_coord[0])) * (__pyx_v_coord[2]))) + ((4.0 * (__pyx_v_coord[1])) * (__pyx_v_coord[2])));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1054
+ *                  4 * coord[0] * coord[1] + 4 * coord[0] * coord[2] + \
+ *                  4 * coord[1] * coord[2]
+ *         phi[1] = -coord[0] + 2 * coordsq[0]             # <<<<<<<<<<<<<<
+ *         phi[2] = -coord[1] + 2 * coordsq[1]
+ *         phi[3] = -coord[2] + 2 * coordsq[2]
+ */
+  (__pyx_v_phi[1]) = ((-(__pyx_v_coord[0])) + (2.0 * (__pyx_v_coordsq[0])));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1055
+ *                  4 * coord[1] * coord[2]
+ *         phi[1] = -coord[0] + 2 * coordsq[0]
+ *         phi[2] = -coord[1] + 2 * coordsq[1]             # <<<<<<<<<<<<<<
+ *         phi[3] = -coord[2] + 2 * coordsq[2]
+ *         phi[4] = 4 * coord[0] - 4 * coordsq[0] - 4 * coord[0] * coord[1] - \
+ */
+  (__pyx_v_phi[2]) = ((-(__pyx_v_coord[1])) + (2.0 * (__pyx_v_coordsq[1])));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1056
+ *         phi[1] = -coord[0] + 2 * coordsq[0]
+ *         phi[2] = -coord[1] + 2 * coordsq[1]
+ *         phi[3] = -coord[2] + 2 * coordsq[2]             # <<<<<<<<<<<<<<
+ *         phi[4] = 4 * coord[0] - 4 * coordsq[0] - 4 * coord[0] * coord[1] - \
+ *                  4 * coord[0] * coord[2]
+ */
+  (__pyx_v_phi[3]) = ((-(__pyx_v_coord[2])) + (2.0 * (__pyx_v_coordsq[2])));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1057
+ *         phi[2] = -coord[1] + 2 * coordsq[1]
+ *         phi[3] = -coord[2] + 2 * coordsq[2]
+ *         phi[4] = 4 * coord[0] - 4 * coordsq[0] - 4 * coord[0] * coord[1] - \             # <<<<<<<<<<<<<<
+ *                  4 * coord[0] * coord[2]
+ *         phi[5] = 4 * coord[0] * coord[1]
+ */
+  (__pyx_v_phi[4]) = ((((4.0 * (__pyx_v_coord[0])) - (4.0 * (__pyx_v_coordsq[0]))) - ((4.0 * (__pyx_v_coord[0])) * (__pyx_v_coord[1]))) - ((4.0 * (__pyx_v_coord[0])) * (__pyx_v_coord[2])));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1059
+ *         phi[4] = 4 * coord[0] - 4 * coordsq[0] - 4 * coord[0] * coord[1] - \
+ *                  4 * coord[0] * coord[2]
+ *         phi[5] = 4 * coord[0] * coord[1]             # <<<<<<<<<<<<<<
+ *         phi[6] = 4 * coord[1] - 4 * coordsq[1] - 4 * coord[0] * coord[1] - \
+ *                  4 * coord[1] * coord[2]
+ */
+  (__pyx_v_phi[5]) = ((4.0 * (__pyx_v_coord[0])) * (__pyx_v_coord[1]));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1060
+ *                  4 * coord[0] * coord[2]
+ *         phi[5] = 4 * coord[0] * coord[1]
+ *         phi[6] = 4 * coord[1] - 4 * coordsq[1] - 4 * coord[0] * coord[1] - \             # <<<<<<<<<<<<<<
+ *                  4 * coord[1] * coord[2]
+ *         phi[7] = 4 * coord[2] - 4 * coordsq[2] - 4 * coord[2] * coord[0] - \
+ */
+  (__pyx_v_phi[6]) = ((((4.0 * (__pyx_v_coord[1])) - (4.0 * (__pyx_v_coordsq[1]))) - ((4.0 * (__pyx_v_coord[0])) * (__pyx_v_coord[1]))) - ((4.0 * (__pyx_v_coord[1])) * (__pyx_v_coord[2])));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1062
+ *         phi[6] = 4 * coord[1] - 4 * coordsq[1] - 4 * coord[0] * coord[1] - \
+ *                  4 * coord[1] * coord[2]
+ *         phi[7] = 4 * coord[2] - 4 * coordsq[2] - 4 * coord[2] * coord[0] - \             # <<<<<<<<<<<<<<
+ *                  4 * coord[2] * coord[1]
+ *         phi[8] = 4 * coord[0] * coord[2]
+ */
+  (__pyx_v_phi[7]) = ((((4.0 * (__pyx_v_coord[2])) - (4.0 * (__pyx_v_coordsq[2]))) - ((4.0 * (__pyx_v_coord[2])) * (__pyx_v_coord[0]))) - ((4.0 * (__pyx_v_coord[2])) * (__pyx_v_coord[1])));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1064
+ *         phi[7] = 4 * coord[2] - 4 * coordsq[2] - 4 * coord[2] * coord[0] - \
+ *                  4 * coord[2] * coord[1]
+ *         phi[8] = 4 * coord[0] * coord[2]             # <<<<<<<<<<<<<<
+ *         phi[9] = 4 * coord[1] * coord[2]
+ * 
+ */
+  (__pyx_v_phi[8]) = ((4.0 * (__pyx_v_coord[0])) * (__pyx_v_coord[2]));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1065
+ *                  4 * coord[2] * coord[1]
+ *         phi[8] = 4 * coord[0] * coord[2]
+ *         phi[9] = 4 * coord[1] * coord[2]             # <<<<<<<<<<<<<<
+ * 
+ *         for i in range(10):
+ */
+  (__pyx_v_phi[9]) = ((4.0 * (__pyx_v_coord[1])) * (__pyx_v_coord[2]));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1067
+ *         phi[9] = 4 * coord[1] * coord[2]
+ * 
+ *         for i in range(10):             # <<<<<<<<<<<<<<
+ *             return_value += phi[i] * vals[i]
+ * 
+ */
+  for (__pyx_t_1 = 0; __pyx_t_1 < 10; __pyx_t_1+=1) {
+    __pyx_v_i = __pyx_t_1;
+
+    /* "yt/utilities/lib/element_mappings.pyx":1068
+ * 
+ *         for i in range(10):
+ *             return_value += phi[i] * vals[i]             # <<<<<<<<<<<<<<
+ * 
+ *         return return_value
+ */
+    __pyx_v_return_value = (__pyx_v_return_value + ((__pyx_v_phi[__pyx_v_i]) * (__pyx_v_vals[__pyx_v_i])));
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":1070
+ *             return_value += phi[i] * vals[i]
+ * 
+ *         return return_value             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_r = __pyx_v_return_value;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1041
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef double sample_at_unit_point(self, double* coord, double* vals) nogil:             # <<<<<<<<<<<<<<
+ *         cdef double[10] phi
+ *         cdef double coordsq[3]
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":1075
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         # for canonical tets, we check whether the mapped_coords are between
+ *         # 0 and 1.
+ */
+
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D_check_inside(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D *__pyx_v_self, double *__pyx_v_mapped_coord) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1078
+ *         # for canonical tets, we check whether the mapped_coords are between
+ *         # 0 and 1.
+ *         if (mapped_coord[0] < -self.inclusion_tol or \             # <<<<<<<<<<<<<<
+ *             mapped_coord[1] < -self.inclusion_tol or \
+ *             mapped_coord[2] < -self.inclusion_tol or \
+ */
+  __pyx_t_2 = (((__pyx_v_mapped_coord[0]) < (-__pyx_v_self->__pyx_base.__pyx_base.inclusion_tol)) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":1079
+ *         # 0 and 1.
+ *         if (mapped_coord[0] < -self.inclusion_tol or \
+ *             mapped_coord[1] < -self.inclusion_tol or \             # <<<<<<<<<<<<<<
+ *             mapped_coord[2] < -self.inclusion_tol or \
+ *             mapped_coord[0] + mapped_coord[1] + mapped_coord[2] - 1.0 > \
+ */
+  __pyx_t_2 = (((__pyx_v_mapped_coord[1]) < (-__pyx_v_self->__pyx_base.__pyx_base.inclusion_tol)) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":1080
+ *         if (mapped_coord[0] < -self.inclusion_tol or \
+ *             mapped_coord[1] < -self.inclusion_tol or \
+ *             mapped_coord[2] < -self.inclusion_tol or \             # <<<<<<<<<<<<<<
+ *             mapped_coord[0] + mapped_coord[1] + mapped_coord[2] - 1.0 > \
+ *             self.inclusion_tol):
+ */
+  __pyx_t_2 = (((__pyx_v_mapped_coord[2]) < (-__pyx_v_self->__pyx_base.__pyx_base.inclusion_tol)) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":1081
+ *             mapped_coord[1] < -self.inclusion_tol or \
+ *             mapped_coord[2] < -self.inclusion_tol or \
+ *             mapped_coord[0] + mapped_coord[1] + mapped_coord[2] - 1.0 > \             # <<<<<<<<<<<<<<
+ *             self.inclusion_tol):
+ *             return 0
+ */
+  __pyx_t_2 = ((((((__pyx_v_mapped_coord[0]) + (__pyx_v_mapped_coord[1])) + (__pyx_v_mapped_coord[2])) - 1.0) > __pyx_v_self->__pyx_base.__pyx_base.inclusion_tol) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1078
+ *         # for canonical tets, we check whether the mapped_coords are between
+ *         # 0 and 1.
+ *         if (mapped_coord[0] < -self.inclusion_tol or \             # <<<<<<<<<<<<<<
+ *             mapped_coord[1] < -self.inclusion_tol or \
+ *             mapped_coord[2] < -self.inclusion_tol or \
+ */
+  if (__pyx_t_1) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":1083
+ *             mapped_coord[0] + mapped_coord[1] + mapped_coord[2] - 1.0 > \
+ *             self.inclusion_tol):
+ *             return 0             # <<<<<<<<<<<<<<
+ *         return 1
+ * 
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "yt/utilities/lib/element_mappings.pyx":1078
+ *         # for canonical tets, we check whether the mapped_coords are between
+ *         # 0 and 1.
+ *         if (mapped_coord[0] < -self.inclusion_tol or \             # <<<<<<<<<<<<<<
+ *             mapped_coord[1] < -self.inclusion_tol or \
+ *             mapped_coord[2] < -self.inclusion_tol or \
+ */
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":1084
+ *             self.inclusion_tol):
+ *             return 0
+ *         return 1             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.boundscheck(False)
+ */
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1075
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_inside(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         # for canonical tets, we check whether the mapped_coords are between
+ *         # 0 and 1.
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":1089
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_mesh_lines(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         cdef double u, v
+ *         cdef double thresh = 2.0e-2
+ */
+
+static int __pyx_f_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D_check_mesh_lines(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D *__pyx_v_self, double *__pyx_v_mapped_coord) {
+  double __pyx_v_u;
+  double __pyx_v_v;
+  double __pyx_v_thresh;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1091
+ *     cdef int check_mesh_lines(self, double* mapped_coord) nogil:
+ *         cdef double u, v
+ *         cdef double thresh = 2.0e-2             # <<<<<<<<<<<<<<
+ *         if mapped_coord[0] == 0:
+ *             u = mapped_coord[1]
+ */
+  __pyx_v_thresh = 2.0e-2;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1092
+ *         cdef double u, v
+ *         cdef double thresh = 2.0e-2
+ *         if mapped_coord[0] == 0:             # <<<<<<<<<<<<<<
+ *             u = mapped_coord[1]
+ *             v = mapped_coord[2]
+ */
+  __pyx_t_1 = (((__pyx_v_mapped_coord[0]) == 0.0) != 0);
+  if (__pyx_t_1) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":1093
+ *         cdef double thresh = 2.0e-2
+ *         if mapped_coord[0] == 0:
+ *             u = mapped_coord[1]             # <<<<<<<<<<<<<<
+ *             v = mapped_coord[2]
+ *         elif mapped_coord[1] == 0:
+ */
+    __pyx_v_u = (__pyx_v_mapped_coord[1]);
+
+    /* "yt/utilities/lib/element_mappings.pyx":1094
+ *         if mapped_coord[0] == 0:
+ *             u = mapped_coord[1]
+ *             v = mapped_coord[2]             # <<<<<<<<<<<<<<
+ *         elif mapped_coord[1] == 0:
+ *             u = mapped_coord[2]
+ */
+    __pyx_v_v = (__pyx_v_mapped_coord[2]);
+
+    /* "yt/utilities/lib/element_mappings.pyx":1092
+ *         cdef double u, v
+ *         cdef double thresh = 2.0e-2
+ *         if mapped_coord[0] == 0:             # <<<<<<<<<<<<<<
+ *             u = mapped_coord[1]
+ *             v = mapped_coord[2]
+ */
+    goto __pyx_L3;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":1095
+ *             u = mapped_coord[1]
+ *             v = mapped_coord[2]
+ *         elif mapped_coord[1] == 0:             # <<<<<<<<<<<<<<
+ *             u = mapped_coord[2]
+ *             v = mapped_coord[0]
+ */
+  __pyx_t_1 = (((__pyx_v_mapped_coord[1]) == 0.0) != 0);
+  if (__pyx_t_1) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":1096
+ *             v = mapped_coord[2]
+ *         elif mapped_coord[1] == 0:
+ *             u = mapped_coord[2]             # <<<<<<<<<<<<<<
+ *             v = mapped_coord[0]
+ *         elif mapped_coord[2] == 0:
+ */
+    __pyx_v_u = (__pyx_v_mapped_coord[2]);
+
+    /* "yt/utilities/lib/element_mappings.pyx":1097
+ *         elif mapped_coord[1] == 0:
+ *             u = mapped_coord[2]
+ *             v = mapped_coord[0]             # <<<<<<<<<<<<<<
+ *         elif mapped_coord[2] == 0:
+ *             u = mapped_coord[1]
+ */
+    __pyx_v_v = (__pyx_v_mapped_coord[0]);
+
+    /* "yt/utilities/lib/element_mappings.pyx":1095
+ *             u = mapped_coord[1]
+ *             v = mapped_coord[2]
+ *         elif mapped_coord[1] == 0:             # <<<<<<<<<<<<<<
+ *             u = mapped_coord[2]
+ *             v = mapped_coord[0]
+ */
+    goto __pyx_L3;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":1098
+ *             u = mapped_coord[2]
+ *             v = mapped_coord[0]
+ *         elif mapped_coord[2] == 0:             # <<<<<<<<<<<<<<
+ *             u = mapped_coord[1]
+ *             v = mapped_coord[0]
+ */
+  __pyx_t_1 = (((__pyx_v_mapped_coord[2]) == 0.0) != 0);
+  if (__pyx_t_1) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":1099
+ *             v = mapped_coord[0]
+ *         elif mapped_coord[2] == 0:
+ *             u = mapped_coord[1]             # <<<<<<<<<<<<<<
+ *             v = mapped_coord[0]
+ *         else:
+ */
+    __pyx_v_u = (__pyx_v_mapped_coord[1]);
+
+    /* "yt/utilities/lib/element_mappings.pyx":1100
+ *         elif mapped_coord[2] == 0:
+ *             u = mapped_coord[1]
+ *             v = mapped_coord[0]             # <<<<<<<<<<<<<<
+ *         else:
+ *             u = mapped_coord[1]
+ */
+    __pyx_v_v = (__pyx_v_mapped_coord[0]);
+
+    /* "yt/utilities/lib/element_mappings.pyx":1098
+ *             u = mapped_coord[2]
+ *             v = mapped_coord[0]
+ *         elif mapped_coord[2] == 0:             # <<<<<<<<<<<<<<
+ *             u = mapped_coord[1]
+ *             v = mapped_coord[0]
+ */
+    goto __pyx_L3;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":1102
+ *             v = mapped_coord[0]
+ *         else:
+ *             u = mapped_coord[1]             # <<<<<<<<<<<<<<
+ *             v = mapped_coord[2]
+ *         if ((u < thresh) or
+ */
+  /*else*/ {
+    __pyx_v_u = (__pyx_v_mapped_coord[1]);
+
+    /* "yt/utilities/lib/element_mappings.pyx":1103
+ *         else:
+ *             u = mapped_coord[1]
+ *             v = mapped_coord[2]             # <<<<<<<<<<<<<<
+ *         if ((u < thresh) or
+ *             (v < thresh) or
+ */
+    __pyx_v_v = (__pyx_v_mapped_coord[2]);
+  }
+  __pyx_L3:;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1104
+ *             u = mapped_coord[1]
+ *             v = mapped_coord[2]
+ *         if ((u < thresh) or             # <<<<<<<<<<<<<<
+ *             (v < thresh) or
+ *             (fabs(u - 1) < thresh) or
+ */
+  __pyx_t_2 = ((__pyx_v_u < __pyx_v_thresh) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L5_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":1105
+ *             v = mapped_coord[2]
+ *         if ((u < thresh) or
+ *             (v < thresh) or             # <<<<<<<<<<<<<<
+ *             (fabs(u - 1) < thresh) or
+ *             (fabs(v - 1) < thresh)):
+ */
+  __pyx_t_2 = ((__pyx_v_v < __pyx_v_thresh) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L5_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":1106
+ *         if ((u < thresh) or
+ *             (v < thresh) or
+ *             (fabs(u - 1) < thresh) or             # <<<<<<<<<<<<<<
+ *             (fabs(v - 1) < thresh)):
+ *             return 1
+ */
+  __pyx_t_2 = ((fabs((__pyx_v_u - 1.0)) < __pyx_v_thresh) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L5_bool_binop_done;
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":1107
+ *             (v < thresh) or
+ *             (fabs(u - 1) < thresh) or
+ *             (fabs(v - 1) < thresh)):             # <<<<<<<<<<<<<<
+ *             return 1
+ *         return -1
+ */
+  __pyx_t_2 = ((fabs((__pyx_v_v - 1.0)) < __pyx_v_thresh) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L5_bool_binop_done:;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1104
+ *             u = mapped_coord[1]
+ *             v = mapped_coord[2]
+ *         if ((u < thresh) or             # <<<<<<<<<<<<<<
+ *             (v < thresh) or
+ *             (fabs(u - 1) < thresh) or
+ */
+  if (__pyx_t_1) {
+
+    /* "yt/utilities/lib/element_mappings.pyx":1108
+ *             (fabs(u - 1) < thresh) or
+ *             (fabs(v - 1) < thresh)):
+ *             return 1             # <<<<<<<<<<<<<<
+ *         return -1
+ * 
+ */
+    __pyx_r = 1;
+    goto __pyx_L0;
+
+    /* "yt/utilities/lib/element_mappings.pyx":1104
+ *             u = mapped_coord[1]
+ *             v = mapped_coord[2]
+ *         if ((u < thresh) or             # <<<<<<<<<<<<<<
+ *             (v < thresh) or
+ *             (fabs(u - 1) < thresh) or
+ */
+  }
+
+  /* "yt/utilities/lib/element_mappings.pyx":1109
+ *             (fabs(v - 1) < thresh)):
+ *             return 1
+ *         return -1             # <<<<<<<<<<<<<<
+ * 
+ * @cython.boundscheck(False)
+ */
+  __pyx_r = -1;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1089
+ *     @cython.wraparound(False)
+ *     @cython.cdivision(True)
+ *     cdef int check_mesh_lines(self, double* mapped_coord) nogil:             # <<<<<<<<<<<<<<
+ *         cdef double u, v
+ *         cdef double thresh = 2.0e-2
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D_2__reduce_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__17, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.Tet2Sampler3D.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D_4__setstate_cython__(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__18, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.Tet2Sampler3D.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":1114
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_hex_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                      np.ndarray[np.float64_t, ndim=1] field_values,
+ *                      np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_1test_hex_sampler(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_2yt_9utilities_3lib_16element_mappings_1test_hex_sampler = {"test_hex_sampler", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_2yt_9utilities_3lib_16element_mappings_1test_hex_sampler, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_1test_hex_sampler(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_vertices = 0;
+  PyArrayObject *__pyx_v_field_values = 0;
+  PyArrayObject *__pyx_v_physical_x = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("test_hex_sampler (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_vertices,&__pyx_n_s_field_values,&__pyx_n_s_physical_x,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_vertices)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_field_values)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("test_hex_sampler", 1, 3, 3, 1); __PYX_ERR(0, 1114, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_physical_x)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("test_hex_sampler", 1, 3, 3, 2); __PYX_ERR(0, 1114, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "test_hex_sampler") < 0)) __PYX_ERR(0, 1114, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v_vertices = ((PyArrayObject *)values[0]);
+    __pyx_v_field_values = ((PyArrayObject *)values[1]);
+    __pyx_v_physical_x = ((PyArrayObject *)values[2]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("test_hex_sampler", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 1114, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.test_hex_sampler", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_vertices), __pyx_ptype_5numpy_ndarray, 1, "vertices", 0))) __PYX_ERR(0, 1114, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_field_values), __pyx_ptype_5numpy_ndarray, 1, "field_values", 0))) __PYX_ERR(0, 1115, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_physical_x), __pyx_ptype_5numpy_ndarray, 1, "physical_x", 0))) __PYX_ERR(0, 1116, __pyx_L1_error)
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_test_hex_sampler(__pyx_self, __pyx_v_vertices, __pyx_v_field_values, __pyx_v_physical_x);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_test_hex_sampler(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_vertices, PyArrayObject *__pyx_v_field_values, PyArrayObject *__pyx_v_physical_x) {
+  double __pyx_v_val;
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D *__pyx_v_sampler = 0;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_field_values;
+  __Pyx_Buffer __pyx_pybuffer_field_values;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_physical_x;
+  __Pyx_Buffer __pyx_pybuffer_physical_x;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_vertices;
+  __Pyx_Buffer __pyx_pybuffer_vertices;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("test_hex_sampler", 0);
+  __pyx_pybuffer_vertices.pybuffer.buf = NULL;
+  __pyx_pybuffer_vertices.refcount = 0;
+  __pyx_pybuffernd_vertices.data = NULL;
+  __pyx_pybuffernd_vertices.rcbuffer = &__pyx_pybuffer_vertices;
+  __pyx_pybuffer_field_values.pybuffer.buf = NULL;
+  __pyx_pybuffer_field_values.refcount = 0;
+  __pyx_pybuffernd_field_values.data = NULL;
+  __pyx_pybuffernd_field_values.rcbuffer = &__pyx_pybuffer_field_values;
+  __pyx_pybuffer_physical_x.pybuffer.buf = NULL;
+  __pyx_pybuffer_physical_x.refcount = 0;
+  __pyx_pybuffernd_physical_x.data = NULL;
+  __pyx_pybuffernd_physical_x.rcbuffer = &__pyx_pybuffer_physical_x;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer, (PyObject*)__pyx_v_vertices, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1114, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_vertices.diminfo[0].strides = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_vertices.diminfo[0].shape = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_vertices.diminfo[1].strides = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_vertices.diminfo[1].shape = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer, (PyObject*)__pyx_v_field_values, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1114, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_field_values.diminfo[0].strides = __pyx_pybuffernd_field_values.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_field_values.diminfo[0].shape = __pyx_pybuffernd_field_values.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_physical_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1114, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_physical_x.diminfo[0].strides = __pyx_pybuffernd_physical_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_physical_x.diminfo[0].shape = __pyx_pybuffernd_physical_x.rcbuffer->pybuffer.shape[0];
+
+  /* "yt/utilities/lib/element_mappings.pyx":1120
+ *     cdef double val
+ * 
+ *     cdef Q1Sampler3D sampler = Q1Sampler3D()             # <<<<<<<<<<<<<<
+ * 
+ *     val = sampler.sample_at_real_point(<double*> vertices.data,
+ */
+  __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1120, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_sampler = ((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1122
+ *     cdef Q1Sampler3D sampler = Q1Sampler3D()
+ * 
+ *     val = sampler.sample_at_real_point(<double*> vertices.data,             # <<<<<<<<<<<<<<
+ *                                        <double*> field_values.data,
+ *                                        <double*> physical_x.data)
+ */
+  __pyx_v_val = ((struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D *)__pyx_v_sampler->__pyx_base.__pyx_base.__pyx_vtab)->__pyx_base.__pyx_base.sample_at_real_point(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *)__pyx_v_sampler), ((double *)__pyx_v_vertices->data), ((double *)__pyx_v_field_values->data), ((double *)__pyx_v_physical_x->data));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1125
+ *                                        <double*> field_values.data,
+ *                                        <double*> physical_x.data)
+ *     return val             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_val); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1125, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1114
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_hex_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                      np.ndarray[np.float64_t, ndim=1] field_values,
+ *                      np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.test_hex_sampler", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_sampler);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":1131
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_hex20_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                        np.ndarray[np.float64_t, ndim=1] field_values,
+ *                        np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_3test_hex20_sampler(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_2yt_9utilities_3lib_16element_mappings_3test_hex20_sampler = {"test_hex20_sampler", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_2yt_9utilities_3lib_16element_mappings_3test_hex20_sampler, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_3test_hex20_sampler(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_vertices = 0;
+  PyArrayObject *__pyx_v_field_values = 0;
+  PyArrayObject *__pyx_v_physical_x = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("test_hex20_sampler (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_vertices,&__pyx_n_s_field_values,&__pyx_n_s_physical_x,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_vertices)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_field_values)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("test_hex20_sampler", 1, 3, 3, 1); __PYX_ERR(0, 1131, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_physical_x)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("test_hex20_sampler", 1, 3, 3, 2); __PYX_ERR(0, 1131, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "test_hex20_sampler") < 0)) __PYX_ERR(0, 1131, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v_vertices = ((PyArrayObject *)values[0]);
+    __pyx_v_field_values = ((PyArrayObject *)values[1]);
+    __pyx_v_physical_x = ((PyArrayObject *)values[2]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("test_hex20_sampler", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 1131, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.test_hex20_sampler", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_vertices), __pyx_ptype_5numpy_ndarray, 1, "vertices", 0))) __PYX_ERR(0, 1131, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_field_values), __pyx_ptype_5numpy_ndarray, 1, "field_values", 0))) __PYX_ERR(0, 1132, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_physical_x), __pyx_ptype_5numpy_ndarray, 1, "physical_x", 0))) __PYX_ERR(0, 1133, __pyx_L1_error)
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_2test_hex20_sampler(__pyx_self, __pyx_v_vertices, __pyx_v_field_values, __pyx_v_physical_x);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_2test_hex20_sampler(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_vertices, PyArrayObject *__pyx_v_field_values, PyArrayObject *__pyx_v_physical_x) {
+  double __pyx_v_val;
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_S2Sampler3D *__pyx_v_sampler = 0;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_field_values;
+  __Pyx_Buffer __pyx_pybuffer_field_values;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_physical_x;
+  __Pyx_Buffer __pyx_pybuffer_physical_x;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_vertices;
+  __Pyx_Buffer __pyx_pybuffer_vertices;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("test_hex20_sampler", 0);
+  __pyx_pybuffer_vertices.pybuffer.buf = NULL;
+  __pyx_pybuffer_vertices.refcount = 0;
+  __pyx_pybuffernd_vertices.data = NULL;
+  __pyx_pybuffernd_vertices.rcbuffer = &__pyx_pybuffer_vertices;
+  __pyx_pybuffer_field_values.pybuffer.buf = NULL;
+  __pyx_pybuffer_field_values.refcount = 0;
+  __pyx_pybuffernd_field_values.data = NULL;
+  __pyx_pybuffernd_field_values.rcbuffer = &__pyx_pybuffer_field_values;
+  __pyx_pybuffer_physical_x.pybuffer.buf = NULL;
+  __pyx_pybuffer_physical_x.refcount = 0;
+  __pyx_pybuffernd_physical_x.data = NULL;
+  __pyx_pybuffernd_physical_x.rcbuffer = &__pyx_pybuffer_physical_x;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer, (PyObject*)__pyx_v_vertices, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1131, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_vertices.diminfo[0].strides = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_vertices.diminfo[0].shape = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_vertices.diminfo[1].strides = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_vertices.diminfo[1].shape = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer, (PyObject*)__pyx_v_field_values, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1131, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_field_values.diminfo[0].strides = __pyx_pybuffernd_field_values.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_field_values.diminfo[0].shape = __pyx_pybuffernd_field_values.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_physical_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1131, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_physical_x.diminfo[0].strides = __pyx_pybuffernd_physical_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_physical_x.diminfo[0].shape = __pyx_pybuffernd_physical_x.rcbuffer->pybuffer.shape[0];
+
+  /* "yt/utilities/lib/element_mappings.pyx":1137
+ *     cdef double val
+ * 
+ *     cdef S2Sampler3D sampler = S2Sampler3D()             # <<<<<<<<<<<<<<
+ * 
+ *     val = sampler.sample_at_real_point(<double*> vertices.data,
+ */
+  __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_S2Sampler3D)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1137, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_sampler = ((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_S2Sampler3D *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1139
+ *     cdef S2Sampler3D sampler = S2Sampler3D()
+ * 
+ *     val = sampler.sample_at_real_point(<double*> vertices.data,             # <<<<<<<<<<<<<<
+ *                                        <double*> field_values.data,
+ *                                        <double*> physical_x.data)
+ */
+  __pyx_v_val = ((struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_S2Sampler3D *)__pyx_v_sampler->__pyx_base.__pyx_base.__pyx_vtab)->__pyx_base.__pyx_base.sample_at_real_point(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *)__pyx_v_sampler), ((double *)__pyx_v_vertices->data), ((double *)__pyx_v_field_values->data), ((double *)__pyx_v_physical_x->data));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1142
+ *                                        <double*> field_values.data,
+ *                                        <double*> physical_x.data)
+ *     return val             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_val); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1142, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1131
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_hex20_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                        np.ndarray[np.float64_t, ndim=1] field_values,
+ *                        np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.test_hex20_sampler", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_sampler);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":1148
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_tetra_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                        np.ndarray[np.float64_t, ndim=1] field_values,
+ *                        np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_5test_tetra_sampler(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_2yt_9utilities_3lib_16element_mappings_5test_tetra_sampler = {"test_tetra_sampler", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_2yt_9utilities_3lib_16element_mappings_5test_tetra_sampler, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_5test_tetra_sampler(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_vertices = 0;
+  PyArrayObject *__pyx_v_field_values = 0;
+  PyArrayObject *__pyx_v_physical_x = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("test_tetra_sampler (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_vertices,&__pyx_n_s_field_values,&__pyx_n_s_physical_x,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_vertices)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_field_values)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("test_tetra_sampler", 1, 3, 3, 1); __PYX_ERR(0, 1148, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_physical_x)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("test_tetra_sampler", 1, 3, 3, 2); __PYX_ERR(0, 1148, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "test_tetra_sampler") < 0)) __PYX_ERR(0, 1148, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v_vertices = ((PyArrayObject *)values[0]);
+    __pyx_v_field_values = ((PyArrayObject *)values[1]);
+    __pyx_v_physical_x = ((PyArrayObject *)values[2]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("test_tetra_sampler", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 1148, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.test_tetra_sampler", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_vertices), __pyx_ptype_5numpy_ndarray, 1, "vertices", 0))) __PYX_ERR(0, 1148, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_field_values), __pyx_ptype_5numpy_ndarray, 1, "field_values", 0))) __PYX_ERR(0, 1149, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_physical_x), __pyx_ptype_5numpy_ndarray, 1, "physical_x", 0))) __PYX_ERR(0, 1150, __pyx_L1_error)
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_4test_tetra_sampler(__pyx_self, __pyx_v_vertices, __pyx_v_field_values, __pyx_v_physical_x);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_4test_tetra_sampler(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_vertices, PyArrayObject *__pyx_v_field_values, PyArrayObject *__pyx_v_physical_x) {
+  double __pyx_v_val;
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *__pyx_v_sampler = NULL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_field_values;
+  __Pyx_Buffer __pyx_pybuffer_field_values;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_physical_x;
+  __Pyx_Buffer __pyx_pybuffer_physical_x;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_vertices;
+  __Pyx_Buffer __pyx_pybuffer_vertices;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("test_tetra_sampler", 0);
+  __pyx_pybuffer_vertices.pybuffer.buf = NULL;
+  __pyx_pybuffer_vertices.refcount = 0;
+  __pyx_pybuffernd_vertices.data = NULL;
+  __pyx_pybuffernd_vertices.rcbuffer = &__pyx_pybuffer_vertices;
+  __pyx_pybuffer_field_values.pybuffer.buf = NULL;
+  __pyx_pybuffer_field_values.refcount = 0;
+  __pyx_pybuffernd_field_values.data = NULL;
+  __pyx_pybuffernd_field_values.rcbuffer = &__pyx_pybuffer_field_values;
+  __pyx_pybuffer_physical_x.pybuffer.buf = NULL;
+  __pyx_pybuffer_physical_x.refcount = 0;
+  __pyx_pybuffernd_physical_x.data = NULL;
+  __pyx_pybuffernd_physical_x.rcbuffer = &__pyx_pybuffer_physical_x;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer, (PyObject*)__pyx_v_vertices, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1148, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_vertices.diminfo[0].strides = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_vertices.diminfo[0].shape = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_vertices.diminfo[1].strides = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_vertices.diminfo[1].shape = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer, (PyObject*)__pyx_v_field_values, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1148, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_field_values.diminfo[0].strides = __pyx_pybuffernd_field_values.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_field_values.diminfo[0].shape = __pyx_pybuffernd_field_values.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_physical_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1148, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_physical_x.diminfo[0].strides = __pyx_pybuffernd_physical_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_physical_x.diminfo[0].shape = __pyx_pybuffernd_physical_x.rcbuffer->pybuffer.shape[0];
+
+  /* "yt/utilities/lib/element_mappings.pyx":1154
+ *     cdef double val
+ * 
+ *     sampler = P1Sampler3D()             # <<<<<<<<<<<<<<
+ * 
+ *     val = sampler.sample_at_real_point(<double*> vertices.data,
+ */
+  __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_P1Sampler3D)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1154, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_sampler = ((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1156
+ *     sampler = P1Sampler3D()
+ * 
+ *     val = sampler.sample_at_real_point(<double*> vertices.data,             # <<<<<<<<<<<<<<
+ *                                        <double*> field_values.data,
+ *                                        <double*> physical_x.data)
+ */
+  __pyx_v_val = ((struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *)__pyx_v_sampler->__pyx_base.__pyx_vtab)->__pyx_base.sample_at_real_point(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *)__pyx_v_sampler), ((double *)__pyx_v_vertices->data), ((double *)__pyx_v_field_values->data), ((double *)__pyx_v_physical_x->data));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1160
+ *                                        <double*> physical_x.data)
+ * 
+ *     return val             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_val); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1160, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1148
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_tetra_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                        np.ndarray[np.float64_t, ndim=1] field_values,
+ *                        np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.test_tetra_sampler", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_sampler);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":1166
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_wedge_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                        np.ndarray[np.float64_t, ndim=1] field_values,
+ *                        np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_7test_wedge_sampler(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_2yt_9utilities_3lib_16element_mappings_7test_wedge_sampler = {"test_wedge_sampler", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_2yt_9utilities_3lib_16element_mappings_7test_wedge_sampler, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_7test_wedge_sampler(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_vertices = 0;
+  PyArrayObject *__pyx_v_field_values = 0;
+  PyArrayObject *__pyx_v_physical_x = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("test_wedge_sampler (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_vertices,&__pyx_n_s_field_values,&__pyx_n_s_physical_x,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_vertices)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_field_values)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("test_wedge_sampler", 1, 3, 3, 1); __PYX_ERR(0, 1166, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_physical_x)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("test_wedge_sampler", 1, 3, 3, 2); __PYX_ERR(0, 1166, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "test_wedge_sampler") < 0)) __PYX_ERR(0, 1166, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v_vertices = ((PyArrayObject *)values[0]);
+    __pyx_v_field_values = ((PyArrayObject *)values[1]);
+    __pyx_v_physical_x = ((PyArrayObject *)values[2]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("test_wedge_sampler", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 1166, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.test_wedge_sampler", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_vertices), __pyx_ptype_5numpy_ndarray, 1, "vertices", 0))) __PYX_ERR(0, 1166, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_field_values), __pyx_ptype_5numpy_ndarray, 1, "field_values", 0))) __PYX_ERR(0, 1167, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_physical_x), __pyx_ptype_5numpy_ndarray, 1, "physical_x", 0))) __PYX_ERR(0, 1168, __pyx_L1_error)
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_6test_wedge_sampler(__pyx_self, __pyx_v_vertices, __pyx_v_field_values, __pyx_v_physical_x);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_6test_wedge_sampler(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_vertices, PyArrayObject *__pyx_v_field_values, PyArrayObject *__pyx_v_physical_x) {
+  double __pyx_v_val;
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_W1Sampler3D *__pyx_v_sampler = 0;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_field_values;
+  __Pyx_Buffer __pyx_pybuffer_field_values;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_physical_x;
+  __Pyx_Buffer __pyx_pybuffer_physical_x;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_vertices;
+  __Pyx_Buffer __pyx_pybuffer_vertices;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("test_wedge_sampler", 0);
+  __pyx_pybuffer_vertices.pybuffer.buf = NULL;
+  __pyx_pybuffer_vertices.refcount = 0;
+  __pyx_pybuffernd_vertices.data = NULL;
+  __pyx_pybuffernd_vertices.rcbuffer = &__pyx_pybuffer_vertices;
+  __pyx_pybuffer_field_values.pybuffer.buf = NULL;
+  __pyx_pybuffer_field_values.refcount = 0;
+  __pyx_pybuffernd_field_values.data = NULL;
+  __pyx_pybuffernd_field_values.rcbuffer = &__pyx_pybuffer_field_values;
+  __pyx_pybuffer_physical_x.pybuffer.buf = NULL;
+  __pyx_pybuffer_physical_x.refcount = 0;
+  __pyx_pybuffernd_physical_x.data = NULL;
+  __pyx_pybuffernd_physical_x.rcbuffer = &__pyx_pybuffer_physical_x;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer, (PyObject*)__pyx_v_vertices, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1166, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_vertices.diminfo[0].strides = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_vertices.diminfo[0].shape = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_vertices.diminfo[1].strides = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_vertices.diminfo[1].shape = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer, (PyObject*)__pyx_v_field_values, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1166, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_field_values.diminfo[0].strides = __pyx_pybuffernd_field_values.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_field_values.diminfo[0].shape = __pyx_pybuffernd_field_values.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_physical_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1166, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_physical_x.diminfo[0].strides = __pyx_pybuffernd_physical_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_physical_x.diminfo[0].shape = __pyx_pybuffernd_physical_x.rcbuffer->pybuffer.shape[0];
+
+  /* "yt/utilities/lib/element_mappings.pyx":1172
+ *     cdef double val
+ * 
+ *     cdef W1Sampler3D sampler = W1Sampler3D()             # <<<<<<<<<<<<<<
+ * 
+ *     val = sampler.sample_at_real_point(<double*> vertices.data,
+ */
+  __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_W1Sampler3D)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1172, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_sampler = ((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_W1Sampler3D *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1174
+ *     cdef W1Sampler3D sampler = W1Sampler3D()
+ * 
+ *     val = sampler.sample_at_real_point(<double*> vertices.data,             # <<<<<<<<<<<<<<
+ *                                        <double*> field_values.data,
+ *                                        <double*> physical_x.data)
+ */
+  __pyx_v_val = ((struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_W1Sampler3D *)__pyx_v_sampler->__pyx_base.__pyx_base.__pyx_vtab)->__pyx_base.__pyx_base.sample_at_real_point(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *)__pyx_v_sampler), ((double *)__pyx_v_vertices->data), ((double *)__pyx_v_field_values->data), ((double *)__pyx_v_physical_x->data));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1177
+ *                                        <double*> field_values.data,
+ *                                        <double*> physical_x.data)
+ *     return val             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_val); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1177, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1166
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_wedge_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                        np.ndarray[np.float64_t, ndim=1] field_values,
+ *                        np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.test_wedge_sampler", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_sampler);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":1183
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_linear1D_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                           np.ndarray[np.float64_t, ndim=1] field_values,
+ *                           np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_9test_linear1D_sampler(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_2yt_9utilities_3lib_16element_mappings_9test_linear1D_sampler = {"test_linear1D_sampler", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_2yt_9utilities_3lib_16element_mappings_9test_linear1D_sampler, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_9test_linear1D_sampler(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_vertices = 0;
+  PyArrayObject *__pyx_v_field_values = 0;
+  PyArrayObject *__pyx_v_physical_x = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("test_linear1D_sampler (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_vertices,&__pyx_n_s_field_values,&__pyx_n_s_physical_x,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_vertices)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_field_values)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("test_linear1D_sampler", 1, 3, 3, 1); __PYX_ERR(0, 1183, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_physical_x)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("test_linear1D_sampler", 1, 3, 3, 2); __PYX_ERR(0, 1183, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "test_linear1D_sampler") < 0)) __PYX_ERR(0, 1183, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v_vertices = ((PyArrayObject *)values[0]);
+    __pyx_v_field_values = ((PyArrayObject *)values[1]);
+    __pyx_v_physical_x = ((PyArrayObject *)values[2]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("test_linear1D_sampler", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 1183, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.test_linear1D_sampler", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_vertices), __pyx_ptype_5numpy_ndarray, 1, "vertices", 0))) __PYX_ERR(0, 1183, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_field_values), __pyx_ptype_5numpy_ndarray, 1, "field_values", 0))) __PYX_ERR(0, 1184, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_physical_x), __pyx_ptype_5numpy_ndarray, 1, "physical_x", 0))) __PYX_ERR(0, 1185, __pyx_L1_error)
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_8test_linear1D_sampler(__pyx_self, __pyx_v_vertices, __pyx_v_field_values, __pyx_v_physical_x);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_8test_linear1D_sampler(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_vertices, PyArrayObject *__pyx_v_field_values, PyArrayObject *__pyx_v_physical_x) {
+  double __pyx_v_val;
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler1D *__pyx_v_sampler = NULL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_field_values;
+  __Pyx_Buffer __pyx_pybuffer_field_values;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_physical_x;
+  __Pyx_Buffer __pyx_pybuffer_physical_x;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_vertices;
+  __Pyx_Buffer __pyx_pybuffer_vertices;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("test_linear1D_sampler", 0);
+  __pyx_pybuffer_vertices.pybuffer.buf = NULL;
+  __pyx_pybuffer_vertices.refcount = 0;
+  __pyx_pybuffernd_vertices.data = NULL;
+  __pyx_pybuffernd_vertices.rcbuffer = &__pyx_pybuffer_vertices;
+  __pyx_pybuffer_field_values.pybuffer.buf = NULL;
+  __pyx_pybuffer_field_values.refcount = 0;
+  __pyx_pybuffernd_field_values.data = NULL;
+  __pyx_pybuffernd_field_values.rcbuffer = &__pyx_pybuffer_field_values;
+  __pyx_pybuffer_physical_x.pybuffer.buf = NULL;
+  __pyx_pybuffer_physical_x.refcount = 0;
+  __pyx_pybuffernd_physical_x.data = NULL;
+  __pyx_pybuffernd_physical_x.rcbuffer = &__pyx_pybuffer_physical_x;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer, (PyObject*)__pyx_v_vertices, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1183, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_vertices.diminfo[0].strides = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_vertices.diminfo[0].shape = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_vertices.diminfo[1].strides = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_vertices.diminfo[1].shape = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer, (PyObject*)__pyx_v_field_values, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1183, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_field_values.diminfo[0].strides = __pyx_pybuffernd_field_values.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_field_values.diminfo[0].shape = __pyx_pybuffernd_field_values.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_physical_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1183, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_physical_x.diminfo[0].strides = __pyx_pybuffernd_physical_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_physical_x.diminfo[0].shape = __pyx_pybuffernd_physical_x.rcbuffer->pybuffer.shape[0];
+
+  /* "yt/utilities/lib/element_mappings.pyx":1189
+ *     cdef double val
+ * 
+ *     sampler = P1Sampler1D()             # <<<<<<<<<<<<<<
+ * 
+ *     val = sampler.sample_at_real_point(<double*> vertices.data,
+ */
+  __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_P1Sampler1D)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1189, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_sampler = ((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler1D *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1191
+ *     sampler = P1Sampler1D()
+ * 
+ *     val = sampler.sample_at_real_point(<double*> vertices.data,             # <<<<<<<<<<<<<<
+ *                                        <double*> field_values.data,
+ *                                        <double*> physical_x.data)
+ */
+  __pyx_v_val = ((struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_P1Sampler1D *)__pyx_v_sampler->__pyx_base.__pyx_vtab)->__pyx_base.sample_at_real_point(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *)__pyx_v_sampler), ((double *)__pyx_v_vertices->data), ((double *)__pyx_v_field_values->data), ((double *)__pyx_v_physical_x->data));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1195
+ *                                        <double*> physical_x.data)
+ * 
+ *     return val             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_val); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1195, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1183
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_linear1D_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                           np.ndarray[np.float64_t, ndim=1] field_values,
+ *                           np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.test_linear1D_sampler", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_sampler);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":1201
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_tri_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                      np.ndarray[np.float64_t, ndim=1] field_values,
+ *                      np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11test_tri_sampler(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_2yt_9utilities_3lib_16element_mappings_11test_tri_sampler = {"test_tri_sampler", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_2yt_9utilities_3lib_16element_mappings_11test_tri_sampler, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_11test_tri_sampler(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_vertices = 0;
+  PyArrayObject *__pyx_v_field_values = 0;
+  PyArrayObject *__pyx_v_physical_x = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("test_tri_sampler (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_vertices,&__pyx_n_s_field_values,&__pyx_n_s_physical_x,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_vertices)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_field_values)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("test_tri_sampler", 1, 3, 3, 1); __PYX_ERR(0, 1201, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_physical_x)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("test_tri_sampler", 1, 3, 3, 2); __PYX_ERR(0, 1201, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "test_tri_sampler") < 0)) __PYX_ERR(0, 1201, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v_vertices = ((PyArrayObject *)values[0]);
+    __pyx_v_field_values = ((PyArrayObject *)values[1]);
+    __pyx_v_physical_x = ((PyArrayObject *)values[2]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("test_tri_sampler", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 1201, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.test_tri_sampler", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_vertices), __pyx_ptype_5numpy_ndarray, 1, "vertices", 0))) __PYX_ERR(0, 1201, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_field_values), __pyx_ptype_5numpy_ndarray, 1, "field_values", 0))) __PYX_ERR(0, 1202, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_physical_x), __pyx_ptype_5numpy_ndarray, 1, "physical_x", 0))) __PYX_ERR(0, 1203, __pyx_L1_error)
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_10test_tri_sampler(__pyx_self, __pyx_v_vertices, __pyx_v_field_values, __pyx_v_physical_x);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_10test_tri_sampler(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_vertices, PyArrayObject *__pyx_v_field_values, PyArrayObject *__pyx_v_physical_x) {
+  double __pyx_v_val;
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler2D *__pyx_v_sampler = NULL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_field_values;
+  __Pyx_Buffer __pyx_pybuffer_field_values;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_physical_x;
+  __Pyx_Buffer __pyx_pybuffer_physical_x;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_vertices;
+  __Pyx_Buffer __pyx_pybuffer_vertices;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("test_tri_sampler", 0);
+  __pyx_pybuffer_vertices.pybuffer.buf = NULL;
+  __pyx_pybuffer_vertices.refcount = 0;
+  __pyx_pybuffernd_vertices.data = NULL;
+  __pyx_pybuffernd_vertices.rcbuffer = &__pyx_pybuffer_vertices;
+  __pyx_pybuffer_field_values.pybuffer.buf = NULL;
+  __pyx_pybuffer_field_values.refcount = 0;
+  __pyx_pybuffernd_field_values.data = NULL;
+  __pyx_pybuffernd_field_values.rcbuffer = &__pyx_pybuffer_field_values;
+  __pyx_pybuffer_physical_x.pybuffer.buf = NULL;
+  __pyx_pybuffer_physical_x.refcount = 0;
+  __pyx_pybuffernd_physical_x.data = NULL;
+  __pyx_pybuffernd_physical_x.rcbuffer = &__pyx_pybuffer_physical_x;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer, (PyObject*)__pyx_v_vertices, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1201, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_vertices.diminfo[0].strides = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_vertices.diminfo[0].shape = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_vertices.diminfo[1].strides = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_vertices.diminfo[1].shape = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer, (PyObject*)__pyx_v_field_values, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1201, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_field_values.diminfo[0].strides = __pyx_pybuffernd_field_values.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_field_values.diminfo[0].shape = __pyx_pybuffernd_field_values.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_physical_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1201, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_physical_x.diminfo[0].strides = __pyx_pybuffernd_physical_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_physical_x.diminfo[0].shape = __pyx_pybuffernd_physical_x.rcbuffer->pybuffer.shape[0];
+
+  /* "yt/utilities/lib/element_mappings.pyx":1207
+ *     cdef double val
+ * 
+ *     sampler = P1Sampler2D()             # <<<<<<<<<<<<<<
+ * 
+ *     val = sampler.sample_at_real_point(<double*> vertices.data,
+ */
+  __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_P1Sampler2D)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1207, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_sampler = ((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler2D *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1209
+ *     sampler = P1Sampler2D()
+ * 
+ *     val = sampler.sample_at_real_point(<double*> vertices.data,             # <<<<<<<<<<<<<<
+ *                                        <double*> field_values.data,
+ *                                        <double*> physical_x.data)
+ */
+  __pyx_v_val = ((struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_P1Sampler2D *)__pyx_v_sampler->__pyx_base.__pyx_vtab)->__pyx_base.sample_at_real_point(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *)__pyx_v_sampler), ((double *)__pyx_v_vertices->data), ((double *)__pyx_v_field_values->data), ((double *)__pyx_v_physical_x->data));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1213
+ *                                        <double*> physical_x.data)
+ * 
+ *     return val             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_val); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1213, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1201
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_tri_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                      np.ndarray[np.float64_t, ndim=1] field_values,
+ *                      np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.test_tri_sampler", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_sampler);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":1219
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_quad_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                       np.ndarray[np.float64_t, ndim=1] field_values,
+ *                       np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_13test_quad_sampler(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_2yt_9utilities_3lib_16element_mappings_13test_quad_sampler = {"test_quad_sampler", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_2yt_9utilities_3lib_16element_mappings_13test_quad_sampler, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_13test_quad_sampler(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_vertices = 0;
+  PyArrayObject *__pyx_v_field_values = 0;
+  PyArrayObject *__pyx_v_physical_x = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("test_quad_sampler (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_vertices,&__pyx_n_s_field_values,&__pyx_n_s_physical_x,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_vertices)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_field_values)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("test_quad_sampler", 1, 3, 3, 1); __PYX_ERR(0, 1219, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_physical_x)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("test_quad_sampler", 1, 3, 3, 2); __PYX_ERR(0, 1219, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "test_quad_sampler") < 0)) __PYX_ERR(0, 1219, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v_vertices = ((PyArrayObject *)values[0]);
+    __pyx_v_field_values = ((PyArrayObject *)values[1]);
+    __pyx_v_physical_x = ((PyArrayObject *)values[2]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("test_quad_sampler", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 1219, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.test_quad_sampler", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_vertices), __pyx_ptype_5numpy_ndarray, 1, "vertices", 0))) __PYX_ERR(0, 1219, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_field_values), __pyx_ptype_5numpy_ndarray, 1, "field_values", 0))) __PYX_ERR(0, 1220, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_physical_x), __pyx_ptype_5numpy_ndarray, 1, "physical_x", 0))) __PYX_ERR(0, 1221, __pyx_L1_error)
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_12test_quad_sampler(__pyx_self, __pyx_v_vertices, __pyx_v_field_values, __pyx_v_physical_x);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_12test_quad_sampler(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_vertices, PyArrayObject *__pyx_v_field_values, PyArrayObject *__pyx_v_physical_x) {
+  double __pyx_v_val;
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D *__pyx_v_sampler = NULL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_field_values;
+  __Pyx_Buffer __pyx_pybuffer_field_values;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_physical_x;
+  __Pyx_Buffer __pyx_pybuffer_physical_x;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_vertices;
+  __Pyx_Buffer __pyx_pybuffer_vertices;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("test_quad_sampler", 0);
+  __pyx_pybuffer_vertices.pybuffer.buf = NULL;
+  __pyx_pybuffer_vertices.refcount = 0;
+  __pyx_pybuffernd_vertices.data = NULL;
+  __pyx_pybuffernd_vertices.rcbuffer = &__pyx_pybuffer_vertices;
+  __pyx_pybuffer_field_values.pybuffer.buf = NULL;
+  __pyx_pybuffer_field_values.refcount = 0;
+  __pyx_pybuffernd_field_values.data = NULL;
+  __pyx_pybuffernd_field_values.rcbuffer = &__pyx_pybuffer_field_values;
+  __pyx_pybuffer_physical_x.pybuffer.buf = NULL;
+  __pyx_pybuffer_physical_x.refcount = 0;
+  __pyx_pybuffernd_physical_x.data = NULL;
+  __pyx_pybuffernd_physical_x.rcbuffer = &__pyx_pybuffer_physical_x;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer, (PyObject*)__pyx_v_vertices, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1219, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_vertices.diminfo[0].strides = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_vertices.diminfo[0].shape = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_vertices.diminfo[1].strides = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_vertices.diminfo[1].shape = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer, (PyObject*)__pyx_v_field_values, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1219, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_field_values.diminfo[0].strides = __pyx_pybuffernd_field_values.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_field_values.diminfo[0].shape = __pyx_pybuffernd_field_values.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_physical_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1219, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_physical_x.diminfo[0].strides = __pyx_pybuffernd_physical_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_physical_x.diminfo[0].shape = __pyx_pybuffernd_physical_x.rcbuffer->pybuffer.shape[0];
+
+  /* "yt/utilities/lib/element_mappings.pyx":1225
+ *     cdef double val
+ * 
+ *     sampler = Q1Sampler2D()             # <<<<<<<<<<<<<<
+ * 
+ *     val = sampler.sample_at_real_point(<double*> vertices.data,
+ */
+  __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1225, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_sampler = ((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1227
+ *     sampler = Q1Sampler2D()
+ * 
+ *     val = sampler.sample_at_real_point(<double*> vertices.data,             # <<<<<<<<<<<<<<
+ *                                        <double*> field_values.data,
+ *                                        <double*> physical_x.data)
+ */
+  __pyx_v_val = ((struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D *)__pyx_v_sampler->__pyx_base.__pyx_base.__pyx_vtab)->__pyx_base.__pyx_base.sample_at_real_point(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *)__pyx_v_sampler), ((double *)__pyx_v_vertices->data), ((double *)__pyx_v_field_values->data), ((double *)__pyx_v_physical_x->data));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1231
+ *                                        <double*> physical_x.data)
+ * 
+ *     return val             # <<<<<<<<<<<<<<
+ * 
+ * @cython.boundscheck(False)
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_val); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1231, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1219
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_quad_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                       np.ndarray[np.float64_t, ndim=1] field_values,
+ *                       np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.test_quad_sampler", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_sampler);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":1236
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_quad2_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                        np.ndarray[np.float64_t, ndim=1] field_values,
+ *                        np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_15test_quad2_sampler(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_2yt_9utilities_3lib_16element_mappings_15test_quad2_sampler = {"test_quad2_sampler", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_2yt_9utilities_3lib_16element_mappings_15test_quad2_sampler, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_15test_quad2_sampler(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_vertices = 0;
+  PyArrayObject *__pyx_v_field_values = 0;
+  PyArrayObject *__pyx_v_physical_x = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("test_quad2_sampler (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_vertices,&__pyx_n_s_field_values,&__pyx_n_s_physical_x,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_vertices)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_field_values)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("test_quad2_sampler", 1, 3, 3, 1); __PYX_ERR(0, 1236, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_physical_x)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("test_quad2_sampler", 1, 3, 3, 2); __PYX_ERR(0, 1236, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "test_quad2_sampler") < 0)) __PYX_ERR(0, 1236, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v_vertices = ((PyArrayObject *)values[0]);
+    __pyx_v_field_values = ((PyArrayObject *)values[1]);
+    __pyx_v_physical_x = ((PyArrayObject *)values[2]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("test_quad2_sampler", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 1236, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.test_quad2_sampler", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_vertices), __pyx_ptype_5numpy_ndarray, 1, "vertices", 0))) __PYX_ERR(0, 1236, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_field_values), __pyx_ptype_5numpy_ndarray, 1, "field_values", 0))) __PYX_ERR(0, 1237, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_physical_x), __pyx_ptype_5numpy_ndarray, 1, "physical_x", 0))) __PYX_ERR(0, 1238, __pyx_L1_error)
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_14test_quad2_sampler(__pyx_self, __pyx_v_vertices, __pyx_v_field_values, __pyx_v_physical_x);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_14test_quad2_sampler(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_vertices, PyArrayObject *__pyx_v_field_values, PyArrayObject *__pyx_v_physical_x) {
+  double __pyx_v_val;
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D *__pyx_v_sampler = NULL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_field_values;
+  __Pyx_Buffer __pyx_pybuffer_field_values;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_physical_x;
+  __Pyx_Buffer __pyx_pybuffer_physical_x;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_vertices;
+  __Pyx_Buffer __pyx_pybuffer_vertices;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("test_quad2_sampler", 0);
+  __pyx_pybuffer_vertices.pybuffer.buf = NULL;
+  __pyx_pybuffer_vertices.refcount = 0;
+  __pyx_pybuffernd_vertices.data = NULL;
+  __pyx_pybuffernd_vertices.rcbuffer = &__pyx_pybuffer_vertices;
+  __pyx_pybuffer_field_values.pybuffer.buf = NULL;
+  __pyx_pybuffer_field_values.refcount = 0;
+  __pyx_pybuffernd_field_values.data = NULL;
+  __pyx_pybuffernd_field_values.rcbuffer = &__pyx_pybuffer_field_values;
+  __pyx_pybuffer_physical_x.pybuffer.buf = NULL;
+  __pyx_pybuffer_physical_x.refcount = 0;
+  __pyx_pybuffernd_physical_x.data = NULL;
+  __pyx_pybuffernd_physical_x.rcbuffer = &__pyx_pybuffer_physical_x;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer, (PyObject*)__pyx_v_vertices, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1236, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_vertices.diminfo[0].strides = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_vertices.diminfo[0].shape = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_vertices.diminfo[1].strides = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_vertices.diminfo[1].shape = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer, (PyObject*)__pyx_v_field_values, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1236, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_field_values.diminfo[0].strides = __pyx_pybuffernd_field_values.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_field_values.diminfo[0].shape = __pyx_pybuffernd_field_values.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_physical_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1236, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_physical_x.diminfo[0].strides = __pyx_pybuffernd_physical_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_physical_x.diminfo[0].shape = __pyx_pybuffernd_physical_x.rcbuffer->pybuffer.shape[0];
+
+  /* "yt/utilities/lib/element_mappings.pyx":1242
+ *     cdef double val
+ * 
+ *     sampler = Q2Sampler2D()             # <<<<<<<<<<<<<<
+ * 
+ *     val = sampler.sample_at_real_point(<double*> vertices.data,
+ */
+  __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1242, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_sampler = ((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1244
+ *     sampler = Q2Sampler2D()
+ * 
+ *     val = sampler.sample_at_real_point(<double*> vertices.data,             # <<<<<<<<<<<<<<
+ *                                        <double*> field_values.data,
+ *                                        <double*> physical_x.data)
+ */
+  __pyx_v_val = ((struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D *)__pyx_v_sampler->__pyx_base.__pyx_base.__pyx_vtab)->__pyx_base.__pyx_base.sample_at_real_point(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *)__pyx_v_sampler), ((double *)__pyx_v_vertices->data), ((double *)__pyx_v_field_values->data), ((double *)__pyx_v_physical_x->data));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1248
+ *                                        <double*> physical_x.data)
+ * 
+ *     return val             # <<<<<<<<<<<<<<
+ * 
+ * @cython.boundscheck(False)
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_val); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1248, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1236
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_quad2_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                        np.ndarray[np.float64_t, ndim=1] field_values,
+ *                        np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.test_quad2_sampler", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_sampler);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":1253
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_tri2_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                       np.ndarray[np.float64_t, ndim=1] field_values,
+ *                       np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_17test_tri2_sampler(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_2yt_9utilities_3lib_16element_mappings_17test_tri2_sampler = {"test_tri2_sampler", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_2yt_9utilities_3lib_16element_mappings_17test_tri2_sampler, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_17test_tri2_sampler(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_vertices = 0;
+  PyArrayObject *__pyx_v_field_values = 0;
+  PyArrayObject *__pyx_v_physical_x = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("test_tri2_sampler (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_vertices,&__pyx_n_s_field_values,&__pyx_n_s_physical_x,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_vertices)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_field_values)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("test_tri2_sampler", 1, 3, 3, 1); __PYX_ERR(0, 1253, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_physical_x)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("test_tri2_sampler", 1, 3, 3, 2); __PYX_ERR(0, 1253, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "test_tri2_sampler") < 0)) __PYX_ERR(0, 1253, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v_vertices = ((PyArrayObject *)values[0]);
+    __pyx_v_field_values = ((PyArrayObject *)values[1]);
+    __pyx_v_physical_x = ((PyArrayObject *)values[2]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("test_tri2_sampler", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 1253, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.test_tri2_sampler", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_vertices), __pyx_ptype_5numpy_ndarray, 1, "vertices", 0))) __PYX_ERR(0, 1253, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_field_values), __pyx_ptype_5numpy_ndarray, 1, "field_values", 0))) __PYX_ERR(0, 1254, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_physical_x), __pyx_ptype_5numpy_ndarray, 1, "physical_x", 0))) __PYX_ERR(0, 1255, __pyx_L1_error)
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_16test_tri2_sampler(__pyx_self, __pyx_v_vertices, __pyx_v_field_values, __pyx_v_physical_x);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_16test_tri2_sampler(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_vertices, PyArrayObject *__pyx_v_field_values, PyArrayObject *__pyx_v_physical_x) {
+  double __pyx_v_val;
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_T2Sampler2D *__pyx_v_sampler = NULL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_field_values;
+  __Pyx_Buffer __pyx_pybuffer_field_values;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_physical_x;
+  __Pyx_Buffer __pyx_pybuffer_physical_x;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_vertices;
+  __Pyx_Buffer __pyx_pybuffer_vertices;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("test_tri2_sampler", 0);
+  __pyx_pybuffer_vertices.pybuffer.buf = NULL;
+  __pyx_pybuffer_vertices.refcount = 0;
+  __pyx_pybuffernd_vertices.data = NULL;
+  __pyx_pybuffernd_vertices.rcbuffer = &__pyx_pybuffer_vertices;
+  __pyx_pybuffer_field_values.pybuffer.buf = NULL;
+  __pyx_pybuffer_field_values.refcount = 0;
+  __pyx_pybuffernd_field_values.data = NULL;
+  __pyx_pybuffernd_field_values.rcbuffer = &__pyx_pybuffer_field_values;
+  __pyx_pybuffer_physical_x.pybuffer.buf = NULL;
+  __pyx_pybuffer_physical_x.refcount = 0;
+  __pyx_pybuffernd_physical_x.data = NULL;
+  __pyx_pybuffernd_physical_x.rcbuffer = &__pyx_pybuffer_physical_x;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer, (PyObject*)__pyx_v_vertices, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1253, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_vertices.diminfo[0].strides = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_vertices.diminfo[0].shape = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_vertices.diminfo[1].strides = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_vertices.diminfo[1].shape = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer, (PyObject*)__pyx_v_field_values, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1253, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_field_values.diminfo[0].strides = __pyx_pybuffernd_field_values.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_field_values.diminfo[0].shape = __pyx_pybuffernd_field_values.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_physical_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1253, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_physical_x.diminfo[0].strides = __pyx_pybuffernd_physical_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_physical_x.diminfo[0].shape = __pyx_pybuffernd_physical_x.rcbuffer->pybuffer.shape[0];
+
+  /* "yt/utilities/lib/element_mappings.pyx":1259
+ *     cdef double val
+ * 
+ *     sampler = T2Sampler2D()             # <<<<<<<<<<<<<<
+ * 
+ *     val = sampler.sample_at_real_point(<double*> vertices.data,
+ */
+  __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_T2Sampler2D)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1259, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_sampler = ((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_T2Sampler2D *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1261
+ *     sampler = T2Sampler2D()
+ * 
+ *     val = sampler.sample_at_real_point(<double*> vertices.data,             # <<<<<<<<<<<<<<
+ *                                        <double*> field_values.data,
+ *                                        <double*> physical_x.data)
+ */
+  __pyx_v_val = ((struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_T2Sampler2D *)__pyx_v_sampler->__pyx_base.__pyx_base.__pyx_vtab)->__pyx_base.__pyx_base.sample_at_real_point(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *)__pyx_v_sampler), ((double *)__pyx_v_vertices->data), ((double *)__pyx_v_field_values->data), ((double *)__pyx_v_physical_x->data));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1265
+ *                                        <double*> physical_x.data)
+ * 
+ *     return val             # <<<<<<<<<<<<<<
+ * 
+ * @cython.boundscheck(False)
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_val); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1265, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1253
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_tri2_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                       np.ndarray[np.float64_t, ndim=1] field_values,
+ *                       np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.test_tri2_sampler", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_sampler);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "yt/utilities/lib/element_mappings.pyx":1270
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_tet2_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                       np.ndarray[np.float64_t, ndim=1] field_values,
+ *                       np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_19test_tet2_sampler(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_2yt_9utilities_3lib_16element_mappings_19test_tet2_sampler = {"test_tet2_sampler", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_2yt_9utilities_3lib_16element_mappings_19test_tet2_sampler, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_19test_tet2_sampler(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_vertices = 0;
+  PyArrayObject *__pyx_v_field_values = 0;
+  PyArrayObject *__pyx_v_physical_x = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("test_tet2_sampler (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_vertices,&__pyx_n_s_field_values,&__pyx_n_s_physical_x,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_vertices)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_field_values)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("test_tet2_sampler", 1, 3, 3, 1); __PYX_ERR(0, 1270, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_physical_x)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("test_tet2_sampler", 1, 3, 3, 2); __PYX_ERR(0, 1270, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "test_tet2_sampler") < 0)) __PYX_ERR(0, 1270, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v_vertices = ((PyArrayObject *)values[0]);
+    __pyx_v_field_values = ((PyArrayObject *)values[1]);
+    __pyx_v_physical_x = ((PyArrayObject *)values[2]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("test_tet2_sampler", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 1270, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.test_tet2_sampler", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_vertices), __pyx_ptype_5numpy_ndarray, 1, "vertices", 0))) __PYX_ERR(0, 1270, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_field_values), __pyx_ptype_5numpy_ndarray, 1, "field_values", 0))) __PYX_ERR(0, 1271, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_physical_x), __pyx_ptype_5numpy_ndarray, 1, "physical_x", 0))) __PYX_ERR(0, 1272, __pyx_L1_error)
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_18test_tet2_sampler(__pyx_self, __pyx_v_vertices, __pyx_v_field_values, __pyx_v_physical_x);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_18test_tet2_sampler(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_vertices, PyArrayObject *__pyx_v_field_values, PyArrayObject *__pyx_v_physical_x) {
+  double __pyx_v_val;
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D *__pyx_v_sampler = NULL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_field_values;
+  __Pyx_Buffer __pyx_pybuffer_field_values;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_physical_x;
+  __Pyx_Buffer __pyx_pybuffer_physical_x;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_vertices;
+  __Pyx_Buffer __pyx_pybuffer_vertices;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("test_tet2_sampler", 0);
+  __pyx_pybuffer_vertices.pybuffer.buf = NULL;
+  __pyx_pybuffer_vertices.refcount = 0;
+  __pyx_pybuffernd_vertices.data = NULL;
+  __pyx_pybuffernd_vertices.rcbuffer = &__pyx_pybuffer_vertices;
+  __pyx_pybuffer_field_values.pybuffer.buf = NULL;
+  __pyx_pybuffer_field_values.refcount = 0;
+  __pyx_pybuffernd_field_values.data = NULL;
+  __pyx_pybuffernd_field_values.rcbuffer = &__pyx_pybuffer_field_values;
+  __pyx_pybuffer_physical_x.pybuffer.buf = NULL;
+  __pyx_pybuffer_physical_x.refcount = 0;
+  __pyx_pybuffernd_physical_x.data = NULL;
+  __pyx_pybuffernd_physical_x.rcbuffer = &__pyx_pybuffer_physical_x;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer, (PyObject*)__pyx_v_vertices, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1270, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_vertices.diminfo[0].strides = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_vertices.diminfo[0].shape = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_vertices.diminfo[1].strides = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_vertices.diminfo[1].shape = __pyx_pybuffernd_vertices.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer, (PyObject*)__pyx_v_field_values, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1270, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_field_values.diminfo[0].strides = __pyx_pybuffernd_field_values.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_field_values.diminfo[0].shape = __pyx_pybuffernd_field_values.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_physical_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 1270, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_physical_x.diminfo[0].strides = __pyx_pybuffernd_physical_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_physical_x.diminfo[0].shape = __pyx_pybuffernd_physical_x.rcbuffer->pybuffer.shape[0];
+
+  /* "yt/utilities/lib/element_mappings.pyx":1276
+ *     cdef double val
+ * 
+ *     sampler = Tet2Sampler3D()             # <<<<<<<<<<<<<<
+ * 
+ *     val = sampler.sample_at_real_point(<double*> vertices.data,
+ */
+  __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1276, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_sampler = ((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1278
+ *     sampler = Tet2Sampler3D()
+ * 
+ *     val = sampler.sample_at_real_point(<double*> vertices.data,             # <<<<<<<<<<<<<<
+ *                                        <double*> field_values.data,
+ *                                        <double*> physical_x.data)
+ */
+  __pyx_v_val = ((struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D *)__pyx_v_sampler->__pyx_base.__pyx_base.__pyx_vtab)->__pyx_base.__pyx_base.sample_at_real_point(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *)__pyx_v_sampler), ((double *)__pyx_v_vertices->data), ((double *)__pyx_v_field_values->data), ((double *)__pyx_v_physical_x->data));
+
+  /* "yt/utilities/lib/element_mappings.pyx":1282
+ *                                        <double*> physical_x.data)
+ * 
+ *     return val             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_val); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1282, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1270
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_tet2_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                       np.ndarray[np.float64_t, ndim=1] field_values,
+ *                       np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.test_tet2_sampler", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_field_values.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_physical_x.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_vertices.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_sampler);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __pyx_unpickle_ElementSampler(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_21__pyx_unpickle_ElementSampler(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_2yt_9utilities_3lib_16element_mappings_21__pyx_unpickle_ElementSampler = {"__pyx_unpickle_ElementSampler", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_2yt_9utilities_3lib_16element_mappings_21__pyx_unpickle_ElementSampler, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_21__pyx_unpickle_ElementSampler(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v___pyx_type = 0;
+  long __pyx_v___pyx_checksum;
+  PyObject *__pyx_v___pyx_state = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__pyx_unpickle_ElementSampler (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pyx_type,&__pyx_n_s_pyx_checksum,&__pyx_n_s_pyx_state,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_type)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_checksum)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_ElementSampler", 1, 3, 3, 1); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_state)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_ElementSampler", 1, 3, 3, 2); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__pyx_unpickle_ElementSampler") < 0)) __PYX_ERR(1, 1, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v___pyx_type = values[0];
+    __pyx_v___pyx_checksum = __Pyx_PyInt_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 1, __pyx_L3_error)
+    __pyx_v___pyx_state = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_ElementSampler", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 1, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.__pyx_unpickle_ElementSampler", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_20__pyx_unpickle_ElementSampler(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_20__pyx_unpickle_ElementSampler(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_v___pyx_PickleError = 0;
+  PyObject *__pyx_v___pyx_result = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_ElementSampler", 0);
+
+  /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xa37a4b3, 0x7d768b6, 0xaddf564):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__19, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "(tree fragment)":5
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xa37a4b3, 0x7d768b6, 0xaddf564):
+ *         from pickle import PickleError as __pyx_PickleError             # <<<<<<<<<<<<<<
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)
+ *     __pyx_result = ElementSampler.__new__(__pyx_type)
+ */
+    __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_n_s_PickleError);
+    __Pyx_GIVEREF(__pyx_n_s_PickleError);
+    PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_PickleError);
+    __pyx_t_4 = __Pyx_Import(__pyx_n_s_pickle, __pyx_t_1, -1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_4, __pyx_n_s_PickleError); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_1);
+    __pyx_v___pyx_PickleError = __pyx_t_1;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":6
+ *     if __pyx_checksum not in (0xa37a4b3, 0x7d768b6, 0xaddf564):
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)             # <<<<<<<<<<<<<<
+ *     __pyx_result = ElementSampler.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ */
+    __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_INCREF(__pyx_v___pyx_PickleError);
+    __pyx_t_1 = __pyx_v___pyx_PickleError; __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_4 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(1, 6, __pyx_L1_error)
+
+    /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xa37a4b3, 0x7d768b6, 0xaddf564):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)
+ */
+  }
+
+  /* "(tree fragment)":7
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)
+ *     __pyx_result = ElementSampler.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_ElementSampler__set_state(<ElementSampler> __pyx_result, __pyx_state)
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_ElementSampler), __pyx_n_s_new); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_5, __pyx_v___pyx_type) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v___pyx_type);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)
+ *     __pyx_result = ElementSampler.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_ElementSampler__set_state(<ElementSampler> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  __pyx_t_3 = (__pyx_v___pyx_state != Py_None);
+  __pyx_t_2 = (__pyx_t_3 != 0);
+  if (__pyx_t_2) {
+
+    /* "(tree fragment)":9
+ *     __pyx_result = ElementSampler.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_ElementSampler__set_state(<ElementSampler> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *     return __pyx_result
+ * cdef __pyx_unpickle_ElementSampler__set_state(ElementSampler __pyx_result, tuple __pyx_state):
+ */
+    if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 9, __pyx_L1_error)
+    __pyx_t_4 = __pyx_f_2yt_9utilities_3lib_16element_mappings___pyx_unpickle_ElementSampler__set_state(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *)__pyx_v___pyx_result), ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 9, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)
+ *     __pyx_result = ElementSampler.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_ElementSampler__set_state(<ElementSampler> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  }
+
+  /* "(tree fragment)":10
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_ElementSampler__set_state(<ElementSampler> __pyx_result, __pyx_state)
+ *     return __pyx_result             # <<<<<<<<<<<<<<
+ * cdef __pyx_unpickle_ElementSampler__set_state(ElementSampler __pyx_result, tuple __pyx_state):
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v___pyx_result);
+  __pyx_r = __pyx_v___pyx_result;
+  goto __pyx_L0;
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_ElementSampler(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.__pyx_unpickle_ElementSampler", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v___pyx_PickleError);
+  __Pyx_XDECREF(__pyx_v___pyx_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":11
+ *         __pyx_unpickle_ElementSampler__set_state(<ElementSampler> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_ElementSampler__set_state(ElementSampler __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):
+ */
+
+static PyObject *__pyx_f_2yt_9utilities_3lib_16element_mappings___pyx_unpickle_ElementSampler__set_state(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __pyx_t_5numpy_float64_t __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_ElementSampler__set_state", 0);
+
+  /* "(tree fragment)":12
+ *     return __pyx_result
+ * cdef __pyx_unpickle_ElementSampler__set_state(ElementSampler __pyx_result, tuple __pyx_state):
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]             # <<<<<<<<<<<<<<
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[2])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_2 == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->inclusion_tol = __pyx_t_2;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->num_mapped_coords = __pyx_t_3;
+
+  /* "(tree fragment)":13
+ * cdef __pyx_unpickle_ElementSampler__set_state(ElementSampler __pyx_result, tuple __pyx_state):
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[2])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(1, 13, __pyx_L1_error)
+  }
+  __pyx_t_5 = PyTuple_GET_SIZE(__pyx_v___pyx_state); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_6 = ((__pyx_t_5 > 2) != 0);
+  if (__pyx_t_6) {
+  } else {
+    __pyx_t_4 = __pyx_t_6;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_6 = __Pyx_HasAttr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_7 = (__pyx_t_6 != 0);
+  __pyx_t_4 = __pyx_t_7;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_4) {
+
+    /* "(tree fragment)":14
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[2])             # <<<<<<<<<<<<<<
+ */
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_update); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    if (unlikely(__pyx_v___pyx_state == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(1, 14, __pyx_L1_error)
+    }
+    __pyx_t_8 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_10 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+      __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_9);
+      if (likely(__pyx_t_10)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+        __Pyx_INCREF(__pyx_t_10);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_9, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_10) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_10, __pyx_t_8) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_8);
+    __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "(tree fragment)":13
+ * cdef __pyx_unpickle_ElementSampler__set_state(ElementSampler __pyx_result, tuple __pyx_state):
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[2])
+ */
+  }
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_ElementSampler__set_state(<ElementSampler> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_ElementSampler__set_state(ElementSampler __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.__pyx_unpickle_ElementSampler__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __pyx_unpickle_P1Sampler1D(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_23__pyx_unpickle_P1Sampler1D(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_2yt_9utilities_3lib_16element_mappings_23__pyx_unpickle_P1Sampler1D = {"__pyx_unpickle_P1Sampler1D", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_2yt_9utilities_3lib_16element_mappings_23__pyx_unpickle_P1Sampler1D, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_23__pyx_unpickle_P1Sampler1D(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v___pyx_type = 0;
+  long __pyx_v___pyx_checksum;
+  PyObject *__pyx_v___pyx_state = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__pyx_unpickle_P1Sampler1D (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pyx_type,&__pyx_n_s_pyx_checksum,&__pyx_n_s_pyx_state,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_type)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_checksum)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_P1Sampler1D", 1, 3, 3, 1); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_state)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_P1Sampler1D", 1, 3, 3, 2); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__pyx_unpickle_P1Sampler1D") < 0)) __PYX_ERR(1, 1, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v___pyx_type = values[0];
+    __pyx_v___pyx_checksum = __Pyx_PyInt_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 1, __pyx_L3_error)
+    __pyx_v___pyx_state = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_P1Sampler1D", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 1, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.__pyx_unpickle_P1Sampler1D", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_22__pyx_unpickle_P1Sampler1D(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_22__pyx_unpickle_P1Sampler1D(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_v___pyx_PickleError = 0;
+  PyObject *__pyx_v___pyx_result = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_P1Sampler1D", 0);
+
+  /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xa37a4b3, 0x7d768b6, 0xaddf564):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__19, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "(tree fragment)":5
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xa37a4b3, 0x7d768b6, 0xaddf564):
+ *         from pickle import PickleError as __pyx_PickleError             # <<<<<<<<<<<<<<
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)
+ *     __pyx_result = P1Sampler1D.__new__(__pyx_type)
+ */
+    __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_n_s_PickleError);
+    __Pyx_GIVEREF(__pyx_n_s_PickleError);
+    PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_PickleError);
+    __pyx_t_4 = __Pyx_Import(__pyx_n_s_pickle, __pyx_t_1, -1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_4, __pyx_n_s_PickleError); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_1);
+    __pyx_v___pyx_PickleError = __pyx_t_1;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":6
+ *     if __pyx_checksum not in (0xa37a4b3, 0x7d768b6, 0xaddf564):
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)             # <<<<<<<<<<<<<<
+ *     __pyx_result = P1Sampler1D.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ */
+    __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_INCREF(__pyx_v___pyx_PickleError);
+    __pyx_t_1 = __pyx_v___pyx_PickleError; __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_4 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(1, 6, __pyx_L1_error)
+
+    /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xa37a4b3, 0x7d768b6, 0xaddf564):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)
+ */
+  }
+
+  /* "(tree fragment)":7
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)
+ *     __pyx_result = P1Sampler1D.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_P1Sampler1D__set_state(<P1Sampler1D> __pyx_result, __pyx_state)
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_P1Sampler1D), __pyx_n_s_new); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_5, __pyx_v___pyx_type) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v___pyx_type);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)
+ *     __pyx_result = P1Sampler1D.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_P1Sampler1D__set_state(<P1Sampler1D> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  __pyx_t_3 = (__pyx_v___pyx_state != Py_None);
+  __pyx_t_2 = (__pyx_t_3 != 0);
+  if (__pyx_t_2) {
+
+    /* "(tree fragment)":9
+ *     __pyx_result = P1Sampler1D.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_P1Sampler1D__set_state(<P1Sampler1D> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *     return __pyx_result
+ * cdef __pyx_unpickle_P1Sampler1D__set_state(P1Sampler1D __pyx_result, tuple __pyx_state):
+ */
+    if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 9, __pyx_L1_error)
+    __pyx_t_4 = __pyx_f_2yt_9utilities_3lib_16element_mappings___pyx_unpickle_P1Sampler1D__set_state(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler1D *)__pyx_v___pyx_result), ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 9, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)
+ *     __pyx_result = P1Sampler1D.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_P1Sampler1D__set_state(<P1Sampler1D> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  }
+
+  /* "(tree fragment)":10
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_P1Sampler1D__set_state(<P1Sampler1D> __pyx_result, __pyx_state)
+ *     return __pyx_result             # <<<<<<<<<<<<<<
+ * cdef __pyx_unpickle_P1Sampler1D__set_state(P1Sampler1D __pyx_result, tuple __pyx_state):
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v___pyx_result);
+  __pyx_r = __pyx_v___pyx_result;
+  goto __pyx_L0;
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_P1Sampler1D(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.__pyx_unpickle_P1Sampler1D", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v___pyx_PickleError);
+  __Pyx_XDECREF(__pyx_v___pyx_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":11
+ *         __pyx_unpickle_P1Sampler1D__set_state(<P1Sampler1D> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_P1Sampler1D__set_state(P1Sampler1D __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):
+ */
+
+static PyObject *__pyx_f_2yt_9utilities_3lib_16element_mappings___pyx_unpickle_P1Sampler1D__set_state(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler1D *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __pyx_t_5numpy_float64_t __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_P1Sampler1D__set_state", 0);
+
+  /* "(tree fragment)":12
+ *     return __pyx_result
+ * cdef __pyx_unpickle_P1Sampler1D__set_state(P1Sampler1D __pyx_result, tuple __pyx_state):
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]             # <<<<<<<<<<<<<<
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[2])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_2 == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->__pyx_base.inclusion_tol = __pyx_t_2;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->__pyx_base.num_mapped_coords = __pyx_t_3;
+
+  /* "(tree fragment)":13
+ * cdef __pyx_unpickle_P1Sampler1D__set_state(P1Sampler1D __pyx_result, tuple __pyx_state):
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[2])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(1, 13, __pyx_L1_error)
+  }
+  __pyx_t_5 = PyTuple_GET_SIZE(__pyx_v___pyx_state); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_6 = ((__pyx_t_5 > 2) != 0);
+  if (__pyx_t_6) {
+  } else {
+    __pyx_t_4 = __pyx_t_6;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_6 = __Pyx_HasAttr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_7 = (__pyx_t_6 != 0);
+  __pyx_t_4 = __pyx_t_7;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_4) {
+
+    /* "(tree fragment)":14
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[2])             # <<<<<<<<<<<<<<
+ */
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_update); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    if (unlikely(__pyx_v___pyx_state == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(1, 14, __pyx_L1_error)
+    }
+    __pyx_t_8 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_10 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+      __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_9);
+      if (likely(__pyx_t_10)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+        __Pyx_INCREF(__pyx_t_10);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_9, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_10) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_10, __pyx_t_8) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_8);
+    __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "(tree fragment)":13
+ * cdef __pyx_unpickle_P1Sampler1D__set_state(P1Sampler1D __pyx_result, tuple __pyx_state):
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[2])
+ */
+  }
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_P1Sampler1D__set_state(<P1Sampler1D> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_P1Sampler1D__set_state(P1Sampler1D __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.__pyx_unpickle_P1Sampler1D__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __pyx_unpickle_P1Sampler2D(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_25__pyx_unpickle_P1Sampler2D(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_2yt_9utilities_3lib_16element_mappings_25__pyx_unpickle_P1Sampler2D = {"__pyx_unpickle_P1Sampler2D", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_2yt_9utilities_3lib_16element_mappings_25__pyx_unpickle_P1Sampler2D, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_25__pyx_unpickle_P1Sampler2D(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v___pyx_type = 0;
+  long __pyx_v___pyx_checksum;
+  PyObject *__pyx_v___pyx_state = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__pyx_unpickle_P1Sampler2D (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pyx_type,&__pyx_n_s_pyx_checksum,&__pyx_n_s_pyx_state,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_type)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_checksum)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_P1Sampler2D", 1, 3, 3, 1); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_state)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_P1Sampler2D", 1, 3, 3, 2); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__pyx_unpickle_P1Sampler2D") < 0)) __PYX_ERR(1, 1, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v___pyx_type = values[0];
+    __pyx_v___pyx_checksum = __Pyx_PyInt_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 1, __pyx_L3_error)
+    __pyx_v___pyx_state = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_P1Sampler2D", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 1, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.__pyx_unpickle_P1Sampler2D", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_24__pyx_unpickle_P1Sampler2D(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_24__pyx_unpickle_P1Sampler2D(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_v___pyx_PickleError = 0;
+  PyObject *__pyx_v___pyx_result = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_P1Sampler2D", 0);
+
+  /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xa37a4b3, 0x7d768b6, 0xaddf564):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__19, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "(tree fragment)":5
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xa37a4b3, 0x7d768b6, 0xaddf564):
+ *         from pickle import PickleError as __pyx_PickleError             # <<<<<<<<<<<<<<
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)
+ *     __pyx_result = P1Sampler2D.__new__(__pyx_type)
+ */
+    __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_n_s_PickleError);
+    __Pyx_GIVEREF(__pyx_n_s_PickleError);
+    PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_PickleError);
+    __pyx_t_4 = __Pyx_Import(__pyx_n_s_pickle, __pyx_t_1, -1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_4, __pyx_n_s_PickleError); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_1);
+    __pyx_v___pyx_PickleError = __pyx_t_1;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":6
+ *     if __pyx_checksum not in (0xa37a4b3, 0x7d768b6, 0xaddf564):
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)             # <<<<<<<<<<<<<<
+ *     __pyx_result = P1Sampler2D.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ */
+    __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_INCREF(__pyx_v___pyx_PickleError);
+    __pyx_t_1 = __pyx_v___pyx_PickleError; __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_4 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(1, 6, __pyx_L1_error)
+
+    /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xa37a4b3, 0x7d768b6, 0xaddf564):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)
+ */
+  }
+
+  /* "(tree fragment)":7
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)
+ *     __pyx_result = P1Sampler2D.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_P1Sampler2D__set_state(<P1Sampler2D> __pyx_result, __pyx_state)
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_P1Sampler2D), __pyx_n_s_new); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_5, __pyx_v___pyx_type) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v___pyx_type);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)
+ *     __pyx_result = P1Sampler2D.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_P1Sampler2D__set_state(<P1Sampler2D> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  __pyx_t_3 = (__pyx_v___pyx_state != Py_None);
+  __pyx_t_2 = (__pyx_t_3 != 0);
+  if (__pyx_t_2) {
+
+    /* "(tree fragment)":9
+ *     __pyx_result = P1Sampler2D.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_P1Sampler2D__set_state(<P1Sampler2D> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *     return __pyx_result
+ * cdef __pyx_unpickle_P1Sampler2D__set_state(P1Sampler2D __pyx_result, tuple __pyx_state):
+ */
+    if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 9, __pyx_L1_error)
+    __pyx_t_4 = __pyx_f_2yt_9utilities_3lib_16element_mappings___pyx_unpickle_P1Sampler2D__set_state(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler2D *)__pyx_v___pyx_result), ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 9, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)
+ *     __pyx_result = P1Sampler2D.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_P1Sampler2D__set_state(<P1Sampler2D> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  }
+
+  /* "(tree fragment)":10
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_P1Sampler2D__set_state(<P1Sampler2D> __pyx_result, __pyx_state)
+ *     return __pyx_result             # <<<<<<<<<<<<<<
+ * cdef __pyx_unpickle_P1Sampler2D__set_state(P1Sampler2D __pyx_result, tuple __pyx_state):
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v___pyx_result);
+  __pyx_r = __pyx_v___pyx_result;
+  goto __pyx_L0;
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_P1Sampler2D(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.__pyx_unpickle_P1Sampler2D", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v___pyx_PickleError);
+  __Pyx_XDECREF(__pyx_v___pyx_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":11
+ *         __pyx_unpickle_P1Sampler2D__set_state(<P1Sampler2D> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_P1Sampler2D__set_state(P1Sampler2D __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):
+ */
+
+static PyObject *__pyx_f_2yt_9utilities_3lib_16element_mappings___pyx_unpickle_P1Sampler2D__set_state(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler2D *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __pyx_t_5numpy_float64_t __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_P1Sampler2D__set_state", 0);
+
+  /* "(tree fragment)":12
+ *     return __pyx_result
+ * cdef __pyx_unpickle_P1Sampler2D__set_state(P1Sampler2D __pyx_result, tuple __pyx_state):
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]             # <<<<<<<<<<<<<<
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[2])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_2 == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->__pyx_base.inclusion_tol = __pyx_t_2;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->__pyx_base.num_mapped_coords = __pyx_t_3;
+
+  /* "(tree fragment)":13
+ * cdef __pyx_unpickle_P1Sampler2D__set_state(P1Sampler2D __pyx_result, tuple __pyx_state):
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[2])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(1, 13, __pyx_L1_error)
+  }
+  __pyx_t_5 = PyTuple_GET_SIZE(__pyx_v___pyx_state); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_6 = ((__pyx_t_5 > 2) != 0);
+  if (__pyx_t_6) {
+  } else {
+    __pyx_t_4 = __pyx_t_6;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_6 = __Pyx_HasAttr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_7 = (__pyx_t_6 != 0);
+  __pyx_t_4 = __pyx_t_7;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_4) {
+
+    /* "(tree fragment)":14
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[2])             # <<<<<<<<<<<<<<
+ */
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_update); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    if (unlikely(__pyx_v___pyx_state == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(1, 14, __pyx_L1_error)
+    }
+    __pyx_t_8 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_10 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+      __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_9);
+      if (likely(__pyx_t_10)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+        __Pyx_INCREF(__pyx_t_10);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_9, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_10) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_10, __pyx_t_8) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_8);
+    __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "(tree fragment)":13
+ * cdef __pyx_unpickle_P1Sampler2D__set_state(P1Sampler2D __pyx_result, tuple __pyx_state):
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[2])
+ */
+  }
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_P1Sampler2D__set_state(<P1Sampler2D> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_P1Sampler2D__set_state(P1Sampler2D __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.__pyx_unpickle_P1Sampler2D__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __pyx_unpickle_P1Sampler3D(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_27__pyx_unpickle_P1Sampler3D(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_2yt_9utilities_3lib_16element_mappings_27__pyx_unpickle_P1Sampler3D = {"__pyx_unpickle_P1Sampler3D", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_2yt_9utilities_3lib_16element_mappings_27__pyx_unpickle_P1Sampler3D, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_2yt_9utilities_3lib_16element_mappings_27__pyx_unpickle_P1Sampler3D(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v___pyx_type = 0;
+  long __pyx_v___pyx_checksum;
+  PyObject *__pyx_v___pyx_state = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__pyx_unpickle_P1Sampler3D (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pyx_type,&__pyx_n_s_pyx_checksum,&__pyx_n_s_pyx_state,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_type)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_checksum)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_P1Sampler3D", 1, 3, 3, 1); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_state)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_P1Sampler3D", 1, 3, 3, 2); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__pyx_unpickle_P1Sampler3D") < 0)) __PYX_ERR(1, 1, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v___pyx_type = values[0];
+    __pyx_v___pyx_checksum = __Pyx_PyInt_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 1, __pyx_L3_error)
+    __pyx_v___pyx_state = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_P1Sampler3D", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 1, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.__pyx_unpickle_P1Sampler3D", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_2yt_9utilities_3lib_16element_mappings_26__pyx_unpickle_P1Sampler3D(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_2yt_9utilities_3lib_16element_mappings_26__pyx_unpickle_P1Sampler3D(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_v___pyx_PickleError = 0;
+  PyObject *__pyx_v___pyx_result = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_P1Sampler3D", 0);
+
+  /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xa37a4b3, 0x7d768b6, 0xaddf564):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__19, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "(tree fragment)":5
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xa37a4b3, 0x7d768b6, 0xaddf564):
+ *         from pickle import PickleError as __pyx_PickleError             # <<<<<<<<<<<<<<
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)
+ *     __pyx_result = P1Sampler3D.__new__(__pyx_type)
+ */
+    __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_n_s_PickleError);
+    __Pyx_GIVEREF(__pyx_n_s_PickleError);
+    PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_PickleError);
+    __pyx_t_4 = __Pyx_Import(__pyx_n_s_pickle, __pyx_t_1, -1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_4, __pyx_n_s_PickleError); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_1);
+    __pyx_v___pyx_PickleError = __pyx_t_1;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":6
+ *     if __pyx_checksum not in (0xa37a4b3, 0x7d768b6, 0xaddf564):
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)             # <<<<<<<<<<<<<<
+ *     __pyx_result = P1Sampler3D.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ */
+    __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_INCREF(__pyx_v___pyx_PickleError);
+    __pyx_t_1 = __pyx_v___pyx_PickleError; __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_4 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(1, 6, __pyx_L1_error)
+
+    /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xa37a4b3, 0x7d768b6, 0xaddf564):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)
+ */
+  }
+
+  /* "(tree fragment)":7
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)
+ *     __pyx_result = P1Sampler3D.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_P1Sampler3D__set_state(<P1Sampler3D> __pyx_result, __pyx_state)
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_2yt_9utilities_3lib_16element_mappings_P1Sampler3D), __pyx_n_s_new); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_5, __pyx_v___pyx_type) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v___pyx_type);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)
+ *     __pyx_result = P1Sampler3D.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_P1Sampler3D__set_state(<P1Sampler3D> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  __pyx_t_3 = (__pyx_v___pyx_state != Py_None);
+  __pyx_t_2 = (__pyx_t_3 != 0);
+  if (__pyx_t_2) {
+
+    /* "(tree fragment)":9
+ *     __pyx_result = P1Sampler3D.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_P1Sampler3D__set_state(<P1Sampler3D> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *     return __pyx_result
+ * cdef __pyx_unpickle_P1Sampler3D__set_state(P1Sampler3D __pyx_result, tuple __pyx_state):
+ */
+    if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 9, __pyx_L1_error)
+    __pyx_t_4 = __pyx_f_2yt_9utilities_3lib_16element_mappings___pyx_unpickle_P1Sampler3D__set_state(((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *)__pyx_v___pyx_result), ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 9, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xa37a4b3, 0x7d768b6, 0xaddf564) = (inclusion_tol, num_mapped_coords))" % __pyx_checksum)
+ *     __pyx_result = P1Sampler3D.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_P1Sampler3D__set_state(<P1Sampler3D> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  }
+
+  /* "(tree fragment)":10
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_P1Sampler3D__set_state(<P1Sampler3D> __pyx_result, __pyx_state)
+ *     return __pyx_result             # <<<<<<<<<<<<<<
+ * cdef __pyx_unpickle_P1Sampler3D__set_state(P1Sampler3D __pyx_result, tuple __pyx_state):
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v___pyx_result);
+  __pyx_r = __pyx_v___pyx_result;
+  goto __pyx_L0;
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_P1Sampler3D(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.__pyx_unpickle_P1Sampler3D", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v___pyx_PickleError);
+  __Pyx_XDECREF(__pyx_v___pyx_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":11
+ *         __pyx_unpickle_P1Sampler3D__set_state(<P1Sampler3D> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_P1Sampler3D__set_state(P1Sampler3D __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):
+ */
+
+static PyObject *__pyx_f_2yt_9utilities_3lib_16element_mappings___pyx_unpickle_P1Sampler3D__set_state(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __pyx_t_5numpy_float64_t __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_P1Sampler3D__set_state", 0);
+
+  /* "(tree fragment)":12
+ *     return __pyx_result
+ * cdef __pyx_unpickle_P1Sampler3D__set_state(P1Sampler3D __pyx_result, tuple __pyx_state):
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]             # <<<<<<<<<<<<<<
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[2])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_2 == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->__pyx_base.inclusion_tol = __pyx_t_2;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->__pyx_base.num_mapped_coords = __pyx_t_3;
+
+  /* "(tree fragment)":13
+ * cdef __pyx_unpickle_P1Sampler3D__set_state(P1Sampler3D __pyx_result, tuple __pyx_state):
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[2])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(1, 13, __pyx_L1_error)
+  }
+  __pyx_t_5 = PyTuple_GET_SIZE(__pyx_v___pyx_state); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_6 = ((__pyx_t_5 > 2) != 0);
+  if (__pyx_t_6) {
+  } else {
+    __pyx_t_4 = __pyx_t_6;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_6 = __Pyx_HasAttr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_7 = (__pyx_t_6 != 0);
+  __pyx_t_4 = __pyx_t_7;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_4) {
+
+    /* "(tree fragment)":14
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[2])             # <<<<<<<<<<<<<<
+ */
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_update); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    if (unlikely(__pyx_v___pyx_state == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(1, 14, __pyx_L1_error)
+    }
+    __pyx_t_8 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_10 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+      __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_9);
+      if (likely(__pyx_t_10)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+        __Pyx_INCREF(__pyx_t_10);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_9, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_10) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_10, __pyx_t_8) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_8);
+    __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "(tree fragment)":13
+ * cdef __pyx_unpickle_P1Sampler3D__set_state(P1Sampler3D __pyx_result, tuple __pyx_state):
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[2])
+ */
+  }
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_P1Sampler3D__set_state(<P1Sampler3D> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_P1Sampler3D__set_state(P1Sampler3D __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("yt.utilities.lib.element_mappings.__pyx_unpickle_P1Sampler3D__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":734
+ * ctypedef npy_cdouble     complex_t
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__pyx_v_a) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew1", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":735
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):
+ *     return PyArray_MultiIterNew(1, <void*>a)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(1, ((void *)__pyx_v_a)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 735, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":734
+ * ctypedef npy_cdouble     complex_t
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew1", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":737
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__pyx_v_a, PyObject *__pyx_v_b) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew2", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":738
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(2, ((void *)__pyx_v_a), ((void *)__pyx_v_b)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 738, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":737
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew2", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":740
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew3", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":741
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(3, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 741, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":740
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew3", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":743
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c, PyObject *__pyx_v_d) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew4", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":744
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(4, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 744, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":743
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew4", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":746
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c, PyObject *__pyx_v_d, PyObject *__pyx_v_e) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew5", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":747
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(5, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d), ((void *)__pyx_v_e)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 747, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":746
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew5", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":749
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
+ *     if PyDataType_HASSUBARRAY(d):
+ *         return <tuple>d.subarray.shape
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__pyx_v_d) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("PyDataType_SHAPE", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":750
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):
+ *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
+ *         return <tuple>d.subarray.shape
+ *     else:
+ */
+  __pyx_t_1 = (PyDataType_HASSUBARRAY(__pyx_v_d) != 0);
+  if (__pyx_t_1) {
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":751
+ * cdef inline tuple PyDataType_SHAPE(dtype d):
+ *     if PyDataType_HASSUBARRAY(d):
+ *         return <tuple>d.subarray.shape             # <<<<<<<<<<<<<<
+ *     else:
+ *         return ()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(((PyObject*)__pyx_v_d->subarray->shape));
+    __pyx_r = ((PyObject*)__pyx_v_d->subarray->shape);
+    goto __pyx_L0;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":750
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):
+ *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
+ *         return <tuple>d.subarray.shape
+ *     else:
+ */
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":753
+ *         return <tuple>d.subarray.shape
+ *     else:
+ *         return ()             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_empty_tuple);
+    __pyx_r = __pyx_empty_tuple;
+    goto __pyx_L0;
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":749
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
+ *     if PyDataType_HASSUBARRAY(d):
+ *         return <tuple>d.subarray.shape
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":928
+ *     int _import_umath() except -1
+ * 
+ * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
+ *     Py_INCREF(base) # important to do this before stealing the reference below!
+ *     PyArray_SetBaseObject(arr, base)
+ */
+
+static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_arr, PyObject *__pyx_v_base) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("set_array_base", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":929
+ * 
+ * cdef inline void set_array_base(ndarray arr, object base):
+ *     Py_INCREF(base) # important to do this before stealing the reference below!             # <<<<<<<<<<<<<<
+ *     PyArray_SetBaseObject(arr, base)
+ * 
+ */
+  Py_INCREF(__pyx_v_base);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":930
+ * cdef inline void set_array_base(ndarray arr, object base):
+ *     Py_INCREF(base) # important to do this before stealing the reference below!
+ *     PyArray_SetBaseObject(arr, base)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object get_array_base(ndarray arr):
+ */
+  (void)(PyArray_SetBaseObject(__pyx_v_arr, __pyx_v_base));
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":928
+ *     int _import_umath() except -1
+ * 
+ * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
+ *     Py_INCREF(base) # important to do this before stealing the reference below!
+ *     PyArray_SetBaseObject(arr, base)
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":932
+ *     PyArray_SetBaseObject(arr, base)
+ * 
+ * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
+ *     base = PyArray_BASE(arr)
+ *     if base is NULL:
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__pyx_v_arr) {
+  PyObject *__pyx_v_base;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("get_array_base", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":933
+ * 
+ * cdef inline object get_array_base(ndarray arr):
+ *     base = PyArray_BASE(arr)             # <<<<<<<<<<<<<<
+ *     if base is NULL:
+ *         return None
+ */
+  __pyx_v_base = PyArray_BASE(__pyx_v_arr);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":934
+ * cdef inline object get_array_base(ndarray arr):
+ *     base = PyArray_BASE(arr)
+ *     if base is NULL:             # <<<<<<<<<<<<<<
+ *         return None
+ *     return <object>base
+ */
+  __pyx_t_1 = ((__pyx_v_base == NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":935
+ *     base = PyArray_BASE(arr)
+ *     if base is NULL:
+ *         return None             # <<<<<<<<<<<<<<
+ *     return <object>base
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":934
+ * cdef inline object get_array_base(ndarray arr):
+ *     base = PyArray_BASE(arr)
+ *     if base is NULL:             # <<<<<<<<<<<<<<
+ *         return None
+ *     return <object>base
+ */
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":936
+ *     if base is NULL:
+ *         return None
+ *     return <object>base             # <<<<<<<<<<<<<<
+ * 
+ * # Versions of the import_* functions which are more suitable for
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_base));
+  __pyx_r = ((PyObject *)__pyx_v_base);
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":932
+ *     PyArray_SetBaseObject(arr, base)
+ * 
+ * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
+ *     base = PyArray_BASE(arr)
+ *     if base is NULL:
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":940
+ * # Versions of the import_* functions which are more suitable for
+ * # Cython code.
+ * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         __pyx_import_array()
+ */
+
+static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("import_array", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":941
+ * # Cython code.
+ * cdef inline int import_array() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         __pyx_import_array()
+ *     except Exception:
+ */
+  {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
+    __Pyx_XGOTREF(__pyx_t_1);
+    __Pyx_XGOTREF(__pyx_t_2);
+    __Pyx_XGOTREF(__pyx_t_3);
+    /*try:*/ {
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":942
+ * cdef inline int import_array() except -1:
+ *     try:
+ *         __pyx_import_array()             # <<<<<<<<<<<<<<
+ *     except Exception:
+ *         raise ImportError("numpy.core.multiarray failed to import")
+ */
+      __pyx_t_4 = _import_array(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 942, __pyx_L3_error)
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":941
+ * # Cython code.
+ * cdef inline int import_array() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         __pyx_import_array()
+ *     except Exception:
+ */
+    }
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    goto __pyx_L8_try_end;
+    __pyx_L3_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":943
+ *     try:
+ *         __pyx_import_array()
+ *     except Exception:             # <<<<<<<<<<<<<<
+ *         raise ImportError("numpy.core.multiarray failed to import")
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
+    if (__pyx_t_4) {
+      __Pyx_AddTraceback("numpy.import_array", __pyx_clineno, __pyx_lineno, __pyx_filename);
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 943, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_GOTREF(__pyx_t_7);
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":944
+ *         __pyx_import_array()
+ *     except Exception:
+ *         raise ImportError("numpy.core.multiarray failed to import")             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int import_umath() except -1:
+ */
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__20, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 944, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_Raise(__pyx_t_8, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __PYX_ERR(2, 944, __pyx_L5_except_error)
+    }
+    goto __pyx_L5_except_error;
+    __pyx_L5_except_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":941
+ * # Cython code.
+ * cdef inline int import_array() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         __pyx_import_array()
+ *     except Exception:
+ */
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L1_error;
+    __pyx_L8_try_end:;
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":940
+ * # Versions of the import_* functions which are more suitable for
+ * # Cython code.
+ * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         __pyx_import_array()
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("numpy.import_array", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":946
+ *         raise ImportError("numpy.core.multiarray failed to import")
+ * 
+ * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         _import_umath()
+ */
+
+static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("import_umath", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":947
+ * 
+ * cdef inline int import_umath() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+  {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
+    __Pyx_XGOTREF(__pyx_t_1);
+    __Pyx_XGOTREF(__pyx_t_2);
+    __Pyx_XGOTREF(__pyx_t_3);
+    /*try:*/ {
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":948
+ * cdef inline int import_umath() except -1:
+ *     try:
+ *         _import_umath()             # <<<<<<<<<<<<<<
+ *     except Exception:
+ *         raise ImportError("numpy.core.umath failed to import")
+ */
+      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 948, __pyx_L3_error)
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":947
+ * 
+ * cdef inline int import_umath() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+    }
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    goto __pyx_L8_try_end;
+    __pyx_L3_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":949
+ *     try:
+ *         _import_umath()
+ *     except Exception:             # <<<<<<<<<<<<<<
+ *         raise ImportError("numpy.core.umath failed to import")
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
+    if (__pyx_t_4) {
+      __Pyx_AddTraceback("numpy.import_umath", __pyx_clineno, __pyx_lineno, __pyx_filename);
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 949, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_GOTREF(__pyx_t_7);
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":950
+ *         _import_umath()
+ *     except Exception:
+ *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int import_ufunc() except -1:
+ */
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__21, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 950, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_Raise(__pyx_t_8, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __PYX_ERR(2, 950, __pyx_L5_except_error)
+    }
+    goto __pyx_L5_except_error;
+    __pyx_L5_except_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":947
+ * 
+ * cdef inline int import_umath() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L1_error;
+    __pyx_L8_try_end:;
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":946
+ *         raise ImportError("numpy.core.multiarray failed to import")
+ * 
+ * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         _import_umath()
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("numpy.import_umath", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":952
+ *         raise ImportError("numpy.core.umath failed to import")
+ * 
+ * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         _import_umath()
+ */
+
+static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("import_ufunc", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":953
+ * 
+ * cdef inline int import_ufunc() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+  {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
+    __Pyx_XGOTREF(__pyx_t_1);
+    __Pyx_XGOTREF(__pyx_t_2);
+    __Pyx_XGOTREF(__pyx_t_3);
+    /*try:*/ {
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":954
+ * cdef inline int import_ufunc() except -1:
+ *     try:
+ *         _import_umath()             # <<<<<<<<<<<<<<
+ *     except Exception:
+ *         raise ImportError("numpy.core.umath failed to import")
+ */
+      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 954, __pyx_L3_error)
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":953
+ * 
+ * cdef inline int import_ufunc() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+    }
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    goto __pyx_L8_try_end;
+    __pyx_L3_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":955
+ *     try:
+ *         _import_umath()
+ *     except Exception:             # <<<<<<<<<<<<<<
+ *         raise ImportError("numpy.core.umath failed to import")
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
+    if (__pyx_t_4) {
+      __Pyx_AddTraceback("numpy.import_ufunc", __pyx_clineno, __pyx_lineno, __pyx_filename);
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 955, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_GOTREF(__pyx_t_7);
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":956
+ *         _import_umath()
+ *     except Exception:
+ *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
+ * 
+ * cdef extern from *:
+ */
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__21, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 956, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_Raise(__pyx_t_8, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __PYX_ERR(2, 956, __pyx_L5_except_error)
+    }
+    goto __pyx_L5_except_error;
+    __pyx_L5_except_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":953
+ * 
+ * cdef inline int import_ufunc() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L1_error;
+    __pyx_L8_try_end:;
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":952
+ *         raise ImportError("numpy.core.umath failed to import")
+ * 
+ * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         _import_umath()
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("numpy.import_ufunc", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":966
+ * 
+ * 
+ * cdef inline bint is_timedelta64_object(object obj):             # <<<<<<<<<<<<<<
+ *     """
+ *     Cython equivalent of `isinstance(obj, np.timedelta64)`
+ */
+
+static CYTHON_INLINE int __pyx_f_5numpy_is_timedelta64_object(PyObject *__pyx_v_obj) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("is_timedelta64_object", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":978
+ *     bool
+ *     """
+ *     return PyObject_TypeCheck(obj, &PyTimedeltaArrType_Type)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = PyObject_TypeCheck(__pyx_v_obj, (&PyTimedeltaArrType_Type));
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":966
+ * 
+ * 
+ * cdef inline bint is_timedelta64_object(object obj):             # <<<<<<<<<<<<<<
+ *     """
+ *     Cython equivalent of `isinstance(obj, np.timedelta64)`
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":981
+ * 
+ * 
+ * cdef inline bint is_datetime64_object(object obj):             # <<<<<<<<<<<<<<
+ *     """
+ *     Cython equivalent of `isinstance(obj, np.datetime64)`
+ */
+
+static CYTHON_INLINE int __pyx_f_5numpy_is_datetime64_object(PyObject *__pyx_v_obj) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("is_datetime64_object", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":993
+ *     bool
+ *     """
+ *     return PyObject_TypeCheck(obj, &PyDatetimeArrType_Type)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = PyObject_TypeCheck(__pyx_v_obj, (&PyDatetimeArrType_Type));
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":981
+ * 
+ * 
+ * cdef inline bint is_datetime64_object(object obj):             # <<<<<<<<<<<<<<
+ *     """
+ *     Cython equivalent of `isinstance(obj, np.datetime64)`
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":996
+ * 
+ * 
+ * cdef inline npy_datetime get_datetime64_value(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the int64 value underlying scalar numpy datetime64 object
+ */
+
+static CYTHON_INLINE npy_datetime __pyx_f_5numpy_get_datetime64_value(PyObject *__pyx_v_obj) {
+  npy_datetime __pyx_r;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1003
+ *     also needed.  That can be found using `get_datetime64_unit`.
+ *     """
+ *     return (<PyDatetimeScalarObject*>obj).obval             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = ((PyDatetimeScalarObject *)__pyx_v_obj)->obval;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":996
+ * 
+ * 
+ * cdef inline npy_datetime get_datetime64_value(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the int64 value underlying scalar numpy datetime64 object
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1006
+ * 
+ * 
+ * cdef inline npy_timedelta get_timedelta64_value(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the int64 value underlying scalar numpy timedelta64 object
+ */
+
+static CYTHON_INLINE npy_timedelta __pyx_f_5numpy_get_timedelta64_value(PyObject *__pyx_v_obj) {
+  npy_timedelta __pyx_r;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1010
+ *     returns the int64 value underlying scalar numpy timedelta64 object
+ *     """
+ *     return (<PyTimedeltaScalarObject*>obj).obval             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = ((PyTimedeltaScalarObject *)__pyx_v_obj)->obval;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1006
+ * 
+ * 
+ * cdef inline npy_timedelta get_timedelta64_value(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the int64 value underlying scalar numpy timedelta64 object
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1013
+ * 
+ * 
+ * cdef inline NPY_DATETIMEUNIT get_datetime64_unit(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the unit part of the dtype for a numpy datetime64 object.
+ */
+
+static CYTHON_INLINE NPY_DATETIMEUNIT __pyx_f_5numpy_get_datetime64_unit(PyObject *__pyx_v_obj) {
+  NPY_DATETIMEUNIT __pyx_r;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1017
+ *     returns the unit part of the dtype for a numpy datetime64 object.
+ *     """
+ *     return <NPY_DATETIMEUNIT>(<PyDatetimeScalarObject*>obj).obmeta.base             # <<<<<<<<<<<<<<
+ */
+  __pyx_r = ((NPY_DATETIMEUNIT)((PyDatetimeScalarObject *)__pyx_v_obj)->obmeta.base);
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1013
+ * 
+ * 
+ * cdef inline NPY_DATETIMEUNIT get_datetime64_unit(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the unit part of the dtype for a numpy datetime64 object.
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_ElementSampler __pyx_vtable_2yt_9utilities_3lib_16element_mappings_ElementSampler;
+
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_ElementSampler(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *p;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *)o);
+  p->__pyx_vtab = __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_ElementSampler;
+  return o;
+}
+
+static void __pyx_tp_dealloc_2yt_9utilities_3lib_16element_mappings_ElementSampler(PyObject *o) {
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && (!PyType_IS_GC(Py_TYPE(o)) || !__Pyx_PyObject_GC_IsFinalized(o))) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static PyMethodDef __pyx_methods_2yt_9utilities_3lib_16element_mappings_ElementSampler[] = {
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_14ElementSampler_3__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_14ElementSampler_5__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_2yt_9utilities_3lib_16element_mappings_ElementSampler = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "yt.utilities.lib.element_mappings.ElementSampler", /*tp_name*/
+  sizeof(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_2yt_9utilities_3lib_16element_mappings_ElementSampler, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  "\n\n    This is a base class for sampling the value of a finite element solution\n    at an arbitrary point inside a mesh element. In general, this will be done\n    by transforming the requested physical coordinate into a mapped coordinate\n    system, sampling the solution in mapped coordinates, and returning the result.\n    This is not to be used directly; use one of the subclasses instead.\n\n    ", /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_2yt_9utilities_3lib_16element_mappings_ElementSampler, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_2yt_9utilities_3lib_16element_mappings_14ElementSampler_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_2yt_9utilities_3lib_16element_mappings_ElementSampler, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_P1Sampler1D __pyx_vtable_2yt_9utilities_3lib_16element_mappings_P1Sampler1D;
+
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_P1Sampler1D(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler1D *p;
+  PyObject *o = __pyx_tp_new_2yt_9utilities_3lib_16element_mappings_ElementSampler(t, a, k);
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler1D *)o);
+  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_ElementSampler*)__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_P1Sampler1D;
+  return o;
+}
+
+static PyMethodDef __pyx_methods_2yt_9utilities_3lib_16element_mappings_P1Sampler1D[] = {
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D_3__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D_5__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler1D = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "yt.utilities.lib.element_mappings.P1Sampler1D", /*tp_name*/
+  sizeof(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler1D), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_2yt_9utilities_3lib_16element_mappings_ElementSampler, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  "\n\n    This implements sampling inside a linear, 1D element.\n\n    ", /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_2yt_9utilities_3lib_16element_mappings_P1Sampler1D, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_2yt_9utilities_3lib_16element_mappings_P1Sampler1D, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_P1Sampler2D __pyx_vtable_2yt_9utilities_3lib_16element_mappings_P1Sampler2D;
+
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_P1Sampler2D(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler2D *p;
+  PyObject *o = __pyx_tp_new_2yt_9utilities_3lib_16element_mappings_ElementSampler(t, a, k);
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler2D *)o);
+  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_ElementSampler*)__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_P1Sampler2D;
+  return o;
+}
+
+static PyMethodDef __pyx_methods_2yt_9utilities_3lib_16element_mappings_P1Sampler2D[] = {
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D_3__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D_5__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler2D = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "yt.utilities.lib.element_mappings.P1Sampler2D", /*tp_name*/
+  sizeof(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler2D), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_2yt_9utilities_3lib_16element_mappings_ElementSampler, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  "\n\n    This implements sampling inside a linear, triangular mesh element.\n    This mapping is linear and can be inverted easily. Note that this\n    implementation uses triangular (or barycentric) coordinates.\n\n    ", /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_2yt_9utilities_3lib_16element_mappings_P1Sampler2D, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_2yt_9utilities_3lib_16element_mappings_P1Sampler2D, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_P1Sampler3D __pyx_vtable_2yt_9utilities_3lib_16element_mappings_P1Sampler3D;
+
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_P1Sampler3D(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *p;
+  PyObject *o = __pyx_tp_new_2yt_9utilities_3lib_16element_mappings_ElementSampler(t, a, k);
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D *)o);
+  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_ElementSampler*)__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_P1Sampler3D;
+  return o;
+}
+
+static PyMethodDef __pyx_methods_2yt_9utilities_3lib_16element_mappings_P1Sampler3D[] = {
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_3__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_5__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler3D = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "yt.utilities.lib.element_mappings.P1Sampler3D", /*tp_name*/
+  sizeof(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_P1Sampler3D), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_2yt_9utilities_3lib_16element_mappings_ElementSampler, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  "\n\n    This implements sampling inside a linear, tetrahedral mesh element.\n    This mapping is linear and can be inverted easily.\n\n    ", /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_2yt_9utilities_3lib_16element_mappings_P1Sampler3D, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_2yt_9utilities_3lib_16element_mappings_P1Sampler3D, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D __pyx_vtable_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D;
+
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D *p;
+  PyObject *o = __pyx_tp_new_2yt_9utilities_3lib_16element_mappings_ElementSampler(t, a, k);
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D *)o);
+  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_ElementSampler*)__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D;
+  return o;
+}
+
+static PyMethodDef __pyx_methods_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D[] = {
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler3D_3__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler3D_5__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "yt.utilities.lib.element_mappings.NonlinearSolveSampler3D", /*tp_name*/
+  sizeof(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_2yt_9utilities_3lib_16element_mappings_ElementSampler, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  "\n\n    This is a base class for handling element samplers that require\n    a nonlinear solve to invert the mapping between coordinate systems.\n    To do this, we perform Newton-Raphson iteration using a specified\n    system of equations with an analytic Jacobian matrix. This solver\n    is hard-coded for 3D for reasons of efficiency. This is not to be\n    used directly, use one of the subclasses instead.\n\n    ", /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler3D_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D __pyx_vtable_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D;
+
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D *p;
+  PyObject *o = __pyx_tp_new_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D(t, a, k);
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D *)o);
+  p->__pyx_base.__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_ElementSampler*)__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D;
+  return o;
+}
+
+static PyMethodDef __pyx_methods_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D[] = {
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D_3__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D_5__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "yt.utilities.lib.element_mappings.Q1Sampler3D", /*tp_name*/
+  sizeof(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_2yt_9utilities_3lib_16element_mappings_ElementSampler, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  "\n\n    This implements sampling inside a 3D, linear, hexahedral mesh element.\n\n    ", /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_W1Sampler3D __pyx_vtable_2yt_9utilities_3lib_16element_mappings_W1Sampler3D;
+
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_W1Sampler3D(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_W1Sampler3D *p;
+  PyObject *o = __pyx_tp_new_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D(t, a, k);
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_W1Sampler3D *)o);
+  p->__pyx_base.__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_ElementSampler*)__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_W1Sampler3D;
+  return o;
+}
+
+static PyMethodDef __pyx_methods_2yt_9utilities_3lib_16element_mappings_W1Sampler3D[] = {
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D_3__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D_5__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_2yt_9utilities_3lib_16element_mappings_W1Sampler3D = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "yt.utilities.lib.element_mappings.W1Sampler3D", /*tp_name*/
+  sizeof(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_W1Sampler3D), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_2yt_9utilities_3lib_16element_mappings_ElementSampler, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  "\n\n    This implements sampling inside a 3D, linear, wedge mesh element.\n\n    ", /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_2yt_9utilities_3lib_16element_mappings_W1Sampler3D, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_2yt_9utilities_3lib_16element_mappings_W1Sampler3D, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_S2Sampler3D __pyx_vtable_2yt_9utilities_3lib_16element_mappings_S2Sampler3D;
+
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_S2Sampler3D(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_S2Sampler3D *p;
+  PyObject *o = __pyx_tp_new_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D(t, a, k);
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_S2Sampler3D *)o);
+  p->__pyx_base.__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_ElementSampler*)__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_S2Sampler3D;
+  return o;
+}
+
+static PyMethodDef __pyx_methods_2yt_9utilities_3lib_16element_mappings_S2Sampler3D[] = {
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D_3__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D_5__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_2yt_9utilities_3lib_16element_mappings_S2Sampler3D = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "yt.utilities.lib.element_mappings.S2Sampler3D", /*tp_name*/
+  sizeof(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_S2Sampler3D), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_2yt_9utilities_3lib_16element_mappings_ElementSampler, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  "\n\n    This implements sampling inside a 3D, 20-node hexahedral mesh element.\n\n    ", /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_2yt_9utilities_3lib_16element_mappings_S2Sampler3D, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_2yt_9utilities_3lib_16element_mappings_S2Sampler3D, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D __pyx_vtable_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D;
+
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D *p;
+  PyObject *o = __pyx_tp_new_2yt_9utilities_3lib_16element_mappings_ElementSampler(t, a, k);
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D *)o);
+  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_ElementSampler*)__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D;
+  return o;
+}
+
+static PyMethodDef __pyx_methods_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D[] = {
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler2D_3__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler2D_5__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "yt.utilities.lib.element_mappings.NonlinearSolveSampler2D", /*tp_name*/
+  sizeof(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_2yt_9utilities_3lib_16element_mappings_ElementSampler, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  "\n\n    This is a base class for handling element samplers that require\n    a nonlinear solve to invert the mapping between coordinate systems.\n    To do this, we perform Newton-Raphson iteration using a specified\n    system of equations with an analytic Jacobian matrix. This solver\n    is hard-coded for 2D for reasons of efficiency. This is not to be\n    used directly, use one of the subclasses instead.\n\n    ", /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler2D_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D __pyx_vtable_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D;
+
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D *p;
+  PyObject *o = __pyx_tp_new_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D(t, a, k);
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D *)o);
+  p->__pyx_base.__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_ElementSampler*)__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D;
+  return o;
+}
+
+static PyMethodDef __pyx_methods_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D[] = {
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q1Sampler2D_3__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q1Sampler2D_5__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "yt.utilities.lib.element_mappings.Q1Sampler2D", /*tp_name*/
+  sizeof(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_2yt_9utilities_3lib_16element_mappings_ElementSampler, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  "\n\n    This implements sampling inside a 2D, linear, quadrilateral mesh element.\n\n    ", /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q1Sampler2D_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D __pyx_vtable_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D;
+
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D *p;
+  PyObject *o = __pyx_tp_new_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D(t, a, k);
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D *)o);
+  p->__pyx_base.__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_ElementSampler*)__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D;
+  return o;
+}
+
+static PyMethodDef __pyx_methods_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D[] = {
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q2Sampler2D_3__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q2Sampler2D_5__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "yt.utilities.lib.element_mappings.Q2Sampler2D", /*tp_name*/
+  sizeof(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_2yt_9utilities_3lib_16element_mappings_ElementSampler, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  "\n\n    This implements sampling inside a 2D, quadratic, quadrilateral mesh element.\n\n    ", /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_2yt_9utilities_3lib_16element_mappings_11Q2Sampler2D_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_T2Sampler2D __pyx_vtable_2yt_9utilities_3lib_16element_mappings_T2Sampler2D;
+
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_T2Sampler2D(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_T2Sampler2D *p;
+  PyObject *o = __pyx_tp_new_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D(t, a, k);
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_T2Sampler2D *)o);
+  p->__pyx_base.__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_ElementSampler*)__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_T2Sampler2D;
+  return o;
+}
+
+static PyMethodDef __pyx_methods_2yt_9utilities_3lib_16element_mappings_T2Sampler2D[] = {
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_11T2Sampler2D_3__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_11T2Sampler2D_5__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_2yt_9utilities_3lib_16element_mappings_T2Sampler2D = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "yt.utilities.lib.element_mappings.T2Sampler2D", /*tp_name*/
+  sizeof(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_T2Sampler2D), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_2yt_9utilities_3lib_16element_mappings_ElementSampler, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  "\n\n    This implements sampling inside a 2D, quadratic, triangular mesh\n    element. Note that this implementation uses canonical coordinates.\n\n    ", /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_2yt_9utilities_3lib_16element_mappings_T2Sampler2D, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_2yt_9utilities_3lib_16element_mappings_11T2Sampler2D_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_2yt_9utilities_3lib_16element_mappings_T2Sampler2D, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+static struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D __pyx_vtable_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D;
+
+static PyObject *__pyx_tp_new_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D *p;
+  PyObject *o = __pyx_tp_new_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D(t, a, k);
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D *)o);
+  p->__pyx_base.__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_2yt_9utilities_3lib_16element_mappings_ElementSampler*)__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D;
+  return o;
+}
+
+static PyMethodDef __pyx_methods_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D[] = {
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D_3__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D_5__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "yt.utilities.lib.element_mappings.Tet2Sampler3D", /*tp_name*/
+  sizeof(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_2yt_9utilities_3lib_16element_mappings_ElementSampler, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  "\n\n    This implements sampling inside a 3D, quadratic, tetrahedral mesh\n    element. Note that this implementation uses canonical coordinates.\n\n    ", /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+
+#if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec_element_mappings(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec_element_mappings},
+  {0, NULL}
+};
+#endif
+
+static struct PyModuleDef __pyx_moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "element_mappings",
+    __pyx_k_This_file_contains_coordinate_m, /* m_doc */
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    0, /* m_size */
+  #else
+    -1, /* m_size */
+  #endif
+    __pyx_methods /* m_methods */,
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    __pyx_moduledef_slots, /* m_slots */
+  #else
+    NULL, /* m_reload */
+  #endif
+    NULL, /* m_traverse */
+    NULL, /* m_clear */
+    NULL /* m_free */
+};
+#endif
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_n_s_ElementSampler, __pyx_k_ElementSampler, sizeof(__pyx_k_ElementSampler), 0, 0, 1, 1},
+  {&__pyx_n_s_ImportError, __pyx_k_ImportError, sizeof(__pyx_k_ImportError), 0, 0, 1, 1},
+  {&__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_k_Incompatible_checksums_0x_x_vs_0, sizeof(__pyx_k_Incompatible_checksums_0x_x_vs_0), 0, 0, 1, 0},
+  {&__pyx_n_s_NonlinearSolveSampler2D, __pyx_k_NonlinearSolveSampler2D, sizeof(__pyx_k_NonlinearSolveSampler2D), 0, 0, 1, 1},
+  {&__pyx_n_s_NonlinearSolveSampler3D, __pyx_k_NonlinearSolveSampler3D, sizeof(__pyx_k_NonlinearSolveSampler3D), 0, 0, 1, 1},
+  {&__pyx_n_s_P1Sampler1D, __pyx_k_P1Sampler1D, sizeof(__pyx_k_P1Sampler1D), 0, 0, 1, 1},
+  {&__pyx_n_s_P1Sampler2D, __pyx_k_P1Sampler2D, sizeof(__pyx_k_P1Sampler2D), 0, 0, 1, 1},
+  {&__pyx_n_s_P1Sampler3D, __pyx_k_P1Sampler3D, sizeof(__pyx_k_P1Sampler3D), 0, 0, 1, 1},
+  {&__pyx_n_s_PickleError, __pyx_k_PickleError, sizeof(__pyx_k_PickleError), 0, 0, 1, 1},
+  {&__pyx_n_s_Q1Sampler2D, __pyx_k_Q1Sampler2D, sizeof(__pyx_k_Q1Sampler2D), 0, 0, 1, 1},
+  {&__pyx_n_s_Q1Sampler3D, __pyx_k_Q1Sampler3D, sizeof(__pyx_k_Q1Sampler3D), 0, 0, 1, 1},
+  {&__pyx_n_s_Q2Sampler2D, __pyx_k_Q2Sampler2D, sizeof(__pyx_k_Q2Sampler2D), 0, 0, 1, 1},
+  {&__pyx_n_s_S2Sampler3D, __pyx_k_S2Sampler3D, sizeof(__pyx_k_S2Sampler3D), 0, 0, 1, 1},
+  {&__pyx_n_s_T2Sampler2D, __pyx_k_T2Sampler2D, sizeof(__pyx_k_T2Sampler2D), 0, 0, 1, 1},
+  {&__pyx_n_s_Tet2Sampler3D, __pyx_k_Tet2Sampler3D, sizeof(__pyx_k_Tet2Sampler3D), 0, 0, 1, 1},
+  {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
+  {&__pyx_n_s_W1Sampler3D, __pyx_k_W1Sampler3D, sizeof(__pyx_k_W1Sampler3D), 0, 0, 1, 1},
+  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_s_dict, __pyx_k_dict, sizeof(__pyx_k_dict), 0, 0, 1, 1},
+  {&__pyx_n_s_field_values, __pyx_k_field_values, sizeof(__pyx_k_field_values), 0, 0, 1, 1},
+  {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
+  {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_init, __pyx_k_init, sizeof(__pyx_k_init), 0, 0, 1, 1},
+  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+  {&__pyx_n_s_new, __pyx_k_new, sizeof(__pyx_k_new), 0, 0, 1, 1},
+  {&__pyx_n_s_np, __pyx_k_np, sizeof(__pyx_k_np), 0, 0, 1, 1},
+  {&__pyx_n_s_numpy, __pyx_k_numpy, sizeof(__pyx_k_numpy), 0, 0, 1, 1},
+  {&__pyx_kp_s_numpy_core_multiarray_failed_to, __pyx_k_numpy_core_multiarray_failed_to, sizeof(__pyx_k_numpy_core_multiarray_failed_to), 0, 0, 1, 0},
+  {&__pyx_kp_s_numpy_core_umath_failed_to_impor, __pyx_k_numpy_core_umath_failed_to_impor, sizeof(__pyx_k_numpy_core_umath_failed_to_impor), 0, 0, 1, 0},
+  {&__pyx_n_s_physical_x, __pyx_k_physical_x, sizeof(__pyx_k_physical_x), 0, 0, 1, 1},
+  {&__pyx_n_s_pickle, __pyx_k_pickle, sizeof(__pyx_k_pickle), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_PickleError, __pyx_k_pyx_PickleError, sizeof(__pyx_k_pyx_PickleError), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_checksum, __pyx_k_pyx_checksum, sizeof(__pyx_k_pyx_checksum), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_result, __pyx_k_pyx_result, sizeof(__pyx_k_pyx_result), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_state, __pyx_k_pyx_state, sizeof(__pyx_k_pyx_state), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_type, __pyx_k_pyx_type, sizeof(__pyx_k_pyx_type), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_unpickle_ElementSampler, __pyx_k_pyx_unpickle_ElementSampler, sizeof(__pyx_k_pyx_unpickle_ElementSampler), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_unpickle_P1Sampler1D, __pyx_k_pyx_unpickle_P1Sampler1D, sizeof(__pyx_k_pyx_unpickle_P1Sampler1D), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_unpickle_P1Sampler2D, __pyx_k_pyx_unpickle_P1Sampler2D, sizeof(__pyx_k_pyx_unpickle_P1Sampler2D), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_unpickle_P1Sampler3D, __pyx_k_pyx_unpickle_P1Sampler3D, sizeof(__pyx_k_pyx_unpickle_P1Sampler3D), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
+  {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+  {&__pyx_n_s_sampler, __pyx_k_sampler, sizeof(__pyx_k_sampler), 0, 0, 1, 1},
+  {&__pyx_kp_s_self_func_self_jac_cannot_be_con, __pyx_k_self_func_self_jac_cannot_be_con, sizeof(__pyx_k_self_func_self_jac_cannot_be_con), 0, 0, 1, 0},
+  {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
+  {&__pyx_kp_s_stringsource, __pyx_k_stringsource, sizeof(__pyx_k_stringsource), 0, 0, 1, 0},
+  {&__pyx_n_s_super, __pyx_k_super, sizeof(__pyx_k_super), 0, 0, 1, 1},
+  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_n_s_test_hex20_sampler, __pyx_k_test_hex20_sampler, sizeof(__pyx_k_test_hex20_sampler), 0, 0, 1, 1},
+  {&__pyx_n_s_test_hex_sampler, __pyx_k_test_hex_sampler, sizeof(__pyx_k_test_hex_sampler), 0, 0, 1, 1},
+  {&__pyx_n_s_test_linear1D_sampler, __pyx_k_test_linear1D_sampler, sizeof(__pyx_k_test_linear1D_sampler), 0, 0, 1, 1},
+  {&__pyx_n_s_test_quad2_sampler, __pyx_k_test_quad2_sampler, sizeof(__pyx_k_test_quad2_sampler), 0, 0, 1, 1},
+  {&__pyx_n_s_test_quad_sampler, __pyx_k_test_quad_sampler, sizeof(__pyx_k_test_quad_sampler), 0, 0, 1, 1},
+  {&__pyx_n_s_test_tet2_sampler, __pyx_k_test_tet2_sampler, sizeof(__pyx_k_test_tet2_sampler), 0, 0, 1, 1},
+  {&__pyx_n_s_test_tetra_sampler, __pyx_k_test_tetra_sampler, sizeof(__pyx_k_test_tetra_sampler), 0, 0, 1, 1},
+  {&__pyx_n_s_test_tri2_sampler, __pyx_k_test_tri2_sampler, sizeof(__pyx_k_test_tri2_sampler), 0, 0, 1, 1},
+  {&__pyx_n_s_test_tri_sampler, __pyx_k_test_tri_sampler, sizeof(__pyx_k_test_tri_sampler), 0, 0, 1, 1},
+  {&__pyx_n_s_test_wedge_sampler, __pyx_k_test_wedge_sampler, sizeof(__pyx_k_test_wedge_sampler), 0, 0, 1, 1},
+  {&__pyx_n_s_update, __pyx_k_update, sizeof(__pyx_k_update), 0, 0, 1, 1},
+  {&__pyx_n_s_val, __pyx_k_val, sizeof(__pyx_k_val), 0, 0, 1, 1},
+  {&__pyx_n_s_vertices, __pyx_k_vertices, sizeof(__pyx_k_vertices), 0, 0, 1, 1},
+  {&__pyx_kp_s_yt_utilities_lib_element_mapping, __pyx_k_yt_utilities_lib_element_mapping, sizeof(__pyx_k_yt_utilities_lib_element_mapping), 0, 0, 1, 0},
+  {&__pyx_n_s_yt_utilities_lib_element_mapping_2, __pyx_k_yt_utilities_lib_element_mapping_2, sizeof(__pyx_k_yt_utilities_lib_element_mapping_2), 0, 0, 1, 1},
+  {0, 0, 0, 0, 0, 0, 0}
+};
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 56, __pyx_L1_error)
+  __pyx_builtin_super = __Pyx_GetBuiltinName(__pyx_n_s_super); if (!__pyx_builtin_super) __PYX_ERR(0, 127, __pyx_L1_error)
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(1, 2, __pyx_L1_error)
+  __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_n_s_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(2, 944, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_self_func_self_jac_cannot_be_con); if (unlikely(!__pyx_tuple_)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple_);
+  __Pyx_GIVEREF(__pyx_tuple_);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ */
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_s_self_func_self_jac_cannot_be_con); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__2);
+  __Pyx_GIVEREF(__pyx_tuple__2);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_s_self_func_self_jac_cannot_be_con); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ */
+  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_s_self_func_self_jac_cannot_be_con); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_s_self_func_self_jac_cannot_be_con); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ */
+  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_s_self_func_self_jac_cannot_be_con); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_s_self_func_self_jac_cannot_be_con); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ */
+  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_s_self_func_self_jac_cannot_be_con); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_s_self_func_self_jac_cannot_be_con); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__9);
+  __Pyx_GIVEREF(__pyx_tuple__9);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ */
+  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_s_self_func_self_jac_cannot_be_con); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__10);
+  __Pyx_GIVEREF(__pyx_tuple__10);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_kp_s_self_func_self_jac_cannot_be_con); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__11);
+  __Pyx_GIVEREF(__pyx_tuple__11);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ */
+  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_kp_s_self_func_self_jac_cannot_be_con); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__12);
+  __Pyx_GIVEREF(__pyx_tuple__12);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_s_self_func_self_jac_cannot_be_con); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ */
+  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_kp_s_self_func_self_jac_cannot_be_con); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__14);
+  __Pyx_GIVEREF(__pyx_tuple__14);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+  __pyx_tuple__15 = PyTuple_Pack(1, __pyx_kp_s_self_func_self_jac_cannot_be_con); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__15);
+  __Pyx_GIVEREF(__pyx_tuple__15);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ */
+  __pyx_tuple__16 = PyTuple_Pack(1, __pyx_kp_s_self_func_self_jac_cannot_be_con); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__16);
+  __Pyx_GIVEREF(__pyx_tuple__16);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ */
+  __pyx_tuple__17 = PyTuple_Pack(1, __pyx_kp_s_self_func_self_jac_cannot_be_con); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__17);
+  __Pyx_GIVEREF(__pyx_tuple__17);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.func,self.jac cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ */
+  __pyx_tuple__18 = PyTuple_Pack(1, __pyx_kp_s_self_func_self_jac_cannot_be_con); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__18);
+  __Pyx_GIVEREF(__pyx_tuple__18);
+  __pyx_tuple__19 = PyTuple_Pack(3, __pyx_int_171418803, __pyx_int_131557558, __pyx_int_182318436); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__19);
+  __Pyx_GIVEREF(__pyx_tuple__19);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":944
+ *         __pyx_import_array()
+ *     except Exception:
+ *         raise ImportError("numpy.core.multiarray failed to import")             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int import_umath() except -1:
+ */
+  __pyx_tuple__20 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_multiarray_failed_to); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(2, 944, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__20);
+  __Pyx_GIVEREF(__pyx_tuple__20);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":950
+ *         _import_umath()
+ *     except Exception:
+ *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int import_ufunc() except -1:
+ */
+  __pyx_tuple__21 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(2, 950, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__21);
+  __Pyx_GIVEREF(__pyx_tuple__21);
+
+  /* "yt/utilities/lib/element_mappings.pyx":1114
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_hex_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                      np.ndarray[np.float64_t, ndim=1] field_values,
+ *                      np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+  __pyx_tuple__22 = PyTuple_Pack(5, __pyx_n_s_vertices, __pyx_n_s_field_values, __pyx_n_s_physical_x, __pyx_n_s_val, __pyx_n_s_sampler); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(0, 1114, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__22);
+  __Pyx_GIVEREF(__pyx_tuple__22);
+  __pyx_codeobj__23 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__22, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_yt_utilities_lib_element_mapping, __pyx_n_s_test_hex_sampler, 1114, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__23)) __PYX_ERR(0, 1114, __pyx_L1_error)
+
+  /* "yt/utilities/lib/element_mappings.pyx":1131
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_hex20_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                        np.ndarray[np.float64_t, ndim=1] field_values,
+ *                        np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+  __pyx_tuple__24 = PyTuple_Pack(5, __pyx_n_s_vertices, __pyx_n_s_field_values, __pyx_n_s_physical_x, __pyx_n_s_val, __pyx_n_s_sampler); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(0, 1131, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__24);
+  __Pyx_GIVEREF(__pyx_tuple__24);
+  __pyx_codeobj__25 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__24, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_yt_utilities_lib_element_mapping, __pyx_n_s_test_hex20_sampler, 1131, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__25)) __PYX_ERR(0, 1131, __pyx_L1_error)
+
+  /* "yt/utilities/lib/element_mappings.pyx":1148
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_tetra_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                        np.ndarray[np.float64_t, ndim=1] field_values,
+ *                        np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+  __pyx_tuple__26 = PyTuple_Pack(5, __pyx_n_s_vertices, __pyx_n_s_field_values, __pyx_n_s_physical_x, __pyx_n_s_val, __pyx_n_s_sampler); if (unlikely(!__pyx_tuple__26)) __PYX_ERR(0, 1148, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__26);
+  __Pyx_GIVEREF(__pyx_tuple__26);
+  __pyx_codeobj__27 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__26, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_yt_utilities_lib_element_mapping, __pyx_n_s_test_tetra_sampler, 1148, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__27)) __PYX_ERR(0, 1148, __pyx_L1_error)
+
+  /* "yt/utilities/lib/element_mappings.pyx":1166
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_wedge_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                        np.ndarray[np.float64_t, ndim=1] field_values,
+ *                        np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+  __pyx_tuple__28 = PyTuple_Pack(5, __pyx_n_s_vertices, __pyx_n_s_field_values, __pyx_n_s_physical_x, __pyx_n_s_val, __pyx_n_s_sampler); if (unlikely(!__pyx_tuple__28)) __PYX_ERR(0, 1166, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__28);
+  __Pyx_GIVEREF(__pyx_tuple__28);
+  __pyx_codeobj__29 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__28, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_yt_utilities_lib_element_mapping, __pyx_n_s_test_wedge_sampler, 1166, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__29)) __PYX_ERR(0, 1166, __pyx_L1_error)
+
+  /* "yt/utilities/lib/element_mappings.pyx":1183
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_linear1D_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                           np.ndarray[np.float64_t, ndim=1] field_values,
+ *                           np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+  __pyx_tuple__30 = PyTuple_Pack(5, __pyx_n_s_vertices, __pyx_n_s_field_values, __pyx_n_s_physical_x, __pyx_n_s_val, __pyx_n_s_sampler); if (unlikely(!__pyx_tuple__30)) __PYX_ERR(0, 1183, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__30);
+  __Pyx_GIVEREF(__pyx_tuple__30);
+  __pyx_codeobj__31 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__30, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_yt_utilities_lib_element_mapping, __pyx_n_s_test_linear1D_sampler, 1183, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__31)) __PYX_ERR(0, 1183, __pyx_L1_error)
+
+  /* "yt/utilities/lib/element_mappings.pyx":1201
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_tri_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                      np.ndarray[np.float64_t, ndim=1] field_values,
+ *                      np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+  __pyx_tuple__32 = PyTuple_Pack(5, __pyx_n_s_vertices, __pyx_n_s_field_values, __pyx_n_s_physical_x, __pyx_n_s_val, __pyx_n_s_sampler); if (unlikely(!__pyx_tuple__32)) __PYX_ERR(0, 1201, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__32);
+  __Pyx_GIVEREF(__pyx_tuple__32);
+  __pyx_codeobj__33 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__32, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_yt_utilities_lib_element_mapping, __pyx_n_s_test_tri_sampler, 1201, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__33)) __PYX_ERR(0, 1201, __pyx_L1_error)
+
+  /* "yt/utilities/lib/element_mappings.pyx":1219
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_quad_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                       np.ndarray[np.float64_t, ndim=1] field_values,
+ *                       np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+  __pyx_tuple__34 = PyTuple_Pack(5, __pyx_n_s_vertices, __pyx_n_s_field_values, __pyx_n_s_physical_x, __pyx_n_s_val, __pyx_n_s_sampler); if (unlikely(!__pyx_tuple__34)) __PYX_ERR(0, 1219, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__34);
+  __Pyx_GIVEREF(__pyx_tuple__34);
+  __pyx_codeobj__35 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__34, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_yt_utilities_lib_element_mapping, __pyx_n_s_test_quad_sampler, 1219, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__35)) __PYX_ERR(0, 1219, __pyx_L1_error)
+
+  /* "yt/utilities/lib/element_mappings.pyx":1236
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_quad2_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                        np.ndarray[np.float64_t, ndim=1] field_values,
+ *                        np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+  __pyx_tuple__36 = PyTuple_Pack(5, __pyx_n_s_vertices, __pyx_n_s_field_values, __pyx_n_s_physical_x, __pyx_n_s_val, __pyx_n_s_sampler); if (unlikely(!__pyx_tuple__36)) __PYX_ERR(0, 1236, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__36);
+  __Pyx_GIVEREF(__pyx_tuple__36);
+  __pyx_codeobj__37 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__36, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_yt_utilities_lib_element_mapping, __pyx_n_s_test_quad2_sampler, 1236, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__37)) __PYX_ERR(0, 1236, __pyx_L1_error)
+
+  /* "yt/utilities/lib/element_mappings.pyx":1253
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_tri2_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                       np.ndarray[np.float64_t, ndim=1] field_values,
+ *                       np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+  __pyx_tuple__38 = PyTuple_Pack(5, __pyx_n_s_vertices, __pyx_n_s_field_values, __pyx_n_s_physical_x, __pyx_n_s_val, __pyx_n_s_sampler); if (unlikely(!__pyx_tuple__38)) __PYX_ERR(0, 1253, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__38);
+  __Pyx_GIVEREF(__pyx_tuple__38);
+  __pyx_codeobj__39 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__38, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_yt_utilities_lib_element_mapping, __pyx_n_s_test_tri2_sampler, 1253, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__39)) __PYX_ERR(0, 1253, __pyx_L1_error)
+
+  /* "yt/utilities/lib/element_mappings.pyx":1270
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_tet2_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                       np.ndarray[np.float64_t, ndim=1] field_values,
+ *                       np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+  __pyx_tuple__40 = PyTuple_Pack(5, __pyx_n_s_vertices, __pyx_n_s_field_values, __pyx_n_s_physical_x, __pyx_n_s_val, __pyx_n_s_sampler); if (unlikely(!__pyx_tuple__40)) __PYX_ERR(0, 1270, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__40);
+  __Pyx_GIVEREF(__pyx_tuple__40);
+  __pyx_codeobj__41 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__40, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_yt_utilities_lib_element_mapping, __pyx_n_s_test_tet2_sampler, 1270, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__41)) __PYX_ERR(0, 1270, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_ElementSampler(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+  __pyx_tuple__42 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__42)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__42);
+  __Pyx_GIVEREF(__pyx_tuple__42);
+  __pyx_codeobj__43 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__42, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_ElementSampler, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__43)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_tuple__44 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__44)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__44);
+  __Pyx_GIVEREF(__pyx_tuple__44);
+  __pyx_codeobj__45 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__44, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_P1Sampler1D, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__45)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_tuple__46 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__46)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__46);
+  __Pyx_GIVEREF(__pyx_tuple__46);
+  __pyx_codeobj__47 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__46, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_P1Sampler2D, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__47)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_tuple__48 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__48)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__48);
+  __Pyx_GIVEREF(__pyx_tuple__48);
+  __pyx_codeobj__49 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__48, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_P1Sampler3D, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__49)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_131557558 = PyInt_FromLong(131557558L); if (unlikely(!__pyx_int_131557558)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_171418803 = PyInt_FromLong(171418803L); if (unlikely(!__pyx_int_171418803)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_182318436 = PyInt_FromLong(182318436L); if (unlikely(!__pyx_int_182318436)) __PYX_ERR(0, 1, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+
+static int __Pyx_modinit_global_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_ElementSampler = &__pyx_vtable_2yt_9utilities_3lib_16element_mappings_ElementSampler;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_ElementSampler.map_real_to_unit = (void (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *, double *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_14ElementSampler_map_real_to_unit;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_ElementSampler.sample_at_unit_point = (double (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_14ElementSampler_sample_at_unit_point;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_ElementSampler.sample_at_real_point = (double (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *, double *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_14ElementSampler_sample_at_real_point;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_ElementSampler.check_inside = (int (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_14ElementSampler_check_inside;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_ElementSampler.check_mesh_lines = (int (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_14ElementSampler_check_mesh_lines;
+  if (PyType_Ready(&__pyx_type_2yt_9utilities_3lib_16element_mappings_ElementSampler) < 0) __PYX_ERR(0, 61, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_2yt_9utilities_3lib_16element_mappings_ElementSampler.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_2yt_9utilities_3lib_16element_mappings_ElementSampler.tp_dictoffset && __pyx_type_2yt_9utilities_3lib_16element_mappings_ElementSampler.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_2yt_9utilities_3lib_16element_mappings_ElementSampler.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_2yt_9utilities_3lib_16element_mappings_ElementSampler.tp_dict, __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_ElementSampler) < 0) __PYX_ERR(0, 61, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_ElementSampler, (PyObject *)&__pyx_type_2yt_9utilities_3lib_16element_mappings_ElementSampler) < 0) __PYX_ERR(0, 61, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_2yt_9utilities_3lib_16element_mappings_ElementSampler) < 0) __PYX_ERR(0, 61, __pyx_L1_error)
+  __pyx_ptype_2yt_9utilities_3lib_16element_mappings_ElementSampler = &__pyx_type_2yt_9utilities_3lib_16element_mappings_ElementSampler;
+  __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_P1Sampler1D = &__pyx_vtable_2yt_9utilities_3lib_16element_mappings_P1Sampler1D;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_P1Sampler1D.__pyx_base = *__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_ElementSampler;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_P1Sampler1D.__pyx_base.map_real_to_unit = (void (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *, double *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D_map_real_to_unit;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_P1Sampler1D.__pyx_base.sample_at_unit_point = (double (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D_sample_at_unit_point;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_P1Sampler1D.__pyx_base.check_inside = (int (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler1D_check_inside;
+  __pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler1D.tp_base = __pyx_ptype_2yt_9utilities_3lib_16element_mappings_ElementSampler;
+  if (PyType_Ready(&__pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler1D) < 0) __PYX_ERR(0, 119, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler1D.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler1D.tp_dictoffset && __pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler1D.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler1D.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler1D.tp_dict, __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_P1Sampler1D) < 0) __PYX_ERR(0, 119, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_P1Sampler1D, (PyObject *)&__pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler1D) < 0) __PYX_ERR(0, 119, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler1D) < 0) __PYX_ERR(0, 119, __pyx_L1_error)
+  __pyx_ptype_2yt_9utilities_3lib_16element_mappings_P1Sampler1D = &__pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler1D;
+  __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_P1Sampler2D = &__pyx_vtable_2yt_9utilities_3lib_16element_mappings_P1Sampler2D;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_P1Sampler2D.__pyx_base = *__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_ElementSampler;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_P1Sampler2D.__pyx_base.map_real_to_unit = (void (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *, double *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D_map_real_to_unit;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_P1Sampler2D.__pyx_base.sample_at_unit_point = (double (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D_sample_at_unit_point;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_P1Sampler2D.__pyx_base.check_inside = (int (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler2D_check_inside;
+  __pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler2D.tp_base = __pyx_ptype_2yt_9utilities_3lib_16element_mappings_ElementSampler;
+  if (PyType_Ready(&__pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler2D) < 0) __PYX_ERR(0, 154, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler2D.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler2D.tp_dictoffset && __pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler2D.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler2D.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler2D.tp_dict, __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_P1Sampler2D) < 0) __PYX_ERR(0, 154, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_P1Sampler2D, (PyObject *)&__pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler2D) < 0) __PYX_ERR(0, 154, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler2D) < 0) __PYX_ERR(0, 154, __pyx_L1_error)
+  __pyx_ptype_2yt_9utilities_3lib_16element_mappings_P1Sampler2D = &__pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler2D;
+  __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_P1Sampler3D = &__pyx_vtable_2yt_9utilities_3lib_16element_mappings_P1Sampler3D;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_P1Sampler3D.__pyx_base = *__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_ElementSampler;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_P1Sampler3D.__pyx_base.map_real_to_unit = (void (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *, double *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_map_real_to_unit;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_P1Sampler3D.__pyx_base.sample_at_unit_point = (double (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_sample_at_unit_point;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_P1Sampler3D.__pyx_base.check_inside = (int (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_check_inside;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_P1Sampler3D.__pyx_base.check_mesh_lines = (int (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_11P1Sampler3D_check_mesh_lines;
+  __pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler3D.tp_base = __pyx_ptype_2yt_9utilities_3lib_16element_mappings_ElementSampler;
+  if (PyType_Ready(&__pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler3D) < 0) __PYX_ERR(0, 225, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler3D.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler3D.tp_dictoffset && __pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler3D.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler3D.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler3D.tp_dict, __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_P1Sampler3D) < 0) __PYX_ERR(0, 225, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_P1Sampler3D, (PyObject *)&__pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler3D) < 0) __PYX_ERR(0, 225, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler3D) < 0) __PYX_ERR(0, 225, __pyx_L1_error)
+  __pyx_ptype_2yt_9utilities_3lib_16element_mappings_P1Sampler3D = &__pyx_type_2yt_9utilities_3lib_16element_mappings_P1Sampler3D;
+  __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D = &__pyx_vtable_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D.__pyx_base = *__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_ElementSampler;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D.__pyx_base.map_real_to_unit = (void (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *, double *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler3D_map_real_to_unit;
+  __pyx_type_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D.tp_base = __pyx_ptype_2yt_9utilities_3lib_16element_mappings_ElementSampler;
+  if (PyType_Ready(&__pyx_type_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D) < 0) __PYX_ERR(0, 319, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D.tp_dictoffset && __pyx_type_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D.tp_dict, __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D) < 0) __PYX_ERR(0, 319, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_NonlinearSolveSampler3D, (PyObject *)&__pyx_type_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D) < 0) __PYX_ERR(0, 319, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D) < 0) __PYX_ERR(0, 319, __pyx_L1_error)
+  __pyx_ptype_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D = &__pyx_type_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D;
+  __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D = &__pyx_vtable_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D.__pyx_base = *__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D.__pyx_base.__pyx_base.sample_at_unit_point = (double (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D_sample_at_unit_point;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D.__pyx_base.__pyx_base.check_inside = (int (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D_check_inside;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D.__pyx_base.__pyx_base.check_mesh_lines = (int (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_11Q1Sampler3D_check_mesh_lines;
+  __pyx_type_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D.tp_base = __pyx_ptype_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D;
+  if (PyType_Ready(&__pyx_type_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D) < 0) __PYX_ERR(0, 426, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D.tp_dictoffset && __pyx_type_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D.tp_dict, __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D) < 0) __PYX_ERR(0, 426, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Q1Sampler3D, (PyObject *)&__pyx_type_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D) < 0) __PYX_ERR(0, 426, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D) < 0) __PYX_ERR(0, 426, __pyx_L1_error)
+  __pyx_ptype_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D = &__pyx_type_2yt_9utilities_3lib_16element_mappings_Q1Sampler3D;
+  __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_W1Sampler3D = &__pyx_vtable_2yt_9utilities_3lib_16element_mappings_W1Sampler3D;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_W1Sampler3D.__pyx_base = *__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_W1Sampler3D.__pyx_base.__pyx_base.sample_at_unit_point = (double (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D_sample_at_unit_point;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_W1Sampler3D.__pyx_base.__pyx_base.check_inside = (int (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D_check_inside;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_W1Sampler3D.__pyx_base.__pyx_base.check_mesh_lines = (int (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_11W1Sampler3D_check_mesh_lines;
+  __pyx_type_2yt_9utilities_3lib_16element_mappings_W1Sampler3D.tp_base = __pyx_ptype_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D;
+  if (PyType_Ready(&__pyx_type_2yt_9utilities_3lib_16element_mappings_W1Sampler3D) < 0) __PYX_ERR(0, 702, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_2yt_9utilities_3lib_16element_mappings_W1Sampler3D.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_2yt_9utilities_3lib_16element_mappings_W1Sampler3D.tp_dictoffset && __pyx_type_2yt_9utilities_3lib_16element_mappings_W1Sampler3D.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_2yt_9utilities_3lib_16element_mappings_W1Sampler3D.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_2yt_9utilities_3lib_16element_mappings_W1Sampler3D.tp_dict, __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_W1Sampler3D) < 0) __PYX_ERR(0, 702, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_W1Sampler3D, (PyObject *)&__pyx_type_2yt_9utilities_3lib_16element_mappings_W1Sampler3D) < 0) __PYX_ERR(0, 702, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_2yt_9utilities_3lib_16element_mappings_W1Sampler3D) < 0) __PYX_ERR(0, 702, __pyx_L1_error)
+  __pyx_ptype_2yt_9utilities_3lib_16element_mappings_W1Sampler3D = &__pyx_type_2yt_9utilities_3lib_16element_mappings_W1Sampler3D;
+  __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_S2Sampler3D = &__pyx_vtable_2yt_9utilities_3lib_16element_mappings_S2Sampler3D;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_S2Sampler3D.__pyx_base = *__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_S2Sampler3D.__pyx_base.__pyx_base.sample_at_unit_point = (double (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D_sample_at_unit_point;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_S2Sampler3D.__pyx_base.__pyx_base.check_inside = (int (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D_check_inside;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_S2Sampler3D.__pyx_base.__pyx_base.check_mesh_lines = (int (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_11S2Sampler3D_check_mesh_lines;
+  __pyx_type_2yt_9utilities_3lib_16element_mappings_S2Sampler3D.tp_base = __pyx_ptype_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D;
+  if (PyType_Ready(&__pyx_type_2yt_9utilities_3lib_16element_mappings_S2Sampler3D) < 0) __PYX_ERR(0, 487, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_2yt_9utilities_3lib_16element_mappings_S2Sampler3D.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_2yt_9utilities_3lib_16element_mappings_S2Sampler3D.tp_dictoffset && __pyx_type_2yt_9utilities_3lib_16element_mappings_S2Sampler3D.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_2yt_9utilities_3lib_16element_mappings_S2Sampler3D.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_2yt_9utilities_3lib_16element_mappings_S2Sampler3D.tp_dict, __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_S2Sampler3D) < 0) __PYX_ERR(0, 487, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_S2Sampler3D, (PyObject *)&__pyx_type_2yt_9utilities_3lib_16element_mappings_S2Sampler3D) < 0) __PYX_ERR(0, 487, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_2yt_9utilities_3lib_16element_mappings_S2Sampler3D) < 0) __PYX_ERR(0, 487, __pyx_L1_error)
+  __pyx_ptype_2yt_9utilities_3lib_16element_mappings_S2Sampler3D = &__pyx_type_2yt_9utilities_3lib_16element_mappings_S2Sampler3D;
+  __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D = &__pyx_vtable_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D.__pyx_base = *__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_ElementSampler;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D.__pyx_base.map_real_to_unit = (void (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *, double *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_23NonlinearSolveSampler2D_map_real_to_unit;
+  __pyx_type_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D.tp_base = __pyx_ptype_2yt_9utilities_3lib_16element_mappings_ElementSampler;
+  if (PyType_Ready(&__pyx_type_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D) < 0) __PYX_ERR(0, 776, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D.tp_dictoffset && __pyx_type_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D.tp_dict, __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D) < 0) __PYX_ERR(0, 776, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_NonlinearSolveSampler2D, (PyObject *)&__pyx_type_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D) < 0) __PYX_ERR(0, 776, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D) < 0) __PYX_ERR(0, 776, __pyx_L1_error)
+  __pyx_ptype_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D = &__pyx_type_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D;
+  __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D = &__pyx_vtable_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D.__pyx_base = *__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D.__pyx_base.__pyx_base.sample_at_unit_point = (double (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_11Q1Sampler2D_sample_at_unit_point;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D.__pyx_base.__pyx_base.check_inside = (int (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_11Q1Sampler2D_check_inside;
+  __pyx_type_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D.tp_base = __pyx_ptype_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D;
+  if (PyType_Ready(&__pyx_type_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D) < 0) __PYX_ERR(0, 876, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D.tp_dictoffset && __pyx_type_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D.tp_dict, __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D) < 0) __PYX_ERR(0, 876, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Q1Sampler2D, (PyObject *)&__pyx_type_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D) < 0) __PYX_ERR(0, 876, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D) < 0) __PYX_ERR(0, 876, __pyx_L1_error)
+  __pyx_ptype_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D = &__pyx_type_2yt_9utilities_3lib_16element_mappings_Q1Sampler2D;
+  __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D = &__pyx_vtable_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D.__pyx_base = *__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D.__pyx_base.__pyx_base.sample_at_unit_point = (double (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_11Q2Sampler2D_sample_at_unit_point;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D.__pyx_base.__pyx_base.check_inside = (int (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_11Q2Sampler2D_check_inside;
+  __pyx_type_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D.tp_base = __pyx_ptype_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D;
+  if (PyType_Ready(&__pyx_type_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D) < 0) __PYX_ERR(0, 916, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D.tp_dictoffset && __pyx_type_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D.tp_dict, __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D) < 0) __PYX_ERR(0, 916, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Q2Sampler2D, (PyObject *)&__pyx_type_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D) < 0) __PYX_ERR(0, 916, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D) < 0) __PYX_ERR(0, 916, __pyx_L1_error)
+  __pyx_ptype_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D = &__pyx_type_2yt_9utilities_3lib_16element_mappings_Q2Sampler2D;
+  __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_T2Sampler2D = &__pyx_vtable_2yt_9utilities_3lib_16element_mappings_T2Sampler2D;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_T2Sampler2D.__pyx_base = *__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_T2Sampler2D.__pyx_base.__pyx_base.sample_at_unit_point = (double (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_11T2Sampler2D_sample_at_unit_point;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_T2Sampler2D.__pyx_base.__pyx_base.check_inside = (int (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_11T2Sampler2D_check_inside;
+  __pyx_type_2yt_9utilities_3lib_16element_mappings_T2Sampler2D.tp_base = __pyx_ptype_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler2D;
+  if (PyType_Ready(&__pyx_type_2yt_9utilities_3lib_16element_mappings_T2Sampler2D) < 0) __PYX_ERR(0, 973, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_2yt_9utilities_3lib_16element_mappings_T2Sampler2D.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_2yt_9utilities_3lib_16element_mappings_T2Sampler2D.tp_dictoffset && __pyx_type_2yt_9utilities_3lib_16element_mappings_T2Sampler2D.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_2yt_9utilities_3lib_16element_mappings_T2Sampler2D.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_2yt_9utilities_3lib_16element_mappings_T2Sampler2D.tp_dict, __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_T2Sampler2D) < 0) __PYX_ERR(0, 973, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_T2Sampler2D, (PyObject *)&__pyx_type_2yt_9utilities_3lib_16element_mappings_T2Sampler2D) < 0) __PYX_ERR(0, 973, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_2yt_9utilities_3lib_16element_mappings_T2Sampler2D) < 0) __PYX_ERR(0, 973, __pyx_L1_error)
+  __pyx_ptype_2yt_9utilities_3lib_16element_mappings_T2Sampler2D = &__pyx_type_2yt_9utilities_3lib_16element_mappings_T2Sampler2D;
+  __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D = &__pyx_vtable_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D.__pyx_base = *__pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D.__pyx_base.__pyx_base.sample_at_unit_point = (double (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D_sample_at_unit_point;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D.__pyx_base.__pyx_base.check_inside = (int (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D_check_inside;
+  __pyx_vtable_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D.__pyx_base.__pyx_base.check_mesh_lines = (int (*)(struct __pyx_obj_2yt_9utilities_3lib_16element_mappings_ElementSampler *, double *))__pyx_f_2yt_9utilities_3lib_16element_mappings_13Tet2Sampler3D_check_mesh_lines;
+  __pyx_type_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D.tp_base = __pyx_ptype_2yt_9utilities_3lib_16element_mappings_NonlinearSolveSampler3D;
+  if (PyType_Ready(&__pyx_type_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D) < 0) __PYX_ERR(0, 1022, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D.tp_dictoffset && __pyx_type_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D.tp_dict, __pyx_vtabptr_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D) < 0) __PYX_ERR(0, 1022, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Tet2Sampler3D, (PyObject *)&__pyx_type_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D) < 0) __PYX_ERR(0, 1022, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D) < 0) __PYX_ERR(0, 1022, __pyx_L1_error)
+  __pyx_ptype_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D = &__pyx_type_2yt_9utilities_3lib_16element_mappings_Tet2Sampler3D;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_type_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_7cpython_4type_type = __Pyx_ImportType_0_29_37(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "type", 
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(PyTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyTypeObject),
+  #else
+  sizeof(PyHeapTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyHeapTypeObject),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_7cpython_4type_type) __PYX_ERR(3, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("numpy"); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 199, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_5numpy_dtype = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "dtype", sizeof(PyArray_Descr), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyArray_Descr),__Pyx_ImportType_CheckSize_Ignore_0_29_37); if (!__pyx_ptype_5numpy_dtype) __PYX_ERR(2, 199, __pyx_L1_error)
+  __pyx_ptype_5numpy_flatiter = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "flatiter", sizeof(PyArrayIterObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyArrayIterObject),__Pyx_ImportType_CheckSize_Ignore_0_29_37); if (!__pyx_ptype_5numpy_flatiter) __PYX_ERR(2, 222, __pyx_L1_error)
+  __pyx_ptype_5numpy_broadcast = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "broadcast", sizeof(PyArrayMultiIterObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyArrayMultiIterObject),__Pyx_ImportType_CheckSize_Ignore_0_29_37); if (!__pyx_ptype_5numpy_broadcast) __PYX_ERR(2, 226, __pyx_L1_error)
+  __pyx_ptype_5numpy_ndarray = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "ndarray", sizeof(PyArrayObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyArrayObject),__Pyx_ImportType_CheckSize_Ignore_0_29_37); if (!__pyx_ptype_5numpy_ndarray) __PYX_ERR(2, 238, __pyx_L1_error)
+  __pyx_ptype_5numpy_generic = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "generic", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_generic) __PYX_ERR(2, 770, __pyx_L1_error)
+  __pyx_ptype_5numpy_number = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "number", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_number) __PYX_ERR(2, 772, __pyx_L1_error)
+  __pyx_ptype_5numpy_integer = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "integer", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_integer) __PYX_ERR(2, 774, __pyx_L1_error)
+  __pyx_ptype_5numpy_signedinteger = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "signedinteger", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_signedinteger) __PYX_ERR(2, 776, __pyx_L1_error)
+  __pyx_ptype_5numpy_unsignedinteger = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "unsignedinteger", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_unsignedinteger) __PYX_ERR(2, 778, __pyx_L1_error)
+  __pyx_ptype_5numpy_inexact = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "inexact", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_inexact) __PYX_ERR(2, 780, __pyx_L1_error)
+  __pyx_ptype_5numpy_floating = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "floating", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_floating) __PYX_ERR(2, 782, __pyx_L1_error)
+  __pyx_ptype_5numpy_complexfloating = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "complexfloating", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_complexfloating) __PYX_ERR(2, 784, __pyx_L1_error)
+  __pyx_ptype_5numpy_flexible = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "flexible", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_flexible) __PYX_ERR(2, 786, __pyx_L1_error)
+  __pyx_ptype_5numpy_character = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "character", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_character) __PYX_ERR(2, 788, __pyx_L1_error)
+  __pyx_ptype_5numpy_ufunc = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "ufunc", sizeof(PyUFuncObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyUFuncObject),__Pyx_ImportType_CheckSize_Ignore_0_29_37); if (!__pyx_ptype_5numpy_ufunc) __PYX_ERR(2, 826, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_variable_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  __pyx_t_1 = PyImport_ImportModule("yt.utilities.lib.autogenerated_element_samplers"); if (!__pyx_t_1) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "Q1Function3D", (void (**)(void))&__pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_Q1Function3D, "void (double *, double *, double *, double *)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "Q1Jacobian3D", (void (**)(void))&__pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_Q1Jacobian3D, "void (double *, double *, double *, double *, double *, double *)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "Q1Function2D", (void (**)(void))&__pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_Q1Function2D, "void (double *, double *, double *, double *)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "Q1Jacobian2D", (void (**)(void))&__pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_Q1Jacobian2D, "void (double *, double *, double *, double *, double *)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "Q2Function2D", (void (**)(void))&__pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_Q2Function2D, "void (double *, double *, double *, double *)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "Q2Jacobian2D", (void (**)(void))&__pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_Q2Jacobian2D, "void (double *, double *, double *, double *, double *)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "Tet2Function3D", (void (**)(void))&__pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_Tet2Function3D, "void (double *, double *, double *, double *)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "Tet2Jacobian3D", (void (**)(void))&__pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_Tet2Jacobian3D, "void (double *, double *, double *, double *, double *, double *)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "T2Function2D", (void (**)(void))&__pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_T2Function2D, "void (double *, double *, double *, double *)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "T2Jacobian2D", (void (**)(void))&__pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_T2Jacobian2D, "void (double *, double *, double *, double *, double *)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "W1Function3D", (void (**)(void))&__pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_W1Function3D, "void (double *, double *, double *, double *)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "W1Jacobian3D", (void (**)(void))&__pyx_f_2yt_9utilities_3lib_30autogenerated_element_samplers_W1Jacobian3D, "void (double *, double *, double *, double *, double *, double *)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+
+#ifndef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
+#endif
+#else
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
+#endif
+#endif
+
+
+#if PY_MAJOR_VERSION < 3
+__Pyx_PyMODINIT_FUNC initelement_mappings(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC initelement_mappings(void)
+#else
+__Pyx_PyMODINIT_FUNC PyInit_element_mappings(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit_element_mappings(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec_element_mappings(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module 'element_mappings' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #elif PY_MAJOR_VERSION >= 3
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  #if CYTHON_REFNANNY
+__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+if (!__Pyx_RefNanny) {
+  PyErr_Clear();
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+  if (!__Pyx_RefNanny)
+      Py_FatalError("failed to import 'refnanny' module");
+}
+#endif
+  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit_element_mappings(void)", 0);
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  PyEval_InitThreads();
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("element_mappings", __pyx_methods, __pyx_k_This_file_contains_coordinate_m, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  #endif
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_b);
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_cython_runtime);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main_yt__utilities__lib__element_mappings) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "yt.utilities.lib.element_mappings")) {
+      if (unlikely(PyDict_SetItemString(modules, "yt.utilities.lib.element_mappings", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code();
+  (void)__Pyx_modinit_variable_export_code();
+  (void)__Pyx_modinit_function_export_code();
+  if (unlikely(__Pyx_modinit_type_init_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely(__Pyx_modinit_type_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_variable_import_code();
+  if (unlikely(__Pyx_modinit_function_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+
+  /* "yt/utilities/lib/element_mappings.pyx":15
+ * from numpy cimport ndarray
+ * 
+ * import numpy as np             # <<<<<<<<<<<<<<
+ * 
+ * from libc.math cimport fabs
+ */
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_numpy, 0, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 15, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_np, __pyx_t_1) < 0) __PYX_ERR(0, 15, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1114
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_hex_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                      np.ndarray[np.float64_t, ndim=1] field_values,
+ *                      np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_2yt_9utilities_3lib_16element_mappings_1test_hex_sampler, NULL, __pyx_n_s_yt_utilities_lib_element_mapping_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1114, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test_hex_sampler, __pyx_t_1) < 0) __PYX_ERR(0, 1114, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1131
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_hex20_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                        np.ndarray[np.float64_t, ndim=1] field_values,
+ *                        np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_2yt_9utilities_3lib_16element_mappings_3test_hex20_sampler, NULL, __pyx_n_s_yt_utilities_lib_element_mapping_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1131, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test_hex20_sampler, __pyx_t_1) < 0) __PYX_ERR(0, 1131, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1148
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_tetra_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                        np.ndarray[np.float64_t, ndim=1] field_values,
+ *                        np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_2yt_9utilities_3lib_16element_mappings_5test_tetra_sampler, NULL, __pyx_n_s_yt_utilities_lib_element_mapping_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1148, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test_tetra_sampler, __pyx_t_1) < 0) __PYX_ERR(0, 1148, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1166
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_wedge_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                        np.ndarray[np.float64_t, ndim=1] field_values,
+ *                        np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_2yt_9utilities_3lib_16element_mappings_7test_wedge_sampler, NULL, __pyx_n_s_yt_utilities_lib_element_mapping_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1166, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test_wedge_sampler, __pyx_t_1) < 0) __PYX_ERR(0, 1166, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1183
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_linear1D_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                           np.ndarray[np.float64_t, ndim=1] field_values,
+ *                           np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_2yt_9utilities_3lib_16element_mappings_9test_linear1D_sampler, NULL, __pyx_n_s_yt_utilities_lib_element_mapping_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1183, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test_linear1D_sampler, __pyx_t_1) < 0) __PYX_ERR(0, 1183, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1201
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_tri_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                      np.ndarray[np.float64_t, ndim=1] field_values,
+ *                      np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_2yt_9utilities_3lib_16element_mappings_11test_tri_sampler, NULL, __pyx_n_s_yt_utilities_lib_element_mapping_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1201, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test_tri_sampler, __pyx_t_1) < 0) __PYX_ERR(0, 1201, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1219
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_quad_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                       np.ndarray[np.float64_t, ndim=1] field_values,
+ *                       np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_2yt_9utilities_3lib_16element_mappings_13test_quad_sampler, NULL, __pyx_n_s_yt_utilities_lib_element_mapping_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1219, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test_quad_sampler, __pyx_t_1) < 0) __PYX_ERR(0, 1219, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1236
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_quad2_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                        np.ndarray[np.float64_t, ndim=1] field_values,
+ *                        np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_2yt_9utilities_3lib_16element_mappings_15test_quad2_sampler, NULL, __pyx_n_s_yt_utilities_lib_element_mapping_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1236, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test_quad2_sampler, __pyx_t_1) < 0) __PYX_ERR(0, 1236, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1253
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_tri2_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                       np.ndarray[np.float64_t, ndim=1] field_values,
+ *                       np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_2yt_9utilities_3lib_16element_mappings_17test_tri2_sampler, NULL, __pyx_n_s_yt_utilities_lib_element_mapping_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1253, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test_tri2_sampler, __pyx_t_1) < 0) __PYX_ERR(0, 1253, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1270
+ * @cython.wraparound(False)
+ * @cython.cdivision(True)
+ * def test_tet2_sampler(np.ndarray[np.float64_t, ndim=2] vertices,             # <<<<<<<<<<<<<<
+ *                       np.ndarray[np.float64_t, ndim=1] field_values,
+ *                       np.ndarray[np.float64_t, ndim=1] physical_x):
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_2yt_9utilities_3lib_16element_mappings_19test_tet2_sampler, NULL, __pyx_n_s_yt_utilities_lib_element_mapping_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1270, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test_tet2_sampler, __pyx_t_1) < 0) __PYX_ERR(0, 1270, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_ElementSampler(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_2yt_9utilities_3lib_16element_mappings_21__pyx_unpickle_ElementSampler, NULL, __pyx_n_s_yt_utilities_lib_element_mapping_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_ElementSampler, __pyx_t_1) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_ElementSampler__set_state(<ElementSampler> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_ElementSampler__set_state(ElementSampler __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_2yt_9utilities_3lib_16element_mappings_23__pyx_unpickle_P1Sampler1D, NULL, __pyx_n_s_yt_utilities_lib_element_mapping_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_P1Sampler1D, __pyx_t_1) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_P1Sampler2D(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_2yt_9utilities_3lib_16element_mappings_25__pyx_unpickle_P1Sampler2D, NULL, __pyx_n_s_yt_utilities_lib_element_mapping_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_P1Sampler2D, __pyx_t_1) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_P1Sampler2D__set_state(<P1Sampler2D> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_P1Sampler2D__set_state(P1Sampler2D __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.inclusion_tol = __pyx_state[0]; __pyx_result.num_mapped_coords = __pyx_state[1]
+ *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_2yt_9utilities_3lib_16element_mappings_27__pyx_unpickle_P1Sampler3D, NULL, __pyx_n_s_yt_utilities_lib_element_mapping_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_P1Sampler3D, __pyx_t_1) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "yt/utilities/lib/element_mappings.pyx":1
+ * # distutils: libraries = STD_LIBS             # <<<<<<<<<<<<<<
+ * """
+ * This file contains coordinate mappings between physical coordinates and those
+ */
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1013
+ * 
+ * 
+ * cdef inline NPY_DATETIMEUNIT get_datetime64_unit(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the unit part of the dtype for a numpy datetime64 object.
+ */
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  if (__pyx_m) {
+    if (__pyx_d) {
+      __Pyx_AddTraceback("init yt.utilities.lib.element_mappings", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    Py_CLEAR(__pyx_m);
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init yt.utilities.lib.element_mappings");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
+  return __pyx_m;
+  #else
+  return;
+  #endif
+}
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* KeywordStringCheck */
+static int __Pyx_CheckKeywordStrings(
+    PyObject *kwdict,
+    const char* function_name,
+    int kw_allowed)
+{
+    PyObject* key = 0;
+    Py_ssize_t pos = 0;
+#if CYTHON_COMPILING_IN_PYPY
+    if (!kw_allowed && PyDict_Next(kwdict, &pos, &key, 0))
+        goto invalid_keyword;
+    return 1;
+#else
+    while (PyDict_Next(kwdict, &pos, &key, 0)) {
+        #if PY_MAJOR_VERSION < 3
+        if (unlikely(!PyString_Check(key)))
+        #endif
+            if (unlikely(!PyUnicode_Check(key)))
+                goto invalid_keyword_type;
+    }
+    if ((!kw_allowed) && unlikely(key))
+        goto invalid_keyword;
+    return 1;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    return 0;
+#endif
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+    return 0;
+}
+
+/* PyErrExceptionMatches */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    PyObject *exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+    if (unlikely(PyTuple_Check(err)))
+        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+}
+#endif
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* GetAttr */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *o, PyObject *n) {
+#if CYTHON_USE_TYPE_SLOTS
+#if PY_MAJOR_VERSION >= 3
+    if (likely(PyUnicode_Check(n)))
+#else
+    if (likely(PyString_Check(n)))
+#endif
+        return __Pyx_PyObject_GetAttrStr(o, n);
+#endif
+    return PyObject_GetAttr(o, n);
+}
+
+/* GetAttr3 */
+static PyObject *__Pyx_GetAttr3Default(PyObject *d) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (unlikely(!__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        return NULL;
+    __Pyx_PyErr_Clear();
+    Py_INCREF(d);
+    return d;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *o, PyObject *n, PyObject *d) {
+    PyObject *r = __Pyx_GetAttr(o, n);
+    return (likely(r)) ? r : __Pyx_GetAttr3Default(d);
+}
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyFunctionFastCall */
+#if CYTHON_FAST_PYCALL
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallNoArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, NULL, 0);
+    }
+#endif
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
+#else
+    if (likely(PyCFunction_Check(func)))
+#endif
+    {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+            return __Pyx_PyObject_CallMethO(func, NULL);
+        }
+    }
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
+}
+#endif
+
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
+
+/* PyObjectCallOneArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
+    }
+#endif
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+#endif
+
+/* RaiseException */
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
+                        CYTHON_UNUSED PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
+        }
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
+    }
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+#else
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+#endif
+
+/* RaiseDoubleKeywords */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AsString(kw_name));
+        #endif
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+    while (PyDict_Next(kwds, &pos, &key, &value)) {
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+            continue;
+        }
+        name = first_kw_arg;
+        #if PY_MAJOR_VERSION < 3
+        if (likely(PyString_Check(key))) {
+            while (*name) {
+                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
+                        && _PyString_Eq(**name, key)) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    if ((**argname == key) || (
+                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
+                             && _PyString_Eq(**argname, key))) {
+                        goto arg_passed_twice;
+                    }
+                    argname++;
+                }
+            }
+        } else
+        #endif
+        if (likely(PyUnicode_Check(key))) {
+            while (*name) {
+                int cmp = (**name == key) ? 0 :
+                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                #endif
+                    PyUnicode_Compare(**name, key);
+                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                if (cmp == 0) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
+                }
+            }
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+        } else {
+            goto invalid_keyword;
+        }
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+/* ArgTypeTest */
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
+{
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    else if (exact) {
+        #if PY_MAJOR_VERSION == 2
+        if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
+        #endif
+    }
+    else {
+        if (likely(__Pyx_TypeCheck(obj, type))) return 1;
+    }
+    PyErr_Format(PyExc_TypeError,
+        "Argument '%.200s' has incorrect type (expected %.200s, got %.200s)",
+        name, type->tp_name, Py_TYPE(obj)->tp_name);
+    return 0;
+}
+
+/* IsLittleEndian */
+static CYTHON_INLINE int __Pyx_Is_Little_Endian(void)
+{
+  union {
+    uint32_t u32;
+    uint8_t u8[4];
+  } S;
+  S.u32 = 0x01020304;
+  return S.u8[0] == 4;
+}
+
+/* BufferFormatCheck */
+static void __Pyx_BufFmt_Init(__Pyx_BufFmt_Context* ctx,
+                              __Pyx_BufFmt_StackElem* stack,
+                              __Pyx_TypeInfo* type) {
+  stack[0].field = &ctx->root;
+  stack[0].parent_offset = 0;
+  ctx->root.type = type;
+  ctx->root.name = "buffer dtype";
+  ctx->root.offset = 0;
+  ctx->head = stack;
+  ctx->head->field = &ctx->root;
+  ctx->fmt_offset = 0;
+  ctx->head->parent_offset = 0;
+  ctx->new_packmode = '@';
+  ctx->enc_packmode = '@';
+  ctx->new_count = 1;
+  ctx->enc_count = 0;
+  ctx->enc_type = 0;
+  ctx->is_complex = 0;
+  ctx->is_valid_array = 0;
+  ctx->struct_alignment = 0;
+  while (type->typegroup == 'S') {
+    ++ctx->head;
+    ctx->head->field = type->fields;
+    ctx->head->parent_offset = 0;
+    type = type->fields->type;
+  }
+}
+static int __Pyx_BufFmt_ParseNumber(const char** ts) {
+    int count;
+    const char* t = *ts;
+    if (*t < '0' || *t > '9') {
+      return -1;
+    } else {
+        count = *t++ - '0';
+        while (*t >= '0' && *t <= '9') {
+            count *= 10;
+            count += *t++ - '0';
+        }
+    }
+    *ts = t;
+    return count;
+}
+static int __Pyx_BufFmt_ExpectNumber(const char **ts) {
+    int number = __Pyx_BufFmt_ParseNumber(ts);
+    if (number == -1)
+        PyErr_Format(PyExc_ValueError,\
+                     "Does not understand character buffer dtype format string ('%c')", **ts);
+    return number;
+}
+static void __Pyx_BufFmt_RaiseUnexpectedChar(char ch) {
+  PyErr_Format(PyExc_ValueError,
+               "Unexpected format string character: '%c'", ch);
+}
+static const char* __Pyx_BufFmt_DescribeTypeChar(char ch, int is_complex) {
+  switch (ch) {
+    case '?': return "'bool'";
+    case 'c': return "'char'";
+    case 'b': return "'signed char'";
+    case 'B': return "'unsigned char'";
+    case 'h': return "'short'";
+    case 'H': return "'unsigned short'";
+    case 'i': return "'int'";
+    case 'I': return "'unsigned int'";
+    case 'l': return "'long'";
+    case 'L': return "'unsigned long'";
+    case 'q': return "'long long'";
+    case 'Q': return "'unsigned long long'";
+    case 'f': return (is_complex ? "'complex float'" : "'float'");
+    case 'd': return (is_complex ? "'complex double'" : "'double'");
+    case 'g': return (is_complex ? "'complex long double'" : "'long double'");
+    case 'T': return "a struct";
+    case 'O': return "Python object";
+    case 'P': return "a pointer";
+    case 's': case 'p': return "a string";
+    case 0: return "end";
+    default: return "unparseable format string";
+  }
+}
+static size_t __Pyx_BufFmt_TypeCharToStandardSize(char ch, int is_complex) {
+  switch (ch) {
+    case '?': case 'c': case 'b': case 'B': case 's': case 'p': return 1;
+    case 'h': case 'H': return 2;
+    case 'i': case 'I': case 'l': case 'L': return 4;
+    case 'q': case 'Q': return 8;
+    case 'f': return (is_complex ? 8 : 4);
+    case 'd': return (is_complex ? 16 : 8);
+    case 'g': {
+      PyErr_SetString(PyExc_ValueError, "Python does not define a standard format string size for long double ('g')..");
+      return 0;
+    }
+    case 'O': case 'P': return sizeof(void*);
+    default:
+      __Pyx_BufFmt_RaiseUnexpectedChar(ch);
+      return 0;
+    }
+}
+static size_t __Pyx_BufFmt_TypeCharToNativeSize(char ch, int is_complex) {
+  switch (ch) {
+    case '?': case 'c': case 'b': case 'B': case 's': case 'p': return 1;
+    case 'h': case 'H': return sizeof(short);
+    case 'i': case 'I': return sizeof(int);
+    case 'l': case 'L': return sizeof(long);
+    #ifdef HAVE_LONG_LONG
+    case 'q': case 'Q': return sizeof(PY_LONG_LONG);
+    #endif
+    case 'f': return sizeof(float) * (is_complex ? 2 : 1);
+    case 'd': return sizeof(double) * (is_complex ? 2 : 1);
+    case 'g': return sizeof(long double) * (is_complex ? 2 : 1);
+    case 'O': case 'P': return sizeof(void*);
+    default: {
+      __Pyx_BufFmt_RaiseUnexpectedChar(ch);
+      return 0;
+    }
+  }
+}
+typedef struct { char c; short x; } __Pyx_st_short;
+typedef struct { char c; int x; } __Pyx_st_int;
+typedef struct { char c; long x; } __Pyx_st_long;
+typedef struct { char c; float x; } __Pyx_st_float;
+typedef struct { char c; double x; } __Pyx_st_double;
+typedef struct { char c; long double x; } __Pyx_st_longdouble;
+typedef struct { char c; void *x; } __Pyx_st_void_p;
+#ifdef HAVE_LONG_LONG
+typedef struct { char c; PY_LONG_LONG x; } __Pyx_st_longlong;
+#endif
+static size_t __Pyx_BufFmt_TypeCharToAlignment(char ch, CYTHON_UNUSED int is_complex) {
+  switch (ch) {
+    case '?': case 'c': case 'b': case 'B': case 's': case 'p': return 1;
+    case 'h': case 'H': return sizeof(__Pyx_st_short) - sizeof(short);
+    case 'i': case 'I': return sizeof(__Pyx_st_int) - sizeof(int);
+    case 'l': case 'L': return sizeof(__Pyx_st_long) - sizeof(long);
+#ifdef HAVE_LONG_LONG
+    case 'q': case 'Q': return sizeof(__Pyx_st_longlong) - sizeof(PY_LONG_LONG);
+#endif
+    case 'f': return sizeof(__Pyx_st_float) - sizeof(float);
+    case 'd': return sizeof(__Pyx_st_double) - sizeof(double);
+    case 'g': return sizeof(__Pyx_st_longdouble) - sizeof(long double);
+    case 'P': case 'O': return sizeof(__Pyx_st_void_p) - sizeof(void*);
+    default:
+      __Pyx_BufFmt_RaiseUnexpectedChar(ch);
+      return 0;
+    }
+}
+/* These are for computing the padding at the end of the struct to align
+   on the first member of the struct. This will probably the same as above,
+   but we don't have any guarantees.
+ */
+typedef struct { short x; char c; } __Pyx_pad_short;
+typedef struct { int x; char c; } __Pyx_pad_int;
+typedef struct { long x; char c; } __Pyx_pad_long;
+typedef struct { float x; char c; } __Pyx_pad_float;
+typedef struct { double x; char c; } __Pyx_pad_double;
+typedef struct { long double x; char c; } __Pyx_pad_longdouble;
+typedef struct { void *x; char c; } __Pyx_pad_void_p;
+#ifdef HAVE_LONG_LONG
+typedef struct { PY_LONG_LONG x; char c; } __Pyx_pad_longlong;
+#endif
+static size_t __Pyx_BufFmt_TypeCharToPadding(char ch, CYTHON_UNUSED int is_complex) {
+  switch (ch) {
+    case '?': case 'c': case 'b': case 'B': case 's': case 'p': return 1;
+    case 'h': case 'H': return sizeof(__Pyx_pad_short) - sizeof(short);
+    case 'i': case 'I': return sizeof(__Pyx_pad_int) - sizeof(int);
+    case 'l': case 'L': return sizeof(__Pyx_pad_long) - sizeof(long);
+#ifdef HAVE_LONG_LONG
+    case 'q': case 'Q': return sizeof(__Pyx_pad_longlong) - sizeof(PY_LONG_LONG);
+#endif
+    case 'f': return sizeof(__Pyx_pad_float) - sizeof(float);
+    case 'd': return sizeof(__Pyx_pad_double) - sizeof(double);
+    case 'g': return sizeof(__Pyx_pad_longdouble) - sizeof(long double);
+    case 'P': case 'O': return sizeof(__Pyx_pad_void_p) - sizeof(void*);
+    default:
+      __Pyx_BufFmt_RaiseUnexpectedChar(ch);
+      return 0;
+    }
+}
+static char __Pyx_BufFmt_TypeCharToGroup(char ch, int is_complex) {
+  switch (ch) {
+    case 'c':
+        return 'H';
+    case 'b': case 'h': case 'i':
+    case 'l': case 'q': case 's': case 'p':
+        return 'I';
+    case '?': case 'B': case 'H': case 'I': case 'L': case 'Q':
+        return 'U';
+    case 'f': case 'd': case 'g':
+        return (is_complex ? 'C' : 'R');
+    case 'O':
+        return 'O';
+    case 'P':
+        return 'P';
+    default: {
+      __Pyx_BufFmt_RaiseUnexpectedChar(ch);
+      return 0;
+    }
+  }
+}
+static void __Pyx_BufFmt_RaiseExpected(__Pyx_BufFmt_Context* ctx) {
+  if (ctx->head == NULL || ctx->head->field == &ctx->root) {
+    const char* expected;
+    const char* quote;
+    if (ctx->head == NULL) {
+      expected = "end";
+      quote = "";
+    } else {
+      expected = ctx->head->field->type->name;
+      quote = "'";
+    }
+    PyErr_Format(PyExc_ValueError,
+                 "Buffer dtype mismatch, expected %s%s%s but got %s",
+                 quote, expected, quote,
+                 __Pyx_BufFmt_DescribeTypeChar(ctx->enc_type, ctx->is_complex));
+  } else {
+    __Pyx_StructField* field = ctx->head->field;
+    __Pyx_StructField* parent = (ctx->head - 1)->field;
+    PyErr_Format(PyExc_ValueError,
+                 "Buffer dtype mismatch, expected '%s' but got %s in '%s.%s'",
+                 field->type->name, __Pyx_BufFmt_DescribeTypeChar(ctx->enc_type, ctx->is_complex),
+                 parent->type->name, field->name);
+  }
+}
+static int __Pyx_BufFmt_ProcessTypeChunk(__Pyx_BufFmt_Context* ctx) {
+  char group;
+  size_t size, offset, arraysize = 1;
+  if (ctx->enc_type == 0) return 0;
+  if (ctx->head->field->type->arraysize[0]) {
+    int i, ndim = 0;
+    if (ctx->enc_type == 's' || ctx->enc_type == 'p') {
+        ctx->is_valid_array = ctx->head->field->type->ndim == 1;
+        ndim = 1;
+        if (ctx->enc_count != ctx->head->field->type->arraysize[0]) {
+            PyErr_Format(PyExc_ValueError,
+                         "Expected a dimension of size %zu, got %zu",
+                         ctx->head->field->type->arraysize[0], ctx->enc_count);
+            return -1;
+        }
+    }
+    if (!ctx->is_valid_array) {
+      PyErr_Format(PyExc_ValueError, "Expected %d dimensions, got %d",
+                   ctx->head->field->type->ndim, ndim);
+      return -1;
+    }
+    for (i = 0; i < ctx->head->field->type->ndim; i++) {
+      arraysize *= ctx->head->field->type->arraysize[i];
+    }
+    ctx->is_valid_array = 0;
+    ctx->enc_count = 1;
+  }
+  group = __Pyx_BufFmt_TypeCharToGroup(ctx->enc_type, ctx->is_complex);
+  do {
+    __Pyx_StructField* field = ctx->head->field;
+    __Pyx_TypeInfo* type = field->type;
+    if (ctx->enc_packmode == '@' || ctx->enc_packmode == '^') {
+      size = __Pyx_BufFmt_TypeCharToNativeSize(ctx->enc_type, ctx->is_complex);
+    } else {
+      size = __Pyx_BufFmt_TypeCharToStandardSize(ctx->enc_type, ctx->is_complex);
+    }
+    if (ctx->enc_packmode == '@') {
+      size_t align_at = __Pyx_BufFmt_TypeCharToAlignment(ctx->enc_type, ctx->is_complex);
+      size_t align_mod_offset;
+      if (align_at == 0) return -1;
+      align_mod_offset = ctx->fmt_offset % align_at;
+      if (align_mod_offset > 0) ctx->fmt_offset += align_at - align_mod_offset;
+      if (ctx->struct_alignment == 0)
+          ctx->struct_alignment = __Pyx_BufFmt_TypeCharToPadding(ctx->enc_type,
+                                                                 ctx->is_complex);
+    }
+    if (type->size != size || type->typegroup != group) {
+      if (type->typegroup == 'C' && type->fields != NULL) {
+        size_t parent_offset = ctx->head->parent_offset + field->offset;
+        ++ctx->head;
+        ctx->head->field = type->fields;
+        ctx->head->parent_offset = parent_offset;
+        continue;
+      }
+      if ((type->typegroup == 'H' || group == 'H') && type->size == size) {
+      } else {
+          __Pyx_BufFmt_RaiseExpected(ctx);
+          return -1;
+      }
+    }
+    offset = ctx->head->parent_offset + field->offset;
+    if (ctx->fmt_offset != offset) {
+      PyErr_Format(PyExc_ValueError,
+                   "Buffer dtype mismatch; next field is at offset %" CYTHON_FORMAT_SSIZE_T "d but %" CYTHON_FORMAT_SSIZE_T "d expected",
+                   (Py_ssize_t)ctx->fmt_offset, (Py_ssize_t)offset);
+      return -1;
+    }
+    ctx->fmt_offset += size;
+    if (arraysize)
+      ctx->fmt_offset += (arraysize - 1) * size;
+    --ctx->enc_count;
+    while (1) {
+      if (field == &ctx->root) {
+        ctx->head = NULL;
+        if (ctx->enc_count != 0) {
+          __Pyx_BufFmt_RaiseExpected(ctx);
+          return -1;
+        }
+        break;
+      }
+      ctx->head->field = ++field;
+      if (field->type == NULL) {
+        --ctx->head;
+        field = ctx->head->field;
+        continue;
+      } else if (field->type->typegroup == 'S') {
+        size_t parent_offset = ctx->head->parent_offset + field->offset;
+        if (field->type->fields->type == NULL) continue;
+        field = field->type->fields;
+        ++ctx->head;
+        ctx->head->field = field;
+        ctx->head->parent_offset = parent_offset;
+        break;
+      } else {
+        break;
+      }
+    }
+  } while (ctx->enc_count);
+  ctx->enc_type = 0;
+  ctx->is_complex = 0;
+  return 0;
+}
+static PyObject *
+__pyx_buffmt_parse_array(__Pyx_BufFmt_Context* ctx, const char** tsp)
+{
+    const char *ts = *tsp;
+    int i = 0, number, ndim;
+    ++ts;
+    if (ctx->new_count != 1) {
+        PyErr_SetString(PyExc_ValueError,
+                        "Cannot handle repeated arrays in format string");
+        return NULL;
+    }
+    if (__Pyx_BufFmt_ProcessTypeChunk(ctx) == -1) return NULL;
+    ndim = ctx->head->field->type->ndim;
+    while (*ts && *ts != ')') {
+        switch (*ts) {
+            case ' ': case '\f': case '\r': case '\n': case '\t': case '\v':  continue;
+            default:  break;
+        }
+        number = __Pyx_BufFmt_ExpectNumber(&ts);
+        if (number == -1) return NULL;
+        if (i < ndim && (size_t) number != ctx->head->field->type->arraysize[i])
+            return PyErr_Format(PyExc_ValueError,
+                        "Expected a dimension of size %zu, got %d",
+                        ctx->head->field->type->arraysize[i], number);
+        if (*ts != ',' && *ts != ')')
+            return PyErr_Format(PyExc_ValueError,
+                                "Expected a comma in format string, got '%c'", *ts);
+        if (*ts == ',') ts++;
+        i++;
+    }
+    if (i != ndim)
+        return PyErr_Format(PyExc_ValueError, "Expected %d dimension(s), got %d",
+                            ctx->head->field->type->ndim, i);
+    if (!*ts) {
+        PyErr_SetString(PyExc_ValueError,
+                        "Unexpected end of format string, expected ')'");
+        return NULL;
+    }
+    ctx->is_valid_array = 1;
+    ctx->new_count = 1;
+    *tsp = ++ts;
+    return Py_None;
+}
+static const char* __Pyx_BufFmt_CheckString(__Pyx_BufFmt_Context* ctx, const char* ts) {
+  int got_Z = 0;
+  while (1) {
+    switch(*ts) {
+      case 0:
+        if (ctx->enc_type != 0 && ctx->head == NULL) {
+          __Pyx_BufFmt_RaiseExpected(ctx);
+          return NULL;
+        }
+        if (__Pyx_BufFmt_ProcessTypeChunk(ctx) == -1) return NULL;
+        if (ctx->head != NULL) {
+          __Pyx_BufFmt_RaiseExpected(ctx);
+          return NULL;
+        }
+        return ts;
+      case ' ':
+      case '\r':
+      case '\n':
+        ++ts;
+        break;
+      case '<':
+        if (!__Pyx_Is_Little_Endian()) {
+          PyErr_SetString(PyExc_ValueError, "Little-endian buffer not supported on big-endian compiler");
+          return NULL;
+        }
+        ctx->new_packmode = '=';
+        ++ts;
+        break;
+      case '>':
+      case '!':
+        if (__Pyx_Is_Little_Endian()) {
+          PyErr_SetString(PyExc_ValueError, "Big-endian buffer not supported on little-endian compiler");
+          return NULL;
+        }
+        ctx->new_packmode = '=';
+        ++ts;
+        break;
+      case '=':
+      case '@':
+      case '^':
+        ctx->new_packmode = *ts++;
+        break;
+      case 'T':
+        {
+          const char* ts_after_sub;
+          size_t i, struct_count = ctx->new_count;
+          size_t struct_alignment = ctx->struct_alignment;
+          ctx->new_count = 1;
+          ++ts;
+          if (*ts != '{') {
+            PyErr_SetString(PyExc_ValueError, "Buffer acquisition: Expected '{' after 'T'");
+            return NULL;
+          }
+          if (__Pyx_BufFmt_ProcessTypeChunk(ctx) == -1) return NULL;
+          ctx->enc_type = 0;
+          ctx->enc_count = 0;
+          ctx->struct_alignment = 0;
+          ++ts;
+          ts_after_sub = ts;
+          for (i = 0; i != struct_count; ++i) {
+            ts_after_sub = __Pyx_BufFmt_CheckString(ctx, ts);
+            if (!ts_after_sub) return NULL;
+          }
+          ts = ts_after_sub;
+          if (struct_alignment) ctx->struct_alignment = struct_alignment;
+        }
+        break;
+      case '}':
+        {
+          size_t alignment = ctx->struct_alignment;
+          ++ts;
+          if (__Pyx_BufFmt_ProcessTypeChunk(ctx) == -1) return NULL;
+          ctx->enc_type = 0;
+          if (alignment && ctx->fmt_offset % alignment) {
+            ctx->fmt_offset += alignment - (ctx->fmt_offset % alignment);
+          }
+        }
+        return ts;
+      case 'x':
+        if (__Pyx_BufFmt_ProcessTypeChunk(ctx) == -1) return NULL;
+        ctx->fmt_offset += ctx->new_count;
+        ctx->new_count = 1;
+        ctx->enc_count = 0;
+        ctx->enc_type = 0;
+        ctx->enc_packmode = ctx->new_packmode;
+        ++ts;
+        break;
+      case 'Z':
+        got_Z = 1;
+        ++ts;
+        if (*ts != 'f' && *ts != 'd' && *ts != 'g') {
+          __Pyx_BufFmt_RaiseUnexpectedChar('Z');
+          return NULL;
+        }
+        CYTHON_FALLTHROUGH;
+      case '?': case 'c': case 'b': case 'B': case 'h': case 'H': case 'i': case 'I':
+      case 'l': case 'L': case 'q': case 'Q':
+      case 'f': case 'd': case 'g':
+      case 'O': case 'p':
+        if ((ctx->enc_type == *ts) && (got_Z == ctx->is_complex) &&
+            (ctx->enc_packmode == ctx->new_packmode) && (!ctx->is_valid_array)) {
+          ctx->enc_count += ctx->new_count;
+          ctx->new_count = 1;
+          got_Z = 0;
+          ++ts;
+          break;
+        }
+        CYTHON_FALLTHROUGH;
+      case 's':
+        if (__Pyx_BufFmt_ProcessTypeChunk(ctx) == -1) return NULL;
+        ctx->enc_count = ctx->new_count;
+        ctx->enc_packmode = ctx->new_packmode;
+        ctx->enc_type = *ts;
+        ctx->is_complex = got_Z;
+        ++ts;
+        ctx->new_count = 1;
+        got_Z = 0;
+        break;
+      case ':':
+        ++ts;
+        while(*ts != ':') ++ts;
+        ++ts;
+        break;
+      case '(':
+        if (!__pyx_buffmt_parse_array(ctx, &ts)) return NULL;
+        break;
+      default:
+        {
+          int number = __Pyx_BufFmt_ExpectNumber(&ts);
+          if (number == -1) return NULL;
+          ctx->new_count = (size_t)number;
+        }
+    }
+  }
+}
+
+/* BufferGetAndValidate */
+  static CYTHON_INLINE void __Pyx_SafeReleaseBuffer(Py_buffer* info) {
+  if (unlikely(info->buf == NULL)) return;
+  if (info->suboffsets == __Pyx_minusones) info->suboffsets = NULL;
+  __Pyx_ReleaseBuffer(info);
+}
+static void __Pyx_ZeroBuffer(Py_buffer* buf) {
+  buf->buf = NULL;
+  buf->obj = NULL;
+  buf->strides = __Pyx_zeros;
+  buf->shape = __Pyx_zeros;
+  buf->suboffsets = __Pyx_minusones;
+}
+static int __Pyx__GetBufferAndValidate(
+        Py_buffer* buf, PyObject* obj,  __Pyx_TypeInfo* dtype, int flags,
+        int nd, int cast, __Pyx_BufFmt_StackElem* stack)
+{
+  buf->buf = NULL;
+  if (unlikely(__Pyx_GetBuffer(obj, buf, flags) == -1)) {
+    __Pyx_ZeroBuffer(buf);
+    return -1;
+  }
+  if (unlikely(buf->ndim != nd)) {
+    PyErr_Format(PyExc_ValueError,
+                 "Buffer has wrong number of dimensions (expected %d, got %d)",
+                 nd, buf->ndim);
+    goto fail;
+  }
+  if (!cast) {
+    __Pyx_BufFmt_Context ctx;
+    __Pyx_BufFmt_Init(&ctx, stack, dtype);
+    if (!__Pyx_BufFmt_CheckString(&ctx, buf->format)) goto fail;
+  }
+  if (unlikely((size_t)buf->itemsize != dtype->size)) {
+    PyErr_Format(PyExc_ValueError,
+      "Item size of buffer (%" CYTHON_FORMAT_SSIZE_T "d byte%s) does not match size of '%s' (%" CYTHON_FORMAT_SSIZE_T "d byte%s)",
+      buf->itemsize, (buf->itemsize > 1) ? "s" : "",
+      dtype->name, (Py_ssize_t)dtype->size, (dtype->size > 1) ? "s" : "");
+    goto fail;
+  }
+  if (buf->suboffsets == NULL) buf->suboffsets = __Pyx_minusones;
+  return 0;
+fail:;
+  __Pyx_SafeReleaseBuffer(buf);
+  return -1;
+}
+
+/* Import */
+  static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+    PyObject *empty_list = 0;
+    PyObject *module = 0;
+    PyObject *global_dict = 0;
+    PyObject *empty_dict = 0;
+    PyObject *list;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_import;
+    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
+    if (!py_import)
+        goto bad;
+    #endif
+    if (from_list)
+        list = from_list;
+    else {
+        empty_list = PyList_New(0);
+        if (!empty_list)
+            goto bad;
+        list = empty_list;
+    }
+    global_dict = PyModule_GetDict(__pyx_m);
+    if (!global_dict)
+        goto bad;
+    empty_dict = PyDict_New();
+    if (!empty_dict)
+        goto bad;
+    {
+        #if PY_MAJOR_VERSION >= 3
+        if (level == -1) {
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
+                module = PyImport_ImportModuleLevelObject(
+                    name, global_dict, empty_dict, list, 1);
+                if (!module) {
+                    if (!PyErr_ExceptionMatches(PyExc_ImportError))
+                        goto bad;
+                    PyErr_Clear();
+                }
+            }
+            level = 0;
+        }
+        #endif
+        if (!module) {
+            #if PY_MAJOR_VERSION < 3
+            PyObject *py_level = PyInt_FromLong(level);
+            if (!py_level)
+                goto bad;
+            module = PyObject_CallFunctionObjArgs(py_import,
+                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
+            Py_DECREF(py_level);
+            #else
+            module = PyImport_ImportModuleLevelObject(
+                name, global_dict, empty_dict, list, level);
+            #endif
+        }
+    }
+bad:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_import);
+    #endif
+    Py_XDECREF(empty_list);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+/* ImportFrom */
+  static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Format(PyExc_ImportError,
+        #if PY_MAJOR_VERSION < 3
+            "cannot import name %.230s", PyString_AS_STRING(name));
+        #else
+            "cannot import name %S", name);
+        #endif
+    }
+    return value;
+}
+
+/* PyObjectCall2Args */
+  static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
+}
+
+/* GetItemInt */
+  static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (!j) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyList_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
+        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyTuple_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
+        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     CYTHON_NCP_UNUSED int wraparound,
+                                                     CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
+            PyObject *r = PyList_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    else if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    } else {
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
+                }
+            }
+            return m->sq_item(o, i);
+        }
+    }
+#else
+    if (is_list || PySequence_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
+#endif
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+}
+
+/* HasAttr */
+  static CYTHON_INLINE int __Pyx_HasAttr(PyObject *o, PyObject *n) {
+    PyObject *r;
+    if (unlikely(!__Pyx_PyBaseString_Check(n))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "hasattr(): attribute name must be string");
+        return -1;
+    }
+    r = __Pyx_GetAttr(o, n);
+    if (unlikely(!r)) {
+        PyErr_Clear();
+        return 0;
+    } else {
+        Py_DECREF(r);
+        return 1;
+    }
+}
+
+/* GetTopmostException */
+  #if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem *
+__Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
+{
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    while ((exc_info->exc_type == NULL || exc_info->exc_type == Py_None) &&
+           exc_info->previous_item != NULL)
+    {
+        exc_info = exc_info->previous_item;
+    }
+    return exc_info;
+}
+#endif
+
+/* SaveResetException */
+  #if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    *type = exc_info->exc_type;
+    *value = exc_info->exc_value;
+    *tb = exc_info->exc_traceback;
+    #else
+    *type = tstate->exc_type;
+    *value = tstate->exc_value;
+    *tb = tstate->exc_traceback;
+    #endif
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+}
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = type;
+    exc_info->exc_value = value;
+    exc_info->exc_traceback = tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = type;
+    tstate->exc_value = value;
+    tstate->exc_traceback = tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+#endif
+
+/* GetException */
+  #if CYTHON_FAST_THREAD_STATE
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb)
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
+#endif
+{
+    PyObject *local_type, *local_value, *local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    local_type = tstate->curexc_type;
+    local_value = tstate->curexc_value;
+    local_tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#else
+    PyErr_Fetch(&local_type, &local_value, &local_tb);
+#endif
+    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
+#if CYTHON_FAST_THREAD_STATE
+    if (unlikely(tstate->curexc_type))
+#else
+    if (unlikely(PyErr_Occurred()))
+#endif
+        goto bad;
+    #if PY_MAJOR_VERSION >= 3
+    if (local_tb) {
+        if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
+            goto bad;
+    }
+    #endif
+    Py_XINCREF(local_tb);
+    Py_XINCREF(local_type);
+    Py_XINCREF(local_value);
+    *type = local_type;
+    *value = local_value;
+    *tb = local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_USE_EXC_INFO_STACK
+    {
+        _PyErr_StackItem *exc_info = tstate->exc_info;
+        tmp_type = exc_info->exc_type;
+        tmp_value = exc_info->exc_value;
+        tmp_tb = exc_info->exc_traceback;
+        exc_info->exc_type = local_type;
+        exc_info->exc_value = local_value;
+        exc_info->exc_traceback = local_tb;
+    }
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = local_type;
+    tstate->exc_value = local_value;
+    tstate->exc_traceback = local_tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#else
+    PyErr_SetExcInfo(local_type, local_value, local_tb);
+#endif
+    return 0;
+bad:
+    *type = 0;
+    *value = 0;
+    *tb = 0;
+    Py_XDECREF(local_type);
+    Py_XDECREF(local_value);
+    Py_XDECREF(local_tb);
+    return -1;
+}
+
+/* PyObject_GenericGetAttrNoDict */
+  #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, attr_name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(attr_name));
+#endif
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name) {
+    PyObject *descr;
+    PyTypeObject *tp = Py_TYPE(obj);
+    if (unlikely(!PyString_Check(attr_name))) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    assert(!tp->tp_dictoffset);
+    descr = _PyType_Lookup(tp, attr_name);
+    if (unlikely(!descr)) {
+        return __Pyx_RaiseGenericGetAttributeError(tp, attr_name);
+    }
+    Py_INCREF(descr);
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_HAVE_CLASS)))
+    #endif
+    {
+        descrgetfunc f = Py_TYPE(descr)->tp_descr_get;
+        if (unlikely(f)) {
+            PyObject *res = f(descr, obj, (PyObject *)tp);
+            Py_DECREF(descr);
+            return res;
+        }
+    }
+    return descr;
+}
+#endif
+
+/* PyObject_GenericGetAttr */
+  #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name) {
+    if (unlikely(Py_TYPE(obj)->tp_dictoffset)) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    return __Pyx_PyObject_GenericGetAttrNoDict(obj, attr_name);
+}
+#endif
+
+/* SetVTable */
+  static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
+#if PY_VERSION_HEX >= 0x02070000
+    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+#else
+    PyObject *ob = PyCObject_FromVoidPtr(vtable, 0);
+#endif
+    if (!ob)
+        goto bad;
+    if (PyDict_SetItem(dict, __pyx_n_s_pyx_vtable, ob) < 0)
+        goto bad;
+    Py_DECREF(ob);
+    return 0;
+bad:
+    Py_XDECREF(ob);
+    return -1;
+}
+
+/* PyObjectGetAttrStrNoError */
+  static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS && PY_VERSION_HEX >= 0x030700B1
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+}
+
+/* SetupReduce */
+  static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
+  int ret;
+  PyObject *name_attr;
+  name_attr = __Pyx_PyObject_GetAttrStr(meth, __pyx_n_s_name);
+  if (likely(name_attr)) {
+      ret = PyObject_RichCompareBool(name_attr, name, Py_EQ);
+  } else {
+      ret = -1;
+  }
+  if (unlikely(ret < 0)) {
+      PyErr_Clear();
+      ret = 0;
+  }
+  Py_XDECREF(name_attr);
+  return ret;
+}
+static int __Pyx_setup_reduce(PyObject* type_obj) {
+    int ret = 0;
+    PyObject *object_reduce = NULL;
+    PyObject *object_getstate = NULL;
+    PyObject *object_reduce_ex = NULL;
+    PyObject *reduce = NULL;
+    PyObject *reduce_ex = NULL;
+    PyObject *reduce_cython = NULL;
+    PyObject *setstate = NULL;
+    PyObject *setstate_cython = NULL;
+    PyObject *getstate = NULL;
+#if CYTHON_USE_PYTYPE_LOOKUP
+    getstate = _PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate);
+#else
+    getstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_getstate);
+    if (!getstate && PyErr_Occurred()) {
+        goto __PYX_BAD;
+    }
+#endif
+    if (getstate) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_getstate = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_getstate);
+#else
+        object_getstate = __Pyx_PyObject_GetAttrStrNoError((PyObject*)&PyBaseObject_Type, __pyx_n_s_getstate);
+        if (!object_getstate && PyErr_Occurred()) {
+            goto __PYX_BAD;
+        }
+#endif
+        if (object_getstate != getstate) {
+            goto __PYX_GOOD;
+        }
+    }
+#if CYTHON_USE_PYTYPE_LOOKUP
+    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#else
+    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#endif
+    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto __PYX_BAD;
+    if (reduce_ex == object_reduce_ex) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#else
+        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#endif
+        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto __PYX_BAD;
+        if (reduce == object_reduce || __Pyx_setup_reduce_is_named(reduce, __pyx_n_s_reduce_cython)) {
+            reduce_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_reduce_cython);
+            if (likely(reduce_cython)) {
+                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+            } else if (reduce == object_reduce || PyErr_Occurred()) {
+                goto __PYX_BAD;
+            }
+            setstate = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate);
+            if (!setstate) PyErr_Clear();
+            if (!setstate || __Pyx_setup_reduce_is_named(setstate, __pyx_n_s_setstate_cython)) {
+                setstate_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_setstate_cython);
+                if (likely(setstate_cython)) {
+                    ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                    ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                } else if (!setstate || PyErr_Occurred()) {
+                    goto __PYX_BAD;
+                }
+            }
+            PyType_Modified((PyTypeObject*)type_obj);
+        }
+    }
+    goto __PYX_GOOD;
+__PYX_BAD:
+    if (!PyErr_Occurred())
+        PyErr_Format(PyExc_RuntimeError, "Unable to initialize pickling for %s", ((PyTypeObject*)type_obj)->tp_name);
+    ret = -1;
+__PYX_GOOD:
+#if !CYTHON_USE_PYTYPE_LOOKUP
+    Py_XDECREF(object_reduce);
+    Py_XDECREF(object_reduce_ex);
+    Py_XDECREF(object_getstate);
+    Py_XDECREF(getstate);
+#endif
+    Py_XDECREF(reduce);
+    Py_XDECREF(reduce_ex);
+    Py_XDECREF(reduce_cython);
+    Py_XDECREF(setstate);
+    Py_XDECREF(setstate_cython);
+    return ret;
+}
+
+/* TypeImport */
+  #ifndef __PYX_HAVE_RT_ImportType_0_29_37
+#define __PYX_HAVE_RT_ImportType_0_29_37
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject *module, const char *module_name, const char *class_name,
+    size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size)
+{
+    PyObject *result = 0;
+    char warning[200];
+    Py_ssize_t basicsize;
+    Py_ssize_t itemsize;
+#ifdef Py_LIMITED_API
+    PyObject *py_basicsize;
+    PyObject *py_itemsize;
+#endif
+    result = PyObject_GetAttrString(module, class_name);
+    if (!result)
+        goto bad;
+    if (!PyType_Check(result)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s.%.200s is not a type object",
+            module_name, class_name);
+        goto bad;
+    }
+#ifndef Py_LIMITED_API
+    basicsize = ((PyTypeObject *)result)->tp_basicsize;
+    itemsize = ((PyTypeObject *)result)->tp_itemsize;
+#else
+    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
+    if (!py_basicsize)
+        goto bad;
+    basicsize = PyLong_AsSsize_t(py_basicsize);
+    Py_DECREF(py_basicsize);
+    py_basicsize = 0;
+    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+    py_itemsize = PyObject_GetAttrString(result, "__itemsize__");
+    if (!py_itemsize)
+        goto bad;
+    itemsize = PyLong_AsSsize_t(py_itemsize);
+    Py_DECREF(py_itemsize);
+    py_itemsize = 0;
+    if (itemsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+#endif
+    if (itemsize) {
+        if (size % alignment) {
+            alignment = size % alignment;
+        }
+        if (itemsize < (Py_ssize_t)alignment)
+            itemsize = (Py_ssize_t)alignment;
+    }
+    if ((size_t)(basicsize + itemsize) < size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    if (check_size == __Pyx_ImportType_CheckSize_Error_0_29_37 && (size_t)basicsize != size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    else if (check_size == __Pyx_ImportType_CheckSize_Warn_0_29_37 && (size_t)basicsize > size) {
+        PyOS_snprintf(warning, sizeof(warning),
+            "%s.%s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
+    }
+    return (PyTypeObject *)result;
+bad:
+    Py_XDECREF(result);
+    return NULL;
+}
+#endif
+
+/* CLineInTraceback */
+  #ifndef CYTHON_CLINE_IN_TRACEBACK
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
+    PyObject *use_cline;
+    PyObject *ptype, *pvalue, *ptraceback;
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject **cython_runtime_dict;
+#endif
+    if (unlikely(!__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+#if CYTHON_COMPILING_IN_CPYTHON
+    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
+    } else
+#endif
+    {
+      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
+      if (use_cline_obj) {
+        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
+        Py_DECREF(use_cline_obj);
+      } else {
+        PyErr_Clear();
+        use_cline = NULL;
+      }
+    }
+    if (!use_cline) {
+        c_line = 0;
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+    }
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache */
+  static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static PyCodeObject *__pyx_find_code_object(int code_line) {
+    PyCodeObject* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = __pyx_code_cache.entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            __pyx_code_cache.entries = entries;
+            __pyx_code_cache.max_count = 64;
+            __pyx_code_cache.count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
+        PyCodeObject* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_DECREF(tmp);
+        return;
+    }
+    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
+        int new_max = __pyx_code_cache.max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        __pyx_code_cache.entries = entries;
+        __pyx_code_cache.max_count = new_max;
+    }
+    for (i=__pyx_code_cache.count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    __pyx_code_cache.count++;
+    Py_INCREF(code_object);
+}
+
+/* AddTraceback */
+  #include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
+    py_srcfile = PyString_FromString(filename);
+    if (!py_srcfile) goto bad;
+    #endif
+    if (c_line) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+        #endif
+    }
+    else {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        if (!py_funcname) goto bad;
+        #endif
+    }
+    #if PY_MAJOR_VERSION < 3
+    py_code = __Pyx_PyCode_New(
+        0,
+        0,
+        0,
+        0,
+        0,
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple, /*PyObject *consts,*/
+        __pyx_empty_tuple, /*PyObject *names,*/
+        __pyx_empty_tuple, /*PyObject *varnames,*/
+        __pyx_empty_tuple, /*PyObject *freevars,*/
+        __pyx_empty_tuple, /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        py_line,
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    Py_DECREF(py_srcfile);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+
+/* CIntFromPyVerify */
+  #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+#if PY_MAJOR_VERSION < 3
+static int __Pyx_GetBuffer(PyObject *obj, Py_buffer *view, int flags) {
+    if (PyObject_CheckBuffer(obj)) return PyObject_GetBuffer(obj, view, flags);
+    PyErr_Format(PyExc_TypeError, "'%.200s' does not have the buffer interface", Py_TYPE(obj)->tp_name);
+    return -1;
+}
+static void __Pyx_ReleaseBuffer(Py_buffer *view) {
+    PyObject *obj = view->obj;
+    if (!obj) return;
+    if (PyObject_CheckBuffer(obj)) {
+        PyBuffer_Release(view);
+        return;
+    }
+    if ((0)) {}
+    view->obj = NULL;
+    Py_DECREF(obj);
+}
+#endif
+
+
+  /* Declarations */
+  #if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
+      return ::std::complex< float >(x, y);
+    }
+  #else
+    static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
+      return x + y*(__pyx_t_float_complex)_Complex_I;
+    }
+  #endif
+#else
+    static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
+      __pyx_t_float_complex z;
+      z.real = x;
+      z.imag = y;
+      return z;
+    }
+#endif
+
+/* Arithmetic */
+  #if CYTHON_CCOMPLEX
+#else
+    static CYTHON_INLINE int __Pyx_c_eq_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+       return (a.real == b.real) && (a.imag == b.imag);
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_sum_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        __pyx_t_float_complex z;
+        z.real = a.real + b.real;
+        z.imag = a.imag + b.imag;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_diff_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        __pyx_t_float_complex z;
+        z.real = a.real - b.real;
+        z.imag = a.imag - b.imag;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_prod_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        __pyx_t_float_complex z;
+        z.real = a.real * b.real - a.imag * b.imag;
+        z.imag = a.real * b.imag + a.imag * b.real;
+        return z;
+    }
+    #if 1
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_quot_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        if (b.imag == 0) {
+            return __pyx_t_float_complex_from_parts(a.real / b.real, a.imag / b.real);
+        } else if (fabsf(b.real) >= fabsf(b.imag)) {
+            if (b.real == 0 && b.imag == 0) {
+                return __pyx_t_float_complex_from_parts(a.real / b.real, a.imag / b.imag);
+            } else {
+                float r = b.imag / b.real;
+                float s = (float)(1.0) / (b.real + b.imag * r);
+                return __pyx_t_float_complex_from_parts(
+                    (a.real + a.imag * r) * s, (a.imag - a.real * r) * s);
+            }
+        } else {
+            float r = b.real / b.imag;
+            float s = (float)(1.0) / (b.imag + b.real * r);
+            return __pyx_t_float_complex_from_parts(
+                (a.real * r + a.imag) * s, (a.imag * r - a.real) * s);
+        }
+    }
+    #else
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_quot_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        if (b.imag == 0) {
+            return __pyx_t_float_complex_from_parts(a.real / b.real, a.imag / b.real);
+        } else {
+            float denom = b.real * b.real + b.imag * b.imag;
+            return __pyx_t_float_complex_from_parts(
+                (a.real * b.real + a.imag * b.imag) / denom,
+                (a.imag * b.real - a.real * b.imag) / denom);
+        }
+    }
+    #endif
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_neg_float(__pyx_t_float_complex a) {
+        __pyx_t_float_complex z;
+        z.real = -a.real;
+        z.imag = -a.imag;
+        return z;
+    }
+    static CYTHON_INLINE int __Pyx_c_is_zero_float(__pyx_t_float_complex a) {
+       return (a.real == 0) && (a.imag == 0);
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_conj_float(__pyx_t_float_complex a) {
+        __pyx_t_float_complex z;
+        z.real =  a.real;
+        z.imag = -a.imag;
+        return z;
+    }
+    #if 1
+        static CYTHON_INLINE float __Pyx_c_abs_float(__pyx_t_float_complex z) {
+          #if !defined(HAVE_HYPOT) || defined(_MSC_VER)
+            return sqrtf(z.real*z.real + z.imag*z.imag);
+          #else
+            return hypotf(z.real, z.imag);
+          #endif
+        }
+        static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_pow_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+            __pyx_t_float_complex z;
+            float r, lnr, theta, z_r, z_theta;
+            if (b.imag == 0 && b.real == (int)b.real) {
+                if (b.real < 0) {
+                    float denom = a.real * a.real + a.imag * a.imag;
+                    a.real = a.real / denom;
+                    a.imag = -a.imag / denom;
+                    b.real = -b.real;
+                }
+                switch ((int)b.real) {
+                    case 0:
+                        z.real = 1;
+                        z.imag = 0;
+                        return z;
+                    case 1:
+                        return a;
+                    case 2:
+                        return __Pyx_c_prod_float(a, a);
+                    case 3:
+                        z = __Pyx_c_prod_float(a, a);
+                        return __Pyx_c_prod_float(z, a);
+                    case 4:
+                        z = __Pyx_c_prod_float(a, a);
+                        return __Pyx_c_prod_float(z, z);
+                }
+            }
+            if (a.imag == 0) {
+                if (a.real == 0) {
+                    return a;
+                } else if ((b.imag == 0) && (a.real >= 0)) {
+                    z.real = powf(a.real, b.real);
+                    z.imag = 0;
+                    return z;
+                } else if (a.real > 0) {
+                    r = a.real;
+                    theta = 0;
+                } else {
+                    r = -a.real;
+                    theta = atan2f(0.0, -1.0);
+                }
+            } else {
+                r = __Pyx_c_abs_float(a);
+                theta = atan2f(a.imag, a.real);
+            }
+            lnr = logf(r);
+            z_r = expf(lnr * b.real - theta * b.imag);
+            z_theta = theta * b.real + lnr * b.imag;
+            z.real = z_r * cosf(z_theta);
+            z.imag = z_r * sinf(z_theta);
+            return z;
+        }
+    #endif
+#endif
+
+/* Declarations */
+  #if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
+      return ::std::complex< double >(x, y);
+    }
+  #else
+    static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
+      return x + y*(__pyx_t_double_complex)_Complex_I;
+    }
+  #endif
+#else
+    static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
+      __pyx_t_double_complex z;
+      z.real = x;
+      z.imag = y;
+      return z;
+    }
+#endif
+
+/* Arithmetic */
+  #if CYTHON_CCOMPLEX
+#else
+    static CYTHON_INLINE int __Pyx_c_eq_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+       return (a.real == b.real) && (a.imag == b.imag);
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_sum_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        __pyx_t_double_complex z;
+        z.real = a.real + b.real;
+        z.imag = a.imag + b.imag;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_diff_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        __pyx_t_double_complex z;
+        z.real = a.real - b.real;
+        z.imag = a.imag - b.imag;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_prod_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        __pyx_t_double_complex z;
+        z.real = a.real * b.real - a.imag * b.imag;
+        z.imag = a.real * b.imag + a.imag * b.real;
+        return z;
+    }
+    #if 1
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_quot_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        if (b.imag == 0) {
+            return __pyx_t_double_complex_from_parts(a.real / b.real, a.imag / b.real);
+        } else if (fabs(b.real) >= fabs(b.imag)) {
+            if (b.real == 0 && b.imag == 0) {
+                return __pyx_t_double_complex_from_parts(a.real / b.real, a.imag / b.imag);
+            } else {
+                double r = b.imag / b.real;
+                double s = (double)(1.0) / (b.real + b.imag * r);
+                return __pyx_t_double_complex_from_parts(
+                    (a.real + a.imag * r) * s, (a.imag - a.real * r) * s);
+            }
+        } else {
+            double r = b.real / b.imag;
+            double s = (double)(1.0) / (b.imag + b.real * r);
+            return __pyx_t_double_complex_from_parts(
+                (a.real * r + a.imag) * s, (a.imag * r - a.real) * s);
+        }
+    }
+    #else
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_quot_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        if (b.imag == 0) {
+            return __pyx_t_double_complex_from_parts(a.real / b.real, a.imag / b.real);
+        } else {
+            double denom = b.real * b.real + b.imag * b.imag;
+            return __pyx_t_double_complex_from_parts(
+                (a.real * b.real + a.imag * b.imag) / denom,
+                (a.imag * b.real - a.real * b.imag) / denom);
+        }
+    }
+    #endif
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_neg_double(__pyx_t_double_complex a) {
+        __pyx_t_double_complex z;
+        z.real = -a.real;
+        z.imag = -a.imag;
+        return z;
+    }
+    static CYTHON_INLINE int __Pyx_c_is_zero_double(__pyx_t_double_complex a) {
+       return (a.real == 0) && (a.imag == 0);
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_conj_double(__pyx_t_double_complex a) {
+        __pyx_t_double_complex z;
+        z.real =  a.real;
+        z.imag = -a.imag;
+        return z;
+    }
+    #if 1
+        static CYTHON_INLINE double __Pyx_c_abs_double(__pyx_t_double_complex z) {
+          #if !defined(HAVE_HYPOT) || defined(_MSC_VER)
+            return sqrt(z.real*z.real + z.imag*z.imag);
+          #else
+            return hypot(z.real, z.imag);
+          #endif
+        }
+        static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_pow_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+            __pyx_t_double_complex z;
+            double r, lnr, theta, z_r, z_theta;
+            if (b.imag == 0 && b.real == (int)b.real) {
+                if (b.real < 0) {
+                    double denom = a.real * a.real + a.imag * a.imag;
+                    a.real = a.real / denom;
+                    a.imag = -a.imag / denom;
+                    b.real = -b.real;
+                }
+                switch ((int)b.real) {
+                    case 0:
+                        z.real = 1;
+                        z.imag = 0;
+                        return z;
+                    case 1:
+                        return a;
+                    case 2:
+                        return __Pyx_c_prod_double(a, a);
+                    case 3:
+                        z = __Pyx_c_prod_double(a, a);
+                        return __Pyx_c_prod_double(z, a);
+                    case 4:
+                        z = __Pyx_c_prod_double(a, a);
+                        return __Pyx_c_prod_double(z, z);
+                }
+            }
+            if (a.imag == 0) {
+                if (a.real == 0) {
+                    return a;
+                } else if ((b.imag == 0) && (a.real >= 0)) {
+                    z.real = pow(a.real, b.real);
+                    z.imag = 0;
+                    return z;
+                } else if (a.real > 0) {
+                    r = a.real;
+                    theta = 0;
+                } else {
+                    r = -a.real;
+                    theta = atan2(0.0, -1.0);
+                }
+            } else {
+                r = __Pyx_c_abs_double(a);
+                theta = atan2(a.imag, a.real);
+            }
+            lnr = log(r);
+            z_r = exp(lnr * b.real - theta * b.imag);
+            z_theta = theta * b.real + lnr * b.imag;
+            z.real = z_r * cos(z_theta);
+            z.imag = z_r * sin(z_theta);
+            return z;
+        }
+    #endif
+#endif
+
+/* CIntToPy */
+  static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPy */
+  static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int) -1;
+        }
+    } else {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* CIntFromPy */
+  static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(long) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (long) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (long) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(long) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(long) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            long val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (long) -1;
+        }
+    } else {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
+}
+
+/* CIntToPy */
+  static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+    }
+}
+
+/* FastTypeChecks */
+  #if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = a->tp_base;
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+#if PY_MAJOR_VERSION == 2
+static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
+    PyObject *exception, *value, *tb;
+    int res;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&exception, &value, &tb);
+    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
+    if (unlikely(res == -1)) {
+        PyErr_WriteUnraisable(err);
+        res = 0;
+    }
+    if (!res) {
+        res = PyObject_IsSubclass(err, exc_type2);
+        if (unlikely(res == -1)) {
+            PyErr_WriteUnraisable(err);
+            res = 0;
+        }
+    }
+    __Pyx_ErrRestore(exception, value, tb);
+    return res;
+}
+#else
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    int res = exc_type1 ? __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type1) : 0;
+    if (!res) {
+        res = __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+    return res;
+}
+#endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* CheckBinaryVersion */
+  static int __Pyx_check_binary_version(void) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
+        char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
+        PyOS_snprintf(message, sizeof(message),
+                      "compiletime version %s of module '%.100s' "
+                      "does not match runtime version %s",
+                      ctversion, __Pyx_MODULE_NAME, rtversion);
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+    return 0;
+}
+
+/* FunctionImport */
+  #ifndef __PYX_HAVE_RT_ImportFunction_0_29_37
+#define __PYX_HAVE_RT_ImportFunction_0_29_37
+static int __Pyx_ImportFunction_0_29_37(PyObject *module, const char *funcname, void (**f)(void), const char *sig) {
+    PyObject *d = 0;
+    PyObject *cobj = 0;
+    union {
+        void (*fp)(void);
+        void *p;
+    } tmp;
+    d = PyObject_GetAttrString(module, (char *)"__pyx_capi__");
+    if (!d)
+        goto bad;
+    cobj = PyDict_GetItemString(d, funcname);
+    if (!cobj) {
+        PyErr_Format(PyExc_ImportError,
+            "%.200s does not export expected C function %.200s",
+                PyModule_GetName(module), funcname);
+        goto bad;
+    }
+#if PY_VERSION_HEX >= 0x02070000
+    if (!PyCapsule_IsValid(cobj, sig)) {
+        PyErr_Format(PyExc_TypeError,
+            "C function %.200s.%.200s has wrong signature (expected %.500s, got %.500s)",
+             PyModule_GetName(module), funcname, sig, PyCapsule_GetName(cobj));
+        goto bad;
+    }
+    tmp.p = PyCapsule_GetPointer(cobj, sig);
+#else
+    {const char *desc, *s1, *s2;
+    desc = (const char *)PyCObject_GetDesc(cobj);
+    if (!desc)
+        goto bad;
+    s1 = desc; s2 = sig;
+    while (*s1 != '\0' && *s1 == *s2) { s1++; s2++; }
+    if (*s1 != *s2) {
+        PyErr_Format(PyExc_TypeError,
+            "C function %.200s.%.200s has wrong signature (expected %.500s, got %.500s)",
+             PyModule_GetName(module), funcname, sig, desc);
+        goto bad;
+    }
+    tmp.p = PyCObject_AsVoidPtr(cobj);}
+#endif
+    *f = tmp.fp;
+    if (!(*f))
+        goto bad;
+    Py_DECREF(d);
+    return 0;
+bad:
+    Py_XDECREF(d);
+    return -1;
+}
+#endif
+
+/* InitStrings */
+  static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+    while (t->p) {
+        #if PY_MAJOR_VERSION < 3
+        if (t->is_unicode) {
+            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
+        } else if (t->intern) {
+            *t->p = PyString_InternFromString(t->s);
+        } else {
+            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        }
+        #else
+        if (t->is_unicode | t->is_str) {
+            if (t->intern) {
+                *t->p = PyUnicode_InternFromString(t->s);
+            } else if (t->encoding) {
+                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
+            } else {
+                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
+            }
+        } else {
+            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
+        }
+        #endif
+        if (!*t->p)
+            return -1;
+        if (PyObject_Hash(*t->p) == -1)
+            return -1;
+        ++t;
+    }
+    return 0;
+}
+
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#if !CYTHON_PEP393_ENABLED
+static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    char* defenc_c;
+    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
+    if (!defenc) return NULL;
+    defenc_c = PyBytes_AS_STRING(defenc);
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    {
+        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
+        char* c;
+        for (c = defenc_c; c < end; c++) {
+            if ((unsigned char) (*c) >= 128) {
+                PyUnicode_AsASCIIString(o);
+                return NULL;
+            }
+        }
+    }
+#endif
+    *length = PyBytes_GET_SIZE(defenc);
+    return defenc_c;
+}
+#else
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+}
+#endif
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+    if (
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+            __Pyx_sys_getdefaultencoding_not_ascii &&
+#endif
+            PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
+    if (PyByteArray_Check(o)) {
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+    } else
+#endif
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
+#if PY_MAJOR_VERSION >= 3
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type %.200s).  "
+                "The ability to return an instance of a strict subclass of int "
+                "is deprecated, and may be removed in a future version of Python.",
+                Py_TYPE(result)->tp_name)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        return result;
+    }
+#endif
+    PyErr_Format(PyExc_TypeError,
+                 "__%.4s__ returned non-%.4s (type %.200s)",
+                 type_name, type_name, Py_TYPE(result)->tp_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  const char *name = NULL;
+  PyObject *res = NULL;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_Check(x) || PyLong_Check(x)))
+#else
+  if (likely(PyLong_Check(x)))
+#endif
+    return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  #if PY_MAJOR_VERSION < 3
+  if (m && m->nb_int) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  else if (m && m->nb_long) {
+    name = "long";
+    res = m->nb_long(x);
+  }
+  #else
+  if (likely(m && m->nb_int)) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  #endif
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+    res = PyNumber_Int(x);
+  }
+#endif
+  if (likely(res)) {
+#if PY_MAJOR_VERSION < 3
+    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
+#else
+    if (unlikely(!PyLong_CheckExact(res))) {
+#endif
+        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
+    }
+  }
+  else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_TypeError,
+                    "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject *x;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_CheckExact(b))) {
+    if (sizeof(Py_ssize_t) >= sizeof(long))
+        return PyInt_AS_LONG(b);
+    else
+        return PyInt_AsSsize_t(b);
+  }
+#endif
+  if (likely(PyLong_CheckExact(b))) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    const digit* digits = ((PyLongObject*)b)->ob_digit;
+    const Py_ssize_t size = Py_SIZE(b);
+    if (likely(__Pyx_sst_abs(size) <= 1)) {
+        ival = likely(size) ? digits[0] : 0;
+        if (size == -1) ival = -ival;
+        return ival;
+    } else {
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
+    #endif
+    return PyLong_AsSsize_t(b);
+  }
+  x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyInt_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+    return PyInt_FromSize_t(ival);
+}
+
+
+#endif /* Py_PYTHON_H */
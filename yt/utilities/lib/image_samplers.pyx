@@ -25,7 +25,7 @@ from field_interpolation_tables cimport (
 from libc.math cimport sqrt
 from libc.stdlib cimport free, malloc
 
-from yt.utilities.lib.fp_utils cimport fclip, i64clip, imin
+from yt.utilities.lib.fp_utils cimport fclip, i64clip, i64max, i64min, imin
 
 from .fixed_interpolator cimport (
     eval_gradient,
@@ -354,6 +354,97 @@ cdef class ProjectionSampler(ImageSampler):
             im.rgba[i] += vc.data[i][di] * dl
 
 
+cdef class MultiFieldProjectionSampler(ImageSampler):
+    # Integrates every field of the volume containers along the rays; the
+    # image has one channel per field.  Rather than being called on each
+    # brick in turn, it casts the rays of a whole set of bricks at once, with
+    # threads working on separate tiles of the image.
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    @cython.cdivision(True)
+    def cast_through_bricks(self, list bricks, int num_threads = 1,
+                            int tile_size = 32):
+        cdef int nb = len(bricks)
+        if nb == 0: return
+        cdef int nch = self.image.shape[2]
+        cdef int i, b, vi, vj
+        cdef np.int64_t t, ti, tj, ntx, nty, x0, x1, y0, y1
+        cdef PartitionedGrid pg
+        cdef VolumeContainer **vcs = <VolumeContainer **> malloc(
+            sizeof(VolumeContainer *) * nb)
+        cdef np.int64_t[:, :] extents = np.empty((nb, 4), dtype="int64")
+        cdef np.int64_t iter[4]
+        for b in range(nb):
+            pg = bricks[b]
+            if pg.container.n_fields != nch:
+                free(vcs)
+                raise RuntimeError("Bricks have %s fields, but the image has "
+                                   "%s channels." % (pg.container.n_fields, nch))
+            vcs[b] = pg.container
+            self.extent_function(self, pg.container, iter)
+            extents[b, 0] = i64clip(iter[0]-1, 0, self.nv[0])
+            extents[b, 1] = i64clip(iter[1]+1, 0, self.nv[0])
+            extents[b, 2] = i64clip(iter[2]-1, 0, self.nv[1])
+            extents[b, 3] = i64clip(iter[3]+1, 0, self.nv[1])
+        ntx = (self.nv[0] + tile_size - 1) // tile_size
+        nty = (self.nv[1] + tile_size - 1) // tile_size
+        cdef np.float64_t *acc
+        cdef np.float64_t *v_pos
+        cdef np.float64_t *v_dir
+        cdef np.float64_t max_t
+        cdef np.float64_t width[3]
+        for i in range(3):
+            width[i] = self.width[i]
+        with nogil, parallel(num_threads = num_threads):
+            acc = <np.float64_t *> malloc(sizeof(np.float64_t) * nch)
+            v_pos = <np.float64_t *> malloc(3 * sizeof(np.float64_t))
+            v_dir = <np.float64_t *> malloc(3 * sizeof(np.float64_t))
+            for t in prange(ntx * nty, schedule="dynamic"):
+                ti = t // nty
+                tj = t % nty
+                # Each pixel belongs to a single tile, so that the threads
+                # never write to the same part of the image.
+                for b in range(nb):
+                    x0 = i64max(ti * tile_size, extents[b, 0])
+                    x1 = i64min((ti + 1) * tile_size, extents[b, 1])
+                    y0 = i64max(tj * tile_size, extents[b, 2])
+                    y1 = i64min((tj + 1) * tile_size, extents[b, 3])
+                    for vi in range(x0, x1):
+                        for vj in range(y0, y1):
+                            self.vector_function(self, vi, vj, width, v_dir, v_pos)
+                            for i in range(nch):
+                                acc[i] = self.image[vi, vj, i]
+                            max_t = fclip(self.zbuffer[vi, vj], 0.0, 1.0)
+                            walk_volume(vcs[b], v_pos, v_dir, self.sample,
+                                        (<void *> acc), NULL, max_t)
+                            for i in range(nch):
+                                self.image[vi, vj, i] = acc[i]
+                if t % 64 == 0:
+                    with gil:
+                        PyErr_CheckSignals()
+            free(acc)
+            free(v_pos)
+            free(v_dir)
+        free(vcs)
+
+    @staticmethod
+    cdef void sample(
+                 VolumeContainer *vc,
+                 np.float64_t v_pos[3],
+                 np.float64_t v_dir[3],
+                 np.float64_t enter_t,
+                 np.float64_t exit_t,
+                 int index[3],
+                 void *data) nogil:
+        cdef np.float64_t *acc = <np.float64_t *> data
+        cdef int i
+        cdef np.float64_t dl = (exit_t - enter_t)
+        cdef int di = (index[0]*vc.dims[1]+index[1])*vc.dims[2]+index[2]
+        for i in range(vc.n_fields):
+            acc[i] += vc.data[i][di] * dl
+
+
 cdef class InterpolatedProjectionSampler(ImageSampler):
     def __cinit__(self,
                   np.ndarray vp_pos,
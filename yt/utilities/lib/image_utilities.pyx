@@ -30,6 +30,46 @@ def add_points_to_greyscale_image(
         buffer_mask[i, j] = 1
     return
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def add_weighted_points_to_greyscale_image(
+        np.float64_t[:, :] buffer,
+        np.uint8_t[:, :] buffer_mask,
+        np.float64_t[:] px,
+        np.float64_t[:] py,
+        np.float64_t[:] pv,
+        np.float64_t[:] pw = None,
+        np.float64_t[:, :] weight_buffer = None):
+    """
+    Splat weighted points onto a greyscale image
+
+    Given an image buffer indexed as (y, x), add the values pv of the points
+    at fractional positions px and py, multiplied by their weights pw if
+    given, to the pixels they fall in; the weights themselves are summed in
+    weight_buffer in the same pass. Pixels that receive a point are flagged
+    in buffer_mask, and points outside of the [0, 1] range are skipped.
+    """
+    cdef int i, j, pi
+    cdef int npart = px.shape[0]
+    cdef int ny = buffer.shape[0]
+    cdef int nx = buffer.shape[1]
+    cdef bint weighted = pw is not None
+    if weighted and weight_buffer is None:
+        raise ValueError("A weight buffer is needed to splat weighted points.")
+    with nogil:
+        for pi in range(npart):
+            if px[pi] < 0.0 or px[pi] > 1.0 or py[pi] < 0.0 or py[pi] > 1.0:
+                continue
+            j = iclip(<int> (nx * px[pi]), 0, nx - 1)
+            i = iclip(<int> (ny * py[pi]), 0, ny - 1)
+            if weighted:
+                buffer[i, j] += pv[pi] * pw[pi]
+                weight_buffer[i, j] += pw[pi]
+            else:
+                buffer[i, j] += pv[pi]
+            buffer_mask[i, j] = 1
+    return
+
 def add_points_to_image(
         np.ndarray[np.uint8_t, ndim=3] buffer,
         np.ndarray[np.float64_t, ndim=1] px,